@@ -1,16 +1,48 @@
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
-from app.config import Config
+from app.config import Config, POOL_SIZE, POOL_WARM_UP, LOG_LEVEL, LOG_FORMAT, LOG_LEVELS, LOG_SAMPLE, JSON_CODEC
+from app.config import SLOW_QUERY_SECONDS, REPEATED_QUERY_LIMIT, DIAGNOSTIC_HEADERS
+from tools.etag import EtagUtils
+from tools.log import Logger
+from tools.jsoncodec import JsonCodec
+from tools.json_provider import FastJSONProvider, AlderRequest
+from tools.pool import PoolUtils
+from tools.metrics import RequestMetrics, TimedQueuePool
+from tools.querystats import QueryStats
 
 db = SQLAlchemy()
 
 def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
-    
+
+    # Time every pool checkout, see RequestMetrics
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {**Config.SQLALCHEMY_ENGINE_OPTIONS, 'poolclass': TimedQueuePool}
+
     db.init_app(app)
 
+    Logger.configure(level=LOG_LEVEL, levels=LOG_LEVELS, sample=LOG_SAMPLE, json_output=LOG_FORMAT == 'json')
+
+    # Encode and decode JSON bodies with the configured codec, or
+    # MessagePack when the request asks for it
+    JsonCodec.use(JSON_CODEC)
+    app.json = FastJSONProvider(app)
+    app.request_class = AlderRequest
+
+    # Answer conditional GET requests with 304 Not Modified
+    app.after_request(EtagUtils.make_conditional)
+
     with app.app_context():
+        # Record request, database and pool metrics, exposed on /metrics
+        RequestMetrics.init_app(app, db.engine)
+
+        # Count the queries of every request and log slow and repeated ones
+        QueryStats.init_app(app, db.engine, SLOW_QUERY_SECONDS, REPEATED_QUERY_LIMIT, DIAGNOSTIC_HEADERS)
+
+        # Register health controller
+        from app.controller.health_controller import health_bp
+        app.register_blueprint(health_bp)
+
         # Register user controller
         from app.controller.user_controller import user_bp
         app.register_blueprint(user_bp)
@@ -58,5 +90,33 @@ def create_app():
         # Register reminder controller
         from app.controller.reminder_controller import reminder_bp
         app.register_blueprint(reminder_bp)
+
+        # Register focus controller
+        from app.controller.focus_controller import focus_bp
+        app.register_blueprint(focus_bp)
+
+        # Register profile controller
+        from app.controller.profile_controller import profile_bp
+        app.register_blueprint(profile_bp)
+
+        # Register leaderboard controller
+        from app.controller.leaderboard_controller import leaderboard_bp
+        app.register_blueprint(leaderboard_bp)
+
+        # Open the connection pool before the first request
+        if POOL_WARM_UP:
+            try:
+                PoolUtils.warm_up(db.engine, POOL_SIZE)
+            except Exception as e:
+                Logger.warn('Unable to warm up the connection pool: %s', e)
+
+        # Load the in-memory leaderboards, boards that fail to load are
+        # loaded on first use instead
+        from app.service.leaderboard_service import LeaderboardService
+        try:
+            LeaderboardService.load_all()
+        except Exception as e:
+            db.session.rollback()
+            Logger.warn('Unable to load leaderboards on startup: %s', e)
     
     return app
@@ -0,0 +1,150 @@
+from asgiref.wsgi import WsgiToAsgi
+from quart import Quart, Request, Response, request
+from quart.json.provider import DefaultJSONProvider
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from werkzeug.exceptions import BadRequest
+from app import create_app
+from app.config import Config, SLOW_QUERY_SECONDS, REPEATED_QUERY_LIMIT, DIAGNOSTIC_HEADERS
+from tools.etag import EtagUtils
+from tools.jsoncodec import JsonCodec
+from tools.json_provider import encode_body
+from tools.msgpackcodec import MsgpackCodec, MSGPACK_MIMETYPE
+from tools.metrics import RequestMetrics, TimedAsyncQueuePool
+from tools.querystats import QueryStats
+
+# Async engine and sessions of the ASGI app. Controllers open one
+# session per request with `async with async_session() as session`.
+# Every pool checkout is timed, see RequestMetrics.
+async_engine = create_async_engine(Config.ASYNC_DATABASE_URI, poolclass=TimedAsyncQueuePool, **Config.ASYNC_ENGINE_OPTIONS)
+async_session = async_sessionmaker(async_engine, expire_on_commit=False)
+
+class RouteDispatcher():
+    """
+    ASGI app that sends each request to the async app if it has a
+    route for the path and method, and to the Flask app otherwise.
+    The reads the bot calls most, the hot writes (user ensure and
+    increment, focus sessions), the profile and the reminder endpoints
+    are ported to async handlers. The other routes run in a worker
+    thread on the Flask app's pool and get no benefit from the async
+    engine.
+    """
+    def __init__(self, async_app, wsgi_app):
+        self.async_app = async_app
+        self.wsgi_app = WsgiToAsgi(wsgi_app)
+        self.adapter = async_app.url_map.bind('')
+
+    def has_route(self, path, method):
+        try:
+            self.adapter.match(path, method)
+            return True
+        except Exception:
+            return False
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'http' and not self.has_route(scope['path'], scope['method']):
+            await self.wsgi_app(scope, receive, send)
+        else:
+            await self.async_app(scope, receive, send)
+
+class AsyncJSONProvider(DefaultJSONProvider):
+    """
+    Quart counterpart of FastJSONProvider: encodes with JsonCodec, or
+    MessagePack when the request's Accept header prefers it.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return JsonCodec.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return JsonCodec.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body, mimetype = encode_body(obj, self.default, request.accept_mimetypes)
+        response = self._app.response_class(body, mimetype=mimetype)
+        response.vary.add('Accept')
+        return response
+
+class AsyncRequest(Request):
+    """
+    Quart counterpart of AlderRequest: get_json also reads
+    application/msgpack bodies.
+    """
+
+    async def get_json(self, force=False, silent=False, cache=True):
+        if self.mimetype != MSGPACK_MIMETYPE or not MsgpackCodec.available:
+            return await super().get_json(force=force, silent=silent, cache=cache)
+        try:
+            return MsgpackCodec.loads(await self.get_data(cache=cache))
+        except Exception as e:
+            if silent:
+                return None
+            raise BadRequest(f'Failed to decode MessagePack body: {str(e)}')
+
+async def make_conditional(response):
+    """
+    Adds a content ETag to successful JSON and MessagePack GET
+    responses that do not have one and answers matching conditional requests with 304, like
+    EtagUtils.make_conditional does for the Flask app.
+    """
+    if request.method not in ('GET', 'HEAD') or response.status_code != 200 or response.mimetype not in ('application/json', MSGPACK_MIMETYPE):
+        return response
+    etag, _ = response.get_etag()
+    if etag is None:
+        etag = EtagUtils.make_etag(await response.get_data())
+        response.set_etag(etag)
+    if etag in request.if_none_match:
+        not_modified = Response('', 304)
+        not_modified.set_etag(etag)
+        return not_modified
+    return response
+
+def create_asgi_app():
+    """
+    Creates the ASGI app. The async handlers share the models and
+    schemas of the Flask app and run their queries on the async engine.
+    Requests without an async handler are served by the Flask app
+    created by create_app.
+    """
+    wsgi_app = create_app()
+    app = Quart(__name__)
+    app.json = AsyncJSONProvider(app)
+    app.request_class = AsyncRequest
+
+    # Record the async routes in the same request metrics and query
+    # diagnostics as the Flask app, so /metrics covers both
+    RequestMetrics.init_app(app, async_engine.sync_engine, is_async=True)
+    QueryStats.init_app(app, async_engine.sync_engine, SLOW_QUERY_SECONDS, REPEATED_QUERY_LIMIT, DIAGNOSTIC_HEADERS, is_async=True)
+
+    # Answer conditional GET requests with 304 Not Modified
+    app.after_request(make_conditional)
+
+    # Register async user controller
+    from app.asgi.controller.user_controller import user_bp
+    app.register_blueprint(user_bp)
+
+    # Register async streak controller
+    from app.asgi.controller.streak_controller import streak_bp
+    app.register_blueprint(streak_bp)
+
+    # Register async todo controller
+    from app.asgi.controller.todo_controller import todo_bp
+    app.register_blueprint(todo_bp)
+
+    # Register async reminder controller
+    from app.asgi.controller.reminder_controller import reminder_bp
+    app.register_blueprint(reminder_bp)
+
+    # Register async focus controller
+    from app.asgi.controller.focus_controller import focus_bp
+    app.register_blueprint(focus_bp)
+
+    # Register async profile controller
+    from app.asgi.controller.profile_controller import profile_bp
+    app.register_blueprint(profile_bp)
+
+    @app.after_serving
+    async def dispose_engine():
+        await async_engine.dispose()
+
+    return RouteDispatcher(app, wsgi_app)
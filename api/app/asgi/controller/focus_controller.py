@@ -0,0 +1,88 @@
+from quart import Blueprint, request, jsonify
+from app.schema.user_schema import UserSchema
+from app.schema.monthtime_schema import MonthTimeSchema
+from app.schema.dailytime_schema import DailyTimeSchema
+from app.schema.streak_schema import StreakSchema
+from app.service.focus_service import FocusService, MAX_SESSIONS_PER_REQUEST
+from app.service.leaderboard_service import LeaderboardService, TIME_BOARDS, STREAK_BOARDS
+from app.asgi import async_session
+
+# Define the async focus Blueprint
+focus_bp = Blueprint('focus_bp', __name__)
+
+# Initialize schemas
+user_schema = UserSchema()
+monthtime_schema = MonthTimeSchema()
+dailytime_schema = DailyTimeSchema()
+streak_schema = StreakSchema()
+
+@focus_bp.route('/focus/session', methods=['POST'])
+async def create_focus_session():
+    """
+    Records a focus session for a user, using the same service as the
+    Flask endpoint on the async session.
+    """
+    data = await request.get_json() or {}
+
+    for field in ['user_id', 'seconds', 'tokens']:
+        if field not in data:
+            return jsonify({'message': f'Missing required field: {field}'}), 400
+        if not isinstance(data[field], int) or data[field] < 0:
+            return jsonify({'message': f'Invalid value for {field}. Must be a non-negative integer.'}), 400
+
+    async with async_session() as session:
+        try:
+            user, monthtime, dailytime, streak = await session.run_sync(
+                lambda sync_session: FocusService.record_session(data['user_id'], data['seconds'], data['tokens'], session=sync_session))
+        except Exception as e:
+            return jsonify({'message': f'Error occurred while recording focus session: {str(e)}'}), 500
+
+    LeaderboardService.set_rows([user, monthtime, dailytime, streak])
+
+    return jsonify({
+        'user': user_schema.dump(user),
+        'monthtime': monthtime_schema.dump(monthtime),
+        'dailytime': dailytime_schema.dump(dailytime),
+        'streak': streak_schema.dump(streak)
+    }), 200
+
+@focus_bp.route('/focus/sessions', methods=['POST'])
+async def create_focus_sessions():
+    """
+    Records a batch of focus sessions, using the same service as the
+    Flask endpoint on the async session.
+    """
+    data = await request.get_json() or {}
+
+    sessions = data.get('sessions')
+    if not isinstance(sessions, list):
+        return jsonify({'message': 'Missing required field: sessions'}), 400
+
+    if len(sessions) > MAX_SESSIONS_PER_REQUEST:
+        return jsonify({'message': f'Too many sessions. At most {MAX_SESSIONS_PER_REQUEST} are accepted per request.'}), 400
+
+    for entry in sessions:
+        if not isinstance(entry, dict):
+            return jsonify({'message': 'Each session must be an object'}), 400
+        for field in ['user_id', 'seconds', 'tokens']:
+            if not isinstance(entry.get(field), int) or entry[field] < 0:
+                return jsonify({'message': f'Each session must have a non-negative integer {field}'}), 400
+
+    deltas = {}
+    for entry in sessions:
+        deltas[entry['user_id']] = deltas.get(entry['user_id'], 0) + entry['seconds']
+
+    async with async_session() as session:
+        try:
+            users_updated = await session.run_sync(lambda sync_session: FocusService.record_sessions(sessions, session=sync_session))
+        except Exception as e:
+            return jsonify({'message': f'Error occurred while recording focus sessions: {str(e)}'}), 500
+
+        # Apply the known time deltas as the Flask endpoint does, and
+        # read back only the streaks computed by the database
+        for board in TIME_BOARDS:
+            LeaderboardService.add_scores(board, deltas)
+        LeaderboardService.add_scores('trivia', dict.fromkeys(deltas, 0))
+        await session.run_sync(lambda sync_session: LeaderboardService.refresh_users(deltas, STREAK_BOARDS, session=sync_session))
+
+    return jsonify({'sessions': len(sessions), 'users': users_updated}), 200
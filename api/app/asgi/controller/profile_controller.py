@@ -0,0 +1,20 @@
+from quart import Blueprint, jsonify
+from app.service.profile_service import ProfileService
+from app.asgi import async_session
+
+# Define the async profile Blueprint
+profile_bp = Blueprint('profile_bp', __name__)
+
+@profile_bp.route('/profile/<int:user_id>', methods=['GET'])
+async def get_profile(user_id):
+    """
+    Returns the profile of the user, read with the same single query
+    as the Flask endpoint on the async session.
+    """
+    async with async_session() as session:
+        profile = await session.run_sync(lambda sync_session: ProfileService.get_profile(user_id, session=sync_session))
+
+    if profile is None:
+        return jsonify({'message': 'User not found'}), 404
+
+    return jsonify(profile), 200
@@ -0,0 +1,114 @@
+from quart import Blueprint, Response, request, jsonify
+from sqlalchemy import select
+from app.model.reminder_model import ReminderModel
+from app.schema.reminder_schema import ReminderSchema
+from app.service.reminder_service import ReminderService, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_ADVANCE_SIZE
+from app.asgi import async_session
+from tools.ndjson import NdjsonUtils
+
+# Define the async Reminder Blueprint
+reminder_bp = Blueprint('reminder_bp', __name__)
+
+# Initialize Reminder Schema
+reminder_schema = ReminderSchema()
+reminders_schema = ReminderSchema(many=True)
+
+# Endpoint to retrieve all reminders for a specific user
+@reminder_bp.route('/reminder/user/<int:user_id>', methods=['GET'])
+async def get_user_reminders(user_id):
+    """
+    Retrieves all reminders for the user by user_id.
+    """
+    async with async_session() as session:
+        reminders = (await session.scalars(select(ReminderModel).where(ReminderModel.user_id == user_id))).all()
+
+    if not reminders:
+        return jsonify({"message": "No reminders found for this user."}), 404
+
+    return jsonify(reminders_schema.dump(reminders)), 200
+
+
+# Endpoint to stream reminders due within a window
+@reminder_bp.route('/reminder/due', methods=['GET'])
+async def get_due_reminders():
+    """
+    Streams the reminders due before `before` as newline-delimited
+    JSON. Takes the same parameters as the Flask endpoint.
+    """
+    before = request.args.get('before')
+    if not before:
+        return jsonify({"message": "The 'before' query parameter is required."}), 400
+
+    try:
+        before = ReminderService.parse_remind_at(before)
+        after = request.args.get('after')
+        after = ReminderService.parse_remind_at(after) if after else None
+    except ValueError:
+        return jsonify({"message": "Invalid date format. Use 'YYYY-MM-DDTHH:MM:SS'."}), 400
+
+    cursor = request.args.get('cursor')
+    try:
+        cursor = ReminderService.decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({"message": "Invalid cursor."}), 400
+
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    if limit <= 0 or limit > MAX_PAGE_SIZE:
+        return jsonify({"message": f"Invalid limit value. Must be between 1 and {MAX_PAGE_SIZE}."}), 400
+
+    statement = ReminderService.get_due_statement(before, after, cursor, limit)
+    encode, mimetype = NdjsonUtils.get_encoder(request.accept_mimetypes)
+
+    async def lines():
+        # The session stays open until the last row is sent
+        async with async_session() as session:
+            reminders = await session.stream_scalars(statement)
+            async for line in NdjsonUtils.async_lines(reminders, reminder_schema.dump, encode):
+                yield line
+
+    response = Response(lines(), mimetype=mimetype)
+    response.vary.add('Accept')
+    return response
+
+
+# Endpoint to advance a batch of fired reminders
+@reminder_bp.route('/reminder/advance', methods=['POST'])
+async def advance_reminders():
+    """
+    Advances the fired reminders in the `ids` list of the request body
+    to their next occurrence, using the same service as the Flask
+    endpoint on the async session.
+    """
+    data = await request.get_json()
+    ids = data.get('ids') if data else None
+
+    # Validate the list of ids
+    if not isinstance(ids, list) or not all(isinstance(id, int) for id in ids):
+        return jsonify({"message": "The 'ids' field must be a list of reminder ids."}), 400
+    if len(ids) > MAX_ADVANCE_SIZE:
+        return jsonify({"message": f"At most {MAX_ADVANCE_SIZE} reminders can be advanced at once."}), 400
+
+    async with async_session() as session:
+        try:
+            updated, deleted_ids = await session.run_sync(lambda sync_session: ReminderService.advance_reminders(ids, session=sync_session))
+            await session.commit()
+        except Exception as e:
+            await session.rollback()
+            return jsonify({"message": f"Error occurred while advancing reminders: {str(e)}"}), 500
+
+    return jsonify({'updated': reminders_schema.dump(updated), 'deleted': deleted_ids}), 200
+
+
+# Endpoint to retrieve a reminder by its ID
+@reminder_bp.route('/reminder/<int:id>', methods=['GET'])
+async def get_reminder(id):
+    """
+    Retrieves a reminder by its ID.
+    """
+    async with async_session() as session:
+        reminder = await session.get(ReminderModel, id)
+
+    if reminder is None:
+        return jsonify({"message": "Reminder not found."}), 404
+
+    return jsonify(reminder_schema.dump(reminder)), 200
@@ -0,0 +1,24 @@
+from quart import Blueprint, jsonify
+from app.model.streak_model import StreakModel
+from app.schema.streak_schema import StreakSchema
+from app.asgi import async_session
+
+# Define the async streak Blueprint
+streak_bp = Blueprint('streak_bp', __name__)
+
+# Initialize StreakSchema
+streak_schema = StreakSchema()
+
+@streak_bp.route('/streak/<int:user_id>', methods=['GET'])
+async def get_user_streak(user_id):
+    """
+    Retrieves the streak given the user_id
+    """
+    async with async_session() as session:
+        streak = await session.get(StreakModel, user_id)
+
+    if streak is None:
+        # Return a 404 error if the streak is not found
+        return jsonify({'message': 'Streak not found'}), 404
+
+    return jsonify(streak_schema.dump(streak))
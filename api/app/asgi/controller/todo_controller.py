@@ -0,0 +1,37 @@
+from quart import Blueprint, jsonify
+from sqlalchemy import select
+from app.model.todo_model import TodoModel
+from app.schema.todo_schema import TodoSchema
+from app.asgi import async_session
+
+# Define the async Todo Blueprint
+todo_bp = Blueprint('todo_bp', __name__)
+
+# Initialize TodoSchema
+todos_schema = TodoSchema(many=True)
+
+@todo_bp.route('/todo/incomplete/<int:user_id>', methods=['GET'])
+async def get_incomplete_todo_items(user_id):
+    """
+    Gets all of the todo items for the user with user_id where
+    the completed_date column is null.
+    """
+    async with async_session() as session:
+        incomplete_todos = (await session.scalars(
+            select(TodoModel).where(TodoModel.user_id == user_id, TodoModel.completed_date.is_(None))
+        )).all()
+
+    return jsonify(todos_schema.dump(incomplete_todos)), 200
+
+@todo_bp.route('/todo/complete/<int:user_id>', methods=['GET'])
+async def get_complete_todo_items(user_id):
+    """
+    Gets all of the todo items for the user with user_id where
+    the completed_date column is not null.
+    """
+    async with async_session() as session:
+        complete_todos = (await session.scalars(
+            select(TodoModel).where(TodoModel.user_id == user_id, TodoModel.completed_date.isnot(None))
+        )).all()
+
+    return jsonify(todos_schema.dump(complete_todos)), 200
@@ -0,0 +1,89 @@
+from quart import Blueprint, request, jsonify
+from app.model.user_model import User
+from app.schema.user_schema import UserSchema
+from app.schema.monthtime_schema import MonthTimeSchema
+from app.schema.dailytime_schema import DailyTimeSchema
+from app.schema.streak_schema import StreakSchema
+from app.service.user_service import UserService
+from app.service.leaderboard_service import LeaderboardService
+from app.asgi import async_session
+from tools.etag import EtagUtils
+from tools.json_provider import prefers_msgpack
+
+# Define the async Blueprint for user-related routes
+user_bp = Blueprint('user_bp', __name__)
+
+# Initialize UserSchema
+user_schema = UserSchema()
+monthtime_schema = MonthTimeSchema()
+dailytime_schema = DailyTimeSchema()
+streak_schema = StreakSchema()
+
+# Endpoint to retrieve a user by ID
+@user_bp.route('/user/<int:id>', methods=['GET'])
+async def get_user(id):
+    async with async_session() as session:
+        user = await session.get(User, id)
+    if user is None:
+        # Return a 404 error if the user is not found
+        return jsonify({'message': 'User not found'}), 404
+
+    # The row ETag matches the Flask app's, so either app can answer
+    # the bot's conditional requests
+    response = jsonify(user_schema.dump(user))
+    response.set_etag(EtagUtils.make_etag(user.id, user.tokens, user.stime, user.timezone, user.hex, user.trivia, prefers_msgpack(request.accept_mimetypes)))
+    return response
+
+# Increment endpoint
+@user_bp.route('/user/<int:id>/increment', methods=['PATCH'])
+async def increment_user(id):
+    """
+    Atomically adds deltas to the user's counters, using the same
+    service as the Flask endpoint on the async session.
+    """
+    data = await request.get_json() or {}
+
+    deltas = {}
+    for field in ['tokens', 'stime', 'trivia']:
+        if field in data:
+            if not isinstance(data[field], int):
+                return jsonify({'message': f'Invalid value for {field}. Must be an integer.'}), 400
+            deltas[field] = data[field]
+
+    if not deltas:
+        return jsonify({'message': 'At least one of tokens, stime or trivia is required'}), 400
+
+    async with async_session() as session:
+        user = await session.run_sync(lambda sync_session: UserService.increment_user(id, session=sync_session, **deltas))
+        if user is None:
+            await session.rollback()
+            return jsonify({'message': 'User not found'}), 404
+        await session.commit()
+
+    LeaderboardService.set_rows([user], deltas)
+
+    return jsonify(user_schema.dump(user))
+
+# Ensure endpoint
+@user_bp.route('/user/<int:id>/ensure', methods=['PUT'])
+async def ensure_user(id):
+    """
+    Idempotently creates any missing user, current monthtime, current
+    dailytime and streak rows for the user, using the same service as
+    the Flask endpoint on the async session.
+    """
+    async with async_session() as session:
+        try:
+            user, monthtime, dailytime, streak, created = await session.run_sync(lambda sync_session: UserService.ensure_user(id, session=sync_session))
+        except Exception as e:
+            return jsonify({'message': f'Unable to ensure user {id}: {str(e)}'}), 500
+
+    # Only rows created by this call add the user to a board
+    LeaderboardService.set_rows(created)
+
+    return jsonify({
+        'user': user_schema.dump(user),
+        'monthtime': monthtime_schema.dump(monthtime),
+        'dailytime': dailytime_schema.dump(dailytime),
+        'streak': streak_schema.dump(streak)
+    }), 200
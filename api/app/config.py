@@ -20,8 +20,60 @@ MYSQL_PASSWORD = MYSQL['password']
 MYSQL_HOST = MYSQL['host']
 MYSQL_DATABASE = MYSQL['database']
 
+# Connection pool of each API process, see the sizing guide in
+# docs/install.markdown
+MYSQL_POOL = MYSQL.get('pool') or {}
+POOL_SIZE = MYSQL_POOL.get('size', 10)
+POOL_MAX_OVERFLOW = MYSQL_POOL.get('max_overflow', 5)
+POOL_TIMEOUT = MYSQL_POOL.get('timeout', 10)
+POOL_RECYCLE = MYSQL_POOL.get('recycle', 1800)
+POOL_PRE_PING = MYSQL_POOL.get('pre_ping', True)
+POOL_WARM_UP = MYSQL_POOL.get('warm_up', True)
+
+# Connection pool of the async engine used by the ASGI app. Requests
+# wait on the database without holding a thread, so a few connections
+# serve many concurrent requests.
+ASYNC_POOL_SIZE = MYSQL_POOL.get('async_size', 5)
+ASYNC_POOL_MAX_OVERFLOW = MYSQL_POOL.get('async_max_overflow', 5)
+
+# Logging settings, see log.* in config.yaml
+LOG_LEVEL = CONFIG.get('log.level', 0)
+LOG_FORMAT = CONFIG.get('log.format', 'text')
+LOG_LEVELS = CONFIG.get('log.levels') or {}
+LOG_SAMPLE = CONFIG.get('log.sample') or {}
+
+# JSON codec of the API, see json.codec in config.yaml
+JSON_CODEC = CONFIG.get('json.codec', 'auto')
+
+# Query diagnostics, see diagnostics in config.yaml
+DIAGNOSTICS = CONFIG.get('diagnostics') or {}
+SLOW_QUERY_SECONDS = DIAGNOSTICS.get('slow_query_seconds', 0.5)
+REPEATED_QUERY_LIMIT = DIAGNOSTICS.get('repeated_query_limit', 5)
+DIAGNOSTIC_HEADERS = DIAGNOSTICS.get('headers', False)
+
+# Production server settings used by gunicorn.conf.py
+SERVER = (CONFIG.get('api') or {}).get('server') or {}
+SERVER_BIND = SERVER.get('bind', '127.0.0.1:5000')
+SERVER_WORKERS = SERVER.get('workers', 1)
+SERVER_THREADS = SERVER.get('threads', 8)
+SERVER_TIMEOUT = SERVER.get('timeout', 60)
+
 class Config:
     PYMYSQL_STRING = f'mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}/{MYSQL_DATABASE}'
-    print(PYMYSQL_STRING)
     SQLALCHEMY_DATABASE_URI = os.getenv('DATABASE_URI', PYMYSQL_STRING)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_size': POOL_SIZE,
+        'max_overflow': POOL_MAX_OVERFLOW,
+        'pool_timeout': POOL_TIMEOUT,
+        'pool_recycle': POOL_RECYCLE,
+        'pool_pre_ping': POOL_PRE_PING
+    }
+    ASYNC_DATABASE_URI = os.getenv('ASYNC_DATABASE_URI', f'mysql+aiomysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}/{MYSQL_DATABASE}')
+    ASYNC_ENGINE_OPTIONS = {
+        'pool_size': ASYNC_POOL_SIZE,
+        'max_overflow': ASYNC_POOL_MAX_OVERFLOW,
+        'pool_timeout': POOL_TIMEOUT,
+        'pool_recycle': POOL_RECYCLE,
+        'pool_pre_ping': POOL_PRE_PING
+    }
@@ -58,16 +58,12 @@ def delete_accomplishments_by_user_id(user_id):
     Delete all accomplishments that match the user_id
     """
 
-    # Query all accomplishments by the given user_id
-    accomplishment_records = Accomplishment.query.filter_by(user_id=user_id).all()
+    # Delete all accomplishments of the given user_id in one statement
+    deleted = Accomplishment.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
-    # Check if any records exist
-    if not accomplishment_records:
+    # Check if any records existed
+    if not deleted:
         return jsonify({'error': f'No accomplishments found for the user with id: {user_id}'})
-    
-    # Delete all records that were found
-    for record in accomplishment_records:
-        db.session.delete(record)
 
     db.session.commit()
 
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from app.model.achievement_model import Achievement
 from app.schema.achievement_schema import AchievementSchema
+from app.service.achievement_service import AchievementService, DEFAULT_CHUNK_SIZE
 from app import db
 
 # Define achievement Blueprint
@@ -58,18 +59,54 @@ def delete_achievements_by_user_id(user_id):
     Delete all achievements that match the user_id
     """
 
-    # Query all achievements by the given user_id
-    achievement_records = Achievement.query.filter_by(user_id=user_id).all()
+    # Delete all achievements of the given user_id in one statement
+    deleted = Achievement.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
-    # Check if any records exist
-    if not achievement_records:
+    # Check if any records existed
+    if not deleted:
         return jsonify({'error': f'No achievements found for the user with id: {user_id}'}), 404
-    
-    # Delete all records that were found
-    for record in achievement_records:
-        db.session.delete(record)
 
     db.session.commit()
 
     # Return 204 No Content
     return '', 204
+
+@achievement_bp.route('/achievements/<int:user_id>/evaluate', methods=['POST'])
+def evaluate_achievements_by_user_id(user_id):
+    """
+    Evaluates the achievement catalogue for the user against the
+    stored statistics, awards every newly earned achievement and
+    returns the earned count, the newly earned ids and the progress
+    towards the next achievement in each category.
+    """
+
+    try:
+        evaluation = AchievementService.evaluate_user(user_id)
+    except Exception as e:
+        return jsonify({'message': f'Error occurred while evaluating achievements: {str(e)}'}), 500
+
+    # Check if the user exists
+    if evaluation is None:
+        return jsonify({'error': f'User with id {user_id} not found'}), 404
+
+    return jsonify(evaluation), 200
+
+@achievement_bp.route('/achievements/evaluate', methods=['POST'])
+def evaluate_all_achievements():
+    """
+    Backfills achievements for every user. Users are evaluated in
+    chunks of `chunk_size` (optional in the request body), with each
+    chunk committed on its own.
+    """
+    data = request.get_json(silent=True) or {}
+
+    chunk_size = data.get('chunk_size', DEFAULT_CHUNK_SIZE)
+    if not isinstance(chunk_size, int) or chunk_size <= 0:
+        return jsonify({'message': 'Invalid value for chunk_size. Must be a positive integer.'}), 400
+
+    try:
+        users_evaluated, achievements_awarded = AchievementService.evaluate_all(chunk_size)
+    except Exception as e:
+        return jsonify({'message': f'Error occurred while evaluating achievements: {str(e)}'}), 500
+
+    return jsonify({'users': users_evaluated, 'awarded': achievements_awarded}), 200
@@ -2,16 +2,16 @@ from flask import Blueprint, request, jsonify
 from app.model.dailytime_model import DailyTime
 from app.schema.dailytime_schema import DailyTimeSchema
 from app import db
-from sqlalchemy import desc
+from app.service.leaderboard_service import LeaderboardService, DAY_BOARDS
 from datetime import datetime
 from tools.utils import DateTimeUtils
+from tools.pagination import PaginationUtils, SortKey
 
 # Define dailytime Blueprint for routes
 dailytime_bp = Blueprint('dailytime_bp', __name__)
 
 # Initialize UserSchema
 dailytime_schema = DailyTimeSchema()
-dailytimes_schema = DailyTimeSchema(many=True)
 
 # Endpoint to retrieve dailytime column by full primary key
 @dailytime_bp.route('/dailytime', methods=['GET'])
@@ -73,6 +73,7 @@ def create_dailytime(user_id):
 
     db.session.add(new_dailytime)
     db.session.commit()
+    LeaderboardService.set_rows([new_dailytime])
 
     result = dailytime_schema.dump(new_dailytime)
     return jsonify(result), 201
@@ -83,18 +84,20 @@ def update_dailytime_stime(user_id):
     # Use the utility method to get the current UTC date
     mth, d, yr, string = DateTimeUtils.get_utc_date_now()
 
-    dailytime_record = DailyTime.query.filter_by(user_id=user_id, d=d, mth=mth, yr=yr).first()
-
-    if dailytime_record is None:
-        return jsonify({'error': f'No DailyTime record found for today: {string}'}), 404
-
     add_stime = request.json.get('stime')
     if add_stime is None:
         return jsonify({'error': 'Missing required field: stime'}), 400
 
-    dailytime_record.stime += add_stime
+    # Add stime with a single UPDATE so concurrent writes are not lost
+    updated = DailyTime.query.filter_by(user_id=user_id, d=d, mth=mth, yr=yr).update(
+        {DailyTime.stime: DailyTime.stime + add_stime}, synchronize_session=False)
 
+    if updated == 0:
+        return jsonify({'error': f'No DailyTime record found for today: {string}'}), 404
+
+    dailytime_record = DailyTime.query.get((user_id, d, mth, yr))
     db.session.commit()
+    LeaderboardService.set_rows([dailytime_record])
 
     result = dailytime_schema.dump(dailytime_record)
     return jsonify(result), 200
@@ -146,36 +149,27 @@ def search_dailytime():
         else:
             return jsonify({'message': f'Invalid condition: {cond}'}), 400
 
-    # Always sort by stime in descending order
-    query = query.order_by(desc(DailyTime.stime))
+    # Always sort by stime in descending order, ties by user_id
+    keys = [SortKey(DailyTime.stime, descending=True), SortKey(DailyTime.user_id, descending=True)]
 
-    # Apply the limit if provided
-    limit = data.get('limit')
-    if limit is not None:
-        try:
-            limit = int(limit)
-            query = query.limit(limit)
-        except ValueError:
-            return jsonify({'message': 'Invalid limit value. Must be an integer.'}), 400
-
-    dailytime_entries = query.all()
-    return jsonify(dailytimes_schema.dump(dailytime_entries)), 200
+    # Return one page of entries, or stream every match
+    try:
+        return PaginationUtils.search_response(query, keys, data, dailytime_schema.dump)
+    except ValueError as e:
+        return jsonify({'message': f'Invalid limit or cursor: {str(e)}'}), 400
 
 # Endpoint to delete all DailyTime entries for a specific user_id
 @dailytime_bp.route('/dailytime/<int:user_id>', methods=['DELETE'])
 def delete_dailytime_by_user_id(user_id):
-    # Query all DailyTime records for the given user_id
-    dailytime_records = DailyTime.query.filter_by(user_id=user_id).all()
+    # Delete all DailyTime records for the given user_id in one statement
+    deleted = DailyTime.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
-    # Check if any records exist
-    if not dailytime_records:
+    # Check if any records existed
+    if not deleted:
         return jsonify({'error': f'No DailyTime records found for user with id: {user_id}'}), 404
 
-    # Delete all found records
-    for record in dailytime_records:
-        db.session.delete(record)
-
     db.session.commit()
+    LeaderboardService.remove_users([user_id], DAY_BOARDS)
 
     # Return 204 No Content
     return '', 204
\ No newline at end of file
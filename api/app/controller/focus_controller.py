@@ -0,0 +1,93 @@
+from flask import Blueprint, request, jsonify
+from app.schema.user_schema import UserSchema
+from app.schema.monthtime_schema import MonthTimeSchema
+from app.schema.dailytime_schema import DailyTimeSchema
+from app.schema.streak_schema import StreakSchema
+from app.service.focus_service import FocusService, MAX_SESSIONS_PER_REQUEST
+from app.service.leaderboard_service import LeaderboardService, TIME_BOARDS, STREAK_BOARDS
+
+# Define the focus Blueprint
+focus_bp = Blueprint('focus_bp', __name__)
+
+# Initialize schemas
+user_schema = UserSchema()
+monthtime_schema = MonthTimeSchema()
+dailytime_schema = DailyTimeSchema()
+streak_schema = StreakSchema()
+
+@focus_bp.route('/focus/session', methods=['POST'])
+def create_focus_session():
+    """
+    Records a focus session for a user. The request body must contain
+    `user_id`, `seconds` and `tokens`. In a single transaction, this
+    creates any missing user, current dailytime, current monthtime and
+    streak rows, adds `seconds` and `tokens` to the user, adds `seconds`
+    to the dailytime and monthtime entries and touches the streak.
+
+    Returns the new totals for each of those resources.
+    """
+    data = request.get_json() or {}
+
+    for field in ['user_id', 'seconds', 'tokens']:
+        if field not in data:
+            return jsonify({'message': f'Missing required field: {field}'}), 400
+        if not isinstance(data[field], int) or data[field] < 0:
+            return jsonify({'message': f'Invalid value for {field}. Must be a non-negative integer.'}), 400
+
+    try:
+        user, monthtime, dailytime, streak = FocusService.record_session(data['user_id'], data['seconds'], data['tokens'])
+    except Exception as e:
+        return jsonify({'message': f'Error occurred while recording focus session: {str(e)}'}), 500
+
+    LeaderboardService.set_rows([user, monthtime, dailytime, streak])
+
+    return jsonify({
+        'user': user_schema.dump(user),
+        'monthtime': monthtime_schema.dump(monthtime),
+        'dailytime': dailytime_schema.dump(dailytime),
+        'streak': streak_schema.dump(streak)
+    }), 200
+
+@focus_bp.route('/focus/sessions', methods=['POST'])
+def create_focus_sessions():
+    """
+    Records a batch of focus sessions. The request body must contain a
+    `sessions` array where each entry has `user_id`, `seconds` and
+    `tokens`. All sessions are applied in one transaction with
+    set-based SQL, so the cost does not grow with one round trip per
+    user. At most MAX_SESSIONS_PER_REQUEST sessions are accepted per
+    request; larger flushes should be split into chunks by the caller.
+    """
+    data = request.get_json() or {}
+
+    sessions = data.get('sessions')
+    if not isinstance(sessions, list):
+        return jsonify({'message': 'Missing required field: sessions'}), 400
+
+    if len(sessions) > MAX_SESSIONS_PER_REQUEST:
+        return jsonify({'message': f'Too many sessions. At most {MAX_SESSIONS_PER_REQUEST} are accepted per request.'}), 400
+
+    for session in sessions:
+        if not isinstance(session, dict):
+            return jsonify({'message': 'Each session must be an object'}), 400
+        for field in ['user_id', 'seconds', 'tokens']:
+            if not isinstance(session.get(field), int) or session[field] < 0:
+                return jsonify({'message': f'Each session must have a non-negative integer {field}'}), 400
+
+    try:
+        users_updated = FocusService.record_sessions(sessions)
+    except Exception as e:
+        return jsonify({'message': f'Error occurred while recording focus sessions: {str(e)}'}), 500
+
+    # Apply the known time deltas. Users new to a board start at their
+    # delta, and new users at a trivia count of 0. Streaks are computed
+    # by the database, so only those are read back.
+    deltas = {}
+    for session in sessions:
+        deltas[session['user_id']] = deltas.get(session['user_id'], 0) + session['seconds']
+    for board in TIME_BOARDS:
+        LeaderboardService.add_scores(board, deltas)
+    LeaderboardService.add_scores('trivia', dict.fromkeys(deltas, 0))
+    LeaderboardService.refresh_users(deltas, STREAK_BOARDS)
+
+    return jsonify({'sessions': len(sessions), 'users': users_updated}), 200
@@ -0,0 +1,43 @@
+from flask import Blueprint, Response, jsonify
+from sqlalchemy import text
+from app import db
+from tools.metrics import RequestMetrics, PROMETHEUS_MIMETYPE
+
+# Define health Blueprint
+health_bp = Blueprint('health_bp', __name__)
+
+@health_bp.route('/metrics', methods=['GET'])
+def get_metrics():
+    """
+    Returns the request and connection pool metrics of this process
+    in the Prometheus text format.
+    """
+    return Response(RequestMetrics.render(db.engine.pool), mimetype=PROMETHEUS_MIMETYPE)
+
+@health_bp.route('/healthz', methods=['GET'])
+def get_health():
+    """
+    Liveness check, answers as long as the process serves requests.
+    """
+    return jsonify({'status': 'ok'}), 200
+
+@health_bp.route('/readyz', methods=['GET'])
+def get_ready():
+    """
+    Readiness check. Checks out a pooled connection and runs a trivial
+    query, answering 503 if the database cannot be reached or no
+    connection frees up within the pool timeout.
+    """
+    pool = db.engine.pool
+    state = {
+        'size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'overflow': pool.overflow()
+    }
+    try:
+        with db.engine.connect() as connection:
+            connection.execute(text('SELECT 1'))
+    except Exception as e:
+        return jsonify({'status': 'unavailable', 'message': f'Database is not available: {str(e)}', 'pool': state}), 503
+
+    return jsonify({'status': 'ready', 'pool': state}), 200
@@ -10,6 +10,18 @@ kanban_bp = Blueprint('kanban_bp', __name__)
 kanban_schema = KanbanSchema()
 kanban_many_schema = KanbanSchema(many=True)
 
+# Columns of a Kanban board, in the order they are returned
+KANBAN_COLUMNS = ('todo', 'doing', 'done')
+
+def group_by_column(items):
+    """
+    Returns the serialized items grouped by their column_name.
+    """
+    columns = {column: [] for column in KANBAN_COLUMNS}
+    for item in items:
+        columns[item.column_name].append(item)
+    return {column: kanban_many_schema.dump(column_items) for column, column_items in columns.items()}
+
 @kanban_bp.route('/kanban', methods=['POST'])
 def create_kanban_item():
     """
@@ -56,17 +68,11 @@ def get_user_kanban_items(user_id):
     in the doing list, and a 'done' list, which contains the list
     of all of the user's kanban items in the done list.
     """
-    # Query the KanbanModel to find items by user_id and group by column_name
-    todo_items = KanbanModel.query.filter_by(user_id=user_id, column_name='todo').all()
-    doing_items = KanbanModel.query.filter_by(user_id=user_id, column_name='doing').all()
-    done_items = KanbanModel.query.filter_by(user_id=user_id, column_name='done').all()
+    # Read the user's items in one query and group them by column_name
+    items = KanbanModel.query.filter(KanbanModel.user_id == user_id, KanbanModel.column_name.in_(KANBAN_COLUMNS)).all()
 
     # Return the items grouped by column
-    return jsonify({
-        'todo': kanban_many_schema.dump(todo_items),
-        'doing': kanban_many_schema.dump(doing_items),
-        'done': kanban_many_schema.dump(done_items)
-    }), 200
+    return jsonify(group_by_column(items)), 200
 
 @kanban_bp.route('/kanban/<int:id>', methods=['POST'])
 def move_kanban_item_column(id):
@@ -193,17 +199,13 @@ def delete_completed_kanban_items(user_id):
     Given the user_id, delete all Kanban items that are marked as
     completed (i.e., in the 'done' column).
     """
-    # Query to find all Kanban items in the 'done' column for the user
-    completed_items = KanbanModel.query.filter_by(user_id=user_id, column_name='done').all()
+    # Delete all Kanban items in the 'done' column for the user in one statement
+    deleted = KanbanModel.query.filter_by(user_id=user_id, column_name='done').delete(synchronize_session=False)
 
     # If no completed items are found, return 404
-    if not completed_items:
+    if not deleted:
         return jsonify({'message': 'No completed Kanban items found for this user'}), 404
 
-    # Delete all completed items
-    for item in completed_items:
-        db.session.delete(item)
-
     # Commit the deletions to the database
     db.session.commit()
 
@@ -221,14 +223,12 @@ def get_user_kanban_items_by_tag(user_id, tag_name):
     in the doing list, and a 'done' list, which contains the list
     of all of the user's kanban items in the done list.
     """
-    # Query the KanbanModel to find items by user_id and tag_name, grouped by column_name
-    todo_items = KanbanModel.query.filter_by(user_id=user_id, tag_name=tag_name, column_name='todo').all()
-    doing_items = KanbanModel.query.filter_by(user_id=user_id, tag_name=tag_name, column_name='doing').all()
-    done_items = KanbanModel.query.filter_by(user_id=user_id, tag_name=tag_name, column_name='done').all()
+    # Read the user's items with the tag in one query and group them by column_name
+    items = KanbanModel.query.filter(
+        KanbanModel.user_id == user_id,
+        KanbanModel.tag_name == tag_name,
+        KanbanModel.column_name.in_(KANBAN_COLUMNS)
+    ).all()
 
     # Return the items grouped by column
-    return jsonify({
-        'todo': kanban_many_schema.dump(todo_items),
-        'doing': kanban_many_schema.dump(doing_items),
-        'done': kanban_many_schema.dump(done_items)
-    }), 200
\ No newline at end of file
+    return jsonify(group_by_column(items)), 200
\ No newline at end of file
@@ -0,0 +1,31 @@
+from flask import Blueprint, request, jsonify
+from app.service.leaderboard_service import LeaderboardService, BOARDS
+
+# Define the leaderboard Blueprint
+leaderboard_bp = Blueprint('leaderboard_bp', __name__)
+
+@leaderboard_bp.route('/leaderboard/<board>', methods=['GET'])
+def get_leaderboard(board):
+    """
+    Returns the top users of a leaderboard as a list of `user_id` and
+    `value`, highest value first. The board is one of all, trivia,
+    month, day, streak, highest_streak or rb. The optional `limit`
+    query parameter defaults to 10.
+
+    Boards are served from memory and do not query the database.
+    """
+
+    # Check if the board exists
+    if board not in BOARDS:
+        return jsonify({'message': f'Invalid board: {board}. Must be one of {", ".join(BOARDS)}.'}), 404
+
+    limit = request.args.get('limit', 10, type=int)
+    if limit <= 0:
+        return jsonify({'message': 'Invalid limit value. Must be a positive integer.'}), 400
+
+    try:
+        top = LeaderboardService.get_top(board, limit)
+    except Exception as e:
+        return jsonify({'message': f'Error occurred while retrieving leaderboard: {str(e)}'}), 500
+
+    return jsonify(top), 200
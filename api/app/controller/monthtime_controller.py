@@ -2,9 +2,10 @@ from flask import Blueprint, request, jsonify
 from app.model.monthtime_model import MonthTime
 from app.schema.monthtime_schema import MonthTimeSchema
 from app import db
-from sqlalchemy import desc
+from app.service.leaderboard_service import LeaderboardService, MONTH_BOARDS
 from datetime import datetime
 from tools.utils import DateTimeUtils
+from tools.pagination import PaginationUtils, SortKey
 from tools.log import Logger
 
 # Define monthtime Blueprint for routes
@@ -12,7 +13,6 @@ monthtime_bp = Blueprint('monthtime_bp', __name__)
 
 # Initialize MonthSchema
 monthtime_schema = MonthTimeSchema()
-monthtimes_schema = MonthTimeSchema(many=True)
 
 # Endpoint to retrieve monthtime column by full primary key
 @monthtime_bp.route('/monthtime', methods=['GET'])
@@ -72,6 +72,7 @@ def create_monthtime(user_id):
 
     db.session.add(new_monthtime)
     db.session.commit()
+    LeaderboardService.set_rows([new_monthtime])
 
     result = monthtime_schema.dump(new_monthtime)
     return jsonify(result), 201
@@ -112,6 +113,7 @@ def create_monthtime_specific():
 
     db.session.add(new_monthtime)
     db.session.commit()
+    LeaderboardService.set_rows([new_monthtime])
 
     result = monthtime_schema.dump(new_monthtime)
     return jsonify(result), 201
@@ -122,18 +124,20 @@ def update_monthtime_stime(user_id):
     # Use the utility method to get the current UTC date
     mth, yr = DateTimeUtils.get_utc_month_year_now()
 
-    monthtime_record = MonthTime.query.filter_by(user_id=user_id, mth=mth, yr=yr).first()
-
-    if monthtime_record is None:
-        return jsonify({'error': f'No MonthTime record found for today: {mth}/{yr}'}), 404
-
     add_stime = request.json.get('stime')
     if add_stime is None:
         return jsonify({'error': 'Missing required field: stime'}), 400
 
-    monthtime_record.stime += add_stime
+    # Add stime with a single UPDATE so concurrent writes are not lost
+    updated = MonthTime.query.filter_by(user_id=user_id, mth=mth, yr=yr).update(
+        {MonthTime.stime: MonthTime.stime + add_stime}, synchronize_session=False)
 
+    if updated == 0:
+        return jsonify({'error': f'No MonthTime record found for today: {mth}/{yr}'}), 404
+
+    monthtime_record = MonthTime.query.get((user_id, mth, yr))
     db.session.commit()
+    LeaderboardService.set_rows([monthtime_record])
 
     result = monthtime_schema.dump(monthtime_record)
     return jsonify(result), 200
@@ -184,36 +188,27 @@ def search_monthtime():
         else:
             return jsonify({'message': f'Invalid condition: {cond}'}), 400
 
-    # Always sort by stime in descending order
-    query = query.order_by(desc(MonthTime.stime))
+    # Always sort by stime in descending order, ties by user_id
+    keys = [SortKey(MonthTime.stime, descending=True), SortKey(MonthTime.user_id, descending=True)]
 
-    # Apply the limit if provided
-    limit = data.get('limit')
-    if limit is not None:
-        try:
-            limit = int(limit)
-            query = query.limit(limit)
-        except ValueError:
-            return jsonify({'message': 'Invalid limit value. Must be an integer.'}), 400
-
-    monthtime_entries = query.all()
-    return jsonify(monthtimes_schema.dump(monthtime_entries)), 200
+    # Return one page of entries, or stream every match
+    try:
+        return PaginationUtils.search_response(query, keys, data, monthtime_schema.dump)
+    except ValueError as e:
+        return jsonify({'message': f'Invalid limit or cursor: {str(e)}'}), 400
 
 # Endpoint to delete all MonthTime entries for a specific user_id
 @monthtime_bp.route('/monthtime/<int:user_id>', methods=['DELETE'])
 def delete_monthtime_by_user_id(user_id):
-    # Query all MonthTime records for the given user_id
-    monthtime_records = MonthTime.query.filter_by(user_id=user_id).all()
+    # Delete all MonthTime records for the given user_id in one statement
+    deleted = MonthTime.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
-    # Check if any records exist
-    if not monthtime_records:
+    # Check if any records existed
+    if not deleted:
         return jsonify({'error': f'No MonthTime records found for user with id: {user_id}'}), 404
 
-    # Delete all found records
-    for record in monthtime_records:
-        db.session.delete(record)
-
     db.session.commit()
+    LeaderboardService.remove_users([user_id], MONTH_BOARDS)
 
     # Return 204 No Content
     return '', 204
\ No newline at end of file
@@ -0,0 +1,21 @@
+from flask import Blueprint, jsonify
+from app.service.profile_service import ProfileService
+
+# Define the profile Blueprint
+profile_bp = Blueprint('profile_bp', __name__)
+
+@profile_bp.route('/profile/<int:user_id>', methods=['GET'])
+def get_profile(user_id):
+    """
+    Returns every field needed to display a user's profile and
+    achievements: user totals, current month and day focus time,
+    streak, Rogue Boss xp, accomplishments, earned achievement ids and
+    the earned and total achievement counts.
+    This endpoint is read-only; the displayed current streak is 0 if
+    the streak has lapsed.
+    """
+    profile = ProfileService.get_profile(user_id)
+    if profile is None:
+        return jsonify({'message': 'User not found'}), 404
+
+    return jsonify(profile), 200
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from app.model.rbuser_model import RogueBossUserModel
 from app.schema.rbuser_schema import RogueBossUserSchema
 from app import db
+from app.service.leaderboard_service import LeaderboardService, RB_BOARDS
 from sqlalchemy import desc
 
 # Define Rogue Boss user Blueprint
@@ -52,6 +53,7 @@ def create_rogue_boss_user():
     # Write the new Rogue Boss user to the database
     db.session.add(new_rb_user)
     db.session.commit()
+    LeaderboardService.set_rows([new_rb_user])
 
     return jsonify(rogue_boss_user_schema.dump(new_rb_user))
 
@@ -100,17 +102,17 @@ def add_xp_to_rogue_boss_user(user_id):
     if 'xp' not in data or not isinstance(data['xp'], int):
         return jsonify({'message': 'Invalid or missing xp value'}), 400
     
-    # Query the RogueBossUserModel to find the user by the given ID
-    rb_user = RogueBossUserModel.query.get(user_id)
-    if rb_user is None:
+    # Add the specified xp to the user's current xp with a single UPDATE
+    updated = RogueBossUserModel.query.filter_by(user_id=user_id).update(
+        {RogueBossUserModel.xp: RogueBossUserModel.xp + data['xp']}, synchronize_session=False)
+    if updated == 0:
         # Return a 404 error if the Rogue Boss User is not found
         return jsonify({'message': f'Rogue Boss User not found for user_id {user_id}'}), 404
-    
-    # Add the specified xp to the user's current xp
-    rb_user.xp += data['xp']
 
-    # Commit the changes to the database
+    # Read back the new xp, then commit the changes to the database
+    rb_user = RogueBossUserModel.query.get(user_id)
     db.session.commit()
+    LeaderboardService.set_rows([rb_user])
 
     # Serialize the updated rb_user object to JSON format using the schema
     return jsonify(rogue_boss_user_schema.dump(rb_user)), 200
@@ -126,6 +128,7 @@ def delete_rogue_boss_user(user_id):
     
     db.session.delete(rb_user)
     db.session.commit()
+    LeaderboardService.remove_users([user_id], RB_BOARDS)
 
     # Return 204 No Content
     return '', 204
@@ -1,7 +1,9 @@
 from flask import Blueprint, request, jsonify
 from app.model.reminder_model import ReminderModel
 from app.schema.reminder_schema import ReminderSchema
+from app.service.reminder_service import ReminderService, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, MAX_ADVANCE_SIZE
 from app import db
+from tools.ndjson import NdjsonUtils
 
 from datetime import datetime
 
@@ -34,7 +36,8 @@ def create_reminder():
         remind_at=data['remind_at'],
         repeat_interval=data.get('repeat_interval'),
         repeat_until=data.get('repeat_until'),
-        repeat_count=data.get('repeat_count')
+        repeat_count=data.get('repeat_count'),
+        anchor_day=ReminderService.parse_remind_at(data['remind_at']).day
     )
 
     # Add and commit the reminder to the database
@@ -74,6 +77,75 @@ def get_all_reminders():
     return jsonify(reminders_schema.dump(reminders)), 200
 
 
+# Endpoint to stream reminders due within a window
+@reminder_bp.route('/reminder/due', methods=['GET'])
+def get_due_reminders():
+    """
+    Streams the reminders due before `before` as newline-delimited
+    JSON, one reminder per line, ordered by remind_at then id. The
+    optional `after` parameter skips reminders due before it.
+
+    Reminders are returned in pages of `limit`. To read the next page,
+    pass the `cursor` of the last reminder returned, which is its
+    remind_at and id joined by an underscore (e.g.
+    2024-09-22T10:00:00_42). A page with fewer than `limit` reminders
+    is the last page.
+    """
+    before = request.args.get('before')
+    if not before:
+        return jsonify({"message": "The 'before' query parameter is required."}), 400
+
+    try:
+        before = ReminderService.parse_remind_at(before)
+        after = request.args.get('after')
+        after = ReminderService.parse_remind_at(after) if after else None
+    except ValueError:
+        return jsonify({"message": "Invalid date format. Use 'YYYY-MM-DDTHH:MM:SS'."}), 400
+
+    cursor = request.args.get('cursor')
+    try:
+        cursor = ReminderService.decode_cursor(cursor) if cursor else None
+    except ValueError:
+        return jsonify({"message": "Invalid cursor."}), 400
+
+    limit = request.args.get('limit', DEFAULT_PAGE_SIZE, type=int)
+    if limit <= 0 or limit > MAX_PAGE_SIZE:
+        return jsonify({"message": f"Invalid limit value. Must be between 1 and {MAX_PAGE_SIZE}."}), 400
+
+    # Read the page, then stream its serialization
+    reminders = ReminderService.get_due_reminders(before, after, cursor, limit)
+    return NdjsonUtils.response(reminders, reminder_schema.dump)
+
+
+# Endpoint to advance a batch of fired reminders
+@reminder_bp.route('/reminder/advance', methods=['POST'])
+def advance_reminders():
+    """
+    Advances the fired reminders in the `ids` list of the request body
+    to their next occurrence. Reminders that do not repeat, or have no
+    occurrence left within repeat_until and repeat_count, are deleted.
+
+    Returns the updated reminders and the ids of the deleted ones.
+    """
+    data = request.get_json()
+    ids = data.get('ids') if data else None
+
+    # Validate the list of ids
+    if not isinstance(ids, list) or not all(isinstance(id, int) for id in ids):
+        return jsonify({"message": "The 'ids' field must be a list of reminder ids."}), 400
+    if len(ids) > MAX_ADVANCE_SIZE:
+        return jsonify({"message": f"At most {MAX_ADVANCE_SIZE} reminders can be advanced at once."}), 400
+
+    try:
+        updated, deleted_ids = ReminderService.advance_reminders(ids)
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({"message": f"Error occurred while advancing reminders: {str(e)}"}), 500
+
+    return jsonify({'updated': reminders_schema.dump(updated), 'deleted': deleted_ids}), 200
+
+
 # Endpoint to retrieve a reminder by its ID
 @reminder_bp.route('/reminder/<int:id>', methods=['GET'])
 def get_reminder(id):
@@ -152,6 +224,7 @@ def update_reminder_date(id):
 
     # Update the remind_at field of the reminder
     reminder.remind_at = updated_remind_at.isoformat()  # Convert back to ISO format string
+    reminder.anchor_day = updated_remind_at.day
 
     # Commit the changes to the database
     db.session.commit()
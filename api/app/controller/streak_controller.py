@@ -1,15 +1,16 @@
 from flask import Blueprint, request, jsonify
 from app.model.streak_model import StreakModel
 from app.schema.streak_schema import StreakSchema
+from app.service.streak_service import StreakService
+from app.service.leaderboard_service import LeaderboardService
 from app import db
-from datetime import datetime, timezone, timedelta
+from tools.pagination import PaginationUtils, SortKey
 
 # Define the streak Blueprint
 streak_bp = Blueprint('streak_bp', __name__)
 
 # Initialize StreakSchema
 streak_schema = StreakSchema()
-streaks_schema = StreakSchema(many=True)
 
 @streak_bp.route('/streak/<int:user_id>', methods=['POST'])
 def set_user_streak(user_id):
@@ -31,46 +32,20 @@ def set_user_streak(user_id):
     - If the user streak's previous_connection_date is more than two days past the
     current date, we will set the current_streak value to 0.
     """
-    # Fetch the current UTC date
-    current_date = datetime.now(timezone.utc).date()
+    # Apply the streak rules for the current UTC date
+    streak, created, updated = StreakService.touch_streak(user_id)
 
-    # Query the StreakModel to find the streak by user_id
-    streak = StreakModel.query.get(user_id)
-
-    if streak is None:
-        # If no streak exists, create a new one with default values
-        new_streak = StreakModel(
-            user_id=user_id,
-            current_streak=0,
-            previous_connection_date=current_date,
-            highest_streak_achieved=0
-        )
-        db.session.add(new_streak)
+    if created:
         db.session.commit()
-        return jsonify(streak_schema.dump(new_streak)), 201
-
-    # If streak exists, check the conditions for updating the streak
-    last_login_date = streak.previous_connection_date
+        LeaderboardService.set_rows([streak])
+        return jsonify(streak_schema.dump(streak)), 201
 
-    if last_login_date == current_date:
+    if not updated:
         # Do nothing if the current date is the same as the last login date
         return jsonify({'message': f'Streak already updated for today for {user_id}'}), 200
 
-    elif last_login_date == current_date - timedelta(days=1):
-        # Increment current streak if the last login date was yesterday
-        streak.current_streak += 1
-
-        # Update highest streak if the current streak exceeds it
-        if streak.current_streak > streak.highest_streak_achieved:
-            streak.highest_streak_achieved = streak.current_streak
-
-    else:
-        # Reset the current streak to 0 if more than one day has passed
-        streak.current_streak = 0
-
-    # Update the previous login date to the current date
-    streak.previous_connection_date = current_date
     db.session.commit()
+    LeaderboardService.set_rows([streak])
 
     return jsonify(streak_schema.dump(streak)), 200
 
@@ -97,15 +72,16 @@ def search_streaks():
     request body. This `search_field` can either be the
     `highest_streak_achieved` field or the `current_streak` field.
     
-    Optionally, a `limit` field can be provided to restrict the
-    number of results returned.
+    Results are returned in pages of `limit`, 10 by default. The cursor
+    of the next page is returned in the X-Next-Cursor header and can be
+    passed back as `cursor`. If `stream` is true, every result is
+    streamed as newline-delimited JSON instead.
     """
     # Get the request JSON data
     data = request.get_json()
 
     # Validate that search_field is provided
     search_field = data.get('search_field')
-    limit = data.get('limit', 10)  # Optional limit field, defaults to None
 
     if not search_field:
         return jsonify({'message': 'Missing search_field'}), 400
@@ -114,22 +90,14 @@ def search_streaks():
     if search_field not in ['highest_streak_achieved', 'current_streak']:
         return jsonify({'message': 'Invalid search_field. Must be either "highest_streak_achieved" or "current_streak"'}), 400
 
+    # Sort by the search_field in descending order, ties by user_id
+    keys = [SortKey(getattr(StreakModel, search_field), descending=True), SortKey(StreakModel.user_id, descending=True)]
+
     try:
-        # Build the query based on the search_field
-        query = StreakModel.query.order_by(getattr(StreakModel, search_field).desc())
-        
-        if limit is not None:
-            # Apply the limit to the query if provided
-            query = query.limit(limit)
-        
-        streaks = query.all()
-        
+        return PaginationUtils.search_response(StreakModel.query, keys, data, streak_schema.dump,
+                                               default_page_size=10, empty_message='No streaks found matching the criteria.')
+    except ValueError as e:
+        return jsonify({'message': f'Invalid limit or cursor: {str(e)}'}), 400
     except Exception as e:
         return jsonify({'message': 'Error occurred during streak search.'}), 500
 
-    if not streaks:
-        return jsonify({'message': 'No streaks found matching the criteria.'}), 404
-
-    # Serialize the results
-    return jsonify(streaks_schema.dump(streaks)), 200
-
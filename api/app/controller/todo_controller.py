@@ -139,16 +139,13 @@ def delete_old_completed_todo_items(user_id):
     # Calculate the date of yesterday
     yesterday = datetime.utcnow().date() - timedelta(days=1)
 
-    # Query and delete completed todo items older than yesterday for the user
-    old_todos = TodoModel.query.filter(TodoModel.user_id == user_id, TodoModel.completed_date <= yesterday).all()
+    # Delete completed todo items older than yesterday for the user in one statement
+    deleted = TodoModel.query.filter(TodoModel.user_id == user_id, TodoModel.completed_date <= yesterday).delete(synchronize_session=False)
 
     # If no old todos are found, return 404
-    if not old_todos:
+    if not deleted:
         return jsonify({'message': 'No old completed todo items found to delete'}), 404
 
-    for todo in old_todos:
-        db.session.delete(todo)
-
     # Commit the deletion to the database
     db.session.commit()
 
@@ -160,17 +157,13 @@ def delete_all_todo_items_by_user_id(user_id):
     """
     Given the user_id, delete all todo items associated with the user.
     """
-    # Query the TodoModel to find all todo items by user_id
-    todos = TodoModel.query.filter_by(user_id=user_id).all()
+    # Delete all todo items of the user in one statement
+    deleted = TodoModel.query.filter_by(user_id=user_id).delete(synchronize_session=False)
 
     # If no todos are found, return 404
-    if not todos:
+    if not deleted:
         return jsonify({'message': f'No todo items found for user_id {user_id}'}), 404
 
-    # Delete all found todo items from the database
-    for todo in todos:
-        db.session.delete(todo)
-
     # Commit the deletion to the database
     db.session.commit()
 
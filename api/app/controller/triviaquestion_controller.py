@@ -1,29 +1,112 @@
 from flask import Blueprint, request, jsonify
 from app.model.triviaquestion_model import TriviaQuestion
 from app.schema.triviaquestion_schema import TriviaQuestionSchema
+from app.model.triviaseen_model import TriviaSeen
+from app.service.trivia_service import TriviaService, MAX_BATCH_SIZE
+from app.service.leaderboard_service import LeaderboardService
 from app import db
-from sqlalchemy.sql.expression import func
 
 # Define triviaquestion Blueprint
 triviaquestion_bp = Blueprint('triviaquestion_bp', __name__)
 
 # Initialize trivia question schema
 triviaquestion_schema = TriviaQuestionSchema()
+triviaquestions_schema = TriviaQuestionSchema(many=True)
+
+def get_random_questions_for_request(count):
+    """
+    Picks random questions using the optional `category`, `author`
+    and `user_id` query parameters. When `user_id` is given, only
+    questions the user has not answered are picked while any remain.
+    """
+    category = request.args.get('category')
+    author = request.args.get('author')
+    user_id = request.args.get('user_id', type=int)
+    if user_id is not None:
+        return TriviaService.get_random_unseen_questions(user_id, count, category, author)
+    return TriviaService.get_random_questions(count, category, author)
 
 @triviaquestion_bp.route('/trivia', methods=['GET'])
 def get_random_trivia_question():
     """
-    Gets a random trivia question from the database.
+    Gets a random trivia question from the database. The optional
+    `category` and `author` query parameters filter the question, and
+    the optional `user_id` query parameter picks a question the user
+    has not answered yet.
     """
-    # Query the database for a random trivia question
-    triviaquestion = TriviaQuestion.query.order_by(func.rand()).first()
+    # Pick a random trivia question from the in-memory id pool
+    triviaquestions = get_random_questions_for_request(1)
 
-    if triviaquestion is None:
+    if not triviaquestions:
         # Return a 404 error if no trivia question is found
         return jsonify({'message': 'No trivia questions found'}), 404
     
     # If found, serialize the triviaquestion object to JSON using the schema
-    return jsonify(triviaquestion_schema.dump(triviaquestion))
+    return jsonify(triviaquestion_schema.dump(triviaquestions[0]))
+
+@triviaquestion_bp.route('/trivia/random', methods=['GET'])
+def get_random_trivia_questions():
+    """
+    Gets a batch of distinct random trivia questions. The `count`
+    query parameter sets the number of questions (default 1, at most
+    MAX_BATCH_SIZE), the optional `category` and `author` query
+    parameters filter the questions and the optional `user_id` query
+    parameter picks questions the user has not answered yet. Fewer
+    questions are returned if not enough match.
+    """
+    count = request.args.get('count', 1, type=int)
+    if count <= 0 or count > MAX_BATCH_SIZE:
+        return jsonify({'message': f'Invalid count value. Must be between 1 and {MAX_BATCH_SIZE}.'}), 400
+
+    triviaquestions = get_random_questions_for_request(count)
+    return jsonify(triviaquestions_schema.dump(triviaquestions)), 200
+
+@triviaquestion_bp.route('/trivia/<int:id>/answer', methods=['POST'])
+def answer_trivia_question(id):
+    """
+    Records a user's answer to the trivia question matching the id in
+    the path. The request body must contain `user_id` and `selection`,
+    the index of the selected option. The question is marked as seen
+    by the user and, if the selection is correct, the user's trivia
+    count is incremented.
+    """
+    data = request.get_json() or {}
+
+    for field in ['user_id', 'selection']:
+        if not isinstance(data.get(field), int):
+            return jsonify({'message': f'Invalid or missing {field}. Must be an integer.'}), 400
+
+    # Query the trivia question model to find the trivia question by the given ID
+    triviaquestion = TriviaQuestion.query.get(id)
+    if triviaquestion is None:
+        return jsonify({'message': 'Trivia question not found'}), 404
+
+    try:
+        correct, trivia, seen = TriviaService.answer_question(data['user_id'], triviaquestion, data['selection'])
+        db.session.commit()
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'message': f'Error occurred while answering trivia question: {str(e)}'}), 500
+
+    if correct:
+        LeaderboardService.set_scores('trivia', {data['user_id']: trivia})
+
+    return jsonify({'correct': correct, 'trivia': trivia, 'seen': seen}), 200
+
+@triviaquestion_bp.route('/trivia/seen/<int:user_id>', methods=['GET'])
+def get_trivia_seen(user_id):
+    """
+    Gets the number of distinct trivia questions the user has answered
+    and the number of questions in the database.
+    """
+    seen_row = TriviaSeen.query.get(user_id)
+    TriviaService.ensure_loaded()
+
+    return jsonify({
+        'user_id': user_id,
+        'seen': seen_row.seen_count if seen_row is not None else 0,
+        'total': TriviaService.get_question_count()
+    }), 200
 
 @triviaquestion_bp.route('/trivia/<int:id>', methods=['GET'])
 def get_trivia_question(id):
@@ -67,6 +150,7 @@ def create_trivia_question():
     # Add the new trivia question to the session and commit to the database
     db.session.add(new_trivia_question)
     db.session.commit()
+    TriviaService.add_question(new_trivia_question)
 
     # Return the created trivia question as a response
     return jsonify(triviaquestion_schema.dump(new_trivia_question)), 201
@@ -102,6 +186,7 @@ def overwrite_trivia_question(id):
 
     # Commit the changes to the database
     db.session.commit()
+    TriviaService.add_question(triviaquestion)
 
     # Return the updated trivia question as a response
     return jsonify(triviaquestion_schema.dump(triviaquestion)), 200
@@ -120,6 +205,7 @@ def delete_trivia_question(id):
     # Delete the trivia question from the session and commit to the database
     db.session.delete(triviaquestion)
     db.session.commit()
+    TriviaService.remove_question(id)
 
     # Return 204 No Content
     return '', 204
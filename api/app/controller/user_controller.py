@@ -1,15 +1,24 @@
 from flask import Blueprint, request, jsonify
 from app.model.user_model import User
 from app.schema.user_schema import UserSchema
+from app.schema.monthtime_schema import MonthTimeSchema
+from app.schema.dailytime_schema import DailyTimeSchema
+from app.schema.streak_schema import StreakSchema
+from app.service.user_service import UserService
 from app import db
-from sqlalchemy import desc  # Import desc for descending order
+from app.service.leaderboard_service import LeaderboardService
+from tools.etag import EtagUtils
+from tools.json_provider import prefers_msgpack
+from tools.pagination import PaginationUtils, SortKey
 
 # Define a new Blueprint for user-related routes
 user_bp = Blueprint('user_bp', __name__)
 
 # Initialize UserSchema
 user_schema = UserSchema()
-users_schema = UserSchema(many=True)
+monthtime_schema = MonthTimeSchema()
+dailytime_schema = DailyTimeSchema()
+streak_schema = StreakSchema()
 
 # Endpoint to retrieve a user by ID
 @user_bp.route('/user/<int:id>', methods=['GET'])
@@ -20,8 +29,17 @@ def get_user(id):
         # Return a 404 error if the user is not found
         return jsonify({'message': 'User not found'}), 404
 
+    # Skip serialization if the caller already has this version of the
+    # user, in the same representation
+    etag = EtagUtils.make_etag(user.id, user.tokens, user.stime, user.timezone, user.hex, user.trivia, prefers_msgpack(request.accept_mimetypes))
+    not_modified = EtagUtils.not_modified(etag)
+    if not_modified is not None:
+        return not_modified
+
     # Serialize the user object to JSON format using the UserSchema
-    return jsonify(user_schema.dump(user))
+    response = jsonify(user_schema.dump(user))
+    response.set_etag(etag)
+    return response
 
 # Endpoint to create a new user
 @user_bp.route('/user', methods=['POST'])
@@ -43,6 +61,7 @@ def create_user():
     
     db.session.add(new_user)
     db.session.commit()
+    LeaderboardService.set_rows([new_user])
 
     return jsonify(user_schema.dump(new_user)), 201
 
@@ -66,6 +85,7 @@ def update_user(id):
     user.trivia = data.get('trivia')
 
     db.session.commit()
+    LeaderboardService.set_rows([user])
 
     return jsonify(user_schema.dump(user))
 
@@ -94,6 +114,7 @@ def partial_update_user(id):
         user.trivia = data.get('trivia')
 
     db.session.commit()
+    LeaderboardService.set_rows([user], data)
 
     return jsonify(user_schema.dump(user))
 
@@ -106,6 +127,9 @@ def delete_user(id):
 
     db.session.delete(user)
     db.session.commit()
+    # The user's rows in the other tables reference it, so a user that
+    # could be deleted has no score left on any board
+    LeaderboardService.remove_users([id])
 
     # Return 204 No Content
     return '', 204
@@ -131,14 +155,67 @@ def set_user_timezone(id):
 
     return jsonify(user_schema.dump(user))
 
+# Increment endpoint
+@user_bp.route('/user/<int:id>/increment', methods=['PATCH'])
+def increment_user(id):
+    """
+    Atomically adds deltas to the user's counters. The request body
+    may contain any of `tokens`, `stime` and `trivia`, where each value
+    is the integer amount to add (negative to subtract). Returns the
+    user with the new totals.
+    """
+    data = request.get_json() or {}
+
+    deltas = {}
+    for field in ['tokens', 'stime', 'trivia']:
+        if field in data:
+            if not isinstance(data[field], int):
+                return jsonify({'message': f'Invalid value for {field}. Must be an integer.'}), 400
+            deltas[field] = data[field]
+
+    if not deltas:
+        return jsonify({'message': 'At least one of tokens, stime or trivia is required'}), 400
+
+    user = UserService.increment_user(id, **deltas)
+    if user is None:
+        db.session.rollback()
+        return jsonify({'message': 'User not found'}), 404
+
+    db.session.commit()
+    LeaderboardService.set_rows([user], deltas)
+
+    return jsonify(user_schema.dump(user))
+
+# Ensure endpoint
+@user_bp.route('/user/<int:id>/ensure', methods=['PUT'])
+def ensure_user(id):
+    """
+    Idempotently creates any missing user, current monthtime, current
+    dailytime and streak rows for the user in one transaction, then
+    returns the combined state of all four.
+    """
+    try:
+        user, monthtime, dailytime, streak, created = UserService.ensure_user(id)
+    except Exception as e:
+        return jsonify({'message': f'Unable to ensure user {id}: {str(e)}'}), 500
+
+    # Only rows created by this call add the user to a board
+    LeaderboardService.set_rows(created)
+
+    return jsonify({
+        'user': user_schema.dump(user),
+        'monthtime': monthtime_schema.dump(monthtime),
+        'dailytime': dailytime_schema.dump(dailytime),
+        'streak': streak_schema.dump(streak)
+    }), 200
+
 # Search endpoint
 @user_bp.route('/user/search', methods=['POST'])
 def search_users():
     data = request.get_json()
 
-    # Optional conditions and limit
+    # Optional conditions and sort field
     conditions = data.get('conditions', [])
-    limit = data.get('limit')
     sort_field = data.get('sort_field')  # Change this to match your request body
 
     query = User.query
@@ -182,28 +259,26 @@ def search_users():
         else:
             return jsonify({'message': f'Invalid condition: {cond}'}), 400
 
-    # Apply sorting if provided (highest to lowest)
+    # Apply sorting if provided (highest to lowest), ties and unsorted
+    # searches are ordered by id so every user has a distinct position
     if sort_field:
         if sort_field == 'stime':
-            sort_column = User.stime
+            sort_key = SortKey(User.stime, descending=True)
         elif sort_field == 'trivia':
-            sort_column = User.trivia
+            sort_key = SortKey(User.trivia, descending=True, default=0)
         elif sort_field == 'tokens':
-            sort_column = User.tokens
+            sort_key = SortKey(User.tokens, descending=True)
         elif sort_field == 'hex':
-            sort_column = User.hex
+            sort_key = SortKey(User.hex, descending=True, default='')
         else:
             return jsonify({'message': f'Invalid sort field: {sort_field}'}), 400
 
-        query = query.order_by(desc(sort_column))  # Ensure sorting is in descending order
-
-    # Apply the limit if provided
-    if limit is not None:
-        try:
-            limit = int(limit)
-            query = query.limit(limit)
-        except ValueError:
-            return jsonify({'message': 'Invalid limit value. Must be an integer.'}), 400
+        keys = [sort_key, SortKey(User.id, descending=True)]
+    else:
+        keys = [SortKey(User.id)]
 
-    users = query.all()
-    return jsonify(users_schema.dump(users))
+    # Return one page of users, or stream every match
+    try:
+        return PaginationUtils.search_response(query, keys, data, user_schema.dump)
+    except ValueError as e:
+        return jsonify({'message': f'Invalid limit or cursor: {str(e)}'}), 400
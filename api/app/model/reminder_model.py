@@ -12,5 +12,6 @@ class ReminderModel(db.Model):
     repeat_interval = db.Column(db.String(50), nullable=True)
     repeat_until = db.Column(db.DateTime, nullable=True)  # NULL means no end
     repeat_count = db.Column(db.Integer, nullable=True)  # NULL means indefinite
+    anchor_day = db.Column(db.SmallInteger, nullable=True)  # Day of the month monthly and yearly repeats return to, NULL means the day of remind_at
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
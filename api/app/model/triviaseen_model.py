@@ -0,0 +1,8 @@
+from app import db
+
+class TriviaSeen(db.Model):
+    __tablename__ = 'triviaseen'
+
+    user_id = db.Column(db.BigInteger, db.ForeignKey('user.id'), primary_key=True)
+    seen = db.Column(db.LargeBinary, nullable=False)
+    seen_count = db.Column(db.Integer, nullable=False, default=0)
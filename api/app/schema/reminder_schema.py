@@ -1,18 +1,12 @@
 from marshmallow import Schema, fields, validate, ValidationError
-import re
+from tools.recurrence import Recurrence
 
-# Custom validator for combinations of mtwhfsu
+# Custom validator for the intervals supported by the recurrence engine
 def validate_repeat_interval(value):
-    # Allow standard intervals
-    standard_intervals = ['daily', 'weekly', 'monthly', 'yearly']
-    if value in standard_intervals:
+    if Recurrence.is_valid(value):
         return True
     
-    # Regex pattern to match any combination of mtwhfsu
-    if re.fullmatch(r'[mtwhfsu]+', value):
-        return True
-    
-    raise ValidationError(f"Invalid repeat_interval: {value}. Must be a valid combination of 'mtwhfsu' or a standard interval (daily, weekly, monthly, yearly).")
+    raise ValidationError(f"Invalid repeat_interval: {value}. Must be a valid combination of 'mtwhfsu', a weekday interval (every_monday, ...), or a standard interval (daily, every_other_day, weekly, monthly, yearly).")
 
 class ReminderSchema(Schema):
     id = fields.Int(dump_only=True)
@@ -0,0 +1,391 @@
+import math
+import operator
+from sqlalchemy import and_
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from app import db
+from app.model.user_model import User
+from app.model.monthtime_model import MonthTime
+from app.model.streak_model import StreakModel
+from app.model.rbuser_model import RogueBossUserModel
+from app.model.achievement_model import Achievement
+from tools.utils import DateTimeUtils
+
+# Alder achievement catalogue. Each achievement belongs to a category
+# whose metric is compared against `value` to decide if it is earned.
+ACHIEVEMENTS = [
+    {
+        'id': 0,
+        'category': 'all_focus',
+        'title': 'Tenfold Tenacity',
+        'desc': 'Accumulate 10 hours total of focus time.',
+        'value': 10
+    },
+    {
+        'id': 1,
+        'category': 'all_focus',
+        'title': 'Fifty-Hour Focus Feat',
+        'desc': 'Accumulate 50 hours total of focus time.',
+        'value': 50
+    },
+    {
+        'id': 2,
+        'category': 'all_focus',
+        'title': 'Centennial Concentration',
+        'desc': 'Accumulate 100 hours total of focus time.',
+        'value': 100
+    },
+    {
+        'id': 3,
+        'category': 'all_focus',
+        'title': 'Focused Endeavor',
+        'desc': 'Accumulate 500 hours total of focus time.',
+        'value': 500
+    },
+    {
+        'id': 4,
+        'category': 'all_focus',
+        'title': 'Thousand-Hour Triumph',
+        'desc': 'Accumulate 1000 hours total of focus time.',
+        'value': 1000
+    },
+    {
+        'id': 5,
+        'category': 'all_focus',
+        'title': 'Dual Millennia of Diligence',
+        'desc': 'Accumulate 2000 hours total of focus time.',
+        'value': 2000
+    },
+    {
+        'id': 6,
+        'category': 'all_focus',
+        'title': 'Pentagram of Persistence',
+        'desc': 'Accumulate 5000 hours total of focus time.',
+        'value': 5000
+    },
+    {
+        'id': 7,
+        'category': 'month_focus',
+        'title': "Journey's Start",
+        'desc': 'Achieve "Novice" focus role (Accumulate 3+ focus hours in a single month).',
+        'value': 3
+    },
+    {
+        'id': 8,
+        'category': 'month_focus',
+        'title': 'Continued Consistency',
+        'desc': 'Achieve "Intermediate" focus role (Accumulate 10+ focus hours in a single month).',
+        'value': 10
+    },
+    {
+        'id': 9,
+        'category': 'month_focus',
+        'title': 'Advancing Focus',
+        'desc': 'Achieve "Advanced" focus role (Accumulate 25+ focus hours in a single month).',
+        'value': 25
+    },
+    {
+        'id': 10,
+        'category': 'month_focus',
+        'title': 'Expertise Attained',
+        'desc': 'Achieve "Expert" focus role (Accumulate 60+ focus hours in a single month).',
+        'value': 60
+    },
+    {
+        'id': 11,
+        'category': 'month_focus',
+        'title': 'Masterful Focus',
+        'desc': 'Achieve "Master" focus role (Accumulate 100+ focus hours in a single month).',
+        'value': 100
+    },
+    {
+        'id': 12,
+        'category': 'month_focus',
+        'title': 'Narlock Focus Trailblazer',
+        'desc': 'Achieve "Narlock Scholar" focus role (Accumulate 250+ focus hours in a single month).',
+        'value': 250
+    },
+    {
+        'id': 13,
+        'category': 'study_streak',
+        'title': 'Steadfast Starter',
+        'desc': 'Obtain a study streak of 3 days (Join a study room for 3 days in a row).',
+        'value': 3
+    },
+    {
+        'id': 14,
+        'category': 'study_streak',
+        'title': 'Diligent Scholar',
+        'desc': 'Obtain a study streak of 10 days (Join a study room for 10 days in a row).',
+        'value': 10
+    },
+    {
+        'id': 15,
+        'category': 'study_streak',
+        'title': 'Consistent Learner',
+        'desc': 'Obtain a study streak of 30 days (Join a study room for 30 days in a row).',
+        'value': 30
+    },
+    {
+        'id': 16,
+        'category': 'study_streak',
+        'title': 'Study Room Centurion',
+        'desc': 'Obtain a study streak of 100 days (Join a study room for 100 days in a row).',
+        'value': 100
+    },
+    {
+        'id': 17,
+        'category': 'study_streak',
+        'title': 'Yearlong Study Sentinel',
+        'desc': 'Obtain a study streak of 365 days (Join a study room for 365 days in a row).',
+        'value': 365
+    },
+    {
+        'id': 18,
+        'category': 'trivia',
+        'title': 'Knowledge Curator',
+        'desc': 'Answer 25 Trivia questions correctly (via `/trivia`)',
+        'value': 25
+    },
+    {
+        'id': 19,
+        'category': 'trivia',
+        'title': 'Mind Sharpshooter',
+        'desc': 'Answer 50 Trivia questions correctly (via `/trivia`)',
+        'value': 50
+    },
+    {
+        'id': 20,
+        'category': 'trivia',
+        'title': 'Wisdom Virtuoso',
+        'desc': 'Answer 100 Trivia questions correctly (via `/trivia`)',
+        'value': 100
+    },
+    {
+        'id': 21,
+        'category': 'rb_xp',
+        'title': 'Rogue Apprentice',
+        'desc': 'Achieve level 3 in Rogue Boss (32+ XP)',
+        'value': 32
+    },
+    {
+        'id': 22,
+        'category': 'rb_xp',
+        'title': 'Decade Attained',
+        'desc': 'Achieve level 10 in Rogue Boss (1427+ XP)',
+        'value': 1427
+    },
+    {
+        'id': 23,
+        'category': 'rb_xp',
+        'title': 'Quadrans Achiever',
+        'desc': 'Achieve level 25 in Rogue Boss (25698+ XP)',
+        'value': 25698
+    },
+    {
+        'id': 24,
+        'category': 'rb_xp',
+        'title': 'Half-Century Champion',
+        'desc': 'Achieve level 50 in Rogue Boss (228837+ XP)',
+        'value': 228837
+    },
+    {
+        'id': 25,
+        'category': 'rb_xp',
+        'title': 'Century Conqueror',
+        'desc': 'Achieve level 100 in Rogue Boss (2037738+ XP)',
+        'value': 2037738
+    }
+]
+
+# Category order, metric comparison and display order. Focus hour
+# achievements require strictly more hours than the value; the rest
+# are earned once the value is reached.
+CATEGORIES = [
+    ('all_focus', operator.gt),
+    ('month_focus', operator.gt),
+    ('study_streak', operator.ge),
+    ('trivia', operator.ge),
+    ('rb_xp', operator.ge)
+]
+
+ACHIEVEMENTS_BY_CATEGORY = {
+    category: [achievement for achievement in ACHIEVEMENTS if achievement['category'] == category]
+    for category, _ in CATEGORIES
+}
+
+# Default number of users evaluated per chunk during a backfill
+DEFAULT_CHUNK_SIZE = 500
+
+class AchievementService():
+    """
+    Evaluates achievements on the server from the stored statistics
+    and awards every newly earned achievement with one insert.
+    """
+
+    @staticmethod
+    def get_metrics_query():
+        """
+        Returns a query selecting every metric used by the catalogue
+        for each user, joined in a single statement.
+        """
+        mth, yr = DateTimeUtils.get_utc_month_year_now()
+        return db.session.query(
+            User.id,
+            User.stime,
+            User.trivia,
+            MonthTime.stime,
+            StreakModel.highest_streak_achieved,
+            RogueBossUserModel.xp
+        ).outerjoin(
+            MonthTime, and_(MonthTime.user_id == User.id, MonthTime.mth == mth, MonthTime.yr == yr)
+        ).outerjoin(
+            StreakModel, StreakModel.user_id == User.id
+        ).outerjoin(
+            RogueBossUserModel, RogueBossUserModel.user_id == User.id
+        )
+
+    @staticmethod
+    def get_metrics(row):
+        """
+        Converts a row of the metrics query into the value compared
+        for each category.
+        """
+        _, stime, trivia, month_stime, highest_streak, rb_xp = row
+        return {
+            'all_focus': math.floor((stime or 0) / 3600),
+            'month_focus': math.floor((month_stime or 0) / 3600),
+            'study_streak': highest_streak or 0,
+            'trivia': trivia or 0,
+            'rb_xp': rb_xp or 0
+        }
+
+    @staticmethod
+    def get_newly_earned(metrics, earned):
+        """
+        Returns the ids of achievements reached by the metrics that
+        are not in the `earned` set.
+        """
+        newly_earned = []
+        for category, compare in CATEGORIES:
+            for achievement in ACHIEVEMENTS_BY_CATEGORY[category]:
+                if achievement['id'] not in earned and compare(metrics[category], achievement['value']):
+                    newly_earned.append(achievement['id'])
+        return newly_earned
+
+    @staticmethod
+    def get_progress(metrics, earned):
+        """
+        Returns, for each category, the next achievement to earn (or
+        the last one if all are earned) and the percent progress
+        towards it.
+        """
+        progress = []
+        for category, _ in CATEGORIES:
+            category_achievements = ACHIEVEMENTS_BY_CATEGORY[category]
+            goal = next((achievement for achievement in category_achievements if achievement['id'] not in earned), None)
+
+            if goal is None:
+                # Every achievement in the category is earned
+                goal = category_achievements[-1]
+                percent = 100
+            else:
+                percent = min(100, round(metrics[category] / goal['value'] * 100))
+
+            progress.append({
+                'category': category,
+                'id': goal['id'],
+                'title': goal['title'],
+                'desc': goal['desc'],
+                'value': goal['value'],
+                'current': metrics[category],
+                'percent': percent
+            })
+        return progress
+
+    @staticmethod
+    def insert_achievements(rows):
+        """
+        Inserts (user_id, id) achievement rows with one multi-row
+        INSERT IGNORE. Does not commit.
+        """
+        if rows:
+            db.session.execute(mysql_insert(Achievement).prefix_with('IGNORE').values([
+                {'id': achievement_id, 'user_id': user_id} for user_id, achievement_id in rows
+            ]))
+
+    @staticmethod
+    def evaluate_user(user_id):
+        """
+        Evaluates every achievement for the user, awards the newly
+        earned ones and returns the evaluation, or None if the user
+        does not exist. The user's hex is included so the achievements
+        embed needs no other request.
+        """
+        row = AchievementService.get_metrics_query().add_columns(User.hex).filter(User.id == user_id).first()
+        if row is None:
+            return None
+
+        metrics = AchievementService.get_metrics(row[:-1])
+        earned = {id for (id,) in db.session.query(Achievement.id).filter_by(user_id=user_id).all()}
+
+        newly_earned = AchievementService.get_newly_earned(metrics, earned)
+        try:
+            AchievementService.insert_achievements([(user_id, achievement_id) for achievement_id in newly_earned])
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+        earned.update(newly_earned)
+        return {
+            'user_id': user_id,
+            'hex': row[-1],
+            'earned': len(earned),
+            'total': len(ACHIEVEMENTS),
+            'new': newly_earned,
+            'progress': AchievementService.get_progress(metrics, earned)
+        }
+
+    @staticmethod
+    def evaluate_all(chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Backfills achievements for every user. Users are read in
+        chunks ordered by id, and each chunk is evaluated with one
+        metrics query, one earned-achievements query and one insert,
+        then committed. Returns (users evaluated, achievements awarded).
+        """
+        users_evaluated = 0
+        achievements_awarded = 0
+        last_id = None
+
+        while True:
+            query = AchievementService.get_metrics_query()
+            if last_id is not None:
+                query = query.filter(User.id > last_id)
+            rows = query.order_by(User.id).limit(chunk_size).all()
+            if not rows:
+                break
+
+            user_ids = [row[0] for row in rows]
+            earned_by_user = {user_id: set() for user_id in user_ids}
+            for user_id, achievement_id in db.session.query(Achievement.user_id, Achievement.id).filter(Achievement.user_id.in_(user_ids)).all():
+                earned_by_user[user_id].add(achievement_id)
+
+            new_rows = []
+            for row in rows:
+                metrics = AchievementService.get_metrics(row)
+                for achievement_id in AchievementService.get_newly_earned(metrics, earned_by_user[row[0]]):
+                    new_rows.append((row[0], achievement_id))
+
+            try:
+                AchievementService.insert_achievements(new_rows)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                raise
+
+            users_evaluated += len(rows)
+            achievements_awarded += len(new_rows)
+            last_id = user_ids[-1]
+
+        return users_evaluated, achievements_awarded
@@ -0,0 +1,141 @@
+from sqlalchemy import update, case, func
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from datetime import datetime, timezone, timedelta
+from app import db
+from app.model.user_model import User
+from app.model.monthtime_model import MonthTime
+from app.model.dailytime_model import DailyTime
+from app.model.streak_model import StreakModel
+from app.service.user_service import UserService
+from app.service.streak_service import StreakService
+from tools.utils import DateTimeUtils
+
+# Maximum number of sessions accepted in a single batch request
+MAX_SESSIONS_PER_REQUEST = 500
+
+class FocusService():
+    """
+    Applies focus time earned in the focus rooms to every aggregate
+    that tracks it: the user totals, the current dailytime and
+    monthtime entries, and the user's streak. Each method runs on the
+    Flask-SQLAlchemy session unless another session is given, such as
+    the sync session of an AsyncSession.run_sync.
+    """
+
+    @staticmethod
+    def record_session(user_id, seconds, tokens, session=None):
+        """
+        Records a single focus session in one transaction. Missing
+        rows are created first, then every counter is incremented with
+        a single UPDATE and the streak is touched. Returns the updated
+        user, monthtime, dailytime and streak models.
+        """
+        if session is None:
+            session = db.session
+
+        try:
+            mth, d, yr, _ = UserService.ensure_user_rows(user_id, session=session)
+
+            user = UserService.increment_user(user_id, tokens=tokens, stime=seconds, session=session)
+
+            if seconds:
+                session.query(MonthTime).filter_by(user_id=user_id, mth=mth, yr=yr).update(
+                    {MonthTime.stime: MonthTime.stime + seconds}, synchronize_session=False)
+                session.query(DailyTime).filter_by(user_id=user_id, d=d, mth=mth, yr=yr).update(
+                    {DailyTime.stime: DailyTime.stime + seconds}, synchronize_session=False)
+
+            streak, _, _ = StreakService.touch_streak(user_id, session=session)
+
+            monthtime = session.get(MonthTime, (user_id, mth, yr))
+            dailytime = session.get(DailyTime, (user_id, d, mth, yr))
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return user, monthtime, dailytime, streak
+
+    @staticmethod
+    def record_sessions(sessions, session=None):
+        """
+        Records many focus sessions in one transaction using set-based
+        SQL. Deltas for the same user are merged first, then:
+        - user totals are created or incremented with a single
+        INSERT ... ON DUPLICATE KEY UPDATE,
+        - the current dailytime and monthtime entries are created or
+        incremented the same way,
+        - missing streaks are inserted and every streak not yet touched
+        today is advanced with a single UPDATE.
+        Returns the number of distinct users updated.
+        """
+        if session is None:
+            session = db.session
+
+        # Merge deltas per user so each user appears once per statement
+        deltas = {}
+        for entry in sessions:
+            seconds, tokens = deltas.get(entry['user_id'], (0, 0))
+            deltas[entry['user_id']] = (seconds + entry['seconds'], tokens + entry['tokens'])
+
+        if not deltas:
+            return 0
+
+        mth, d, yr, _ = DateTimeUtils.get_utc_date_now()
+        current_date = datetime.now(timezone.utc).date()
+        previous_date = current_date - timedelta(days=1)
+        user_ids = list(deltas.keys())
+
+        try:
+            # User totals
+            stmt = mysql_insert(User).values([
+                {'id': user_id, 'tokens': tokens, 'stime': seconds, 'timezone': 'UTC', 'hex': '383838', 'trivia': 0}
+                for user_id, (seconds, tokens) in deltas.items()
+            ])
+            session.execute(stmt.on_duplicate_key_update(
+                tokens=User.tokens + stmt.inserted.tokens,
+                stime=User.stime + stmt.inserted.stime
+            ))
+
+            # Current monthtime entries
+            stmt = mysql_insert(MonthTime).values([
+                {'user_id': user_id, 'mth': mth, 'yr': yr, 'stime': seconds}
+                for user_id, (seconds, _) in deltas.items()
+            ])
+            session.execute(stmt.on_duplicate_key_update(stime=MonthTime.stime + stmt.inserted.stime))
+
+            # Current dailytime entries
+            stmt = mysql_insert(DailyTime).values([
+                {'user_id': user_id, 'd': d, 'mth': mth, 'yr': yr, 'stime': seconds}
+                for user_id, (seconds, _) in deltas.items()
+            ])
+            session.execute(stmt.on_duplicate_key_update(stime=DailyTime.stime + stmt.inserted.stime))
+
+            # Missing streaks start today at 0
+            session.execute(mysql_insert(StreakModel).prefix_with('IGNORE').values([
+                {'user_id': user_id, 'current_streak': 0, 'previous_connection_date': current_date, 'highest_streak_achieved': 0}
+                for user_id in user_ids
+            ]))
+
+            # Advance streaks not yet touched today. MySQL applies SET clauses
+            # left to right, so highest_streak_achieved is computed before
+            # current_streak changes.
+            next_streak = case(
+                (StreakModel.previous_connection_date == previous_date, StreakModel.current_streak + 1),
+                else_=0
+            )
+            session.execute(
+                update(StreakModel)
+                .where(StreakModel.user_id.in_(user_ids), StreakModel.previous_connection_date != current_date)
+                .ordered_values(
+                    (StreakModel.highest_streak_achieved, func.greatest(StreakModel.highest_streak_achieved, next_streak)),
+                    (StreakModel.current_streak, next_streak),
+                    (StreakModel.previous_connection_date, current_date)
+                )
+            )
+
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        return len(user_ids)
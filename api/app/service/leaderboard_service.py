@@ -0,0 +1,280 @@
+import time
+import threading
+from bisect import bisect_left, insort
+from sqlalchemy import func
+from app import db
+from app.model.user_model import User
+from app.model.monthtime_model import MonthTime
+from app.model.dailytime_model import DailyTime
+from app.model.streak_model import StreakModel
+from app.model.rbuser_model import RogueBossUserModel
+from tools.utils import DateTimeUtils
+
+# Number of seconds before a board is reloaded from the database. This
+# reconciles writes made outside of this process, such as by another
+# API worker or directly against the database.
+REFRESH_SECONDS = 600
+
+# Maximum number of entries returned for a single board
+MAX_LIMIT = 100
+
+def all_scores_query(session):
+    return session.query(User.id, User.stime)
+
+def trivia_scores_query(session):
+    return session.query(User.id, func.coalesce(User.trivia, 0))
+
+def month_scores_query(session):
+    mth, yr = DateTimeUtils.get_utc_month_year_now()
+    return session.query(MonthTime.user_id, MonthTime.stime).filter(MonthTime.mth == mth, MonthTime.yr == yr)
+
+def day_scores_query(session):
+    mth, d, yr, _ = DateTimeUtils.get_utc_date_now()
+    return session.query(DailyTime.user_id, DailyTime.stime).filter(DailyTime.d == d, DailyTime.mth == mth, DailyTime.yr == yr)
+
+def streak_scores_query(session):
+    return session.query(StreakModel.user_id, StreakModel.current_streak)
+
+def highest_streak_scores_query(session):
+    return session.query(StreakModel.user_id, StreakModel.highest_streak_achieved)
+
+def rb_scores_query(session):
+    return session.query(RogueBossUserModel.user_id, RogueBossUserModel.xp)
+
+def month_period():
+    return DateTimeUtils.get_utc_month_year_now()
+
+def day_period():
+    mth, d, yr, _ = DateTimeUtils.get_utc_date_now()
+    return mth, d, yr
+
+# Board name -> (scores query on a session, user id column, period
+# function). Boards with a period are emptied and reloaded when the UTC
+# period changes.
+BOARDS = {
+    'all': (all_scores_query, User.id, None),
+    'trivia': (trivia_scores_query, User.id, None),
+    'month': (month_scores_query, MonthTime.user_id, month_period),
+    'day': (day_scores_query, DailyTime.user_id, day_period),
+    'streak': (streak_scores_query, StreakModel.user_id, None),
+    'highest_streak': (highest_streak_scores_query, StreakModel.user_id, None),
+    'rb': (rb_scores_query, RogueBossUserModel.user_id, None)
+}
+
+# Boards affected by each kind of write
+TIME_BOARDS = ('all', 'month', 'day')
+USER_BOARDS = ('all', 'trivia')
+MONTH_BOARDS = ('month',)
+DAY_BOARDS = ('day',)
+STREAK_BOARDS = ('streak', 'highest_streak')
+RB_BOARDS = ('rb',)
+
+# Model -> boards read from its table
+TABLE_BOARDS = {
+    User: USER_BOARDS,
+    MonthTime: MONTH_BOARDS,
+    DailyTime: DAY_BOARDS,
+    StreakModel: STREAK_BOARDS,
+    RogueBossUserModel: RB_BOARDS
+}
+
+# Board name -> (score attribute, period function) of the rows of its
+# table. Rows of another period than the board's are not on the board.
+ROW_SCORES = {
+    'all': ('stime', None),
+    'trivia': ('trivia', None),
+    'month': ('stime', lambda row: (row.mth, row.yr)),
+    'day': ('stime', lambda row: (row.mth, row.d, row.yr)),
+    'streak': ('current_streak', None),
+    'highest_streak': ('highest_streak_achieved', None),
+    'rb': ('xp', None)
+}
+
+class Leaderboard():
+    """
+    Scores for a single board, kept in a list sorted by descending
+    score so the top entries are a slice. Inserting or moving a user
+    is a binary search plus a list insert.
+    """
+
+    def __init__(self, rows, period=None):
+        self.period = period
+        self.loaded_at = time.monotonic()
+        self.scores = {user_id: score for user_id, score in rows}
+        self.ranking = sorted((-score, user_id) for user_id, score in self.scores.items())
+
+    def set(self, user_id, score):
+        previous = self.scores.get(user_id)
+        if previous == score:
+            return
+        if previous is not None:
+            del self.ranking[bisect_left(self.ranking, (-previous, user_id))]
+        self.scores[user_id] = score
+        insort(self.ranking, (-score, user_id))
+
+    def remove(self, user_id):
+        previous = self.scores.pop(user_id, None)
+        if previous is not None:
+            del self.ranking[bisect_left(self.ranking, (-previous, user_id))]
+
+    def top(self, limit):
+        return [{'user_id': user_id, 'value': -score} for score, user_id in self.ranking[:limit]]
+
+class LeaderboardService():
+    """
+    In-memory leaderboards for the month, day, all-time, streak, trivia
+    and Rogue Boss boards. Boards are loaded once and then updated by
+    the write paths, so reading the top of a board does not touch the
+    database.
+    """
+    _boards = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load(board):
+        """
+        Loads the full board from the database and replaces the
+        in-memory copy.
+        """
+        query, _, period = BOARDS[board]
+        leaderboard = Leaderboard(query(db.session).all(), period() if period else None)
+        with LeaderboardService._lock:
+            LeaderboardService._boards[board] = leaderboard
+        return leaderboard
+
+    @staticmethod
+    def load_all():
+        """
+        Loads every board. Called once on startup.
+        """
+        for board in BOARDS:
+            LeaderboardService.load(board)
+
+    @staticmethod
+    def get_board(board):
+        """
+        Returns the in-memory board, loading it if it has not been
+        loaded, if its period has ended or if it is older than
+        REFRESH_SECONDS.
+        """
+        _, _, period = BOARDS[board]
+        leaderboard = LeaderboardService._boards.get(board)
+        if leaderboard is None \
+                or (period is not None and leaderboard.period != period()) \
+                or time.monotonic() - leaderboard.loaded_at > REFRESH_SECONDS:
+            leaderboard = LeaderboardService.load(board)
+        return leaderboard
+
+    @staticmethod
+    def get_top(board, limit=10):
+        """
+        Returns the top `limit` entries of the board as a list of
+        {user_id, value}, highest value first.
+        """
+        leaderboard = LeaderboardService.get_board(board)
+        with LeaderboardService._lock:
+            return leaderboard.top(min(limit, MAX_LIMIT))
+
+    @staticmethod
+    def set_scores(board, scores):
+        """
+        Applies the {user_id: score} of a committed write to the board
+        if it is loaded, without reading the database.
+        """
+        leaderboard = LeaderboardService._boards.get(board)
+        if leaderboard is None:
+            return
+        with LeaderboardService._lock:
+            for user_id, score in scores.items():
+                leaderboard.set(user_id, score)
+
+    @staticmethod
+    def add_scores(board, deltas):
+        """
+        Adds the {user_id: delta} of a committed increment to the
+        board if it is loaded, without reading the database. Users not
+        on the board are added with the delta as their score, as for a
+        row the write created.
+        """
+        leaderboard = LeaderboardService._boards.get(board)
+        if leaderboard is None:
+            return
+        with LeaderboardService._lock:
+            for user_id, delta in deltas.items():
+                leaderboard.set(user_id, leaderboard.scores.get(user_id, 0) + delta)
+
+    @staticmethod
+    def set_rows(rows, fields=None):
+        """
+        Applies the scores of committed model rows, such as the User
+        or MonthTime a write returns, to the loaded boards of their
+        table. If `fields` is given, only the boards scored by one of
+        those fields are updated. Nothing is read from the database
+        beyond the rows' own attributes.
+        """
+        for row in rows:
+            for board in TABLE_BOARDS[type(row)]:
+                attribute, row_period = ROW_SCORES[board]
+                if fields is not None and attribute not in fields:
+                    continue
+                leaderboard = LeaderboardService._boards.get(board)
+                if leaderboard is None:
+                    continue
+                if row_period is not None and row_period(row) != leaderboard.period:
+                    continue
+                user_id = getattr(row, BOARDS[board][1].key)
+                LeaderboardService.set_scores(board, {user_id: getattr(row, attribute) or 0})
+
+    @staticmethod
+    def remove_users(user_ids, boards=BOARDS):
+        """
+        Removes the users of a committed delete from the given loaded
+        boards.
+        """
+        for board in boards:
+            leaderboard = LeaderboardService._boards.get(board)
+            if leaderboard is None:
+                continue
+            with LeaderboardService._lock:
+                for user_id in user_ids:
+                    leaderboard.remove(user_id)
+
+    @staticmethod
+    def refresh_users(user_ids, boards=BOARDS, session=None):
+        """
+        Re-reads the committed scores of the given users for the given
+        boards and applies them to the loaded boards, for writes whose
+        new scores are computed by the database. Users without a
+        row for a board are removed from it. Boards that are not loaded
+        are skipped, as they will read the new scores when loaded.
+        Called after the write has been committed, on the Flask-SQLAlchemy
+        session unless another session is given.
+        """
+        if session is None:
+            session = db.session
+
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return
+
+        for board in boards:
+            leaderboard = LeaderboardService._boards.get(board)
+            if leaderboard is None:
+                continue
+
+            query, user_id_column, _ = BOARDS[board]
+            try:
+                scores = dict(query(session).filter(user_id_column.in_(user_ids)).all())
+            except Exception:
+                # The write has already been committed, so drop the board
+                # and let the next read reload it rather than failing
+                with LeaderboardService._lock:
+                    LeaderboardService._boards.pop(board, None)
+                continue
+
+            with LeaderboardService._lock:
+                for user_id in user_ids:
+                    if user_id in scores:
+                        leaderboard.set(user_id, scores[user_id])
+                    else:
+                        leaderboard.remove(user_id)
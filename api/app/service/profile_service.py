@@ -0,0 +1,108 @@
+from sqlalchemy import and_, select
+from datetime import datetime, timezone, timedelta
+from app import db
+from app.model.user_model import User
+from app.model.monthtime_model import MonthTime
+from app.model.dailytime_model import DailyTime
+from app.model.streak_model import StreakModel
+from app.model.rbuser_model import RogueBossUserModel
+from app.model.accomplishment_model import Accomplishment
+from app.model.achievement_model import Achievement
+from app.service.achievement_service import AchievementService, ACHIEVEMENTS
+from tools.utils import DateTimeUtils
+from tools.aggregate import json_array_agg
+
+class ProfileService():
+    """
+    Builds the aggregated profile used by the /profile and
+    /achievements embeds.
+    """
+
+    @staticmethod
+    def get_effective_streak(current_streak, previous_connection_date, current_date):
+        """
+        Returns the current streak as it would be displayed today
+        without writing to the streak. A streak whose last connection
+        is older than yesterday has lapsed and is shown as 0.
+        """
+        if previous_connection_date is None or current_streak is None:
+            return 0
+        if previous_connection_date < current_date - timedelta(days=1):
+            return 0
+        return current_streak
+
+    @staticmethod
+    def get_profile(user_id, session=None):
+        """
+        Returns the profile for the user as a dictionary, or None if
+        the user does not exist. Everything is read with a single
+        query: the user, current monthtime, current dailytime, streak
+        and Rogue Boss rows are outer-joined, and the list-valued
+        accomplishments and achievements are aggregated into JSON
+        arrays by correlated subqueries.
+
+        `achievements_earned` also counts achievements the statistics
+        have reached but that have not been awarded yet, so the count
+        matches what the next evaluation will store.
+
+        Runs on the Flask-SQLAlchemy session unless another session is
+        given, such as the sync session of an AsyncSession.run_sync.
+        """
+        if session is None:
+            session = db.session
+
+        mth, d, yr, _ = DateTimeUtils.get_utc_date_now()
+        current_date = datetime.now(timezone.utc).date()
+
+        accomplishments = select(json_array_agg(Accomplishment.msg)).where(Accomplishment.user_id == User.id).scalar_subquery()
+        achievements = select(json_array_agg(Achievement.id)).where(Achievement.user_id == User.id).scalar_subquery()
+
+        row = session.query(
+            User,
+            MonthTime.stime,
+            DailyTime.stime,
+            StreakModel.current_streak,
+            StreakModel.highest_streak_achieved,
+            StreakModel.previous_connection_date,
+            RogueBossUserModel.rbtype,
+            RogueBossUserModel.xp,
+            accomplishments,
+            achievements
+        ).outerjoin(
+            MonthTime, and_(MonthTime.user_id == User.id, MonthTime.mth == mth, MonthTime.yr == yr)
+        ).outerjoin(
+            DailyTime, and_(DailyTime.user_id == User.id, DailyTime.d == d, DailyTime.mth == mth, DailyTime.yr == yr)
+        ).outerjoin(
+            StreakModel, StreakModel.user_id == User.id
+        ).outerjoin(
+            RogueBossUserModel, RogueBossUserModel.user_id == User.id
+        ).filter(User.id == user_id).first()
+
+        if row is None:
+            return None
+
+        user, month_stime, daily_stime, current_streak, highest_streak, previous_connection_date, rbtype, rb_xp, accomplishments, achievements = row
+        accomplishments = accomplishments or []
+        achievements = achievements or []
+
+        metrics = AchievementService.get_metrics((user.id, user.stime, user.trivia, month_stime, highest_streak, rb_xp))
+        reached = AchievementService.get_newly_earned(metrics, set(achievements))
+
+        return {
+            'id': user.id,
+            'tokens': user.tokens,
+            'stime': user.stime,
+            'timezone': user.timezone,
+            'hex': user.hex,
+            'trivia': user.trivia or 0,
+            'month_stime': month_stime or 0,
+            'daily_stime': daily_stime or 0,
+            'current_streak': ProfileService.get_effective_streak(current_streak, previous_connection_date, current_date),
+            'highest_streak_achieved': highest_streak or 0,
+            'rbtype': rbtype,
+            'rb_xp': rb_xp or 0,
+            'accomplishments': accomplishments,
+            'achievements': achievements,
+            'achievements_earned': len(achievements) + len(reached),
+            'achievements_total': len(ACHIEVEMENTS)
+        }
@@ -0,0 +1,117 @@
+from datetime import datetime
+from sqlalchemy import and_, or_, select, update, bindparam
+from app import db
+from app.model.reminder_model import ReminderModel
+from tools.recurrence import Recurrence
+
+# Format of remind_at in requests, responses and cursors
+REMIND_AT_FORMAT = '%Y-%m-%dT%H:%M:%S'
+
+# Default and maximum number of reminders returned by a single page
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+# Maximum number of reminders advanced by a single request
+MAX_ADVANCE_SIZE = 1000
+
+class ReminderService():
+    """
+    Windowed reads of due reminders and batched advancing of fired
+    reminders. Reminders are paged in (remind_at, id) order with a
+    keyset cursor, which the index on reminder (remind_at) serves
+    without sorting or skipping rows.
+    """
+
+    @staticmethod
+    def parse_remind_at(value):
+        """
+        Parses a remind_at string. Raises ValueError if it is not in
+        REMIND_AT_FORMAT.
+        """
+        return datetime.strptime(value, REMIND_AT_FORMAT)
+
+    @staticmethod
+    def decode_cursor(cursor):
+        """
+        Returns the (remind_at, id) a cursor points at. Raises
+        ValueError if the cursor is malformed.
+        """
+        remind_at, _, id = cursor.rpartition('_')
+        return ReminderService.parse_remind_at(remind_at), int(id)
+
+    @staticmethod
+    def get_due_statement(before, after=None, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Returns a select of up to `limit` reminders due before `before`,
+        and at or after `after` if given, ordered by (remind_at, id).
+        If a cursor is given, only reminders after the reminder it
+        points at are selected. Shared by the WSGI and ASGI apps.
+        """
+        statement = select(ReminderModel).where(ReminderModel.remind_at < before)
+        if after is not None:
+            statement = statement.where(ReminderModel.remind_at >= after)
+        if cursor is not None:
+            remind_at, id = cursor
+            statement = statement.where(or_(
+                ReminderModel.remind_at > remind_at,
+                and_(ReminderModel.remind_at == remind_at, ReminderModel.id > id)
+            ))
+        return statement.order_by(ReminderModel.remind_at, ReminderModel.id).limit(limit)
+
+    @staticmethod
+    def get_due_reminders(before, after=None, cursor=None, limit=DEFAULT_PAGE_SIZE):
+        """
+        Returns the list of reminders of get_due_statement. The page
+        is read in full, as it is capped by `limit`, so it can be
+        serialized after the request's session is closed.
+        """
+        statement = ReminderService.get_due_statement(before, after, cursor, limit)
+        return db.session.scalars(statement).all()
+
+    @staticmethod
+    def advance_reminders(ids, now=None, session=None):
+        """
+        Advances fired reminders to their next occurrence after `now`.
+        Repeating reminders are moved with one batched UPDATE, and
+        reminders with no further occurrence are removed with one
+        DELETE. Ids that do not exist are ignored. Returns (updated
+        reminders as dicts, deleted ids). Does not commit.
+
+        Runs on the Flask-SQLAlchemy session unless another session is
+        given, such as the sync session of an AsyncSession.run_sync.
+        """
+        now = now or datetime.utcnow()
+        if session is None:
+            session = db.session
+
+        # Read only the columns needed, so no ORM objects are left dirty
+        # and flushed one row at a time
+        rows = session.query(
+            ReminderModel.id, ReminderModel.user_id, ReminderModel.title, ReminderModel.remind_at,
+            ReminderModel.repeat_interval, ReminderModel.repeat_until, ReminderModel.repeat_count, ReminderModel.anchor_day
+        ).filter(ReminderModel.id.in_(ids)).with_for_update().all()
+
+        updated = []
+        deleted_ids = []
+        for row in rows:
+            recurrence = Recurrence.parse(row.repeat_interval)
+            occurrence = recurrence.advance(row.remind_at, now, row.repeat_until, row.repeat_count, row.anchor_day) if recurrence else None
+            if occurrence is None:
+                deleted_ids.append(row.id)
+                continue
+
+            reminder = row._asdict()
+            reminder['remind_at'], reminder['repeat_count'] = occurrence
+            updated.append(reminder)
+
+        if updated:
+            table = ReminderModel.__table__
+            session.execute(
+                update(table)
+                .where(table.c.id == bindparam('b_id'))
+                .values(remind_at=bindparam('b_remind_at'), repeat_count=bindparam('b_repeat_count'), updated_at=now),
+                [{'b_id': r['id'], 'b_remind_at': r['remind_at'], 'b_repeat_count': r['repeat_count']} for r in updated]
+            )
+        if deleted_ids:
+            session.query(ReminderModel).filter(ReminderModel.id.in_(deleted_ids)).delete(synchronize_session=False)
+        return updated, deleted_ids
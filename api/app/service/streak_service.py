@@ -0,0 +1,58 @@
+from datetime import datetime, timezone, timedelta
+from app import db
+from app.model.streak_model import StreakModel
+
+class StreakService():
+    """
+    Shared streak logic used by the streak and focus controllers.
+    """
+
+    @staticmethod
+    def touch_streak(user_id, session=None):
+        """
+        Records a connection for the user on the current UTC date and
+        returns (streak, created, updated). Does not commit.
+
+        - If no streak exists, one is created with default values.
+        - If the previous connection was today, nothing changes.
+        - If the previous connection was yesterday, the current streak
+        is incremented and the highest streak is raised if exceeded.
+        - Otherwise the current streak is reset to 0.
+
+        Runs on the Flask-SQLAlchemy session unless another session is
+        given, such as the sync session of an AsyncSession.run_sync.
+        """
+        if session is None:
+            session = db.session
+
+        current_date = datetime.now(timezone.utc).date()
+
+        # Lock the row so concurrent touches cannot both increment it
+        streak = session.query(StreakModel).filter_by(user_id=user_id).with_for_update().first()
+
+        if streak is None:
+            streak = StreakModel(
+                user_id=user_id,
+                current_streak=0,
+                previous_connection_date=current_date,
+                highest_streak_achieved=0
+            )
+            session.add(streak)
+            return streak, True, False
+
+        last_login_date = streak.previous_connection_date
+
+        if last_login_date == current_date:
+            return streak, False, False
+
+        elif last_login_date == current_date - timedelta(days=1):
+            streak.current_streak += 1
+
+            if streak.current_streak > streak.highest_streak_achieved:
+                streak.highest_streak_achieved = streak.current_streak
+
+        else:
+            streak.current_streak = 0
+
+        streak.previous_connection_date = current_date
+        return streak, False, True
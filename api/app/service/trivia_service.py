@@ -0,0 +1,251 @@
+import time
+import random
+import threading
+from sqlalchemy import insert
+from app import db
+from app.model.triviaquestion_model import TriviaQuestion
+from app.model.triviaseen_model import TriviaSeen
+from app.service.user_service import UserService
+from tools.bitmap import Bitmap
+
+# Number of seconds before the id pools are reloaded from the database.
+# This reconciles questions added or removed by other API processes.
+REFRESH_SECONDS = 600
+
+# Maximum number of questions returned by a single batch request
+MAX_BATCH_SIZE = 50
+
+# Random picks tried per requested question before falling back to a
+# scan of the pool for unseen questions
+UNSEEN_ATTEMPTS = 16
+
+class IdPool():
+    """
+    A set of question ids that supports adding, removing and picking
+    a random id in constant time. Ids are kept in a list for sampling
+    and their positions in a dict so removal can swap the last id
+    into the removed slot.
+    """
+
+    def __init__(self):
+        self.ids = []
+        self.positions = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def add(self, id):
+        if id not in self.positions:
+            self.positions[id] = len(self.ids)
+            self.ids.append(id)
+
+    def remove(self, id):
+        position = self.positions.pop(id, None)
+        if position is None:
+            return
+        last = self.ids.pop()
+        if position < len(self.ids):
+            self.ids[position] = last
+            self.positions[last] = position
+
+    def choice(self):
+        return random.choice(self.ids)
+
+    def sample(self, count):
+        return random.sample(self.ids, min(count, len(self.ids)))
+
+def pool_keys(category, author):
+    """
+    Returns the keys of every pool a question with the given category
+    and author belongs to.
+    """
+    return [(None, None), (category, None), (None, author), (category, author)]
+
+class TriviaService():
+    """
+    Random trivia question selection. The ids of every question are
+    kept in memory, grouped by category, author and both, so picking
+    random questions never scans or sorts the triviaquestion table.
+    The questions themselves are then read by primary key.
+    """
+    _pools = None
+    _questions = {}
+    _loaded_at = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def load():
+        """
+        Loads the id, category and author of every question and
+        rebuilds the pools.
+        """
+        rows = db.session.query(TriviaQuestion.id, TriviaQuestion.category, TriviaQuestion.author).all()
+        pools = {}
+        questions = {}
+        for id, category, author in rows:
+            questions[id] = (category, author)
+            for key in pool_keys(category, author):
+                pools.setdefault(key, IdPool()).add(id)
+
+        with TriviaService._lock:
+            TriviaService._pools = pools
+            TriviaService._questions = questions
+            TriviaService._loaded_at = time.monotonic()
+
+    @staticmethod
+    def ensure_loaded():
+        if TriviaService._pools is None or time.monotonic() - TriviaService._loaded_at > REFRESH_SECONDS:
+            TriviaService.load()
+
+    @staticmethod
+    def add_question(question):
+        """
+        Adds a committed question to the pools. Called after a
+        question is created or updated.
+        """
+        if TriviaService._pools is None:
+            return
+        with TriviaService._lock:
+            TriviaService._remove(question.id)
+            TriviaService._questions[question.id] = (question.category, question.author)
+            for key in pool_keys(question.category, question.author):
+                TriviaService._pools.setdefault(key, IdPool()).add(question.id)
+
+    @staticmethod
+    def remove_question(id):
+        """
+        Removes a question from the pools. Called after a question is
+        deleted.
+        """
+        if TriviaService._pools is None:
+            return
+        with TriviaService._lock:
+            TriviaService._remove(id)
+
+    @staticmethod
+    def _remove(id):
+        attributes = TriviaService._questions.pop(id, None)
+        if attributes is None:
+            return
+        for key in pool_keys(*attributes):
+            pool = TriviaService._pools.get(key)
+            if pool is not None:
+                pool.remove(id)
+                if not pool:
+                    del TriviaService._pools[key]
+
+    @staticmethod
+    def get_question_count():
+        return len(TriviaService._questions)
+
+    @staticmethod
+    def get_pool(category=None, author=None):
+        """
+        Returns the pool for the given filters, or None if no question
+        matches them. The caller must hold the lock.
+        """
+        return TriviaService._pools.get((category, author))
+
+    @staticmethod
+    def get_questions_by_ids(ids):
+        """
+        Reads the questions with the given ids by primary key and
+        returns them in the order of `ids`. Ids whose question no
+        longer exists are removed from the pools.
+        """
+        if not ids:
+            return []
+        found = {question.id: question for question in TriviaQuestion.query.filter(TriviaQuestion.id.in_(ids)).all()}
+        for id in ids:
+            if id not in found:
+                TriviaService.remove_question(id)
+        return [found[id] for id in ids if id in found]
+
+    @staticmethod
+    def get_random_questions(count=1, category=None, author=None):
+        """
+        Returns up to `count` distinct random questions matching the
+        optional category and author filters.
+        """
+        TriviaService.ensure_loaded()
+        with TriviaService._lock:
+            pool = TriviaService.get_pool(category, author)
+            ids = pool.sample(count) if pool is not None else []
+        return TriviaService.get_questions_by_ids(ids)
+
+    @staticmethod
+    def get_seen(user_id):
+        """
+        Returns the bitmap of question ids the user has answered.
+        """
+        seen = db.session.query(TriviaSeen.seen).filter(TriviaSeen.user_id == user_id).scalar()
+        return Bitmap.from_compressed(seen)
+
+    @staticmethod
+    def pick_unseen(pool, seen, count):
+        """
+        Picks up to `count` distinct ids from the pool that are not in
+        `seen`. Random picks are tried first, which takes O(1) expected
+        attempts while most of the pool is unseen. Once the user has
+        seen most of the pool, the unseen ids are found with one scan.
+        If the user has seen every question, seen ids are repeated.
+        """
+        picked = []
+        attempts = 0
+        while len(picked) < count and attempts < count * UNSEEN_ATTEMPTS:
+            attempts += 1
+            id = pool.choice()
+            if id not in seen and id not in picked:
+                picked.append(id)
+        if len(picked) == count:
+            return picked
+
+        unseen = [id for id in pool.ids if id not in seen and id not in picked]
+        picked += random.sample(unseen, min(count - len(picked), len(unseen)))
+
+        if len(picked) < count:
+            repeats = [id for id in pool.ids if id not in picked]
+            picked += random.sample(repeats, min(count - len(picked), len(repeats)))
+        return picked
+
+    @staticmethod
+    def get_random_unseen_questions(user_id, count=1, category=None, author=None):
+        """
+        Returns up to `count` distinct random questions matching the
+        optional filters that the user has not answered yet.
+        """
+        TriviaService.ensure_loaded()
+        seen = TriviaService.get_seen(user_id)
+        with TriviaService._lock:
+            pool = TriviaService.get_pool(category, author)
+            ids = TriviaService.pick_unseen(pool, seen, count) if pool is not None else []
+        return TriviaService.get_questions_by_ids(ids)
+
+    @staticmethod
+    def answer_question(user_id, question, selection):
+        """
+        Records the user's answer to the question. The question is
+        marked as seen in the user's bitmap and, if the selection is
+        correct, the user's trivia count is incremented. Returns
+        (correct, trivia, seen_count). Does not commit.
+        """
+        correct = selection == question.correct
+
+        # Ensure the user and their seen row exist, then lock the row so
+        # concurrent answers do not overwrite each other's bitmap
+        UserService.ensure_user_rows(user_id)
+        db.session.execute(insert(TriviaSeen).prefix_with('IGNORE').values(
+            user_id=user_id, seen=Bitmap().to_compressed(), seen_count=0
+        ))
+        seen_row = TriviaSeen.query.filter_by(user_id=user_id).with_for_update().first()
+
+        seen = Bitmap.from_compressed(seen_row.seen)
+        if seen.add(question.id):
+            seen_row.seen = seen.to_compressed()
+            seen_row.seen_count += 1
+        seen_count = seen_row.seen_count
+
+        # Flush before incrementing, which expires the loaded objects
+        db.session.flush()
+        user = UserService.increment_user(user_id, trivia=1 if correct else 0)
+        return correct, user.trivia or 0, seen_count
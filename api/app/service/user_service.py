@@ -0,0 +1,99 @@
+from sqlalchemy import insert, func
+from datetime import datetime, timezone
+from app import db
+from app.model.user_model import User
+from app.model.monthtime_model import MonthTime
+from app.model.dailytime_model import DailyTime
+from app.model.streak_model import StreakModel
+from tools.utils import DateTimeUtils
+
+class UserService():
+    """
+    Shared user operations that span more than one table. Controllers
+    call into these so that the same logic is not repeated per route.
+    Each runs on the Flask-SQLAlchemy session unless another session is
+    given, such as the sync session of an AsyncSession.run_sync.
+    """
+
+    @staticmethod
+    def ensure_user_rows(user_id, session=None):
+        """
+        Creates any missing user, current monthtime, current dailytime
+        and streak rows for the given user_id. Uses INSERT IGNORE so
+        concurrent calls for the same user never fail on a duplicate
+        key and existing rows are left untouched. Returns the current
+        (mth, d, yr) and the set of models whose row was created. Does
+        not commit.
+        """
+        if session is None:
+            session = db.session
+
+        mth, d, yr, _ = DateTimeUtils.get_utc_date_now()
+        current_date = datetime.now(timezone.utc).date()
+
+        rows = {
+            User: dict(id=user_id, tokens=0, stime=0, timezone='UTC', hex='383838', trivia=0),
+            MonthTime: dict(user_id=user_id, mth=mth, yr=yr, stime=0),
+            DailyTime: dict(user_id=user_id, d=d, mth=mth, yr=yr, stime=0),
+            StreakModel: dict(user_id=user_id, current_streak=0, previous_connection_date=current_date, highest_streak_achieved=0)
+        }
+
+        created = set()
+        for model, values in rows.items():
+            # INSERT OR IGNORE is SQLite's spelling, used by the tests
+            statement = insert(model).prefix_with('IGNORE', dialect='mysql').prefix_with('OR IGNORE', dialect='sqlite')
+            if session.execute(statement.values(**values)).rowcount:
+                created.add(model)
+
+        return mth, d, yr, created
+
+    @staticmethod
+    def ensure_user(user_id, session=None):
+        """
+        Ensures every per-user row exists in a single transaction and
+        returns the user, monthtime, dailytime and streak models,
+        followed by the list of those that were created.
+        """
+        if session is None:
+            session = db.session
+
+        try:
+            mth, d, yr, created = UserService.ensure_user_rows(user_id, session=session)
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+
+        user = session.get(User, user_id)
+        monthtime = session.get(MonthTime, (user_id, mth, yr))
+        dailytime = session.get(DailyTime, (user_id, d, mth, yr))
+        streak = session.get(StreakModel, user_id)
+        return user, monthtime, dailytime, streak, [row for row in (user, monthtime, dailytime, streak) if type(row) in created]
+
+    @staticmethod
+    def increment_user(user_id, tokens=0, stime=0, trivia=0, session=None):
+        """
+        Atomically adds the given deltas to the user's counters with a
+        single UPDATE ... SET col = col + :delta statement and returns
+        the updated user, or None if the user does not exist. Negative
+        deltas subtract. Does not commit.
+        """
+        if session is None:
+            session = db.session
+
+        values = {}
+        if tokens:
+            values[User.tokens] = User.tokens + tokens
+        if stime:
+            values[User.stime] = User.stime + stime
+        if trivia:
+            values[User.trivia] = func.coalesce(User.trivia, 0) + trivia
+
+        if values:
+            updated = session.query(User).filter_by(id=user_id).update(values, synchronize_session=False)
+            if updated == 0:
+                return None
+
+        # Read back the new totals within the same transaction
+        session.expire_all()
+        return session.get(User, user_id)
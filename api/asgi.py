@@ -0,0 +1,18 @@
+"""
+asgi.py
+author: narlock
+
+ASGI entry point of the Alder API. The user, streak and todo reads,
+the user ensure and increment, focus session and profile endpoints and
+the reminder endpoints run as async handlers on an async MySQL driver,
+so they serve many concurrent requests with a small connection pool.
+Every other endpoint is served by the Flask app in a worker thread, as
+under gunicorn. See "Async mode" in docs/install.markdown.
+
+Usage (from the api directory):
+    uvicorn asgi:app --host 127.0.0.1 --port 5000
+"""
+
+from app.asgi import create_asgi_app
+
+app = create_asgi_app()
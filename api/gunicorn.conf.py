@@ -0,0 +1,31 @@
+"""
+gunicorn.conf.py
+author: narlock
+
+Production server settings for the Alder API, read from the
+api.server section of config.yaml.
+
+Usage (from the api directory):
+    gunicorn -c gunicorn.conf.py main:app
+
+Each worker process runs its own copy of the app, with its own
+connection pool and in-memory leaderboards, so the app is not
+preloaded: it is created after the fork and no pooled connection
+is ever shared between processes. See the sizing guide in
+docs/install.markdown for choosing workers, threads and pool size.
+"""
+
+from app.config import SERVER_BIND, SERVER_WORKERS, SERVER_THREADS, SERVER_TIMEOUT
+
+bind = SERVER_BIND
+workers = SERVER_WORKERS
+threads = SERVER_THREADS
+worker_class = 'gthread'
+timeout = SERVER_TIMEOUT
+preload_app = False
+
+# Keep connections from the bot open between requests
+keepalive = 30
+
+accesslog = '-'
+errorlog = '-'
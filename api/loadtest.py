@@ -0,0 +1,88 @@
+"""
+loadtest.py
+author: narlock
+
+Sends concurrent requests to a running Alder API and reports the
+throughput and latency percentiles, to size the server workers,
+threads and connection pool. Only the standard library is used, so
+it can be run from any machine that can reach the API.
+
+Usage (from the api directory):
+    python3 loadtest.py [url] [concurrency] [seconds] [path ...]
+
+    python3 loadtest.py http://127.0.0.1:5000 32 30 /user/1 /leaderboard/all
+
+Each of `concurrency` threads sends GET requests to the paths in turn
+for `seconds` seconds, without keep-alive pauses between requests.
+"""
+
+import sys
+import time
+import threading
+import urllib.request
+import urllib.error
+
+DEFAULT_URL = 'http://127.0.0.1:5000'
+DEFAULT_CONCURRENCY = 16
+DEFAULT_SECONDS = 20
+DEFAULT_PATHS = ['/user/1']
+
+def percentile(values, fraction):
+    if not values:
+        return 0
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+def run_client(url, paths, deadline, latencies, errors):
+    """
+    Sends requests until the deadline, appending the latency of each
+    successful request and counting failed requests by status.
+    """
+    index = 0
+    while time.monotonic() < deadline:
+        path = paths[index % len(paths)]
+        index += 1
+        start = time.perf_counter()
+        try:
+            with urllib.request.urlopen(f'{url}{path}', timeout=30) as response:
+                response.read()
+            latencies.append(time.perf_counter() - start)
+        except urllib.error.HTTPError as e:
+            # 404 is an answer from the API, it counts as served
+            if e.code == 404:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors[e.code] = errors.get(e.code, 0) + 1
+        except Exception as e:
+            errors[type(e).__name__] = errors.get(type(e).__name__, 0) + 1
+
+def main():
+    url = sys.argv[1].rstrip('/') if len(sys.argv) > 1 else DEFAULT_URL
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_CONCURRENCY
+    seconds = float(sys.argv[3]) if len(sys.argv) > 3 else DEFAULT_SECONDS
+    paths = sys.argv[4:] or DEFAULT_PATHS
+
+    latencies = []
+    errors = {}
+    deadline = time.monotonic() + seconds
+    threads = [threading.Thread(target=run_client, args=(url, paths, deadline, latencies, errors)) for _ in range(concurrency)]
+
+    print(f'Sending requests to {url} from {concurrency} threads for {seconds:g}s: {", ".join(paths)}')
+    start = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - start
+
+    latencies.sort()
+    print(f'requests   {len(latencies)}')
+    print(f'throughput {len(latencies) / elapsed:.1f} req/s')
+    print(f'latency    p50 {percentile(latencies, 0.5) * 1000:.1f}ms '
+          f'p95 {percentile(latencies, 0.95) * 1000:.1f}ms '
+          f'p99 {percentile(latencies, 0.99) * 1000:.1f}ms '
+          f'max {max(latencies, default=0) * 1000:.1f}ms')
+    if errors:
+        print(f'errors     {", ".join(f"{key}: {count}" for key, count in sorted(errors.items(), key=str))}')
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,18 @@
+"""
+main.py
+author: narlock
+
+Entry point of the Alder API. Running this file starts Flask's
+development server, with the debugger and reloader enabled when
+FLASK_DEBUG=1. In production, serve `main:app` with gunicorn instead:
+
+    gunicorn -c gunicorn.conf.py main:app
+"""
+
+import os
 from app import create_app
 
 app = create_app()
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    app.run(debug=os.getenv('FLASK_DEBUG') == '1')
@@ -0,0 +1,109 @@
+"""
+migrate.py
+author: narlock
+
+Applies the versioned schema migrations in api/migrations to the
+database configured in config.yaml. Each migration is a file named
+NNNN_description.py with an upgrade(connection) and a
+downgrade(connection) function. The applied versions are recorded
+in the schema_version table.
+
+Usage (from the api directory):
+    python3 migrate.py status             # Lists migrations and whether they are applied
+    python3 migrate.py upgrade [version]  # Applies migrations up to version (default latest)
+    python3 migrate.py downgrade version  # Reverts migrations above version (0 reverts all)
+"""
+
+import os
+import re
+import sys
+import importlib.util
+from datetime import datetime
+from sqlalchemy import create_engine, text
+from app.config import Config
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE = re.compile(r'^(\d{4})_(\w+)\.py$')
+
+def load_migrations():
+    """
+    Returns the migrations in api/migrations as a list of
+    (version, name, module) ordered by version.
+    """
+    migrations = []
+    for file_name in sorted(os.listdir(MIGRATIONS_DIR)):
+        match = MIGRATION_FILE.match(file_name)
+        if match is None:
+            continue
+        spec = importlib.util.spec_from_file_location(file_name[:-3], os.path.join(MIGRATIONS_DIR, file_name))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        migrations.append((int(match.group(1)), match.group(2), module))
+    return migrations
+
+def get_applied_versions(engine):
+    """
+    Returns the set of applied versions, creating the schema_version
+    table if it does not exist.
+    """
+    with engine.begin() as connection:
+        connection.execute(text(
+            'CREATE TABLE IF NOT EXISTS schema_version('
+            'version INT UNSIGNED NOT NULL PRIMARY KEY, '
+            'name VARCHAR(100) NOT NULL, '
+            'applied_at DATETIME NOT NULL)'
+        ))
+        return {row[0] for row in connection.execute(text('SELECT version FROM schema_version'))}
+
+def upgrade(engine, migrations, target):
+    applied = get_applied_versions(engine)
+    for version, name, module in migrations:
+        if version > target or version in applied:
+            continue
+        print(f'Applying {version:04d}_{name}')
+        # MySQL commits DDL implicitly, so each migration is recorded
+        # as soon as it completes
+        with engine.begin() as connection:
+            module.upgrade(connection)
+            connection.execute(text('INSERT INTO schema_version (version, name, applied_at) VALUES (:version, :name, :applied_at)'),
+                               {'version': version, 'name': name, 'applied_at': datetime.utcnow()})
+
+def downgrade(engine, migrations, target):
+    applied = get_applied_versions(engine)
+    for version, name, module in reversed(migrations):
+        if version <= target or version not in applied:
+            continue
+        print(f'Reverting {version:04d}_{name}')
+        with engine.begin() as connection:
+            module.downgrade(connection)
+            connection.execute(text('DELETE FROM schema_version WHERE version = :version'), {'version': version})
+
+def status(engine, migrations):
+    applied = get_applied_versions(engine)
+    for version, name, _ in migrations:
+        state = 'applied' if version in applied else 'pending'
+        print(f'{version:04d}_{name}: {state}')
+
+def main(args):
+    if not args or args[0] not in ['status', 'upgrade', 'downgrade']:
+        print(__doc__)
+        return 1
+
+    migrations = load_migrations()
+    engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
+    command = args[0]
+
+    if command == 'status':
+        status(engine, migrations)
+    elif command == 'upgrade':
+        target = int(args[1]) if len(args) > 1 else max((version for version, _, _ in migrations), default=0)
+        upgrade(engine, migrations, target)
+    else:
+        if len(args) < 2:
+            print('A target version is required to downgrade')
+            return 1
+        downgrade(engine, migrations, int(args[1]))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
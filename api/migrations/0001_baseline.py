@@ -0,0 +1,152 @@
+"""
+Creates the Alder tables defined in setupdb.sql if they do not exist,
+so that a database created by setupdb.sql is adopted as is.
+"""
+
+from tools.migration import MigrationUtils
+
+# Tables in creation order, dropped in reverse order on downgrade
+TABLES = [
+    'user',
+    'monthtime',
+    'dailytime',
+    'rbuser',
+    'accomplishment',
+    'dailytoken',
+    'achievement',
+    'streak',
+    'todo',
+    'triviaquestion',
+    'kanban',
+    'reminder'
+]
+
+def upgrade(connection):
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `user` (
+            id BIGINT UNSIGNED NOT NULL PRIMARY KEY,
+            tokens INT UNSIGNED NOT NULL,
+            stime BIGINT UNSIGNED NOT NULL,
+            timezone VARCHAR(100) NOT NULL DEFAULT 'UTC',
+            hex VARCHAR(7),
+            trivia INT UNSIGNED
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `monthtime` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            mth SMALLINT NOT NULL,
+            yr SMALLINT NOT NULL,
+            stime INT UNSIGNED NOT NULL,
+            PRIMARY KEY (user_id, mth, yr),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `dailytime` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            d SMALLINT NOT NULL,
+            mth SMALLINT NOT NULL,
+            yr SMALLINT NOT NULL,
+            stime INT UNSIGNED NOT NULL,
+            PRIMARY KEY (user_id, d, mth, yr),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `rbuser` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            rbtype VARCHAR(15) NOT NULL,
+            xp BIGINT UNSIGNED NOT NULL,
+            model INT UNSIGNED NOT NULL,
+            purchased_models VARCHAR(200),
+            PRIMARY KEY (user_id),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `accomplishment` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            msg VARCHAR(200),
+            PRIMARY KEY(user_id, msg)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `dailytoken` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            date_time DATETIME NOT NULL,
+            PRIMARY KEY (user_id),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `achievement` (
+            id INT UNSIGNED,
+            user_id BIGINT UNSIGNED,
+            PRIMARY KEY(id, user_id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `streak` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            current_streak INT UNSIGNED DEFAULT 0,
+            previous_connection_date DATE NOT NULL,
+            highest_streak_achieved INT UNSIGNED DEFAULT 0,
+            PRIMARY KEY (user_id),
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `todo` (
+            id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+            user_id BIGINT UNSIGNED NOT NULL,
+            item_name VARCHAR(250),
+            completed_date DATE,
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `triviaquestion` (
+            id INT UNSIGNED NOT NULL AUTO_INCREMENT,
+            title VARCHAR(500) NOT NULL,
+            option_a VARCHAR(100) NOT NULL,
+            option_b VARCHAR(100) NOT NULL,
+            option_c VARCHAR(100) NOT NULL,
+            option_d VARCHAR(100) NOT NULL,
+            correct SMALLINT NOT NULL,
+            author VARCHAR(100) NOT NULL,
+            category VARCHAR(100) NOT NULL,
+            PRIMARY KEY (id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `kanban` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY,
+            item_name VARCHAR(250) NOT NULL,
+            column_name VARCHAR(50) NOT NULL,
+            priority_number INT,
+            tag_name VARCHAR(50),
+            velocity INT,
+            FOREIGN KEY (user_id) REFERENCES user(id)
+        )
+    """)
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `reminder` (
+            id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+            user_id BIGINT UNSIGNED NOT NULL,
+            title VARCHAR(255) NOT NULL,
+            description TEXT,
+            remind_at DATETIME NOT NULL,
+            repeat_interval VARCHAR(50), -- e.g., 'daily', 'weekly', 'monthly', 'yearly', or a custom like: 'every_other_day', 'every_monday', 'every_tuesday', 'every_wednesday', 'every_thursday', 'every_friday', 'every_saturday', 'every_sunday', or combination of 'mtwhfsu'
+            repeat_until DATETIME, -- The date until which the reminder should repeat, NULL means indefinitely
+            repeat_count INT UNSIGNED, -- The number of times to repeat, NULL for indefinite or repeat until a specific date
+            created_at DATETIME,
+            updated_at DATETIME,
+            FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+        )
+    """)
+
+def downgrade(connection):
+    for table in reversed(TABLES):
+        MigrationUtils.execute(connection, f'DROP TABLE IF EXISTS `{table}`')
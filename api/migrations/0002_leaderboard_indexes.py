@@ -0,0 +1,27 @@
+"""
+Adds indexes for the leaderboard queries. The monthtime and dailytime
+primary keys start with user_id, so searching a period needs an index
+that starts with the period columns. The stime column is included so
+the period is read in score order without a filesort.
+"""
+
+from tools.migration import MigrationUtils
+
+# (table, index, columns)
+INDEXES = [
+    ('monthtime', 'ix_monthtime_period_stime', ['yr', 'mth', 'stime']),
+    ('dailytime', 'ix_dailytime_period_stime', ['yr', 'mth', 'd', 'stime']),
+    ('user', 'ix_user_stime', ['stime']),
+    ('user', 'ix_user_trivia', ['trivia']),
+    ('streak', 'ix_streak_current_streak', ['current_streak']),
+    ('streak', 'ix_streak_highest_streak_achieved', ['highest_streak_achieved']),
+    ('rbuser', 'ix_rbuser_xp', ['xp'])
+]
+
+def upgrade(connection):
+    for table, index, columns in INDEXES:
+        MigrationUtils.create_index(connection, table, index, columns)
+
+def downgrade(connection):
+    for table, index, _ in reversed(INDEXES):
+        MigrationUtils.drop_index(connection, table, index)
@@ -0,0 +1,34 @@
+"""
+Adds indexes for the per-user lookups: todos by completion date,
+kanban items by column and tag, reminders by time and achievements
+by user.
+
+The todo, kanban and reminder indexes start with user_id, so MySQL
+drops the index it created for the user_id foreign key in their
+favour. Downgrading restores a user_id index first so the foreign
+key keeps an index.
+"""
+
+from tools.migration import MigrationUtils
+
+# (table, index, columns)
+INDEXES = [
+    ('todo', 'ix_todo_user_completed_date', ['user_id', 'completed_date']),
+    ('kanban', 'ix_kanban_user_column_tag', ['user_id', 'column_name', 'tag_name']),
+    ('reminder', 'ix_reminder_user_remind_at', ['user_id', 'remind_at']),
+    ('reminder', 'ix_reminder_remind_at', ['remind_at']),
+    ('achievement', 'ix_achievement_user_id', ['user_id', 'id'])
+]
+
+# Tables whose foreign key on user_id is covered by an index above
+FOREIGN_KEY_TABLES = ['todo', 'kanban', 'reminder']
+
+def upgrade(connection):
+    for table, index, columns in INDEXES:
+        MigrationUtils.create_index(connection, table, index, columns)
+
+def downgrade(connection):
+    for table in FOREIGN_KEY_TABLES:
+        MigrationUtils.create_index(connection, table, f'ix_{table}_user_id', ['user_id'])
+    for table, index, _ in reversed(INDEXES):
+        MigrationUtils.drop_index(connection, table, index)
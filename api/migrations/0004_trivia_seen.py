@@ -0,0 +1,20 @@
+"""
+Adds the triviaseen table, which stores the trivia questions each user
+has answered as a zlib-compressed bitmap indexed by question id.
+"""
+
+from tools.migration import MigrationUtils
+
+def upgrade(connection):
+    MigrationUtils.execute(connection, """
+        CREATE TABLE IF NOT EXISTS `triviaseen` (
+            user_id BIGINT UNSIGNED NOT NULL,
+            seen MEDIUMBLOB NOT NULL,
+            seen_count INT UNSIGNED NOT NULL DEFAULT 0,
+            PRIMARY KEY (user_id),
+            FOREIGN KEY (user_id) REFERENCES user(id) ON DELETE CASCADE
+        )
+    """)
+
+def downgrade(connection):
+    MigrationUtils.execute(connection, 'DROP TABLE IF EXISTS `triviaseen`')
@@ -0,0 +1,14 @@
+"""
+Adds reminder.anchor_day, the day of the month a monthly or yearly
+reminder was set for. Occurrences return to it after a shorter month
+instead of staying on the clamped day. Existing reminders keep NULL,
+which uses the day of their current remind_at.
+"""
+
+from tools.migration import MigrationUtils
+
+def upgrade(connection):
+    MigrationUtils.add_column(connection, 'reminder', 'anchor_day', 'SMALLINT NULL')
+
+def downgrade(connection):
+    MigrationUtils.drop_column(connection, 'reminder', 'anchor_day')
@@ -0,0 +1,37 @@
+import os
+import sys
+import pytest
+
+API_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The API modules are imported as top-level packages (app, tools), as
+# when the API is run from the api directory
+sys.path.insert(0, API_DIR)
+
+@pytest.fixture(scope='session')
+def app(tmp_path_factory):
+    """
+    The Flask app on a temporary SQLite database, in testing mode so
+    every response carries the query diagnostic headers. Skipped when
+    the API dependencies are not installed.
+    """
+    pytest.importorskip('flask_sqlalchemy')
+    os.environ['DATABASE_URI'] = f"sqlite:///{tmp_path_factory.mktemp('db') / 'alder.db'}"
+
+    # config.yaml is read relative to the api directory
+    cwd = os.getcwd()
+    os.chdir(API_DIR)
+    try:
+        from app import create_app, db
+        alder_app = create_app()
+    finally:
+        os.chdir(cwd)
+
+    alder_app.config['TESTING'] = True
+    with alder_app.app_context():
+        db.create_all()
+    return alder_app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
@@ -0,0 +1,74 @@
+import asyncio
+import pytest
+
+@pytest.fixture(scope='module')
+def asgi(app):
+    """
+    The async app of the ASGI mode on the same SQLite database as the
+    Flask app, and a function running a coroutine on one event loop,
+    which the pooled connections of the async engine are bound to.
+    """
+    pytest.importorskip('quart')
+    pytest.importorskip('aiosqlite')
+    from app.config import Config
+    Config.ASYNC_DATABASE_URI = app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite://', 'sqlite+aiosqlite://', 1)
+
+    from app.asgi import create_asgi_app, async_engine
+    async_app = create_asgi_app().async_app
+    async_app.testing = True
+
+    loop = asyncio.new_event_loop()
+    yield async_app.test_client(), loop.run_until_complete
+    loop.run_until_complete(async_engine.dispose())
+    loop.close()
+
+def test_ensure_and_increment_are_async(asgi):
+    client, run = asgi
+
+    response = run(client.put('/user/8100/ensure'))
+    assert response.status_code == 200
+    assert run(response.get_json())['user']['tokens'] == 0
+
+    response = run(client.patch('/user/8100/increment', json={'tokens': 3, 'stime': 60}))
+    assert response.status_code == 200
+    user = run(response.get_json())
+    assert (user['tokens'], user['stime']) == (3, 60)
+
+    response = run(client.patch('/user/8101/increment', json={'tokens': 3}))
+    assert response.status_code == 404
+
+def test_focus_session_is_async(asgi):
+    client, run = asgi
+
+    response = run(client.post('/focus/session', json={'user_id': 8102, 'seconds': 120, 'tokens': 2}))
+    assert response.status_code == 200
+    body = run(response.get_json())
+    assert body['user']['stime'] == 120
+    assert body['dailytime']['stime'] == 120
+    assert body['monthtime']['stime'] == 120
+
+def test_profile_is_async(asgi):
+    client, run = asgi
+    run(client.put('/user/8103/ensure'))
+
+    response = run(client.get('/profile/8103'))
+    assert response.status_code == 200
+    assert run(response.get_json())['id'] == 8103
+    assert int(response.headers['X-Query-Count']) == 1
+
+    response = run(client.get('/profile/8104'))
+    assert response.status_code == 404
+
+def test_async_routes_are_in_the_metrics(asgi, client):
+    async_client, run = asgi
+    series = 'alder_request_duration_seconds_count{method="PUT",route="/user/<int:id>/ensure"}'
+
+    def count():
+        for line in client.get('/metrics').get_data(as_text=True).splitlines():
+            if line.startswith(series + ' '):
+                return int(line.split()[1])
+        return 0
+
+    before = count()
+    run(async_client.put('/user/8105/ensure'))
+    assert count() == before + 1
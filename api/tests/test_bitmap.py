@@ -0,0 +1,38 @@
+import random
+
+from tools.bitmap import Bitmap
+
+def test_add_and_contains():
+    bitmap = Bitmap()
+    assert 0 not in bitmap
+    assert bitmap.add(0)
+    assert bitmap.add(9)
+    assert not bitmap.add(9)
+    assert 0 in bitmap and 9 in bitmap
+    assert 1 not in bitmap and 8 not in bitmap
+    assert 10**6 not in bitmap
+    assert len(bitmap) == 2
+
+def test_compressed_round_trip():
+    random.seed(0)
+    ids = set(random.sample(range(100000), 500))
+    bitmap = Bitmap()
+    for id in ids:
+        bitmap.add(id)
+
+    restored = Bitmap.from_compressed(bitmap.to_compressed())
+
+    assert len(restored) == len(ids)
+    assert all(id in restored for id in ids)
+    assert not any(id in restored for id in range(100000) if id not in ids)
+
+def test_empty_stored_bitmap():
+    assert len(Bitmap.from_compressed(None)) == 0
+    assert len(Bitmap.from_compressed(b'')) == 0
+    assert len(Bitmap.from_compressed(Bitmap().to_compressed())) == 0
+
+def test_sparse_bitmap_compresses_well():
+    bitmap = Bitmap()
+    for id in range(0, 100000, 1000):
+        bitmap.add(id)
+    assert len(bitmap.to_compressed()) < 500
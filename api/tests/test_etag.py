@@ -0,0 +1,58 @@
+def seed_user(app, id):
+    from app import db
+    from app.model.user_model import User
+    with app.app_context():
+        db.session.add(User(id=id, tokens=0, stime=0, timezone='UTC', trivia=0))
+        db.session.commit()
+
+def test_unchanged_user_is_not_modified(app, client):
+    seed_user(app, 3000)
+
+    response = client.get('/user/3000')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+
+    response = client.get('/user/3000', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+    assert response.headers['ETag'] == etag
+
+def test_updated_user_gets_a_new_etag(app, client):
+    seed_user(app, 3001)
+    etag = client.get('/user/3001').headers['ETag']
+
+    assert client.patch('/user/3001/increment', json={'tokens': 5}).status_code == 200
+
+    response = client.get('/user/3001', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.get_json()['tokens'] == 5
+    assert response.headers['ETag'] != etag
+
+def test_content_etag_of_other_gets(app, client):
+    from app import db
+    from app.model.kanban_model import KanbanModel
+    with app.app_context():
+        db.session.add(KanbanModel(user_id=3002, item_name='Item', column_name='todo', tag_name='school'))
+        db.session.commit()
+
+    response = client.get('/kanban/user/3002')
+    etag = response.headers['ETag']
+    assert response.status_code == 200
+
+    response = client.get('/kanban/user/3002', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.data == b''
+
+def test_stale_etag_gets_the_body(app, client):
+    seed_user(app, 3003)
+
+    response = client.get('/user/3003', headers={'If-None-Match': '"stale"'})
+    assert response.status_code == 200
+    assert response.get_json()['id'] == 3003
+
+def test_non_get_responses_have_no_etag(app, client):
+    seed_user(app, 3004)
+
+    response = client.patch('/user/3004/increment', json={'tokens': 1})
+    assert response.status_code == 200
+    assert 'ETag' not in response.headers
@@ -0,0 +1,108 @@
+import json
+import pytest
+from datetime import date
+
+pytest.importorskip('flask')
+
+from werkzeug.datastructures import MIMEAccept
+from werkzeug.http import parse_accept_header
+from tools.json_provider import prefers_msgpack, encode_body
+from tools.msgpackcodec import MsgpackCodec, MSGPACK_MIMETYPE
+
+def accept(value):
+    return parse_accept_header(value, MIMEAccept)
+
+def default(value):
+    # Like Flask's default, raises TypeError for unsupported values
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+@pytest.mark.parametrize('header, expected', [
+    (None, False),
+    ('*/*', False),
+    ('application/json', False),
+    ('application/json, application/msgpack;q=0.5', False),
+    ('application/msgpack', True),
+    ('application/msgpack, application/json;q=0.5', True),
+    ('application/msgpack, */*;q=0.1', True),
+])
+def test_prefers_msgpack(monkeypatch, header, expected):
+    monkeypatch.setattr(MsgpackCodec, 'available', True)
+
+    assert prefers_msgpack(accept(header)) == expected
+
+def test_json_without_msgpack_installed(monkeypatch):
+    monkeypatch.setattr(MsgpackCodec, 'available', False)
+
+    assert not prefers_msgpack(accept('application/msgpack'))
+
+def test_json_body():
+    body, mimetype = encode_body({'id': 1, 'day': date(2024, 9, 22)}, default, accept('application/json'))
+
+    assert mimetype == 'application/json'
+    assert json.loads(body) == {'id': 1, 'day': '2024-09-22'}
+
+def test_json_body_outside_a_request():
+    body, mimetype = encode_body([1, 2], default, None)
+
+    assert mimetype == 'application/json'
+    assert json.loads(body) == [1, 2]
+
+def test_msgpack_body():
+    pytest.importorskip('msgpack')
+
+    body, mimetype = encode_body({'id': 2**63 - 1, 'day': date(2024, 9, 22)}, default, accept(MSGPACK_MIMETYPE))
+
+    assert mimetype == MSGPACK_MIMETYPE
+    assert MsgpackCodec.loads(body) == {'id': 2**63 - 1, 'day': '2024-09-22'}
+
+def test_msgpack_falls_back_to_json_for_wide_integers():
+    pytest.importorskip('msgpack')
+
+    body, mimetype = encode_body({'id': 2**70}, default, accept(MSGPACK_MIMETYPE))
+
+    assert mimetype == 'application/json'
+    assert json.loads(body) == {'id': 2**70}
+
+def test_response_follows_the_accept_header(app, client):
+    pytest.importorskip('msgpack')
+    from app import db
+    from app.model.user_model import User
+    with app.app_context():
+        db.session.add(User(id=6000, tokens=3, stime=0, timezone='UTC', trivia=0))
+        db.session.commit()
+
+    response = client.get('/user/6000', headers={'Accept': MSGPACK_MIMETYPE})
+    assert response.mimetype == MSGPACK_MIMETYPE
+    assert MsgpackCodec.loads(response.data)['tokens'] == 3
+    assert 'Accept' in response.vary
+    msgpack_etag = response.headers['ETag']
+
+    response = client.get('/user/6000', headers={'Accept': 'application/json'})
+    assert response.mimetype == 'application/json'
+    assert response.get_json()['tokens'] == 3
+    # Each representation has its own ETag
+    assert response.headers['ETag'] != msgpack_etag
+
+def test_msgpack_request_body(app, client):
+    pytest.importorskip('msgpack')
+    from app import db
+    from app.model.user_model import User
+    with app.app_context():
+        db.session.add(User(id=6001, tokens=0, stime=0, timezone='UTC', trivia=0))
+        db.session.commit()
+
+    response = client.patch('/user/6001/increment', data=MsgpackCodec.dumps({'tokens': 4}), content_type=MSGPACK_MIMETYPE)
+
+    assert response.status_code == 200
+    assert response.get_json()['tokens'] == 4
+
+def test_provider_falls_back_to_json_for_wide_integers(app):
+    pytest.importorskip('msgpack')
+
+    with app.test_request_context(headers={'Accept': MSGPACK_MIMETYPE}):
+        response = app.json.response({'id': 2**70})
+
+    assert response.mimetype == 'application/json'
+    assert json.loads(response.data) == {'id': 2**70}
@@ -0,0 +1,53 @@
+import pytest
+
+# Queries of an ensure call: one INSERT and one read back per table
+ENSURE_QUERIES = 8
+
+@pytest.fixture
+def boards(app):
+    """
+    Loads every board, as on startup, and returns a function giving
+    the score of a user on a board, or None if the user is not on it.
+    """
+    from app.service.leaderboard_service import LeaderboardService
+    with app.app_context():
+        LeaderboardService.load_all()
+    return lambda board, user_id: LeaderboardService._boards[board].scores.get(user_id)
+
+def test_ensure_adds_only_created_rows(client, boards):
+    response = client.put('/user/7000/ensure')
+    assert response.status_code == 200
+    assert int(response.headers['X-Query-Count']) == ENSURE_QUERIES
+    for board in ('all', 'trivia', 'month', 'day', 'streak', 'highest_streak'):
+        assert boards(board, 7000) == 0
+
+    # Nothing is created the second time, and no board is read
+    response = client.put('/user/7000/ensure')
+    assert response.status_code == 200
+    assert int(response.headers['X-Query-Count']) == ENSURE_QUERIES
+
+def test_increment_updates_the_boards_of_its_fields(client, boards):
+    client.put('/user/7001/ensure')
+
+    response = client.patch('/user/7001/increment', json={'stime': 50, 'trivia': 2})
+    assert response.status_code == 200
+    assert boards('all', 7001) == 50
+    assert boards('trivia', 7001) == 2
+
+    client.patch('/user/7001/increment', json={'tokens': 5})
+    assert boards('all', 7001) == 50
+
+def test_other_periods_are_not_on_the_board(client, boards):
+    response = client.post('/monthtime', json={'user_id': 7002, 'mth': 1, 'yr': 2000, 'stime': 90})
+
+    assert response.status_code == 201
+    assert boards('month', 7002) is None
+
+def test_deleted_user_leaves_the_boards(client, boards):
+    response = client.post('/user', json={'id': 7003, 'tokens': 0, 'stime': 30, 'trivia': 1})
+    assert response.status_code == 201
+    assert boards('all', 7003) == 30
+
+    assert client.delete('/user/7003').status_code == 204
+    assert boards('all', 7003) is None
+    assert boards('trivia', 7003) is None
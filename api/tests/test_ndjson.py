@@ -0,0 +1,75 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+
+# Reminders of these tests are due in a window no other test uses
+WINDOW_START = datetime(2031, 1, 1, 9, 0, 0)
+BEFORE = '2031-01-02T00:00:00'
+
+def test_lines_writes_one_line_per_item():
+    pytest.importorskip('flask')
+    from tools.ndjson import NdjsonUtils
+
+    lines = list(NdjsonUtils.lines([{'id': 1}, {'id': 2}], lambda item: {**item, 'seen': True}))
+
+    assert [json.loads(line) for line in lines] == [{'id': 1, 'seen': True}, {'id': 2, 'seen': True}]
+    assert all(line.endswith(b'\n') and line.count(b'\n') == 1 for line in lines)
+
+def test_cursor_round_trip(app):
+    from app.service.reminder_service import ReminderService
+
+    cursor = ReminderService.decode_cursor('2024-09-22T10:00:00_42')
+
+    assert cursor == (datetime(2024, 9, 22, 10, 0, 0), 42)
+
+@pytest.mark.parametrize('cursor', ['', '42', '2024-09-22T10:00:00', '2024-09-22_42', '2024-09-22T10:00:00_x'])
+def test_malformed_cursor_raises(app, cursor):
+    from app.service.reminder_service import ReminderService
+
+    with pytest.raises(ValueError):
+        ReminderService.decode_cursor(cursor)
+
+def seed_reminders(app):
+    """
+    Seeds reminders due in the window, three of them at the same time
+    so pages split between reminders sharing remind_at, and one due
+    after the window. Returns the ids due in the window, in
+    (remind_at, id) order.
+    """
+    from app import db
+    from app.model.reminder_model import ReminderModel
+
+    times = [WINDOW_START + timedelta(hours=hours) for hours in (3, 1, 2, 2, 2, 0, 5)]
+    with app.app_context():
+        # Ids are given as SQLite does not generate BIGINT keys
+        reminders = [ReminderModel(id=5000+i, user_id=2000, title=f'Reminder {i}', remind_at=remind_at) for i, remind_at in enumerate(times)]
+        late = ReminderModel(id=5100, user_id=2000, title='Late', remind_at=datetime(2031, 1, 3))
+        db.session.add_all(reminders + [late])
+        db.session.commit()
+        return [reminder.id for reminder in sorted(reminders, key=lambda reminder: (reminder.remind_at, reminder.id))]
+
+def read_page(client, **params):
+    response = client.get('/reminder/due', query_string={'before': BEFORE, 'after': WINDOW_START.strftime('%Y-%m-%dT%H:%M:%S'), **params})
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    return [json.loads(line) for line in response.data.splitlines()]
+
+def test_due_reminders_are_paged_with_the_cursor(app, client):
+    expected = seed_reminders(app)
+
+    pages = []
+    cursor = None
+    while True:
+        page = read_page(client, limit=3, **({'cursor': cursor} if cursor else {}))
+        pages.append(page)
+        if len(page) < 3:
+            break
+        cursor = f"{page[-1]['remind_at']}_{page[-1]['id']}"
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert [reminder['id'] for page in pages for reminder in page] == expected
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get('/reminder/due', query_string={'before': BEFORE, 'cursor': 'not-a-cursor'})
+
+    assert response.status_code == 400
@@ -0,0 +1,96 @@
+import json
+import pytest
+from types import SimpleNamespace
+
+# Users of these tests are told apart from other tests' users by their
+# tokens
+TOKENS = 777
+
+def user_keys():
+    from app.model.user_model import User
+    from tools.pagination import SortKey
+    return [SortKey(User.trivia, descending=True, default=0), SortKey(User.id, descending=True)]
+
+def test_cursor_round_trip(app):
+    from tools.pagination import PaginationUtils
+    keys = user_keys()
+
+    cursor = PaginationUtils.encode_cursor(keys, SimpleNamespace(trivia=12, id=340282366920938463))
+
+    assert PaginationUtils.decode_cursor(keys, cursor) == [12, 340282366920938463]
+
+def test_cursor_of_null_value_holds_the_default(app):
+    from tools.pagination import PaginationUtils
+    keys = user_keys()
+
+    cursor = PaginationUtils.encode_cursor(keys, SimpleNamespace(trivia=None, id=1))
+
+    assert PaginationUtils.decode_cursor(keys, cursor) == [0, 1]
+
+@pytest.mark.parametrize('cursor', ['not a cursor', 'bm90IGpzb24=', 'WzFd', 'eyJhIjogMX0='])
+def test_malformed_cursor_raises(app, cursor):
+    # Not base64, not JSON, one value for two keys, and not a list
+    from tools.pagination import PaginationUtils
+
+    with pytest.raises(ValueError):
+        PaginationUtils.decode_cursor(user_keys(), cursor)
+
+def test_page_size(app):
+    from tools.pagination import PaginationUtils, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+    assert PaginationUtils.get_page_size(None) == DEFAULT_PAGE_SIZE
+    assert PaginationUtils.get_page_size('25') == 25
+    assert PaginationUtils.get_page_size(MAX_PAGE_SIZE) == MAX_PAGE_SIZE
+    for limit in (0, -1, MAX_PAGE_SIZE + 1, 'ten'):
+        with pytest.raises(ValueError):
+            PaginationUtils.get_page_size(limit)
+
+def seed_users(app):
+    """
+    Seeds users with tied and missing trivia scores. Returns their ids
+    in the order of a search sorted by trivia.
+    """
+    from app import db
+    from app.model.user_model import User
+
+    scores = {4000: 5, 4001: None, 4002: 9, 4003: 5, 4004: 5, 4005: None, 4006: 1, 4007: 9, 4008: 0, 4009: 5, 4010: 3}
+    with app.app_context():
+        db.session.add_all([User(id=id, tokens=TOKENS, stime=0, timezone='UTC', trivia=trivia) for id, trivia in scores.items()])
+        db.session.commit()
+    return sorted(scores, key=lambda id: (scores[id] or 0, id), reverse=True)
+
+def search(client, **body):
+    return client.post('/user/search', json={
+        'conditions': [{'field': 'tokens', 'condition': 'eq', 'value': TOKENS}],
+        'sort_field': 'trivia',
+        **body
+    })
+
+def test_search_is_paged_with_the_cursor(app, client):
+    expected = seed_users(app)
+
+    ids = []
+    pages = 0
+    cursor = None
+    while True:
+        response = search(client, limit=4, **({'cursor': cursor} if cursor else {}))
+        assert response.status_code == 200
+        ids += [user['id'] for user in response.get_json()]
+        pages += 1
+        cursor = response.headers.get('X-Next-Cursor')
+        if cursor is None:
+            break
+
+    assert pages == 3
+    assert ids == expected
+
+    # Streaming from a page's cursor returns every later user
+    cursor = search(client, limit=4).headers['X-Next-Cursor']
+    response = search(client, cursor=cursor, stream=True)
+    assert response.status_code == 200
+    assert [json.loads(line)['id'] for line in response.data.splitlines()] == expected[4:]
+
+def test_search_with_invalid_cursor(client):
+    response = search(client, cursor='not a cursor')
+
+    assert response.status_code == 400
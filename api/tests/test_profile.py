@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+
+def seed(app, rows):
+    from app import db
+    with app.app_context():
+        db.session.add_all(rows)
+        db.session.commit()
+
+def test_profile_is_read_with_one_query(app, client):
+    from app.model.user_model import User
+    from app.model.monthtime_model import MonthTime
+    from app.model.streak_model import StreakModel
+    from app.model.accomplishment_model import Accomplishment
+    from app.model.achievement_model import Achievement
+    from tools.utils import DateTimeUtils
+
+    mth, yr = DateTimeUtils.get_utc_month_year_now()
+    seed(app, [
+        User(id=8000, tokens=4, stime=7200, timezone='UTC', trivia=3),
+        MonthTime(user_id=8000, mth=mth, yr=yr, stime=3600),
+        StreakModel(user_id=8000, current_streak=2, previous_connection_date=datetime.now(timezone.utc).date(), highest_streak_achieved=5),
+        Accomplishment(user_id=8000, msg='Finished, the essay'),
+        Accomplishment(user_id=8000, msg='Read "a book"'),
+        Achievement(user_id=8000, id=1),
+        Achievement(user_id=8000, id=2)
+    ])
+
+    response = client.get('/profile/8000')
+    profile = response.get_json()
+
+    assert response.status_code == 200
+    assert int(response.headers['X-Query-Count']) == 1
+    assert profile['stime'] == 7200
+    assert profile['month_stime'] == 3600
+    assert profile['daily_stime'] == 0
+    assert profile['current_streak'] == 2
+    assert profile['highest_streak_achieved'] == 5
+    assert sorted(profile['accomplishments']) == ['Finished, the essay', 'Read "a book"']
+    assert sorted(profile['achievements']) == [1, 2]
+
+def test_profile_without_list_values(app, client):
+    from app.model.user_model import User
+    seed(app, [User(id=8001, tokens=0, stime=0, timezone='UTC')])
+
+    profile = client.get('/profile/8001').get_json()
+
+    assert profile['accomplishments'] == []
+    assert profile['achievements'] == []
+    assert profile['rb_xp'] == 0
+
+def test_missing_profile(client):
+    assert client.get('/profile/8999').status_code == 404
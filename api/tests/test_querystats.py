@@ -0,0 +1,92 @@
+import itertools
+import pytest
+from datetime import date, timedelta
+
+# Each test seeds its rows for users of its own, so tests sharing the
+# database do not see each other's rows
+user_ids = itertools.count(1000)
+
+# Queries a bulk delete may run whatever the number of rows: the
+# DELETE, and the leaderboard refresh of the time endpoints
+MAX_DELETE_QUERIES = 2
+
+def query_count(response):
+    return int(response.headers['X-Query-Count'])
+
+def seed(app, rows):
+    from app import db
+    with app.app_context():
+        db.session.add_all(rows)
+        db.session.commit()
+
+def kanban_items(user_id, count):
+    from app.model.kanban_model import KanbanModel
+    columns = ('todo', 'doing', 'done')
+    return [KanbanModel(user_id=user_id, item_name=f'Item {i}', column_name=columns[i % 3], tag_name='school') for i in range(count)]
+
+def todo_items(user_id, count):
+    from app.model.todo_model import TodoModel
+    completed_date = date.today() - timedelta(days=7)
+    return [TodoModel(user_id=user_id, item_name=f'Item {i}', completed_date=completed_date) for i in range(count)]
+
+def accomplishments(user_id, count):
+    from app.model.accomplishment_model import Accomplishment
+    return [Accomplishment(user_id=user_id, msg=f'Accomplishment {i}') for i in range(count)]
+
+def achievements(user_id, count):
+    from app.model.achievement_model import Achievement
+    return [Achievement(user_id=user_id, id=i) for i in range(count)]
+
+def dailytimes(user_id, count):
+    from app.model.dailytime_model import DailyTime
+    return [DailyTime(user_id=user_id, d=i % 28 + 1, mth=i // 28 + 1, yr=2024, stime=3600) for i in range(count)]
+
+def monthtimes(user_id, count):
+    from app.model.monthtime_model import MonthTime
+    return [MonthTime(user_id=user_id, mth=i % 12 + 1, yr=2000 + i // 12, stime=3600) for i in range(count)]
+
+@pytest.mark.parametrize('path', ['/kanban/user/{}', '/kanban/user/{}/tag/school'])
+def test_kanban_board_is_read_with_one_query(app, client, path):
+    for count in (3, 30):
+        user_id = next(user_ids)
+        seed(app, kanban_items(user_id, count))
+
+        response = client.get(path.format(user_id))
+
+        assert response.status_code == 200
+        assert [len(response.get_json()[column]) for column in ('todo', 'doing', 'done')] == [count // 3] * 3
+        assert query_count(response) == 1
+
+@pytest.mark.parametrize('path, rows', [
+    ('/kanban/user/{}', kanban_items),
+    ('/todo/complete/{}', todo_items),
+    ('/todo/all/{}', todo_items),
+    ('/accomplishments/{}', accomplishments),
+    ('/achievements/{}', achievements),
+    ('/dailytime/{}', dailytimes),
+    ('/monthtime/{}', monthtimes)
+])
+def test_bulk_delete_query_count_does_not_grow_with_rows(app, client, path, rows):
+    counts = []
+    for count in (3, 30):
+        user_id = next(user_ids)
+        seed(app, rows(user_id, count))
+
+        response = client.delete(path.format(user_id))
+
+        assert response.status_code == 204
+        counts.append(query_count(response))
+    assert counts[0] == counts[1] <= MAX_DELETE_QUERIES
+
+def test_repeated_statements_are_reported(app):
+    from tools.querystats import QueryStats
+
+    with app.test_request_context('/'):
+        QueryStats.before_request()
+        for _ in range(QueryStats.repeated_query_limit + 1):
+            QueryStats.observe_query('SELECT * FROM user WHERE id = ?', (1,), 0.001)
+        QueryStats.observe_query('SELECT * FROM kanban', (), 0.001)
+        response = QueryStats.after_request(app.response_class())
+
+    assert response.headers['X-Query-Count'] == str(QueryStats.repeated_query_limit + 2)
+    assert response.headers['X-Repeated-Queries'] == '1'
@@ -0,0 +1,30 @@
+import pytest
+
+sqlalchemy = pytest.importorskip('sqlalchemy')
+
+from tools.querytimer import QueryTimer
+
+def test_each_statement_is_timed_once_for_every_callback():
+    engine = sqlalchemy.create_engine('sqlite://')
+    first, second = [], []
+    QueryTimer.listen(engine, lambda statement, parameters, seconds: first.append(statement))
+    QueryTimer.listen(engine, lambda statement, parameters, seconds: second.append(statement))
+
+    with engine.connect() as connection:
+        connection.execute(sqlalchemy.text('SELECT 1'))
+
+    assert first == second == ['SELECT 1']
+
+def test_failed_statements_are_timed_and_leave_nothing_on_the_connection():
+    engine = sqlalchemy.create_engine('sqlite://')
+    statements = []
+    QueryTimer.listen(engine, lambda statement, parameters, seconds: statements.append(statement))
+
+    with engine.connect() as connection:
+        with pytest.raises(sqlalchemy.exc.OperationalError):
+            connection.execute(sqlalchemy.text('SELECT * FROM missing'))
+        connection.execute(sqlalchemy.text('SELECT 2'))
+        info = dict(connection.info)
+
+    assert statements == ['SELECT * FROM missing', 'SELECT 2']
+    assert info == {}
@@ -0,0 +1,62 @@
+from datetime import datetime
+
+from tools.recurrence import Recurrence, add_months
+
+def occurrences(repeat_interval, remind_at, count, anchor_day=None):
+    """
+    Returns the next `count` occurrences of a reminder, advancing from
+    each occurrence in turn as the API does after each delivery.
+    """
+    recurrence = Recurrence.parse(repeat_interval)
+    anchor_day = anchor_day or remind_at.day
+    result = []
+    for _ in range(count):
+        remind_at, _ = recurrence.advance(remind_at, remind_at, anchor_day=anchor_day)
+        result.append(remind_at.strftime('%Y-%m-%d'))
+    return result
+
+def test_monthly_on_the_28th_stays_on_the_28th():
+    assert occurrences('monthly', datetime(2025, 1, 28, 9), 4) == ['2025-02-28', '2025-03-28', '2025-04-28', '2025-05-28']
+
+def test_monthly_on_the_29th_returns_after_february():
+    assert occurrences('monthly', datetime(2025, 1, 29, 9), 4) == ['2025-02-28', '2025-03-29', '2025-04-29', '2025-05-29']
+    assert occurrences('monthly', datetime(2024, 1, 29, 9), 2) == ['2024-02-29', '2024-03-29']
+
+def test_monthly_on_the_30th_returns_after_february():
+    assert occurrences('monthly', datetime(2025, 1, 30, 9), 4) == ['2025-02-28', '2025-03-30', '2025-04-30', '2025-05-30']
+
+def test_monthly_on_the_31st_follows_the_end_of_the_month():
+    assert occurrences('monthly', datetime(2025, 1, 31, 9), 4) == ['2025-02-28', '2025-03-31', '2025-04-30', '2025-05-31']
+
+def test_yearly_on_february_29th():
+    assert occurrences('yearly', datetime(2024, 2, 29, 9), 4) == ['2025-02-28', '2026-02-28', '2027-02-28', '2028-02-29']
+
+def test_yearly_on_february_28th_stays_on_the_28th():
+    assert occurrences('yearly', datetime(2023, 2, 28, 9), 2) == ['2024-02-28', '2025-02-28']
+
+def test_anchor_defaults_to_the_day_of_remind_at():
+    assert add_months(datetime(2025, 2, 28, 9), 1) == datetime(2025, 3, 28, 9)
+    assert add_months(datetime(2025, 2, 28, 9), 1, anchor_day=31) == datetime(2025, 3, 31, 9)
+
+def test_advance_keeps_the_time_of_day():
+    assert add_months(datetime(2025, 1, 31, 23, 59, 30), 1) == datetime(2025, 2, 28, 23, 59, 30)
+
+def test_advance_skips_missed_occurrences():
+    recurrence = Recurrence.parse('daily')
+    assert recurrence.advance(datetime(2025, 1, 1, 9), datetime(2025, 1, 3, 12), repeat_count=5) == (datetime(2025, 1, 4, 9), 2)
+
+def test_advance_stops_at_repeat_until_and_repeat_count():
+    recurrence = Recurrence.parse('weekly')
+    assert recurrence.advance(datetime(2025, 1, 1, 9), datetime(2025, 1, 1, 9), repeat_until=datetime(2025, 1, 5)) is None
+    assert recurrence.advance(datetime(2025, 1, 1, 9), datetime(2025, 1, 1, 9), repeat_count=0) is None
+
+def test_weekday_letters():
+    recurrence = Recurrence.parse('mwf')
+    # 2025-01-03 is a Friday
+    assert recurrence.next(datetime(2025, 1, 3, 9)) == datetime(2025, 1, 6, 9)
+    assert Recurrence.parse('every_wednesday').next(datetime(2025, 1, 3, 9)) == datetime(2025, 1, 8, 9)
+
+def test_parse_rejects_unknown_intervals():
+    assert Recurrence.parse(None) is None
+    assert not Recurrence.is_valid('fortnightly')
+    assert not Recurrence.is_valid('mxz')
@@ -0,0 +1,43 @@
+import pytest
+
+from tools.bitmap import Bitmap
+
+@pytest.fixture
+def trivia_service(app):
+    from app.service import trivia_service
+    return trivia_service
+
+def make_pool(trivia_service, ids):
+    pool = trivia_service.IdPool()
+    for id in ids:
+        pool.add(id)
+    return pool
+
+def test_id_pool_remove_keeps_the_other_ids(trivia_service):
+    pool = make_pool(trivia_service, range(10))
+    pool.remove(3)
+    pool.remove(9)
+    pool.remove(42)
+    assert sorted(pool.ids) == [0, 1, 2, 4, 5, 6, 7, 8]
+    assert all(pool.ids[position] == id for id, position in pool.positions.items())
+
+def test_pick_unseen_skips_seen_questions(trivia_service):
+    pool = make_pool(trivia_service, range(100))
+    seen = Bitmap()
+    for id in range(95):
+        seen.add(id)
+
+    picked = trivia_service.TriviaService.pick_unseen(pool, seen, 5)
+
+    assert sorted(picked) == [95, 96, 97, 98, 99]
+
+def test_pick_unseen_repeats_only_once_everything_is_seen(trivia_service):
+    pool = make_pool(trivia_service, range(10))
+    seen = Bitmap()
+    for id in range(9):
+        seen.add(id)
+
+    picked = trivia_service.TriviaService.pick_unseen(pool, seen, 3)
+
+    assert picked[0] == 9
+    assert len(set(picked)) == 3
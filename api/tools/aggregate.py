@@ -0,0 +1,22 @@
+from sqlalchemy import JSON
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
+
+class json_array_agg(FunctionElement):
+    """
+    Aggregate of a column into a JSON array, returned as a list, so
+    list-valued data can be read in the same query as the row it
+    belongs to. Compiled to JSON_ARRAYAGG on MySQL and json_group_array
+    on SQLite. MySQL returns NULL rather than an empty array when no
+    row is aggregated.
+    """
+    type = JSON()
+    inherit_cache = True
+
+@compiles(json_array_agg, 'mysql')
+def compile_json_array_agg_mysql(element, compiler, **kw):
+    return f'JSON_ARRAYAGG({compiler.process(element.clauses, **kw)})'
+
+@compiles(json_array_agg, 'sqlite')
+def compile_json_array_agg_sqlite(element, compiler, **kw):
+    return f'json_group_array({compiler.process(element.clauses, **kw)})'
@@ -0,0 +1,121 @@
+"""
+benchmark_json.py
+author: narlock
+
+Benchmarks the JSON codecs on the largest Alder API payloads. Run from
+the api directory:
+
+    python -m tools.benchmark_json [rounds]
+
+For each payload, reports the time the API takes to encode it and the
+time the bot takes to parse it from the response bytes, with the json
+module, and with orjson and MessagePack when they are installed. The
+json module parse includes decoding the bytes to text, as the bot did
+before it parsed from bytes. The MessagePack body size is also shown.
+"""
+
+import json
+import random
+import sys
+import time
+
+from tools.jsoncodec import JsonCodec, orjson
+from tools.msgpackcodec import MsgpackCodec
+
+USER_ID = 123456789012345678
+
+def reminders(count):
+    """
+    Body of GET /reminder, every reminder in the database.
+    """
+    return [{
+        'id': id,
+        'user_id': USER_ID + id % 500,
+        'title': f'Reminder number {id} for the study group',
+        'description': 'Review the chapter notes and finish the practice problems before the session.',
+        'remind_at': '2024-09-22T10:00:00',
+        'repeat_interval': random.choice([None, 'daily', 'weekly', 'mwf']),
+        'repeat_until': None,
+        'repeat_count': None,
+        'created_at': '2024-09-01T08:30:00',
+        'updated_at': '2024-09-21T10:00:00'
+    } for id in range(count)]
+
+def users(count):
+    """
+    Body of a full page of POST /user/search.
+    """
+    return [{
+        'id': USER_ID + id,
+        'tokens': random.randint(0, 100000),
+        'stime': random.randint(0, 10**7),
+        'timezone': 'America/Chicago',
+        'hex': '383838',
+        'trivia': random.randint(0, 500)
+    } for id in range(count)]
+
+def monthtimes(count):
+    """
+    Body of a full page of POST /monthtime/search.
+    """
+    return [{'user_id': USER_ID + id, 'mth': 9, 'yr': 2024, 'stime': random.randint(0, 10**6)} for id in range(count)]
+
+def kanban(count):
+    """
+    Body of GET /kanban/user/<user_id>, a large kanban board.
+    """
+    return [{
+        'id': id,
+        'user_id': USER_ID,
+        'item_name': f'Kanban item {id}: write the next section of the report',
+        'column_name': random.choice(['todo', 'in progress', 'done']),
+        'priority_number': random.randint(1, 5),
+        'tag_name': random.choice([None, 'school', 'work', 'personal']),
+        'velocity': random.choice([None, '1', '3', '5'])
+    } for id in range(count)]
+
+PAYLOADS = [
+    ('GET /reminder (5000)', lambda: reminders(5000)),
+    ('POST /user/search (1000)', lambda: users(1000)),
+    ('POST /monthtime/search (1000)', lambda: monthtimes(1000)),
+    ('GET /kanban/user (300)', lambda: kanban(300))
+]
+
+def timed(function, rounds):
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        function()
+    return (time.perf_counter() - begin) / rounds * 1e3
+
+def run(rounds):
+    random.seed(0)
+    codecs = ['json'] + (['orjson'] if orjson is not None else [])
+    print(f'JSON benchmark, {rounds} rounds per payload, times in ms')
+    header = ' '.join(f'{f"{codec} encode":>14} {f"{codec} parse":>14}' for codec in codecs)
+    if MsgpackCodec.available:
+        header += f' {"msgpack encode":>14} {"msgpack parse":>14} {"size":>8}'
+    print(f'{"payload":<32} {"size":>8} {header}')
+
+    for label, build in PAYLOADS:
+        payload = build()
+        body = json.dumps(payload).encode()
+        results = []
+        for codec in codecs:
+            JsonCodec.use(codec)
+            encode = timed(lambda: JsonCodec.dumps(payload), rounds)
+            if codec == 'json':
+                parse = timed(lambda: json.loads(body.decode()), rounds)
+            else:
+                parse = timed(lambda: JsonCodec.loads(body), rounds)
+            assert JsonCodec.loads(JsonCodec.dumps(payload)) == payload
+            results.append(f'{encode:>14.3f} {parse:>14.3f}')
+        if MsgpackCodec.available:
+            packed = MsgpackCodec.dumps(payload)
+            encode = timed(lambda: MsgpackCodec.dumps(payload), rounds)
+            parse = timed(lambda: MsgpackCodec.loads(packed), rounds)
+            assert MsgpackCodec.loads(packed) == payload
+            results.append(f'{encode:>14.3f} {parse:>14.3f} {len(packed) // 1024:>6}kB')
+        print(f'{label:<32} {len(body) // 1024:>6}kB ' + ' '.join(results))
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
@@ -0,0 +1,102 @@
+"""
+benchmark_log.py
+author: narlock
+
+Benchmarks the per-call cost of the logger. Run from the api directory:
+
+    python -m tools.benchmark_log [calls]
+
+Compares the previous logger, which built the message and looked up the
+caller with inspect.stack() on every call, with tools.log. Calls are made
+from a stack of STACK_DEPTH frames, as they would be from a request
+handler or a bot command, since inspect.stack() reads every frame of the
+stack. Output goes to os.devnull, so only the cost of the call is measured.
+"""
+
+import contextlib
+import inspect
+import os
+import sys
+import time
+
+from datetime import datetime
+from tools.log import Logger
+
+# Frames below the logging call, about as deep as a Flask view or a
+# discord.py command handler
+STACK_DEPTH = 30
+
+# Request body logged by every call, like the bot's API client does
+BODY = {'user_id': 123456789012345678, 'title': 'Study for the exam', 'remind_at': '2024-09-22T10:00:00'}
+
+class PreviousLogger():
+    """
+    The logger before tools.log was reworked, kept for comparison.
+    """
+    level = 0
+
+    @staticmethod
+    def get_caller_function_name():
+        return inspect.stack()[2].function
+
+    @staticmethod
+    def debug(message):
+        if PreviousLogger.level in [0]:
+            func_name = PreviousLogger.get_caller_function_name()
+            print(f"\033[33m{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\033[0m DEBUG \033[35m{func_name} \033[0m{message}")
+
+def previous_call():
+    PreviousLogger.debug(f'[POST] Request Body: {BODY}')
+
+def current_call():
+    Logger.debug('[%s] Request Body: %s', 'POST', BODY)
+
+def at_depth(depth, function, calls):
+    """
+    Calls `function` `calls` times from `depth` nested frames and
+    returns the seconds taken.
+    """
+    if depth > 0:
+        return at_depth(depth - 1, function, calls)
+    begin = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return time.perf_counter() - begin
+
+def report(label, elapsed, calls):
+    print(f'{label:<36} {elapsed / calls * 1e6:>9.3f}us/call')
+
+def run(calls):
+    # inspect.stack() is far slower than the rest, so it gets fewer calls
+    previous_calls = max(calls // 100, 1)
+
+    print(f'Logger benchmark, {calls} calls at a stack depth of {STACK_DEPTH}')
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        Logger.configure(level=0, stream=devnull)
+
+        PreviousLogger.level = 0
+        previous_enabled = at_depth(STACK_DEPTH, previous_call, previous_calls)
+        PreviousLogger.level = 1
+        previous_disabled = at_depth(STACK_DEPTH, previous_call, calls)
+
+        begin = time.perf_counter()
+        current_enabled = at_depth(STACK_DEPTH, current_call, calls)
+        Logger.flush(timeout=None)
+        written = time.perf_counter() - begin
+
+        Logger.configure(level=1)
+        current_disabled = at_depth(STACK_DEPTH, current_call, calls)
+
+        Logger.configure(level=0, sample={__name__: 0.01})
+        current_sampled = at_depth(STACK_DEPTH, current_call, calls)
+        Logger.flush(timeout=None)
+
+    report('previous, enabled', previous_enabled, previous_calls)
+    report('previous, disabled', previous_disabled, calls)
+    report('current, enabled (caller)', current_enabled, calls)
+    report('current, enabled (until written)', written, calls)
+    report('current, disabled', current_disabled, calls)
+    report('current, sampled at 1%', current_sampled, calls)
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
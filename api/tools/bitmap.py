@@ -0,0 +1,39 @@
+import zlib
+
+class Bitmap():
+    """
+    A growable bitmap of non-negative integers backed by a bytearray,
+    where bit i is set when i is in the set. Membership tests and adds
+    are O(1). Bitmaps are stored zlib-compressed, so a sparse bitmap
+    over a large id range takes only a few hundred bytes.
+    """
+
+    def __init__(self, data=b''):
+        self.bits = bytearray(data)
+
+    @staticmethod
+    def from_compressed(data):
+        return Bitmap(zlib.decompress(data) if data else b'')
+
+    def to_compressed(self):
+        return zlib.compress(bytes(self.bits))
+
+    def __contains__(self, value):
+        index = value >> 3
+        return index < len(self.bits) and bool(self.bits[index] & (1 << (value & 7)))
+
+    def add(self, value):
+        """
+        Sets the bit for value. Returns True if it was not already set.
+        """
+        index = value >> 3
+        if index >= len(self.bits):
+            self.bits.extend(bytes(index + 1 - len(self.bits)))
+        mask = 1 << (value & 7)
+        if self.bits[index] & mask:
+            return False
+        self.bits[index] |= mask
+        return True
+
+    def __len__(self):
+        return sum(bin(byte).count('1') for byte in self.bits)
@@ -0,0 +1,45 @@
+import hashlib
+from flask import request, make_response
+
+class EtagUtils():
+    """
+    Conditional GET support. Every successful GET response gets an
+    ETag hashed from its body, and a request whose If-None-Match
+    matches it is answered with 304 Not Modified and no body.
+
+    Endpoints that can derive the ETag from the row they read may call
+    not_modified before serializing, so an unchanged resource also
+    skips serialization.
+    """
+
+    @staticmethod
+    def make_etag(*values):
+        """
+        Returns an ETag for the given column values of a resource.
+        """
+        return hashlib.blake2b(repr(values).encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def not_modified(etag):
+        """
+        Returns a 304 response if the request's If-None-Match matches
+        the ETag, otherwise None.
+        """
+        if etag in request.if_none_match:
+            response = make_response('', 304)
+            response.set_etag(etag)
+            return response
+        return None
+
+    @staticmethod
+    def make_conditional(response):
+        """
+        Adds a content ETag to successful GET responses that do not
+        have one and answers matching conditional requests with 304.
+        Registered as an after_request hook. Streamed responses are
+        left untouched.
+        """
+        if request.method not in ('GET', 'HEAD') or response.status_code != 200 or response.is_streamed:
+            return response
+        response.add_etag()
+        return response.make_conditional(request)
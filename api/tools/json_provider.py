@@ -0,0 +1,67 @@
+from flask import Request, request, has_request_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import BadRequest
+from tools.jsoncodec import JsonCodec
+from tools.msgpackcodec import MsgpackCodec, MSGPACK_MIMETYPE
+
+def prefers_msgpack(accept_mimetypes):
+    """
+    Returns True if the request's Accept header ranks MessagePack above
+    JSON. Requests without an Accept header, or accepting anything,
+    get JSON.
+    """
+    return MsgpackCodec.available and accept_mimetypes[MSGPACK_MIMETYPE] > accept_mimetypes['application/json']
+
+def encode_body(obj, default, accept_mimetypes):
+    """
+    Returns the (body, mimetype) of a response holding `obj`, encoded
+    as MessagePack if the request prefers it and otherwise as JSON.
+    Values MessagePack cannot hold, such as integers wider than 64
+    bits, fall back to JSON. msgpack hands those to `default` rather
+    than raising OverflowError, so any value it cannot encode falls back.
+    """
+    if accept_mimetypes is not None and prefers_msgpack(accept_mimetypes):
+        try:
+            return MsgpackCodec.dumps(obj, default=default), MSGPACK_MIMETYPE
+        except (OverflowError, TypeError, ValueError):
+            pass
+    return JsonCodec.dumps(obj, default=default) + b'\n', 'application/json'
+
+class FastJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes and decodes with JsonCodec.
+    Responses are written straight from the encoded bytes, as
+    MessagePack when the request's Accept header prefers it. Values the
+    codecs do not support, such as dates and decimals, are converted
+    the same way as by Flask's default provider. Keys keep the order
+    of the schema instead of being sorted.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return JsonCodec.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return JsonCodec.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body, mimetype = encode_body(obj, self.default, request.accept_mimetypes if has_request_context() else None)
+        response = self._app.response_class(body, mimetype=mimetype)
+        response.vary.add('Accept')
+        return response
+
+class AlderRequest(Request):
+    """
+    Request that also reads MessagePack bodies, sent with the
+    application/msgpack Content-Type, through get_json.
+    """
+
+    def get_json(self, force=False, silent=False, cache=True):
+        if self.mimetype != MSGPACK_MIMETYPE or not MsgpackCodec.available:
+            return super().get_json(force=force, silent=silent, cache=cache)
+        try:
+            return MsgpackCodec.loads(self.get_data(cache=cache))
+        except Exception as e:
+            if silent:
+                return None
+            raise BadRequest(f'Failed to decode MessagePack body: {str(e)}')
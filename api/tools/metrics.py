@@ -0,0 +1,189 @@
+import threading
+import time
+from sqlalchemy.pool import QueuePool, AsyncAdaptedQueuePool
+from tools.requestcontext import RequestContext
+from tools.querytimer import QueryTimer
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Upper bounds in seconds of the pool checkout wait buckets
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 10)
+
+# Route label of requests that did not match a route
+UNMATCHED_ROUTE = 'unmatched'
+
+PROMETHEUS_MIMETYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+class Histogram():
+    """
+    Cumulative histogram in the Prometheus format: a count per bucket
+    of observations at or below its bound, their sum and their count.
+    """
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+        self.sum += value
+        self.count += 1
+
+    def render(self, name, labels):
+        lines = []
+        for bound, count in zip(self.buckets, self.counts):
+            lines.append(f'{series(name + "_bucket", labels, le=bound)} {count}')
+        lines.append(f'{series(name + "_bucket", labels, le="+Inf")} {self.count}')
+        lines.append(f'{series(name + "_sum", labels)} {self.sum}')
+        lines.append(f'{series(name + "_count", labels)} {self.count}')
+        return lines
+
+def series(name, labels, **extra):
+    """
+    Returns a series name with its labels, e.g. name{route="/user"}.
+    """
+    items = list(labels.items()) + list(extra.items())
+    if not items:
+        return name
+    values = ','.join(f'{key}="{escape_label(value)}"' for key, value in items)
+    return f'{name}{{{values}}}'
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+class TimedPool():
+    """
+    Pool mixin that records how long each checkout waits for a
+    connection, including opening a new one.
+    """
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            RequestMetrics.observe_pool_wait(time.perf_counter() - start)
+
+class TimedQueuePool(TimedPool, QueuePool):
+    pass
+
+class TimedAsyncQueuePool(TimedPool, AsyncAdaptedQueuePool):
+    pass
+
+class RequestMetrics():
+    """
+    Request metrics of this process, exposed in the Prometheus text
+    format: per-route latency and database time histograms, response
+    status counts, requests in flight, pool checkout wait and the state
+    of the connection pool. Each gunicorn worker keeps its own metrics.
+
+    Requests are labelled with their route rule, such as
+    /user/<int:id>, so every user id is counted under one route.
+    """
+    _lock = threading.Lock()
+    _latency = {}
+    _db_time = {}
+    _statuses = {}
+    _pool_wait = Histogram(POOL_WAIT_BUCKETS)
+    _in_flight = 0
+
+    @staticmethod
+    def init_app(app, engine, is_async=False):
+        """
+        Registers the request hooks on the app and the query timing
+        callback on the engine. `is_async` is set for the Quart app of
+        the ASGI mode, with the sync engine of its async engine.
+        """
+        app.before_request(RequestContext.hook(RequestMetrics.before_request, is_async))
+        app.after_request(RequestContext.hook(RequestMetrics.after_request, is_async))
+        app.teardown_request(RequestContext.hook(RequestMetrics.teardown_request, is_async))
+        QueryTimer.listen(engine, RequestMetrics.observe_query)
+
+    @staticmethod
+    def before_request():
+        _, _, g = RequestContext.current()
+        g.metrics_start = time.perf_counter()
+        g.metrics_db_time = 0
+        with RequestMetrics._lock:
+            RequestMetrics._in_flight += 1
+
+    @staticmethod
+    def after_request(response):
+        _, request, g = RequestContext.current()
+        start = g.get('metrics_start')
+        if start is None:
+            return response
+        elapsed = time.perf_counter() - start
+        route = request.url_rule.rule if request.url_rule is not None else UNMATCHED_ROUTE
+        key = (request.method, route)
+        with RequestMetrics._lock:
+            RequestMetrics._latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(elapsed)
+            RequestMetrics._db_time.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(g.metrics_db_time)
+            status_key = key + (response.status_code,)
+            RequestMetrics._statuses[status_key] = RequestMetrics._statuses.get(status_key, 0) + 1
+        return response
+
+    @staticmethod
+    def teardown_request(exception=None):
+        _, _, g = RequestContext.current()
+        if g.pop('metrics_start', None) is not None:
+            with RequestMetrics._lock:
+                RequestMetrics._in_flight -= 1
+
+    @staticmethod
+    def observe_query(statement, parameters, elapsed):
+        context = RequestContext.current()
+        if context is not None and 'metrics_db_time' in context[2]:
+            context[2].metrics_db_time += elapsed
+
+    @staticmethod
+    def observe_pool_wait(seconds):
+        with RequestMetrics._lock:
+            RequestMetrics._pool_wait.observe(seconds)
+
+    @staticmethod
+    def render(pool=None):
+        """
+        Returns every metric in the Prometheus text format. The state
+        of `pool` is read at the time of the call.
+        """
+        lines = []
+        with RequestMetrics._lock:
+            lines.append('# HELP alder_request_duration_seconds Time to handle a request, by route.')
+            lines.append('# TYPE alder_request_duration_seconds histogram')
+            for (method, route), histogram in sorted(RequestMetrics._latency.items()):
+                lines += histogram.render('alder_request_duration_seconds', {'method': method, 'route': route})
+
+            lines.append('# HELP alder_request_db_seconds Time spent executing queries per request, by route.')
+            lines.append('# TYPE alder_request_db_seconds histogram')
+            for (method, route), histogram in sorted(RequestMetrics._db_time.items()):
+                lines += histogram.render('alder_request_db_seconds', {'method': method, 'route': route})
+
+            lines.append('# HELP alder_responses_total Responses sent, by route and status code.')
+            lines.append('# TYPE alder_responses_total counter')
+            for (method, route, status), count in sorted(RequestMetrics._statuses.items()):
+                lines.append(f'{series("alder_responses_total", {"method": method, "route": route, "status": status})} {count}')
+
+            lines.append('# HELP alder_requests_in_flight Requests currently being handled.')
+            lines.append('# TYPE alder_requests_in_flight gauge')
+            lines.append(f'alder_requests_in_flight {RequestMetrics._in_flight}')
+
+            lines.append('# HELP alder_pool_checkout_wait_seconds Time waited for a pooled database connection.')
+            lines.append('# TYPE alder_pool_checkout_wait_seconds histogram')
+            lines += RequestMetrics._pool_wait.render('alder_pool_checkout_wait_seconds', {})
+
+        if pool is not None:
+            for name, value, description in (
+                ('alder_pool_size', pool.size(), 'Connections the pool keeps open.'),
+                ('alder_pool_checked_out', pool.checkedout(), 'Connections in use.'),
+                ('alder_pool_checked_in', pool.checkedin(), 'Idle connections in the pool.'),
+                ('alder_pool_overflow', pool.overflow(), 'Connections opened beyond the pool size.')
+            ):
+                lines.append(f'# HELP {name} {description}')
+                lines.append(f'# TYPE {name} gauge')
+                lines.append(f'{name} {value}')
+
+        return '\n'.join(lines) + '\n'
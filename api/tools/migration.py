@@ -0,0 +1,49 @@
+from sqlalchemy import text
+
+class MigrationUtils():
+    """
+    Helpers used by the scripts in api/migrations. Each helper takes
+    the connection passed to a migration's upgrade or downgrade
+    function and checks the live schema first, so a migration can be
+    applied to a database that already has part of the change.
+    """
+
+    @staticmethod
+    def execute(connection, statement):
+        connection.execute(text(statement))
+
+    @staticmethod
+    def index_exists(connection, table, index):
+        result = connection.execute(text(
+            'SELECT COUNT(*) FROM information_schema.statistics '
+            'WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :index'
+        ), {'table': table, 'index': index})
+        return result.scalar() > 0
+
+    @staticmethod
+    def create_index(connection, table, index, columns):
+        if not MigrationUtils.index_exists(connection, table, index):
+            MigrationUtils.execute(connection, f'CREATE INDEX `{index}` ON `{table}` ({", ".join(columns)})')
+
+    @staticmethod
+    def drop_index(connection, table, index):
+        if MigrationUtils.index_exists(connection, table, index):
+            MigrationUtils.execute(connection, f'DROP INDEX `{index}` ON `{table}`')
+
+    @staticmethod
+    def column_exists(connection, table, column):
+        result = connection.execute(text(
+            'SELECT COUNT(*) FROM information_schema.columns '
+            'WHERE table_schema = DATABASE() AND table_name = :table AND column_name = :column'
+        ), {'table': table, 'column': column})
+        return result.scalar() > 0
+
+    @staticmethod
+    def add_column(connection, table, column, definition):
+        if not MigrationUtils.column_exists(connection, table, column):
+            MigrationUtils.execute(connection, f'ALTER TABLE `{table}` ADD COLUMN `{column}` {definition}')
+
+    @staticmethod
+    def drop_column(connection, table, column):
+        if MigrationUtils.column_exists(connection, table, column):
+            MigrationUtils.execute(connection, f'ALTER TABLE `{table}` DROP COLUMN `{column}`')
@@ -0,0 +1,58 @@
+from flask import Response, request
+from tools.jsoncodec import JsonCodec
+from tools.msgpackcodec import MsgpackCodec, MSGPACK_MIMETYPE
+from tools.json_provider import prefers_msgpack
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+
+def encode_line(obj):
+    return JsonCodec.dumps(obj) + b'\n'
+
+class NdjsonUtils():
+    """
+    Newline-delimited JSON responses. Each item is written as one
+    line as soon as it is serialized, so large results are sent
+    without building the whole encoded body in memory.
+
+    Requests preferring MessagePack get the items as MessagePack
+    objects written back to back instead of lines.
+    """
+
+    @staticmethod
+    def get_encoder(accept_mimetypes):
+        """
+        Returns the (item encoder, mimetype) for the request's Accept
+        header.
+        """
+        if prefers_msgpack(accept_mimetypes):
+            return MsgpackCodec.dumps, MSGPACK_MIMETYPE
+        return encode_line, NDJSON_MIMETYPE
+
+    @staticmethod
+    def lines(items, dump, encode=encode_line):
+        for item in items:
+            yield encode(dump(item))
+
+    @staticmethod
+    async def async_lines(items, dump, encode=encode_line):
+        async for item in items:
+            yield encode(dump(item))
+
+    @staticmethod
+    def response(items, dump, status=200, headers=None):
+        """
+        Returns a streamed response with one line per item of
+        `items`, each serialized with `dump`. Items are serialized
+        after the view returns, once the request's database session
+        is gone, so `items` must be already loaded rows, not a lazy
+        query.
+        """
+        encode, mimetype = NdjsonUtils.get_encoder(request.accept_mimetypes)
+        response = Response(
+            NdjsonUtils.lines(items, dump, encode),
+            status=status,
+            mimetype=mimetype,
+            headers=headers
+        )
+        response.vary.add('Accept')
+        return response
@@ -0,0 +1,149 @@
+import base64
+import json
+from flask import jsonify
+from sqlalchemy import and_, or_, func
+from tools.ndjson import NdjsonUtils
+
+# Page size used when a request does not give a limit, and the largest
+# page a request may ask for
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# Response header holding the cursor of the next page
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+class SortKey():
+    """
+    A column of a keyset ordering. The last key of an ordering must be
+    unique, such as the primary key, so that every row has a distinct
+    position. Nullable columns are given a `default` to sort NULL as,
+    since NULL cannot be compared in the keyset condition.
+    """
+
+    def __init__(self, column, descending=False, default=None):
+        self.column = column
+        self.descending = descending
+        self.default = default
+        self.expression = func.coalesce(column, default) if default is not None else column
+
+    def order_by(self):
+        return self.expression.desc() if self.descending else self.expression.asc()
+
+    def after(self, value):
+        return self.expression < value if self.descending else self.expression > value
+
+    def value(self, row):
+        value = getattr(row, self.column.key)
+        return self.default if value is None else value
+
+class PaginationUtils():
+    """
+    Keyset pagination. Rows are ordered by a list of SortKeys and a
+    page continues after the sort values of the previous page's last
+    row, so every page is an index range scan no matter how deep it
+    is, unlike OFFSET which reads and discards every earlier row.
+    """
+
+    @staticmethod
+    def get_page_size(value, default=DEFAULT_PAGE_SIZE):
+        """
+        Returns the page size for a requested limit. Raises ValueError
+        if it is not an integer between 1 and MAX_PAGE_SIZE.
+        """
+        if value is None:
+            return default
+        page_size = int(value)
+        if page_size <= 0 or page_size > MAX_PAGE_SIZE:
+            raise ValueError(f'Limit must be between 1 and {MAX_PAGE_SIZE}')
+        return page_size
+
+    @staticmethod
+    def encode_cursor(keys, row):
+        values = [key.value(row) for key in keys]
+        return base64.urlsafe_b64encode(json.dumps(values).encode()).decode()
+
+    @staticmethod
+    def decode_cursor(keys, cursor):
+        """
+        Returns the sort values a cursor points at. Raises ValueError
+        if the cursor is malformed.
+        """
+        try:
+            values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        except Exception:
+            raise ValueError('Invalid cursor')
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError('Invalid cursor')
+        return values
+
+    @staticmethod
+    def after(query, keys, values):
+        """
+        Filters the query to the rows that sort after `values`: rows
+        equal on the first i keys and after the value of key i, for
+        any i.
+        """
+        conditions = []
+        for i, key in enumerate(keys):
+            equal = [keys[j].expression == values[j] for j in range(i)]
+            conditions.append(and_(*equal, key.after(values[i])))
+        return query.filter(or_(*conditions))
+
+    @staticmethod
+    def page(query, keys, cursor=None, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Returns (rows, next cursor) for the page of the query after
+        `cursor`. The next cursor is None on the last page. Raises
+        ValueError if the cursor is malformed.
+        """
+        if cursor:
+            query = PaginationUtils.after(query, keys, PaginationUtils.decode_cursor(keys, cursor))
+        rows = query.order_by(*[key.order_by() for key in keys]).limit(page_size + 1).all()
+        if len(rows) <= page_size:
+            return rows, None
+        rows = rows[:page_size]
+        return rows, PaginationUtils.encode_cursor(keys, rows[-1])
+
+    @staticmethod
+    def read_all(query, keys, cursor=None, limit=None):
+        """
+        Returns every row of the query after `cursor`, up to `limit`,
+        in key order. The rows are read before the response is
+        streamed, since the request's session is closed by the time
+        the stream is written. Raises ValueError if the cursor is
+        malformed.
+        """
+        if cursor:
+            query = PaginationUtils.after(query, keys, PaginationUtils.decode_cursor(keys, cursor))
+        query = query.order_by(*[key.order_by() for key in keys])
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
+
+    @staticmethod
+    def search_response(query, keys, data, dump, default_page_size=DEFAULT_PAGE_SIZE, empty_message=None):
+        """
+        Returns the response to a search request body. By default one
+        page of up to `limit` results is returned as a JSON list, with
+        the cursor of the next page in the X-Next-Cursor header when
+        there are more results. Passing that cursor as `cursor` returns
+        the next page. If `stream` is true, every result after `cursor`
+        is streamed as newline-delimited JSON instead, up to `limit` if
+        given. If `empty_message` is given, an empty page is answered
+        with 404 and that message. Raises ValueError for an invalid
+        limit or cursor.
+        """
+        cursor = data.get('cursor')
+        limit = data.get('limit')
+
+        if data.get('stream'):
+            limit = int(limit) if limit is not None else None
+            return NdjsonUtils.response(PaginationUtils.read_all(query, keys, cursor, limit), dump)
+
+        rows, next_cursor = PaginationUtils.page(query, keys, cursor, PaginationUtils.get_page_size(limit, default_page_size))
+        if not rows and empty_message is not None:
+            return jsonify({'message': empty_message}), 404
+        response = jsonify([dump(row) for row in rows])
+        if next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return response
@@ -0,0 +1,20 @@
+class PoolUtils():
+    """
+    Helpers for the SQLAlchemy connection pool of an API process.
+    """
+
+    @staticmethod
+    def warm_up(engine, count):
+        """
+        Opens `count` connections and returns them to the pool, so the
+        first requests of a new process reuse them instead of each
+        connecting to MySQL. Returns the number of connections opened.
+        """
+        connections = []
+        try:
+            for _ in range(count):
+                connections.append(engine.connect())
+        finally:
+            for connection in connections:
+                connection.close()
+        return len(connections)
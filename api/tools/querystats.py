@@ -0,0 +1,77 @@
+from tools.requestcontext import RequestContext
+from tools.log import Logger
+from tools.querytimer import QueryTimer
+
+# Longest parameter text written with a slow query
+MAX_LOGGED_PARAMETERS = 500
+
+class QueryStats():
+    """
+    Query diagnostics for the API. Counts the queries and database time
+    of every request, and logs:
+
+    - statements slower than `slow_query_seconds`, with their
+      parameters, whether or not they run in a request.
+    - statements run more than `repeated_query_limit` times by one
+      request, whatever their parameters, the usual sign of an N+1
+      pattern that one query could replace.
+
+    With `headers` on, or when the app is testing, every response
+    carries X-Query-Count, X-DB-Time (milliseconds) and
+    X-Repeated-Queries, the number of statements over the limit.
+    Queries of a streamed response that run after it has started are
+    not included in its headers.
+    """
+    slow_query_seconds = 0.5
+    repeated_query_limit = 5
+    headers = False
+
+    @staticmethod
+    def init_app(app, engine, slow_query_seconds=None, repeated_query_limit=None, headers=None, is_async=False):
+        if slow_query_seconds is not None:
+            QueryStats.slow_query_seconds = slow_query_seconds
+        if repeated_query_limit is not None:
+            QueryStats.repeated_query_limit = repeated_query_limit
+        if headers is not None:
+            QueryStats.headers = bool(headers)
+
+        app.before_request(RequestContext.hook(QueryStats.before_request, is_async))
+        app.after_request(RequestContext.hook(QueryStats.after_request, is_async))
+        QueryTimer.listen(engine, QueryStats.observe_query)
+
+    @staticmethod
+    def before_request():
+        _, _, g = RequestContext.current()
+        g.query_count = 0
+        g.query_time = 0
+        g.query_statements = {}
+
+    @staticmethod
+    def after_request(response):
+        app, request, g = RequestContext.current()
+        if 'query_statements' not in g:
+            return response
+
+        repeated = {statement: count for statement, count in g.query_statements.items() if count > QueryStats.repeated_query_limit}
+        for statement, count in repeated.items():
+            Logger.warn('Statement run %d times by %s %s, possible N+1: %s', count, request.method, request.path, statement)
+
+        if QueryStats.headers or app.testing:
+            response.headers['X-Query-Count'] = str(g.query_count)
+            response.headers['X-DB-Time'] = f'{g.query_time * 1000:.1f}'
+            response.headers['X-Repeated-Queries'] = str(len(repeated))
+        return response
+
+    @staticmethod
+    def observe_query(statement, parameters, elapsed):
+        if elapsed >= QueryStats.slow_query_seconds:
+            Logger.warn('Slow query (%.3fs): %s parameters=%s', elapsed, statement, repr(parameters)[:MAX_LOGGED_PARAMETERS])
+
+        context = RequestContext.current()
+        if context is not None and 'query_statements' in context[2]:
+            g = context[2]
+            g.query_count += 1
+            g.query_time += elapsed
+            # Statements are parametrized, so the same text with other
+            # parameters is the same query shape
+            g.query_statements[statement] = g.query_statements.get(statement, 0) + 1
@@ -0,0 +1,58 @@
+import time
+from sqlalchemy import event
+
+class QueryTimer():
+    """
+    Times every statement run on an engine with a single set of cursor
+    listeners and passes (statement, parameters, seconds) to each
+    callback registered with listen, so the statement is timed once
+    however many tools observe it.
+
+    The start time is kept on the statement's execution context rather
+    than on the connection, and a statement that raises is finished by
+    the handle_error listener, so nothing is left behind on pooled
+    connections when a query fails.
+    """
+    _callbacks = {}
+
+    @staticmethod
+    def listen(engine, callback):
+        """
+        Calls `callback(statement, parameters, seconds)` after each
+        statement run on the engine, including statements that fail.
+        """
+        if engine not in QueryTimer._callbacks:
+            QueryTimer._callbacks[engine] = []
+            event.listen(engine, 'before_cursor_execute', QueryTimer.before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', QueryTimer.after_cursor_execute)
+            event.listen(engine, 'handle_error', QueryTimer.handle_error)
+        QueryTimer._callbacks[engine].append(callback)
+
+    @staticmethod
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context.query_timer_start = time.perf_counter()
+
+    @staticmethod
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        QueryTimer.finish(conn, context, statement, parameters)
+
+    @staticmethod
+    def handle_error(exception_context):
+        if exception_context.connection is not None:
+            QueryTimer.finish(exception_context.connection, exception_context.execution_context,
+                              exception_context.statement, exception_context.parameters)
+
+    @staticmethod
+    def finish(conn, context, statement, parameters):
+        """
+        Reports the statement's time to the callbacks, unless it was
+        already reported or never started.
+        """
+        start = getattr(context, 'query_timer_start', None)
+        if start is None:
+            return
+        context.query_timer_start = None
+        elapsed = time.perf_counter() - start
+        for callback in QueryTimer._callbacks.get(conn.engine, ()):
+            callback(statement, parameters, elapsed)
@@ -0,0 +1,115 @@
+import calendar
+import re
+from datetime import timedelta
+
+# Weekday letters used by custom intervals, Monday first to match
+# datetime.weekday()
+WEEKDAY_LETTERS = 'mtwhfsu'
+
+# Fixed intervals in days
+DAY_INTERVALS = {
+    'daily': 1,
+    'every_other_day': 2,
+    'weekly': 7
+}
+
+# Intervals in months
+MONTH_INTERVALS = {
+    'monthly': 1,
+    'yearly': 12
+}
+
+# Single weekday intervals, e.g. 'every_monday'
+WEEKDAY_INTERVALS = {
+    f'every_{calendar.day_name[day].lower()}': WEEKDAY_LETTERS[day]
+    for day in range(7)
+}
+
+WEEKDAYS_PATTERN = re.compile(f'[{WEEKDAY_LETTERS}]+')
+
+def add_months(value, months, anchor_day=None):
+    """
+    Adds a number of months to a datetime, keeping the time. The day is
+    `anchor_day`, the day of the month the reminder was set for, or the
+    day of `value` if not given, clamped to the last day of the target
+    month. Since the anchor is kept, a reminder on the 31st is on the
+    last day of every month and one on the 28th stays on the 28th.
+    """
+    month_index = value.year * 12 + value.month - 1 + months
+    year, month = divmod(month_index, 12)
+    month += 1
+    day = min(anchor_day or value.day, calendar.monthrange(year, month)[1])
+    return value.replace(year=year, month=month, day=day)
+
+class Recurrence():
+    """
+    A parsed repeat_interval. Supports daily, every_other_day, weekly,
+    monthly, yearly, every_<weekday> and any combination of the weekday
+    letters mtwhfsu (e.g. 'mwf'). Each occurrence keeps the time of day
+    of the previous one, and monthly and yearly occurrences fall on the
+    reminder's anchor day when the month has it.
+    """
+
+    def __init__(self, days=None, months=None, weekdays=None):
+        self.days = days
+        self.months = months
+        self.weekdays = weekdays
+
+    @staticmethod
+    def parse(repeat_interval):
+        """
+        Returns the Recurrence for a repeat_interval, or None if it is
+        empty or not supported.
+        """
+        if not repeat_interval:
+            return None
+        if repeat_interval in DAY_INTERVALS:
+            return Recurrence(days=DAY_INTERVALS[repeat_interval])
+        if repeat_interval in MONTH_INTERVALS:
+            return Recurrence(months=MONTH_INTERVALS[repeat_interval])
+        letters = WEEKDAY_INTERVALS.get(repeat_interval, repeat_interval)
+        if WEEKDAYS_PATTERN.fullmatch(letters):
+            return Recurrence(weekdays={WEEKDAY_LETTERS.index(letter) for letter in letters})
+        return None
+
+    @staticmethod
+    def is_valid(repeat_interval):
+        return Recurrence.parse(repeat_interval) is not None
+
+    def next(self, value, anchor_day=None):
+        """
+        Returns the first occurrence after the datetime `value`.
+        """
+        if self.days is not None:
+            return value + timedelta(days=self.days)
+        if self.months is not None:
+            return add_months(value, self.months, anchor_day)
+        for offset in range(1, 8):
+            candidate = value + timedelta(days=offset)
+            if candidate.weekday() in self.weekdays:
+                return candidate
+
+    def advance(self, remind_at, now, repeat_until=None, repeat_count=None, anchor_day=None):
+        """
+        Returns (next_remind_at, repeat_count) for a reminder that fired
+        at `remind_at`. The next occurrence is the first one after both
+        `remind_at` and `now`, so occurrences missed while the reminder
+        was not delivered are skipped, each using up one repeat. Returns
+        None if the reminder has no further occurrences because it would
+        pass `repeat_until` or run out of `repeat_count`.
+
+        `anchor_day` is the day of the month the reminder was set for,
+        which monthly and yearly occurrences return to after a shorter
+        month. It defaults to the day of `remind_at`.
+        """
+        next_remind_at = remind_at
+        while True:
+            if repeat_count is not None:
+                if repeat_count <= 0:
+                    return None
+                repeat_count -= 1
+            next_remind_at = self.next(next_remind_at, anchor_day)
+            if repeat_until is not None and next_remind_at > repeat_until:
+                return None
+            if next_remind_at > now:
+                return next_remind_at, repeat_count
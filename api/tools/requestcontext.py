@@ -0,0 +1,39 @@
+import flask
+
+try:
+    import quart
+except ImportError:
+    quart = None
+
+class RequestContext():
+    """
+    Access to the current request of either the Flask app or the
+    Quart app of the ASGI mode, so the request hooks of the metrics
+    and query diagnostics are shared by both.
+    """
+
+    @staticmethod
+    def current():
+        """
+        Returns the (app, request, g) of the current Flask or Quart
+        request, or None outside of a request.
+        """
+        if flask.has_request_context():
+            return flask.current_app, flask.request, flask.g
+        if quart is not None and quart.has_request_context():
+            return quart.current_app, quart.request, quart.g
+        return None
+
+    @staticmethod
+    def hook(func, is_async=False):
+        """
+        Returns the request hook `func` as registered on an app. Hooks
+        of the Quart app are wrapped in a coroutine so they run on the
+        event loop rather than in a worker thread.
+        """
+        if not is_async:
+            return func
+
+        async def run(*args):
+            return func(*args)
+        return run
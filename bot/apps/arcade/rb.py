@@ -11,16 +11,23 @@ The following code (rb.py) provides a Discord interface for interacting with Rog
 
 import cfg
 import discord
-import requests
-import json
+import aiohttp
 import traceback
 
 from tools.log import Logger
+from tools.jsoncodec import JsonCodec
+from client.alder.alder_api_client import AlderAPIClient
 from client.alder.interface.user_client import UserClient
 from client.alder.interface.rogueboss_client import RbClient
 
 RB_MODELS = ['TRINITY', 'ANT']
 
+# Seconds to wait for the Rogue Boss server to answer the ping
+PING_TIMEOUT = 1
+
+# Seconds to wait for the Rogue Boss server to resolve an attack
+ATTACK_TIMEOUT = 5
+
 class RogueBossTypeChooser(discord.ui.View):
     """
     RogueBossTypeChooser is the Discord view of the Rogue Boss dialog for selecting a type.
@@ -49,42 +56,42 @@ class RogueBossTypeChooser(discord.ui.View):
     @discord.ui.button(label='🔥 FIRE', style=discord.ButtonStyle.blurple)
     async def option_fire(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You chose 🔥 **FIRE**!\n\nYour attacks will do extra damage to 🪨 **EARTH** bosses!\nBeware of 💧 **WATER** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'FIRE')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'FIRE')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='💧 WATER', style=discord.ButtonStyle.blurple)
     async def option_water(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You chose 💧 **WATER**!\n\nYour attacks will do extra damage to 🔥 **FIRE** bosses!\nBeware of 🪨 **EARTH** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'WATER')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'WATER')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='🪨 EARTH', style=discord.ButtonStyle.blurple)
     async def option_earth(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You pressed 🪨 **EARTH**\n\nYour attacks will do extra damage to 💧 **WATER** bosses!\nBeware of 🔥 **FIRE** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'EARTH')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'EARTH')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
         
     @discord.ui.button(label='🔮 PSYCHIC', style=discord.ButtonStyle.blurple)
     async def option_psychic(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You pressed 🔮 **PSYCHIC**\n\nYour attacks will do extra damage to 🌑 **DARK** bosses!\nBeware of 💫 **LIGHT** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'PSYCHIC')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'PSYCHIC')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
     
     @discord.ui.button(label='💫 LIGHT', style=discord.ButtonStyle.blurple)
     async def option_light(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You pressed 💫 **LIGHT**\n\nYour attacks will do extra damage to 🔮 **PSYCHIC** bosses!\nBeware of 🌑 **DARK** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'LIGHT')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'LIGHT')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='🌑 DARK', style=discord.ButtonStyle.blurple)
     async def option_dark(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'You pressed 🌑 **DARK**\n\nYour attacks will do extra damage to 💫 **LIGHT** bosses!\nBeware of 🔮 **PSYCHIC** bosses, your attacks will do half the damage!', inline=False)
-        RbClient.create_rogue_boss_user(interaction.user.id, 'DARK')
+        await RbClient.create_rogue_boss_user(interaction.user.id, 'DARK')
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
@@ -121,11 +128,11 @@ class RogueBoss():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def show_stats(self, interaction: discord.Interaction, user):
+    async def show_stats(self, interaction: discord.Interaction, user):
         Logger.debug(f'Inside of show_stats for {interaction.user.name}')
 
         # Fetch the caller's hex code
-        color = UserClient.get_discord_user_embed_color(interaction.user.id)
+        color = await UserClient.get_discord_user_embed_color(interaction.user.id)
 
         embed = discord.Embed(title=f'RogueBoss Statistics for {interaction.user.name}', color=color)
         try:
@@ -170,12 +177,14 @@ class RogueBoss():
         level = 1 if xp < 9 else round(xp ** 0.317)
         return level
 
-    def play_rb(self, interaction: discord.Interaction, user):
+    async def play_rb(self, interaction: discord.Interaction, user):
         # Obtain ping to see if Rogue Boss is up!
         url = cfg.ROGUE_BOSS_URL
+        session = AlderAPIClient.get_session()
         try:
             Logger.debug('Pinging Rogue Boss Server...')
-            ping_response = requests.get(url, timeout=1)
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=PING_TIMEOUT)) as ping_response:
+                await ping_response.read()
         except Exception as e:
             Logger.warn('Rogue Boss Server not available...')
             message = 'Rogue Boss event is **NOT** active at this time.\n→ The event will be active during the __next study stream__!'
@@ -186,7 +195,7 @@ class RogueBoss():
             return embed
 
         # Check tokens to see if the user can play Rogue Boss
-        user_tokens = UserClient.get_user_tokens(interaction.user.id)
+        user_tokens = await UserClient.get_user_tokens(interaction.user.id)
 
         if user_tokens < 25:
             # User cannot play rogue boss
@@ -199,23 +208,29 @@ class RogueBoss():
         """
 
         # Subtract tokens for play
-        UserClient.subtract_tokens_user(interaction.user.id, 25)
+        await UserClient.subtract_tokens_user(interaction.user.id, 25)
 
         # Prepare request to LAN server and send
         model_index = user['model'] if user['model'] is not None else 0
         payload = {'id': user['user_id'], 'name': interaction.user.name, 'type': user['rbtype'], 'model': RB_MODELS[model_index], 'weapon': 1, 'powerUp': 1, 'exp': user['xp']}
-        response = requests.post(url, json=payload)
-        Logger.debug(f'Response from Rogue Boss Server: {response.status_code} on {url}.')
+        try:
+            async with session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=ATTACK_TIMEOUT)) as response:
+                status_code = response.status
+                content = await response.read()
+        except Exception as e:
+            Logger.error('Rogue Boss attack failed on %s: %s', url, e)
+            return cfg.ErrorEmbed.message("Unexpected error occurred. We are sorry for the inconvenience.")
+        Logger.debug('Response from Rogue Boss Server: %s on %s.', status_code, url)
 
-        if response.status_code == 200:
-            body = json.loads(response.text)
+        if status_code == 200:
+            body = JsonCodec.loads(content)
             Logger.debug(f'Rogue Boss response body: {body}')
 
             # Check if the boss was slain, if it was, print out that message and that the user slayed the boss!
             if(body['slain'] is True):
                 # Update each row of the database where the damageList contains the user id, update XP for each as well
                 # Return embed with results of defeating the boss.
-                top_contributors_set = self.update_rbuser_xp(body)
+                top_contributors_set = await self.update_rbuser_xp(body)
                 
                 guild = interaction.guild
                 usernames_and_damage = []
@@ -270,7 +285,7 @@ class RogueBoss():
             embed = cfg.ErrorEmbed.message("Unexpected error occurred. We are sorry for the inconvenience.")
             return embed
         
-    def update_rbuser_xp(self, response_body):
+    async def update_rbuser_xp(self, response_body):
         """
         Given a JSON response body from Rogue Boss, update Rogue Boss user
         experience.
@@ -288,7 +303,7 @@ class RogueBoss():
             damage = item.get("damage")
             xp_gained = damage / 2
 
-            RbClient.add_xp_to_rogue_boss_user(user_id, xp_gained)
+            await RbClient.add_xp_to_rogue_boss_user(user_id, xp_gained)
             contributors.append({"user_id": user_id, "damage": damage})
 
         contributors.sort(key=lambda x: x["damage"], reverse=True)
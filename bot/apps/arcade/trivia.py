@@ -11,14 +11,15 @@ import discord
 from tools.log import Logger
 from client.alder.interface.triviaquestion_client import TriviaQuestionClient
 from client.alder.interface.user_client import UserClient
+from apps.arcade.trivia_buffer import trivia_buffer
 
 class TriviaButtons(discord.ui.View):
-    def __init__(self, embed: discord.Embed, user_id: int):
+    def __init__(self, embed: discord.Embed, user_id: int, question):
         super().__init__(timeout=None)
         self.embed = embed
         self.user_id = user_id
 
-        self.dbresponse = TriviaQuestionClient.get_random_trivia_question_contents()
+        self.dbresponse = question
         Logger.debug(f'Random trivia response: {self.dbresponse}')
 
         # set values before creating f-string (due to Python 3.11 limitations)
@@ -29,11 +30,25 @@ class TriviaButtons(discord.ui.View):
         self.question = f'**Category**: {self.category}\n**By**: {self.author}\n\n**{self.title}**'
         self.options = [self.dbresponse['option_a'], self.dbresponse['option_b'], self.dbresponse['option_c'], self.dbresponse['option_d']]
         self.correct = self.dbresponse['correct']
+        self.question_id = self.dbresponse['id']
 
         self.options_message = f'**A**: {self.options[0]}\n**B**: {self.options[1]}\n**C**: {self.options[2]}\n**D**: {self.options[3]}'
         self.embed.set_field_at(0, name='\u200b', value=self.question, inline=False)
         self.embed.set_field_at(1, name='\u200b', value=self.options_message, inline=False)
 
+    @classmethod
+    async def create(cls, embed: discord.Embed, user_id: int):
+        """
+        Retrieves a random trivia question and returns the view for it,
+        or None if no question could be retrieved. The question is
+        normally one prefetched for the player, and is only fetched
+        from the API when none is kept for them.
+        """
+        question = await trivia_buffer.get(user_id)
+        if question is None:
+            return None
+        return cls(embed, user_id, question)
+
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         """Check if the user who clicked the button is the same as the user who initiated the game."""
         return interaction.user.id == self.user_id
@@ -41,35 +56,35 @@ class TriviaButtons(discord.ui.View):
     @discord.ui.button(label='A', style=discord.ButtonStyle.blurple)
     async def option_a(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'**Category**: {self.category}\n**By**: {self.author}\n\nYou selected **A**', inline=False)
-        self.check_correct_answer(interaction, 0)
+        await self.check_correct_answer(interaction, 0)
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='B', style=discord.ButtonStyle.blurple)
     async def option_b(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'**Category**: {self.category}\n**By**: {self.author}\n\nYou selected **B**', inline=False)
-        self.check_correct_answer(interaction, 1)
+        await self.check_correct_answer(interaction, 1)
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='C', style=discord.ButtonStyle.blurple)
     async def option_c(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'**Category**: {self.category}\n**By**: {self.author}\n\nYou selected **C**', inline=False)
-        self.check_correct_answer(interaction, 2)
+        await self.check_correct_answer(interaction, 2)
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
     @discord.ui.button(label='D', style=discord.ButtonStyle.blurple)
     async def option_d(self, interaction: discord.Interaction, button: discord.ui.Button):
         self.embed.set_field_at(0, name='\u200b', value=f'**Category**: {self.category}\n**By**: {self.author}\n\nYou selected **D**', inline=False)
-        self.check_correct_answer(interaction, 3)
+        await self.check_correct_answer(interaction, 3)
         self.clear_items()
         await interaction.response.edit_message(embed=self.embed, view=self)
 
-    def check_correct_answer(self, interaction: discord.Interaction, selection: int):
+    async def check_correct_answer(self, interaction: discord.Interaction, selection: int):
         print(f'selection:{selection} and self.correct={self.correct}')
         won_status = selection == self.correct
-        wins = self.update_wins(won_status, interaction)
+        wins = await self.update_wins(selection, interaction)
         if won_status:
             self.embed.color = discord.Color.green()
             self.embed.set_field_at(1, name='\u200b', value=f'You answered correctly!\nYou now have `{wins}` trivia questions correctly answered.', inline=False)
@@ -77,10 +92,19 @@ class TriviaButtons(discord.ui.View):
             self.embed.color = discord.Color.red()
             self.embed.set_field_at(1, name='\u200b', value=f'You answered incorrectly!\nYou have `{wins}` trivia questions correctly answered.', inline=False)
     
-    def update_wins(self, won_status, interaction: discord.Interaction) -> int:
-        if won_status:
-            UserClient.add_trivia_win_for_user(interaction.user.id)
-        return UserClient.get_user_trivia(interaction.user.id)
+    async def update_wins(self, selection: int, interaction: discord.Interaction) -> int:
+        # Record the answer so the question is not asked again, the API
+        # increments the trivia count when correct and returns the total
+        answer = await TriviaQuestionClient.answer_trivia_question_contents(self.question_id, interaction.user.id, selection)
+        if answer is not None:
+            # Top up the user's unseen questions if they are running low
+            trivia_buffer.refill_if_low(interaction.user.id)
+            return answer['trivia']
+
+        # The answer may have been recorded before the request failed, so
+        # do not increment again here
+        Logger.error(f'Unable to record trivia answer for {interaction.user.id}')
+        return await UserClient.get_user_trivia(interaction.user.id)
 
 class Trivia():
     """
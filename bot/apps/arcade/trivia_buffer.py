@@ -0,0 +1,142 @@
+"""
+trivia_buffer.py
+author: narlock
+
+Prefetch buffer of trivia questions so that /trivia can be answered
+without waiting on the Alder API.
+"""
+
+import asyncio
+import time
+
+from collections import OrderedDict, deque
+from tools.log import Logger
+from client.alder.interface.triviaquestion_client import TriviaQuestionClient
+
+# Number of questions kept prefetched for each player, and the count
+# below which a background refill is started
+BUFFER_SIZE = 3
+LOW_WATER_MARK = 2
+
+# Maximum number of players with prefetched unseen questions
+MAX_USERS = 500
+
+# Number of seconds a prefetched question is served before it is
+# discarded, so edits made to questions on the API are picked up
+QUESTION_TTL = 600
+
+class TriviaBuffer():
+    """
+    Holds up to BUFFER_SIZE prefetched trivia questions per player.
+    Every question is requested with the player's user_id, so it is
+    one they have not answered. Whenever a player's questions drop
+    below LOW_WATER_MARK, a background task refills them with one
+    batch request, so /trivia is answered from the buffer without
+    waiting on the Alder API. Only a player with nothing prefetched,
+    such as on their first game, waits for a request.
+
+    There is no buffer shared between players, since a question
+    fetched without a user_id may be one the player already answered.
+    """
+    def __init__(self):
+        self.user_questions = OrderedDict()
+        self.refills = {}
+
+    def is_fresh(self, fetched_at):
+        return time.monotonic() - fetched_at < QUESTION_TTL
+
+    def questions(self, user_id: int):
+        """
+        Returns the deque of (fetched_at, question) kept for the user
+        with expired questions discarded.
+        """
+        questions = self.user_questions.get(user_id)
+        if questions is None:
+            return deque()
+        while questions and not self.is_fresh(questions[0][0]):
+            questions.popleft()
+        return questions
+
+    def has_question(self, user_id: int):
+        return len(self.questions(user_id)) > 0
+
+    def keep(self, user_id: int, questions):
+        """
+        Adds fetched questions to the user's buffer, skipping those
+        already kept, up to BUFFER_SIZE.
+        """
+        kept = self.questions(user_id)
+        kept_ids = {question['id'] for _, question in kept}
+        fetched_at = time.monotonic()
+        for question in questions:
+            if len(kept) >= BUFFER_SIZE:
+                break
+            if question['id'] not in kept_ids:
+                kept.append((fetched_at, question))
+                kept_ids.add(question['id'])
+
+        self.user_questions[user_id] = kept
+        self.user_questions.move_to_end(user_id)
+        while len(self.user_questions) > MAX_USERS:
+            self.user_questions.popitem(last=False)
+
+    def pop(self, user_id: int):
+        """
+        Returns the next question prefetched for the user, or None if
+        none is kept.
+        """
+        questions = self.questions(user_id)
+        if not questions:
+            return None
+        return questions.popleft()[1]
+
+    async def get(self, user_id: int):
+        """
+        Returns an unseen question for the user, requesting it from the
+        Alder API if none is prefetched. Starts a background refill if
+        the user's buffer is below LOW_WATER_MARK. Returns None if the
+        request fails.
+        """
+        question = self.pop(user_id)
+        if question is None:
+            Logger.debug('No trivia question prefetched, fetching questions for %s', user_id)
+            questions = await TriviaQuestionClient.get_random_trivia_questions_contents(BUFFER_SIZE + 1, user_id)
+            if not questions:
+                return None
+            question = questions[0]
+            self.keep(user_id, questions[1:])
+
+        self.refill_if_low(user_id, exclude=question['id'])
+        return question
+
+    def refill_if_low(self, user_id: int, exclude: int = None):
+        """
+        Starts a background refill of the user's buffer if it is below
+        LOW_WATER_MARK and no refill is running for them. `exclude` is
+        the id of a question being asked, which must not be kept.
+        """
+        if len(self.questions(user_id)) >= LOW_WATER_MARK or user_id in self.refills:
+            return
+        self.refills[user_id] = asyncio.create_task(self.refill(user_id, exclude))
+
+    async def refill(self, user_id: int, exclude: int = None):
+        try:
+            count = BUFFER_SIZE - len(self.questions(user_id))
+            # Ask for one more when the question being asked may be returned
+            questions = await TriviaQuestionClient.get_random_trivia_questions_contents(count + (exclude is not None), user_id)
+            self.keep(user_id, [question for question in questions if question['id'] != exclude])
+        except Exception as e:
+            Logger.error(f'Unable to refill trivia questions for {user_id}: {str(e)}')
+        finally:
+            self.refills.pop(user_id, None)
+
+    def clear(self):
+        """
+        Discards every prefetched question. Used after questions are
+        edited or deleted.
+        """
+        for task in self.refills.values():
+            task.cancel()
+        self.user_questions.clear()
+
+trivia_buffer = TriviaBuffer()
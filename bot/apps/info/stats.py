@@ -9,22 +9,18 @@ import cfg
 import discord
 import math
 import traceback
-import json
 
 from tools.log import Logger
 from apps.info.achievement import Achievements
 from client.alder.interface.user_client import UserClient
-from client.alder.interface.monthtime_client import MonthTimeClient
-from client.alder.interface.dailytime_client import DailyTimeClient
+from client.alder.interface.profile_client import ProfileClient
 from client.alder.interface.rogueboss_client import RbClient
-from client.alder.interface.accomplishment_client import AccomplishmentClient
-from client.alder.interface.streak_client import StreakClient
 
 class Stats():
     def __init__(self, achievements: Achievements):
         self.achievements = achievements
 
-    def create_profile_embed(self, interaction: discord.Interaction, user: discord.User = None):
+    async def create_profile_embed(self, interaction: discord.Interaction, user: discord.User = None):
         """
         Create embed for discord user profile.
         """
@@ -54,36 +50,35 @@ class Stats():
             special_emote += f'<:Alumni:{cfg.ALUMNI_EMOJI}>'
         
         # Create user if they do not exist in DB
-        UserClient.create_user_if_dne(calling_user.id)
+        await UserClient.create_user_if_dne(calling_user.id)
 
-        # Fetch the statistics for the profile
-        month_stime = MonthTimeClient.get_stime_value_for_user_current_month(calling_user.id) // 3600
-        daily_stime = DailyTimeClient.get_stime_value_for_user_today(calling_user.id) // 3600
-        user_stime = UserClient.get_user_stime(calling_user.id) // 3600
-        user_tokens = UserClient.get_user_tokens(calling_user.id)
-        user_trivia = UserClient.get_user_trivia(calling_user.id)
-        rb_level = RbClient.get_rogue_boss_level(calling_user.id)
-        accomplishments = AccomplishmentClient.get_accomplishments_for_user_content(calling_user.id)
+        # Fetch every statistic for the profile in one request
+        profile = await ProfileClient.get_profile_content(calling_user.id)
+        if profile is None:
+            return cfg.ErrorEmbed.message('Unable to retrieve profile information.\nPlease contact server administrator.')
 
-        # Get achievement information from Achievements module
-        achievements = self.achievements.get_earned_achievements(calling_user.id)
+        month_stime = profile['month_stime'] // 3600
+        daily_stime = profile['daily_stime'] // 3600
+        user_stime = profile['stime'] // 3600
+        user_tokens = profile['tokens']
+        user_trivia = profile['trivia']
+        rb_level = RbClient.get_level_from_xp(profile['rb_xp']) if profile['rbtype'] is not None else 0
+        accomplishments = profile['accomplishments']
+
+        # Get achievement information from the profile
+        achievements = self.achievements.get_earned_achievements(profile)
         earned_achievements = achievements[0]
         total_achievements = achievements[1]
 
-        # Upsert streak if applicable, then retrieve streak
-        StreakClient.set_streak_for_user(calling_user.id)
-        streak_response = StreakClient.get_streak_for_user(calling_user.id)
-        if streak_response is not None:
-            streak_no = json.loads(streak_response.text)['current_streak']
-            if streak_no == 0:
-                streak = ''
-            else: 
-                streak = f'🔥 **Activity Streak:** {streak_no}'
-        else:
+        # Display the current streak if there is one
+        streak_no = profile['current_streak']
+        if streak_no == 0:
             streak = ''
+        else:
+            streak = f'🔥 **Activity Streak:** {streak_no}'
 
         # Create Discord Embed for Profile
-        embed = discord.Embed(title=f'**{calling_user.name}** {special_emote}', description=streak, color=UserClient.get_discord_user_embed_color(calling_user.id))
+        embed = discord.Embed(title=f'**{calling_user.name}** {special_emote}', description=streak, color=UserClient.get_embed_color_from_hex(profile['hex']))
         try:
             embed.set_thumbnail(url=f'{calling_user.avatar.url}')
         except Exception as e:
@@ -15,11 +15,11 @@ from client.alder.interface.user_client import UserClient
 
 class TimeZoneApp():
     @staticmethod
-    def set_timezone(interaction: discord.Interaction, timezone: str):
+    async def set_timezone(interaction: discord.Interaction, timezone: str):
         """
         Sets the user's timezone.
         """
-        UserClient.create_user_if_dne(interaction.user.id)
+        await UserClient.create_user_if_dne(interaction.user.id)
 
         # Validate the timezone string
         try:
@@ -30,7 +30,7 @@ class TimeZoneApp():
         
         # The timezone string is valid. Set it
         try:
-            response = UserClient.set_timezone(interaction.user.id, timezone)
+            response = await UserClient.set_timezone(interaction.user.id, timezone)
             
             if response is None:
                 raise Exception
@@ -44,16 +44,16 @@ class TimeZoneApp():
             return cfg.ErrorEmbed.message(message)
         
     @staticmethod
-    def get_current_timezone_embed(interaction: discord.Interaction):
+    async def get_current_timezone_embed(interaction: discord.Interaction):
         """
         Return an embed displaying the user's current timezone
         """
-        UserClient.create_user_if_dne(interaction.user.id)
+        await UserClient.create_user_if_dne(interaction.user.id)
 
         # Retrieve timezone
         try:
-            timezone = TimeZoneApp.get_timezone(interaction)
-            embed = discord.Embed(title=f'Timezone', color=UserClient.get_discord_user_embed_color(interaction.user.id))
+            timezone = await TimeZoneApp.get_timezone(interaction)
+            embed = discord.Embed(title=f'Timezone', color=await UserClient.get_discord_user_embed_color(interaction.user.id))
             embed.add_field(name='Current Timezone', value=timezone, inline=False)
             embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
             return embed
@@ -62,13 +62,13 @@ class TimeZoneApp():
             return cfg.ErrorEmbed.message('An unexpected error occurred when retrieiving timezone information')
         
     @staticmethod
-    def get_timezone(interaction: discord.Interaction):
+    async def get_timezone(interaction: discord.Interaction):
         """
         Retrieves the calling user's timezone.
         """
-        UserClient.create_user_if_dne(interaction.user.id)
+        await UserClient.create_user_if_dne(interaction.user.id)
 
-        response = UserClient.get_timezone(interaction.user.id)
+        response = await UserClient.get_timezone(interaction.user.id)
 
         if response is None:
             raise Exception
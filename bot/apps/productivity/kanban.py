@@ -20,12 +20,12 @@ class Kanban():
         else:
             return "🔴"
 
-    def view_kanban_board(self, interaction: discord.Interaction):
-        items_by_column = KanbanClient.get_user_kanban_items_by_user_id_content(interaction.user.id)
+    async def view_kanban_board(self, interaction: discord.Interaction):
+        items_by_column = await KanbanClient.get_user_kanban_items_by_user_id_content(interaction.user.id)
         if items_by_column is None:
             return cfg.ErrorEmbed.message('Unable to connect to Kanban Client.\nPlease contact server administrator.')
 
-        embed = self.get_sample_embed(interaction)
+        embed = await self.get_sample_embed(interaction)
 
         todo_item_string = ''
         doing_item_string = ''
@@ -73,12 +73,12 @@ class Kanban():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def view_kanban_board_tag(self, interaction: discord.Interaction, tag):
-        items_by_column = KanbanClient.get_user_kanban_items_by_tag_content(interaction.user.id, tag)
+    async def view_kanban_board_tag(self, interaction: discord.Interaction, tag):
+        items_by_column = await KanbanClient.get_user_kanban_items_by_tag_content(interaction.user.id, tag)
         if items_by_column is None:
             return cfg.ErrorEmbed.message('Unable to connect to Kanban Client.\nPlease contact server administrator.')
         
-        embed = self.get_sample_embed(interaction)
+        embed = await self.get_sample_embed(interaction)
 
         todo_item_string = ''
         doing_item_string = ''
@@ -126,39 +126,39 @@ class Kanban():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
 
-    def add_kanban_item(self, interaction: discord.Interaction, name, priority, tag, velocity):
-        KanbanClient.create_kanban_item(interaction.user.id, name, priority, tag, velocity)
+    async def add_kanban_item(self, interaction: discord.Interaction, name, priority, tag, velocity):
+        await KanbanClient.create_kanban_item(interaction.user.id, name, priority, tag, velocity)
         if tag:
-            return self.view_kanban_board_tag(interaction, tag)
+            return await self.view_kanban_board_tag(interaction, tag)
         else:
-            return self.view_kanban_board(interaction)
+            return await self.view_kanban_board(interaction)
 
-    def move_kanban_item(self, interaction: discord.Interaction, kanban_id):
-        KanbanClient.move_kanban_item_column(kanban_id, interaction.user.id)
-        return self.view_kanban_board(interaction)
+    async def move_kanban_item(self, interaction: discord.Interaction, kanban_id):
+        await KanbanClient.move_kanban_item_column(kanban_id, interaction.user.id)
+        return await self.view_kanban_board(interaction)
 
-    def update_kanban_item(self, interaction: discord.Interaction, kanban_id, name, priority, tag, velocity):
-        KanbanClient.update_kanban_details_with_priority_tag_velocity(kanban_id, interaction.user.id, name, priority, tag, velocity)
+    async def update_kanban_item(self, interaction: discord.Interaction, kanban_id, name, priority, tag, velocity):
+        await KanbanClient.update_kanban_details_with_priority_tag_velocity(kanban_id, interaction.user.id, name, priority, tag, velocity)
         
         if tag:
-            return self.view_kanban_board_tag(interaction, tag)
+            return await self.view_kanban_board_tag(interaction, tag)
         else:
-            return self.view_kanban_board(interaction)
+            return await self.view_kanban_board(interaction)
 
-    def remove_kanban_item(self, interaction: discord.Interaction, kanban_id):
-        KanbanClient.delete_user_kanban_item(interaction.user.id, kanban_id)
-        return self.view_kanban_board(interaction)
+    async def remove_kanban_item(self, interaction: discord.Interaction, kanban_id):
+        await KanbanClient.delete_user_kanban_item(interaction.user.id, kanban_id)
+        return await self.view_kanban_board(interaction)
 
-    def move_kanban_item_to_column(self, interaction: discord.Interaction, kanban_id, column):
-        KanbanClient.move_kanban_item_column(kanban_id, interaction.user.id, column)
-        return self.view_kanban_board(interaction)
+    async def move_kanban_item_to_column(self, interaction: discord.Interaction, kanban_id, column):
+        await KanbanClient.move_kanban_item_column(kanban_id, interaction.user.id, column)
+        return await self.view_kanban_board(interaction)
     
-    def complete(self, interaction: discord.Interaction):
-        KanbanClient.delete_completed_user_kanban_items(interaction.user.id)
-        return self.view_kanban_board(interaction)
+    async def complete(self, interaction: discord.Interaction):
+        await KanbanClient.delete_completed_user_kanban_items(interaction.user.id)
+        return await self.view_kanban_board(interaction)
 
-    def get_sample_embed(self, interaction: discord.Interaction):
-        color = UserClient.get_discord_user_embed_color(interaction.user.id)
+    async def get_sample_embed(self, interaction: discord.Interaction):
+        color = await UserClient.get_discord_user_embed_color(interaction.user.id)
         embed = discord.Embed(title=f'🗂️ {interaction.user.name}\'s Kanban Board', color=color)
         try:
             embed.set_thumbnail(url=f'{interaction.user.avatar.url}')
@@ -5,3 +5,197 @@ author: narlock
 Interface for sending reminders to users
 """
 
+import asyncio
+import time
+import traceback
+import pytz
+
+from datetime import datetime
+from tools.log import Logger
+from client.alder.interface.reminder_client import ReminderClient
+from apps.productivity.reminder_queue import ReminderEntry, ReminderQueue
+from apps.productivity.reminder_delivery import ReminderDelivery
+
+# Number of seconds ahead of now that reminders are kept in memory
+HORIZON_SECONDS = 24 * 60 * 60
+
+# Number of seconds between pulls of the next window of reminders
+WINDOW_SECONDS = 60 * 60
+
+# Maximum number of fired reminders advanced by a single request
+ADVANCE_BATCH_SIZE = 500
+
+# Number of seconds delivered reminders are collected before they are
+# advanced together
+ADVANCE_DELAY = 1
+
+# Format of remind_at in the Alder API
+REMIND_AT_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+class ReminderScheduler():
+    """
+    Hands reminders to the ReminderDelivery pipeline when they are due.
+    Pending reminders are kept in a ReminderQueue, and the scheduler
+    sleeps until the earliest one is due instead of checking every
+    reminder on an interval. Adding a reminder that is due before the
+    current wake-up time wakes the scheduler early.
+
+    Only reminders due before the horizon, about HORIZON_SECONDS ahead,
+    are kept in memory. Every WINDOW_SECONDS the horizon is moved forward
+    and the reminders due in the new window are read from the API.
+    """
+    def __init__(self, bot):
+        self.bot = bot
+        self.queue = ReminderQueue()
+        self.wake = asyncio.Event()
+        self.horizon = None
+        self.fired = set()
+        self.delivery = ReminderDelivery(bot, self.mark_fired)
+        self.task = None
+        self.window_task = None
+        self.advance_task = None
+        self.advance_lock = asyncio.Lock()
+
+    async def load(self):
+        """
+        Load every reminder due before the horizon from the API,
+        including overdue reminders, into the queue.
+        """
+        horizon = int(time.time()) + HORIZON_SECONDS
+        due_reminders = await ReminderClient.get_all_due_reminders(format_timestamp(horizon))
+        if due_reminders is None:
+            Logger.error('Failed to load reminders.')
+            return
+
+        self.horizon = horizon
+        for reminder in due_reminders:
+            self.add(reminder)
+        Logger.info(f'Loaded {len(self.queue)} reminders due in the next {HORIZON_SECONDS // 3600} hours.')
+
+    async def pull_window(self):
+        """
+        Moves the horizon forward and loads the reminders due between
+        the previous horizon and the new one. If the request fails, the
+        horizon is kept and the same window is retried next time.
+        """
+        if self.horizon is None:
+            await self.load()
+            return
+
+        horizon = int(time.time()) + HORIZON_SECONDS
+        due_reminders = await ReminderClient.get_all_due_reminders(format_timestamp(horizon), format_timestamp(self.horizon))
+        if due_reminders is None:
+            Logger.error('Failed to load the next window of reminders.')
+            return
+
+        self.horizon = horizon
+        for reminder in due_reminders:
+            self.add(reminder)
+        Logger.debug('Loaded %d reminders, %d pending.', len(due_reminders), len(self.queue))
+
+    def add(self, reminder: dict):
+        """
+        Schedules a reminder returned by the Alder API, replacing any
+        pending reminder with the same id. Reminders due after the
+        horizon are left to be read with their window.
+        """
+        remind_at = datetime.strptime(reminder['remind_at'], REMIND_AT_FORMAT).replace(tzinfo=pytz.utc)
+        if self.horizon is not None and remind_at.timestamp() >= self.horizon:
+            return
+        self.push(ReminderEntry(
+            remind_at.timestamp(),
+            reminder['id'],
+            reminder['user_id'],
+            reminder['title'],
+            reminder.get('repeat_interval')
+        ))
+
+    def push(self, entry: ReminderEntry):
+        next_due = self.queue.next_due()
+        self.queue.push(entry)
+        if next_due is None or entry.due < next_due:
+            self.wake.set()
+
+    def cancel(self, reminder_id: int):
+        """
+        Removes a pending reminder. The scheduler is not woken, as a
+        cancelled reminder at the top of the queue is skipped when it
+        wakes up.
+        """
+        return self.queue.cancel(reminder_id)
+
+    def start(self):
+        self.delivery.start()
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self.run())
+        if self.window_task is None or self.window_task.done():
+            self.window_task = asyncio.create_task(self.run_window())
+
+    async def run_window(self):
+        while True:
+            await asyncio.sleep(WINDOW_SECONDS)
+            Logger.info(f'Reminder delivery: {self.delivery.metrics.summary()}')
+            try:
+                await self.advance()
+                await self.pull_window()
+            except Exception as e:
+                Logger.error(f"An unexpected error occurred: {str(e)}")
+                traceback.print_exc()
+
+    async def run(self):
+        while True:
+            self.wake.clear()
+            next_due = self.queue.next_due()
+            timeout = None if next_due is None else max(next_due - time.time(), 0)
+            try:
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+            for entry in self.queue.pop_due(time.time()):
+                self.delivery.submit(entry)
+
+    def mark_fired(self, reminder_id: int):
+        """
+        Records a delivered reminder and advances it along with the other
+        reminders delivered within ADVANCE_DELAY seconds.
+        """
+        self.fired.add(reminder_id)
+        if self.advance_task is None or self.advance_task.done():
+            self.advance_task = asyncio.create_task(self.advance_later())
+
+    async def advance_later(self):
+        # Keep advancing while reminders are delivered, stopping if a
+        # request fails so it is retried with the next window pull
+        while self.fired:
+            await asyncio.sleep(ADVANCE_DELAY)
+            if not await self.advance():
+                return
+
+    async def advance(self):
+        """
+        Advances every fired reminder in one request. The API moves
+        repeating reminders to their next occurrence and deletes the
+        others. Next occurrences within the horizon are scheduled. If
+        the request fails, the reminders are kept and retried later.
+        Returns False if any request failed.
+        """
+        success = True
+        async with self.advance_lock:
+            fired = list(self.fired)
+            for start in range(0, len(fired), ADVANCE_BATCH_SIZE):
+                ids = fired[start:start + ADVANCE_BATCH_SIZE]
+                result = await ReminderClient.advance_reminders(ids)
+                if result is None:
+                    Logger.error(f"Failed to advance {len(ids)} reminders, will retry.")
+                    success = False
+                    continue
+
+                self.fired.difference_update(ids)
+                for reminder in result['updated']:
+                    self.add(reminder)
+                Logger.info(f"Advanced {len(result['updated'])} repeating reminders and deleted {len(result['deleted'])} reminders.")
+        return success
+
+def format_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, pytz.utc).strftime(REMIND_AT_FORMAT)
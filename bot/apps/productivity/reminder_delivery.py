@@ -0,0 +1,140 @@
+"""
+reminder_delivery.py
+author: narlock
+
+Delivers due reminders to users as direct messages using a pool of
+workers, so a large number of reminders due at the same time are sent
+concurrently instead of one after another.
+"""
+
+import asyncio
+import discord
+
+from collections import OrderedDict
+from tools.log import Logger
+from client.alder.interface.reminder_client import ReminderClient
+from apps.productivity.reminder_queue import ReminderEntry
+from apps.productivity.reminder_pacing import RateBudget, DeliveryMetrics
+
+# Number of reminders delivered concurrently
+WORKER_COUNT = 8
+
+# Requests per second and burst allowed for each Discord route used to
+# deliver a reminder. Staying under these avoids hitting Discord's own
+# rate limits, which would stall every worker at once.
+ROUTE_BUDGETS = {
+    'fetch_user': (10, 10),
+    'send_dm': (5, 10)
+}
+
+# Attempts made to send a reminder before it is dropped, and the delay
+# before the first retry, doubled for each further attempt
+MAX_ATTEMPTS = 5
+RETRY_DELAY = 5
+
+# Maximum number of users fetched from Discord that are kept in memory
+MAX_CACHED_USERS = 1000
+
+class ReminderDelivery():
+    """
+    Sends reminders with WORKER_COUNT workers reading from a shared
+    queue. Users are looked up in the bot's cache and a small cache of
+    fetched users before fetching them from Discord. Every request is
+    paced by the budget of its route. Failed messages are retried with
+    exponential backoff.
+
+    `on_done` is called with the id of every reminder that should be
+    advanced to its next occurrence, whether it was sent or dropped.
+    """
+    def __init__(self, bot, on_done):
+        self.bot = bot
+        self.on_done = on_done
+        self.queue = asyncio.Queue()
+        self.budgets = {route: RateBudget(rate, burst) for route, (rate, burst) in ROUTE_BUDGETS.items()}
+        self.users = OrderedDict()
+        self.metrics = DeliveryMetrics()
+        self.workers = []
+
+    def start(self):
+        self.workers = [worker for worker in self.workers if not worker.done()]
+        while len(self.workers) < WORKER_COUNT:
+            self.workers.append(asyncio.create_task(self.work()))
+
+    def submit(self, entry: ReminderEntry, attempt: int = 1):
+        self.queue.put_nowait((entry, attempt))
+
+    async def work(self):
+        while True:
+            entry, attempt = await self.queue.get()
+            try:
+                await self.deliver(entry, attempt)
+            except Exception as e:
+                Logger.error(f"An unexpected error occurred delivering reminder {entry.id}: {str(e)}")
+                self.retry(entry, attempt)
+            finally:
+                self.queue.task_done()
+
+    async def get_user(self, user_id: int):
+        """
+        Returns the user, using the bot's cache or the cache of fetched
+        users before fetching them from Discord.
+        """
+        user = self.bot.get_user(user_id)
+        if user is not None:
+            return user
+
+        user = self.users.get(user_id)
+        if user is not None:
+            self.users.move_to_end(user_id)
+            return user
+
+        await self.budgets['fetch_user'].acquire()
+        user = await self.bot.fetch_user(user_id)
+        self.users[user_id] = user
+        while len(self.users) > MAX_CACHED_USERS:
+            self.users.popitem(last=False)
+        return user
+
+    async def deliver(self, entry: ReminderEntry, attempt: int):
+        try:
+            user = await self.get_user(entry.user_id)
+        except discord.errors.NotFound:
+            # If the user is not found, delete the reminder from the database
+            deleted = await ReminderClient.delete_reminder_by_id(entry.id)
+            if deleted:
+                Logger.info(f"Deleted reminder {entry.id} from the database due to user not found.")
+            else:
+                Logger.error(f"Failed to delete reminder {entry.id} from the database due to user not found.")
+            return
+
+        try:
+            await self.budgets['send_dm'].acquire()
+            await user.send(f"Reminder: {entry.title}")
+        except discord.errors.Forbidden:
+            # The user does not accept direct messages, retrying will not help
+            Logger.warn(f"Reminder {entry.id} could not be sent to user {entry.user_id}, direct messages are closed.")
+            self.metrics.dropped += 1
+            self.on_done(entry.id)
+            return
+        except discord.errors.HTTPException as e:
+            Logger.warn(f"Reminder {entry.id} failed on attempt {attempt}: {str(e)}")
+            self.retry(entry, attempt)
+            return
+
+        self.metrics.record_sent(entry)
+        self.on_done(entry.id)
+
+    def retry(self, entry: ReminderEntry, attempt: int):
+        """
+        Submits the reminder again after a backoff delay, or drops it
+        once MAX_ATTEMPTS have failed.
+        """
+        if attempt >= MAX_ATTEMPTS:
+            Logger.error(f"Dropping reminder {entry.id} after {attempt} failed attempts.")
+            self.metrics.dropped += 1
+            self.on_done(entry.id)
+            return
+
+        self.metrics.retried += 1
+        delay = RETRY_DELAY * 2 ** (attempt - 1)
+        asyncio.get_running_loop().call_later(delay, self.submit, entry, attempt + 1)
@@ -0,0 +1,65 @@
+"""
+reminder_pacing.py
+author: narlock
+
+Rate budgets and delivery metrics of the reminder workers. This module
+has no dependency on the bot configuration so it can be tested alone.
+"""
+
+import asyncio
+import time
+
+from collections import deque
+from apps.productivity.reminder_queue import ReminderEntry
+
+# Number of recent delivery lags kept for the lag percentiles
+LAG_SAMPLES = 1000
+
+class RateBudget():
+    """
+    Token bucket for a single route. Each request takes a token, and
+    tokens are added back at `rate` per second up to `burst`.
+    """
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class DeliveryMetrics():
+    """
+    Counts delivered, retried and dropped reminders and keeps the most
+    recent delivery lags, measured from the reminder's due time to the
+    time its message was sent.
+    """
+    def __init__(self):
+        self.sent = 0
+        self.retried = 0
+        self.dropped = 0
+        self.lags = deque(maxlen=LAG_SAMPLES)
+
+    def record_sent(self, entry: ReminderEntry):
+        self.sent += 1
+        self.lags.append(max(time.time() - entry.due, 0))
+
+    def percentile(self, fraction: float):
+        if not self.lags:
+            return 0
+        lags = sorted(self.lags)
+        return lags[min(int(len(lags) * fraction), len(lags) - 1)]
+
+    def summary(self):
+        return (f'sent {self.sent}, retried {self.retried}, dropped {self.dropped}, '
+                f'lag p50 {self.percentile(0.5):.2f}s p95 {self.percentile(0.95):.2f}s max {max(self.lags, default=0):.2f}s')
@@ -0,0 +1,102 @@
+"""
+reminder_queue.py
+author: narlock
+
+Min-heap of pending reminders ordered by due time. This module has no
+dependency on the bot configuration so it can be benchmarked alone.
+"""
+
+import heapq
+
+class ReminderEntry():
+    """
+    A pending reminder. Uses __slots__ to keep each entry small, since
+    the queue may hold a very large number of them. `due` is the UTC
+    POSIX timestamp the reminder is due at.
+    """
+    __slots__ = ('due', 'id', 'user_id', 'title', 'repeat_interval', 'cancelled')
+
+    def __init__(self, due: float, id: int, user_id: int, title: str, repeat_interval: str = None):
+        self.due = due
+        self.id = id
+        self.user_id = user_id
+        self.title = title
+        self.repeat_interval = repeat_interval
+        self.cancelled = False
+
+class ReminderQueue():
+    """
+    Reminders ordered by due time. The heap holds (due, id, entry)
+    tuples so ordering is compared on plain values. Inserting is
+    O(log n) and cancelling is O(1): a cancelled entry is only marked,
+    and is discarded when it reaches the top of the heap. The heap is
+    rebuilt once cancelled entries make up more than half of it, so
+    they cannot accumulate.
+    """
+    def __init__(self):
+        self.heap = []
+        self.entries = {}
+        self.cancelled_count = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, id):
+        return id in self.entries
+
+    def push(self, entry: ReminderEntry):
+        """
+        Adds the entry, replacing any pending entry with the same id.
+        """
+        self.cancel(entry.id)
+        self.entries[entry.id] = entry
+        heapq.heappush(self.heap, (entry.due, entry.id, entry))
+
+    def cancel(self, id: int):
+        """
+        Cancels the pending entry with the given id. Returns True if
+        an entry was cancelled.
+        """
+        entry = self.entries.pop(id, None)
+        if entry is None:
+            return False
+        entry.cancelled = True
+        self.cancelled_count += 1
+        if self.cancelled_count > len(self.heap) // 2:
+            self.compact()
+        return True
+
+    def compact(self):
+        """
+        Removes every cancelled entry from the heap.
+        """
+        self.heap = [item for item in self.heap if not item[2].cancelled]
+        heapq.heapify(self.heap)
+        self.cancelled_count = 0
+
+    def discard_cancelled(self):
+        while self.heap and self.heap[0][2].cancelled:
+            heapq.heappop(self.heap)
+            self.cancelled_count -= 1
+
+    def next_due(self):
+        """
+        Returns the due timestamp of the earliest pending entry, or
+        None if the queue is empty.
+        """
+        self.discard_cancelled()
+        return self.heap[0][0] if self.heap else None
+
+    def pop_due(self, now: float):
+        """
+        Removes and returns every pending entry due at or before `now`,
+        earliest first.
+        """
+        due = []
+        self.discard_cancelled()
+        while self.heap and self.heap[0][0] <= now:
+            entry = heapq.heappop(self.heap)[2]
+            del self.entries[entry.id]
+            due.append(entry)
+            self.discard_cancelled()
+        return due
@@ -57,17 +57,17 @@ class ShopColor():
         user_id = member.id
 
         # Ensure that the user has been created
-        UserClient.create_user_if_dne(user_id)
+        await UserClient.create_user_if_dne(user_id)
 
         # Fetch user's tokens.
-        tokens = UserClient.get_user_tokens(user_id)
+        tokens = await UserClient.get_user_tokens(user_id)
 
         # Check if they can purchase a color role.
         if not tokens >= 500:
             return cfg.ErrorEmbed.notokens(tokens, 500)
         
         # Update user's tokens to subtract 500
-        UserClient.subtract_tokens_user(user_id, 500)
+        await UserClient.subtract_tokens_user(user_id, 500)
         tokens -= 500
 
         # Update the user's color role. Ensure that they do not have other color roles.
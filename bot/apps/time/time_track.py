@@ -16,8 +16,7 @@ import traceback
 
 from tools.log import Logger
 from client.alder.interface.user_client import UserClient
-from client.alder.interface.dailytime_client import DailyTimeClient
-from client.alder.interface.monthtime_client import MonthTimeClient
+from client.alder.interface.focus_client import FocusClient
 from client.alder.interface.streak_client import StreakClient
 
 SECONDS_FOR_TOKEN = 300
@@ -25,7 +24,7 @@ ACTIVITY_ROOMS = cfg.ACTIVITY_CHANNEL_IDS
 user_time = {}
 
 class TimeTrack():
-    def start_up(self, guild: discord.Guild):
+    async def start_up(self, guild: discord.Guild):
         """
         Utilized when the bot starts up, this function will obtain
         the current voice channel information of the server and begin to
@@ -34,7 +33,7 @@ class TimeTrack():
         """
         try:
             voice_channels = guild.voice_channels
-            Logger.debug(f"Obtained voice channels from guild {voice_channels}.")
+            Logger.debug("Obtained voice channels from guild %s.", voice_channels)
         except Exception as e:
             Logger.error(f"An unexpected error occurred when fetching voice channels from guild. {e}")
 
@@ -49,31 +48,33 @@ class TimeTrack():
                     user_time[member.id] = time.time()
 
                     # Create the user if they do not exist
-                    UserClient.create_user_if_dne(member.id)
+                    await UserClient.create_user_if_dne(member.id)
                     
-    def handle_shutdown(self, guild: discord.Guild):
+    async def handle_shutdown(self, guild: discord.Guild):
         voice_channels = guild.voice_channels
-        Logger.debug(f"Successfully obtained voice channels from guild {voice_channels}.")
+        Logger.debug("Successfully obtained voice channels from guild %s.", voice_channels)
 
+        sessions = []
         for channel in voice_channels:
             if isinstance(channel, discord.VoiceChannel) and channel.id in ACTIVITY_ROOMS:
                 # Obtain the members that are currently in activity rooms
                 members = channel.members
                 for member in members:
-                    # If those members exist in the user_time dictionary, update their time and tokens before shutting down
+                    # If those members exist in the user_time dictionary, collect their time and tokens before shutting down
                     if member.id in user_time:
                         # Calculate activity time and tokens earned
                         focused_time_of_member = round(time.time() - user_time[member.id])
                         tokens_earned = (focused_time_of_member // SECONDS_FOR_TOKEN)
+                        sessions.append({"user_id": member.id, "seconds": focused_time_of_member, "tokens": tokens_earned})
 
-                        # Update the user time and tokens earned
-                        self.update_user_time_and_tokens_entry_in_database(member.id, focused_time_of_member, tokens_earned)
-                        Logger.success(f"Member {member.name} time saved {focused_time_of_member}, earned {tokens_earned} tokens.")
+        # Save the time and tokens earned for every member in chunked batch requests
+        await self.save_sessions(sessions)
 
-    def update_connected_users(self, guild: discord.Guild):
+    async def update_connected_users(self, guild: discord.Guild):
         voice_channels = guild.voice_channels
-        Logger.debug(f"Successfully obtained voice channels from guild {voice_channels}.")
+        Logger.debug("Successfully obtained voice channels from guild %s.", voice_channels)
 
+        sessions = []
         for channel in voice_channels:
             if isinstance(channel, discord.VoiceChannel) and channel.id in ACTIVITY_ROOMS:
                 members = channel.members
@@ -88,14 +89,37 @@ class TimeTrack():
                         # Resetting time
                         user_time[member.id] = time.time()
 
-                        self.update_user_time_and_tokens_entry_in_database(member.id, focused_time_of_member, tokens_earned)
-                        Logger.success(f"Member {member.name} time saved {focused_time_of_member}, earned {tokens_earned} tokens.")
+                        sessions.append({"user_id": member.id, "seconds": focused_time_of_member, "tokens": tokens_earned})
 
-    def update_time_on_event(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
-        Logger.debug(f"Update Time Event Received in Time Track for {member.name}. Current user_time {user_time}")
+        # Save the time and tokens earned for every member in chunked batch requests
+        failed = await self.save_sessions(sessions)
+
+        # Give the time of sessions that could not be saved back to their
+        # members, so it is saved with their next update. Members who
+        # left while saving have no next update, so retry theirs alone.
+        for session in failed:
+            if session["user_id"] in user_time:
+                user_time[session["user_id"]] -= session["seconds"]
+            else:
+                await self.update_user_time_and_tokens_entry_in_database(session["user_id"], session["seconds"], session["tokens"])
+
+    async def save_sessions(self, sessions):
+        """
+        Records the collected focus sessions with the batch endpoint.
+        Returns the sessions that could not be recorded.
+        """
+        if not sessions:
+            return []
+
+        failed = await FocusClient.add_focus_sessions(sessions)
+        Logger.success(f"Saved {len(sessions) - len(failed)} of {len(sessions)} focus sessions.")
+        return failed
+
+    async def update_time_on_event(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        Logger.debug("Update Time Event Received in Time Track for %s. Current user_time %s", member.name, user_time)
 
         # Validate study streak
-        StreakClient.set_streak_for_user(member.id)
+        await StreakClient.set_streak_for_user(member.id)
 
         # Event when joining a focus room
         if member.id not in user_time and (before.channel is None or before.channel not in ACTIVITY_ROOMS) and (after.channel is not None and after.channel.id in ACTIVITY_ROOMS):
@@ -107,7 +131,7 @@ class TimeTrack():
             """
             Logger.info(f'{member.name} joined {after.channel.name}')
             user_time[member.id] = time.time()
-            UserClient.create_user_if_dne(member.id)
+            await UserClient.create_user_if_dne(member.id)
 
         # Event when leaving a focus room
         if member.id in user_time and before.channel is not None and before.channel.id in ACTIVITY_ROOMS and (after.channel is None or after.channel.id not in ACTIVITY_ROOMS):
@@ -122,14 +146,14 @@ class TimeTrack():
                 Logger.info(f"{member.name} left {before.channel.name}. {focused_time_of_member} seconds added to time, earning {tokens_earned} tokens.")
                 del user_time[member.id]
 
-                self.update_user_time_and_tokens_entry_in_database(member.id, focused_time_of_member, tokens_earned)
+                await self.update_user_time_and_tokens_entry_in_database(member.id, focused_time_of_member, tokens_earned)
             except KeyError as e:
                 Logger.error(f"KeyError occurred when accessing user_time. Invalid Key: {e.args[0]}")
             except Exception as e:
                 traceback.print_exc()
                 Logger.error(f"An unexpected error occurred inside of TimeTrack.update_time_on_event for {member.name}.")
 
-    def update_time_on_call(self, interaction: discord.Interaction, user: discord.User):
+    async def update_time_on_call(self, interaction: discord.Interaction, user: discord.User):
         """
         Under the condition that the /stats command is called on a particular user
         (if no user is provided, the calling user a part of the interaction will be
@@ -146,7 +170,7 @@ class TimeTrack():
             calling_user = user
 
         # Resiliency check: ensure the user exists in the database
-        UserClient.create_user_if_dne(calling_user.id)
+        await UserClient.create_user_if_dne(calling_user.id)
 
         # Check if user is in voice channel, if they are update info accordingly
         if calling_user.id in user_time:
@@ -162,21 +186,15 @@ class TimeTrack():
                 Logger.info(f"Updating profile statistics for {calling_user.id}. {focused_time_of_member} seconds added to time, earning {tokens_earned} tokens.")
 
                 # Update MySQL User Entry
-                self.update_user_time_and_tokens_entry_in_database(calling_user.id, focused_time_of_member, tokens_earned)
+                await self.update_user_time_and_tokens_entry_in_database(calling_user.id, focused_time_of_member, tokens_earned)
             except KeyError as e:
                 Logger.error(f"KeyError occurred when accessing user_time. Invalid Key: {e.args[0]}")
             except:
                 Logger.error(f"An unexpected error occurred inside of TimeTrack.update_time_on_event.")
 
-    def update_user_time_and_tokens_entry_in_database(self, user_id, focus_time, tokens):
-        # Resiliency check: ensure that the user has been created on the database
-        UserClient.create_user_if_dne(user_id)
-
-        # Update user resource
-        UserClient.add_stime_and_tokens_user(user_id, focus_time, tokens)
-
-        # Update dailytime resource
-        DailyTimeClient.add_stime_to_user_dailytime(user_id, focus_time)
-
-        # Update monthtime
-        MonthTimeClient.add_stime_to_user_monthtime(user_id, focus_time)
+    async def update_user_time_and_tokens_entry_in_database(self, user_id, focus_time, tokens):
+        # Record the session: the API creates any missing rows and updates the
+        # user, dailytime, monthtime and streak resources in one transaction
+        totals = await FocusClient.add_focus_session(user_id, focus_time, tokens)
+        if totals is None:
+            Logger.error(f"Unable to record focus session of {focus_time} seconds for {user_id}.")
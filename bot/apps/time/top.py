@@ -9,24 +9,21 @@ import cfg
 import discord
 
 from tools.log import Logger
-from client.alder.interface.monthtime_client import MonthTimeClient
-from client.alder.interface.dailytime_client import DailyTimeClient
-from client.alder.interface.user_client import UserClient
+from client.alder.interface.leaderboard_client import LeaderboardClient
 from client.alder.interface.rogueboss_client import RbClient
-from client.alder.interface.streak_client import StreakClient
 
 PLACES = [':first_place: First', ':second_place: Second', ':third_place: Third']
 HONORABLE_MENTIONS_NAME = ':mega: Honorable Mentions'
 
 class Top():
-    def display_top(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the top users on the server, handles different counts of top users.
         """
         Logger.debug(f"Generating top embed. Requested by {interaction.user.name}")
         
         # Retrieve top monthtime users
-        top_monthtime_users = MonthTimeClient.get_top_10_stime_users_current_month()
+        top_monthtime_users = await LeaderboardClient.get_leaderboard_content('month')
 
         # Return no members on leaderboard if none are found
         if not top_monthtime_users:
@@ -51,7 +48,7 @@ class Top():
                 embed.set_thumbnail(url=f'{avatar_url}')
 
             # Convert user month stime to hours
-            month_time = user['stime'] // 3600
+            month_time = user['value'] // 3600
 
             if index < 3:
                 # Add dedicated embed field if in first, second, or third place
@@ -69,14 +66,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def display_top_daily(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_daily(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the top users on the server for today, handles different counts of top users.
         """
         Logger.debug(f"Generating top daily embed. Requested by {interaction.user.name}")
         
         # Retrieve top monthtime users
-        top_dailytime_users = DailyTimeClient.get_top_10_stime_users_today()
+        top_dailytime_users = await LeaderboardClient.get_leaderboard_content('day')
 
         # Return no members on leaderboard if none are found
         if not top_dailytime_users:
@@ -101,7 +98,7 @@ class Top():
                 embed.set_thumbnail(url=f'{avatar_url}')
 
             # Convert user daily stime to hours
-            daily_time = user['stime'] // 3600
+            daily_time = user['value'] // 3600
 
             if index < 3:
                 # Add dedicated embed field if in first, second, or third place
@@ -119,14 +116,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def display_top_trivia(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_trivia(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the top trivia users on the server, handles different counts of top users.
         """
         Logger.debug(f'Generating top trivia embed. Requested by {interaction.user.name}')
 
         # Retrieve top trivia users
-        top_trivia_users = UserClient.search_top_trivia_users()
+        top_trivia_users = await LeaderboardClient.get_leaderboard_content('trivia')
 
         # Return no members on leaderboard if none are found
         if not top_trivia_users:
@@ -140,7 +137,7 @@ class Top():
 
         for index, user in enumerate(top_trivia_users):
             # Obtain the mmeber from their user_id
-            member = interaction.guild.get_member(user['id'])
+            member = interaction.guild.get_member(user['user_id'])
 
             # Set the username based on the value of the member.
             username = self.get_username(member)
@@ -150,7 +147,7 @@ class Top():
                 avatar_url = self.get_top_url(member)
                 embed.set_thumbnail(url=f'{avatar_url}')
 
-            user_trivia = user['trivia']
+            user_trivia = user['value']
             if index < 3:
                 # Add dedicated embed field if member is in first, second, or third place
                 embed.add_field(name=PLACES[index], value=f'**{username}** ({user_trivia} correct answers)', inline=False)
@@ -167,14 +164,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def display_top_rb(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_rb(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the top rogue boss users on the server, handles different counts of top users.
         """
         Logger.debug(f'Generating top rogue boss embed. Requested by {interaction.user.name}')
 
         # Retrieve top rogue boss users
-        top_rogueboss_users = RbClient.get_top_10_rogue_boss_users()
+        top_rogueboss_users = await LeaderboardClient.get_leaderboard_content('rb')
 
         # Return no members on leaderboard if none are found
         if not top_rogueboss_users:
@@ -194,7 +191,8 @@ class Top():
             username = self.get_username(member)
 
             # Get user Rogue Boss level and XP
-            rb_level, rb_xp = RbClient.get_rogue_boss_level_and_xp(member.id)
+            rb_xp = user['value']
+            rb_level = RbClient.get_level_from_xp(rb_xp)
 
             if member is not None and index == 0:
                 # Add the member's avatar as the embed thumnbail
@@ -217,14 +215,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def display_top_all(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_all(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the top users on the server, handles different counts of top users.
         """
         Logger.debug(f"Generating top embed. Requested by {interaction.user.name}")
         
         # Retrieve top monthtime users
-        top_stime_users = UserClient.search_top_stime_users()
+        top_stime_users = await LeaderboardClient.get_leaderboard_content('all')
 
         # Return no members on leaderboard if none are found
         if not top_stime_users:
@@ -238,7 +236,7 @@ class Top():
 
         for index, user in enumerate(top_stime_users):
             # Obtain the member from their user_id
-            member = interaction.guild.get_member(user['id'])
+            member = interaction.guild.get_member(user['user_id'])
 
             # Set the username based on the value of the member.
             username = self.get_username(member)
@@ -249,7 +247,7 @@ class Top():
                 embed.set_thumbnail(url=f'{avatar_url}')
 
             # Convert user month stime to hours
-            stime = user['stime'] // 3600
+            stime = user['value'] // 3600
 
             if index < 3:
                 # Add dedicated embed field if in first, second, or third place
@@ -266,14 +264,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
     
-    def display_top_streak(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_streak(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the users with the highest current streaks on the server, handles different counts of top users.
         """
         Logger.debug(f'Generating top current streak embed. Requested by {interaction.user.id}')
 
         # Retrieve top current streak users
-        top_streak_users = StreakClient.get_top_10_current_streak_users()
+        top_streak_users = await LeaderboardClient.get_leaderboard_content('streak')
 
         # Return no members on leaderboard if none are found
         if not top_streak_users:
@@ -297,7 +295,7 @@ class Top():
                 avatar_url = self.get_top_url(member)
                 embed.set_thumbnail(url=f'{avatar_url}')
 
-            user_current_streak = user['current_streak']
+            user_current_streak = user['value']
             if index < 3:
                 # Add dedicated embed field if in first, second, or third place
                 embed.add_field(name=PLACES[index], value=f'**{username}** ({user_current_streak} days)', inline=False)
@@ -314,14 +312,14 @@ class Top():
         embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
         return embed
 
-    def display_top_streaks_all_time(self, interaction: discord.Interaction) -> discord.Embed:
+    async def display_top_streaks_all_time(self, interaction: discord.Interaction) -> discord.Embed:
         """
         Generates the embed for the users with the highest current streaks on the server, handles different counts of top users.
         """
         Logger.debug(f'Generating top current streak embed. Requested by {interaction.user.id}')
 
         # Retrieve top current streak users
-        top_streak_users = StreakClient.get_top_10_highest_streak_users()
+        top_streak_users = await LeaderboardClient.get_leaderboard_content('highest_streak')
 
         # Return no members on leaderboard if none are found
         if not top_streak_users:
@@ -345,7 +343,7 @@ class Top():
                 avatar_url = self.get_top_url(member)
                 embed.set_thumbnail(url=f'{avatar_url}')
 
-            user_highest_streak = user['highest_streak_achieved']
+            user_highest_streak = user['value']
             if index < 3:
                 # Add dedicated embed field if in first, second, or third place
                 embed.add_field(name=PLACES[index], value=f'**{username}** ({user_highest_streak} days)', inline=False)
@@ -49,12 +49,21 @@ MYSQL_PASSWORD = MYSQL['password']
 MYSQL_HOST = MYSQL['host']
 MYSQL_DATABASE = MYSQL['database']
 
-# Initialize log level constant
+# Initialize logging constants
 LOG_LEVEL = CONFIG['log.level']
+LOG_FORMAT = CONFIG.get('log.format', 'text')
+LOG_LEVELS = CONFIG.get('log.levels') or {}
+LOG_SAMPLE = CONFIG.get('log.sample') or {}
+
+# Initialize JSON codec constant
+JSON_CODEC = CONFIG.get('json.codec', 'auto')
 
 # Initialize Alder API URL
 ALDER_API_URL = CONFIG['api']['url']
 
+# Whether the Alder API client asks for MessagePack instead of JSON
+ALDER_API_MSGPACK = CONFIG['api'].get('msgpack', False)
+
 # Initialize Rogue Boss URL
 ROGUE_BOSS_URL = CONFIG['rogueboss']['url']
 
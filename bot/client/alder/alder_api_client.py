@@ -3,26 +3,96 @@ alder_api_client.py
 author: narlock
 
 The client interface for communicating with the Alder API.
-Uses the requests module to perform the HTTP requests.
+Uses a single pooled aiohttp session to perform the HTTP requests
+so that calls never block the Discord event loop.
 """
 
 import cfg
-import requests
+import aiohttp
 import traceback
-import json
 
+from collections import OrderedDict
 from tools.log import Logger
+from tools.jsoncodec import JsonCodec
+from tools.msgpackcodec import MsgpackCodec, MSGPACK_MIMETYPE
 
 BASE_URL = cfg.ALDER_API_URL
 
+# Total number of seconds a single request is allowed to take
+DEFAULT_TIMEOUT = 5
+
+# Maximum number of pooled keep-alive connections to the Alder API
+POOL_LIMIT = 20
+
+# Maximum number of GET responses kept for conditional requests
+MAX_CACHED_RESPONSES = 256
+
+JsonCodec.use(cfg.JSON_CODEC)
+
+# Send and receive MessagePack instead of JSON when configured. Every
+# response says which one it holds, so JSON answers are still read.
+USE_MSGPACK = cfg.ALDER_API_MSGPACK and MsgpackCodec.available
+if cfg.ALDER_API_MSGPACK and not MsgpackCodec.available:
+    Logger.warn('api.msgpack is enabled but msgpack is not installed, using JSON.')
+
+ACCEPT = f'{MSGPACK_MIMETYPE}, application/json;q=0.9' if USE_MSGPACK else 'application/json'
+
+class AlderAPIResponse():
+    """
+    Lightweight response returned by the AlderAPIClient. The body is
+    read eagerly so the underlying connection can be released back to
+    the pool before the caller parses it.
+
+    A cached response is returned again when the API answers 304 Not
+    Modified, so the body parsed by json() is shared and must be
+    treated as read-only.
+
+    The body is kept as bytes and parsed from them directly, and is
+    only decoded to text if `text` is read. MessagePack bodies are
+    parsed the same way as JSON ones.
+    """
+    def __init__(self, status_code, content, etag=None, content_type=None):
+        self.status_code = status_code
+        self.content = content
+        self.etag = etag
+        self.content_type = content_type
+        self.body = None
+        self.parsed = False
+
+    @property
+    def text(self):
+        return self.content.decode()
+
+    def json(self):
+        """
+        Returns the parsed JSON body. The body is parsed once and reused
+        on later calls.
+        """
+        if not self.parsed:
+            if self.content_type == MSGPACK_MIMETYPE:
+                self.body = MsgpackCodec.loads(self.content)
+            else:
+                self.body = JsonCodec.loads(self.content)
+            self.parsed = True
+        return self.body
+
+    def records(self):
+        """
+        Returns the list of objects of a streamed response, sent as
+        newline-delimited JSON or as back to back MessagePack objects.
+        """
+        if self.content_type == MSGPACK_MIMETYPE:
+            return MsgpackCodec.loads_sequence(self.content)
+        return [JsonCodec.loads(line) for line in self.content.splitlines() if line]
+
 class AlderAPIClient():
     """
-    Usage: 
-    Import both the AlderAPIClient and the json module.
+    Usage:
+    Import the AlderAPIClient.
     Make your HTTP call and retrieve the body as JSON.
 
-    response = AlderAPIClient.get('/user/1') # Performs call and sets response
-    body = json.loads(response.text) # Parses text response to Python object
+    response = await AlderAPIClient.get('/user/1') # Performs call and sets response
+    body = response.json() # Parses text response to Python object
 
     Now, we can use the body as a Python object. For example, if response.text was:
     {
@@ -32,99 +102,138 @@ class AlderAPIClient():
     "tokens": 0,
     "trivia": 0
     }
-    json.loads would parse this into an actual Python object
+    response.json() would parse this into an actual Python object
     {'hex': '383838', 'id': 1, 'stime': 0, 'tokens': 0, 'trivia': 0}
     And we can access each field in the response.
     print(body['hex']) # would print 383838
+
+    GET responses carrying an ETag are kept in a bounded LRU. The next
+    GET of the same path sends If-None-Match, and if the API answers
+    304 Not Modified the cached response, with its already parsed body,
+    is returned.
     """
-    
+    _session = None
+    _cache = OrderedDict()
+
     @staticmethod
-    def get(path):
+    def get_session():
         """
-        Performs a HTTP GET request against the Alder API
-        given a path. Returns the response.
+        Returns the shared aiohttp session, creating it on first use.
+        The session must be created from within the running event loop.
+        """
+        if AlderAPIClient._session is None or AlderAPIClient._session.closed:
+            connector = aiohttp.TCPConnector(limit=POOL_LIMIT, keepalive_timeout=30)
+            AlderAPIClient._session = aiohttp.ClientSession(connector=connector)
+        return AlderAPIClient._session
+
+    @staticmethod
+    async def close():
+        """
+        Closes the shared session and its pooled connections.
+        """
+        if AlderAPIClient._session is not None and not AlderAPIClient._session.closed:
+            await AlderAPIClient._session.close()
+        AlderAPIClient._session = None
+
+    @staticmethod
+    async def request(method, path, request_body=None, timeout=DEFAULT_TIMEOUT):
+        """
+        Performs a HTTP request against the Alder API given the
+        method, path and optional request body. Returns the response,
+        or None if the request could not be completed.
         """
         url = f'{BASE_URL}{path}'
         try:
-            Logger.debug(f'[GET] Request URL: {url}')
-            response = requests.get(url, timeout=5)
-            Logger.debug(f'[GET] Response {response.status_code}: {response.text}')
+            Logger.debug('[%s] Request URL: %s', method, url)
+            if request_body is not None:
+                Logger.debug('[%s] Request Body: %s', method, request_body)
+
+            headers = {'Accept': ACCEPT}
+            data = None
+            if request_body is not None:
+                if USE_MSGPACK:
+                    data = MsgpackCodec.dumps(request_body)
+                    headers['Content-Type'] = MSGPACK_MIMETYPE
+                else:
+                    data = JsonCodec.dumps(request_body)
+                    headers['Content-Type'] = 'application/json'
+
+            # Revalidate a cached GET response instead of downloading it again
+            cached = AlderAPIClient._cache.get(path) if method == 'GET' else None
+            if cached is not None:
+                headers['If-None-Match'] = cached.etag
+
+            session = AlderAPIClient.get_session()
+            async with session.request(method, url, data=data, headers=headers, timeout=aiohttp.ClientTimeout(total=timeout)) as raw_response:
+                if raw_response.status == 304 and cached is not None:
+                    AlderAPIClient._cache.move_to_end(path)
+                    Logger.debug('[%s] Response 304, using cached response', method)
+                    return cached
+                response = AlderAPIResponse(raw_response.status, await raw_response.read(), raw_response.headers.get('ETag'), raw_response.content_type)
+            Logger.debug('[%s] Response %s: %s', method, response.status_code, response.content)
+
+            if method == 'GET':
+                AlderAPIClient.cache_response(path, response)
             return response
         except Exception as e:
-            Logger.error(f'Error during GET {url}: {str(e)}')
+            Logger.error(f'Error during {method} {url}: {str(e)}')
             traceback.print_exc()
             return None
 
     @staticmethod
-    def post(path, request_body):
+    def cache_response(path, response):
+        """
+        Keeps a successful GET response that has an ETag, evicting the
+        least recently used response once MAX_CACHED_RESPONSES is
+        reached. Other responses remove the cached one for the path.
+        """
+        if response.status_code != 200 or response.etag is None:
+            AlderAPIClient._cache.pop(path, None)
+            return
+        AlderAPIClient._cache[path] = response
+        AlderAPIClient._cache.move_to_end(path)
+        while len(AlderAPIClient._cache) > MAX_CACHED_RESPONSES:
+            AlderAPIClient._cache.popitem(last=False)
+
+    @staticmethod
+    async def get(path, timeout=DEFAULT_TIMEOUT):
+        """
+        Performs a HTTP GET request against the Alder API
+        given a path. Returns the response.
+        """
+        return await AlderAPIClient.request('GET', path, timeout=timeout)
+
+    @staticmethod
+    async def post(path, request_body, timeout=DEFAULT_TIMEOUT):
         """
         Performs HTTP POST request against the Alder API
         given the path and optional request body. Returns the
         response.
         """
-        url = f'{BASE_URL}{path}'
-        try:
-            Logger.debug(f'[POST] Request URL: {url}')
-            Logger.debug(f'[POST] Request Body: {json.dumps(request_body)}')
-            response = requests.post(url, json=request_body, timeout=5)
-            Logger.debug(f'[POST] Response {response.status_code}: {response.text}')
-            return response
-        except Exception as e:
-            Logger.error(f'Error during POST {url}: {str(e)}')
-            traceback.print_exc()
-            return None
+        return await AlderAPIClient.request('POST', path, request_body, timeout=timeout)
 
     @staticmethod
-    def patch(path, request_body):
+    async def patch(path, request_body, timeout=DEFAULT_TIMEOUT):
         """
         Performs HTTP PATCH request against the Alder API
         given the path and optional request body. Returns the
         response.
         """
-        url = f'{BASE_URL}{path}'
-        try:
-            Logger.debug(f'[PATCH] Request URL: {url}')
-            Logger.debug(f'[PATCH] Request Body: {json.dumps(request_body)}')
-            response = requests.patch(url, json=request_body, timeout=5)
-            Logger.debug(f'[PATCH] Response {response.status_code}: {response.text}')
-            return response
-        except Exception as e:
-            Logger.error(f'Error during PATCH {url}: {str(e)}')
-            traceback.print_exc()
-            return None
+        return await AlderAPIClient.request('PATCH', path, request_body, timeout=timeout)
 
     @staticmethod
-    def put(path, request_body):
+    async def put(path, request_body, timeout=DEFAULT_TIMEOUT):
         """
         Performs HTTP PUT request against the Alder API
         given the path and optional request body. Returns the
         response.
         """
-        url = f'{BASE_URL}{path}'
-        try:
-            Logger.debug(f'[PUT] Request URL: {url}')
-            Logger.debug(f'[PUT] Request Body: {json.dumps(request_body)}')
-            response = requests.put(url, json=request_body, timeout=5)
-            Logger.debug(f'[PUT] Response {response.status_code}: {response.text}')
-            return response
-        except Exception as e:
-            Logger.error(f'Error during PUT {url}: {str(e)}')
-            traceback.print_exc()
-            return None
+        return await AlderAPIClient.request('PUT', path, request_body, timeout=timeout)
 
     @staticmethod
-    def delete(path):
+    async def delete(path, timeout=DEFAULT_TIMEOUT):
         """
         Performs HTTP DELETE against the Alder API given
         the path. Returns the response.
         """
-        url = f'{BASE_URL}{path}'
-        try:
-            Logger.debug(f'[DELETE] Request URL: {url}')
-            response = requests.delete(url, timeout=5)
-            Logger.debug(f'[DELETE] Response {response.status_code}: {response.text}')
-            return response
-        except Exception as e:
-            Logger.error(f'Error during DELETE {url}: {str(e)}')
-            traceback.print_exc()
-            return None
+        return await AlderAPIClient.request('DELETE', path, timeout=timeout)
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 accomplishment resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class AccomplishmentClient():
@@ -30,40 +28,40 @@ class AccomplishmentClient():
     # =====================
 
     @staticmethod
-    def get_accomplishments_for_user(user_id):
+    async def get_accomplishments_for_user(user_id):
         """
         Given the user_id, returns all of the accomplishments
         that match the user_id.
         """
-        return AlderAPIClient.get(f'/accomplishments/{user_id}')
+        return await AlderAPIClient.get(f'/accomplishments/{user_id}')
     
     @staticmethod
-    def create_accomplishment_entry(request_body):
+    async def create_accomplishment_entry(request_body):
         """
         Given a request_body, creates an accomplishment
         for the user.
         """
-        return AlderAPIClient.post(f'/accomplishments', request_body)
+        return await AlderAPIClient.post(f'/accomplishments', request_body)
     
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_accomplishments_for_user_content(user_id):
+    async def get_accomplishments_for_user_content(user_id):
         """
         Given the user_id, returns the list of accomplishments
         for the user.
         """
-        response = AccomplishmentClient.get_accomplishments_for_user(user_id)
+        response = await AccomplishmentClient.get_accomplishments_for_user(user_id)
         if response is None or response.status_code == 404:
             return []
         else:
-            accomplishments = json.loads(response.text)
+            accomplishments = response.json()
             return [item['msg'] for item in accomplishments]
     
     @staticmethod
-    def add_user_accomplishment(user_id: int, accomplishment: str):
+    async def add_user_accomplishment(user_id: int, accomplishment: str):
         """
         Adds the accomplishment `accomplishment` to the user
         with `user_id`.
@@ -76,4 +74,4 @@ class AccomplishmentClient():
         }
 
         # Add the accomplishment
-        return AccomplishmentClient.create_accomplishment_entry(request_body)
\ No newline at end of file
+        return await AccomplishmentClient.create_accomplishment_entry(request_body)
\ No newline at end of file
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 achievement resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class AchievementClient():
@@ -30,40 +28,56 @@ class AchievementClient():
     # =====================
 
     @staticmethod
-    def get_achievements_for_user(user_id):
+    async def get_achievements_for_user(user_id):
         """
         Given the user_id, returns all of the achievements
         for the user.
         """
-        return AlderAPIClient.get(f'/achievements/{user_id}')
+        return await AlderAPIClient.get(f'/achievements/{user_id}')
     
     @staticmethod
-    def create_achievement_entry(request_body):
+    async def create_achievement_entry(request_body):
         """
         Given the request body, create the achievement
         entry.
         """
-        return AlderAPIClient.post('/achievements', request_body)
+        return await AlderAPIClient.post('/achievements', request_body)
+
+    @staticmethod
+    async def evaluate_achievements_for_user(user_id):
+        """
+        Given the user_id, evaluates the achievements for the
+        user on the API and awards any newly earned achievements.
+        """
+        return await AlderAPIClient.post(f'/achievements/{user_id}/evaluate', {})
+
+    @staticmethod
+    async def evaluate_all_achievements(chunk_size=500):
+        """
+        Evaluates the achievements for every user on the API
+        in chunks of chunk_size users.
+        """
+        return await AlderAPIClient.post('/achievements/evaluate', {'chunk_size': chunk_size}, timeout=300)
 
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_achievements_for_user_content(user_id):
+    async def get_achievements_for_user_content(user_id):
         """
         Given the user_id, returns the list of achievement ids
         for the user
         """
-        response = AchievementClient.get_achievements_for_user(user_id)
+        response = await AchievementClient.get_achievements_for_user(user_id)
         if response is None or response.status_code == 404:
             return []
         else:
-            achievements = json.loads(response.text)
+            achievements = response.json()
             return [item['id'] for item in achievements]
     
     @staticmethod
-    def add_user_achievement_id(user_id: int, achievement_id: int):
+    async def add_user_achievement_id(user_id: int, achievement_id: int):
         """
         Adds the achievement id to the user's achievements.
         """
@@ -75,4 +89,17 @@ class AchievementClient():
         }
 
         # Add the achievement
-        return AchievementClient.create_achievement_entry(request_body)
\ No newline at end of file
+        return await AchievementClient.create_achievement_entry(request_body)
+
+    @staticmethod
+    async def evaluate_achievements_for_user_content(user_id):
+        """
+        Given the user_id, evaluates the user's achievements and
+        returns the evaluation containing the earned count, total
+        count, newly earned ids and per category progress. Returns
+        None if the evaluation could not be performed.
+        """
+        response = await AchievementClient.evaluate_achievements_for_user(user_id)
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 dailytime resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class DailyTimeClient():
@@ -30,43 +28,43 @@ class DailyTimeClient():
     # =====================
 
     @staticmethod
-    def search_dailytime(request_body):
+    async def search_dailytime(request_body):
         """
         Searches based on the criteria provided in the request body.
         Returns the results of that search.
         """
-        return AlderAPIClient.post('/dailytime/search', request_body)
+        return await AlderAPIClient.post('/dailytime/search', request_body)
     
     @staticmethod
-    def create_dailytime_today_for_user(user_id: int):
+    async def create_dailytime_today_for_user(user_id: int):
         """
         Creates a daily time entry for the user provided
         in the `user_id` parameter.
         """
-        return AlderAPIClient.post(f'/dailytime/{user_id}', None)
+        return await AlderAPIClient.post(f'/dailytime/{user_id}', None)
     
     @staticmethod
-    def get_dailytime_today_for_user(user_id: int):
+    async def get_dailytime_today_for_user(user_id: int):
         """
         Retrieves the daily time entry for the user on the current
         day with respect to UTC time zone.
         """
-        return AlderAPIClient.get(f'/dailytime/{user_id}')
+        return await AlderAPIClient.get(f'/dailytime/{user_id}')
     
     @staticmethod
-    def get_dailytime_for_user_specific_date(user_id: int, day: int, month: int, year: int):
+    async def get_dailytime_for_user_specific_date(user_id: int, day: int, month: int, year: int):
         """
         Retrieves the daily time entry for the user on a specific
         date specified by the `day`, `month`, and `year` parameters.
         """
-        return AlderAPIClient.get(f'/dailytime?user_id={user_id}&day={day}&month={month}&year={year}')
+        return await AlderAPIClient.get(f'/dailytime?user_id={user_id}&day={day}&month={month}&year={year}')
 
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def add_stime_to_user_dailytime(user_id: str, stime_to_add: int):
+    async def add_stime_to_user_dailytime(user_id: str, stime_to_add: int):
         """
         Adds `stime_to_add` to the user's daily time entry with `user_id`. 
         """
@@ -77,20 +75,20 @@ class DailyTimeClient():
         }
 
         # Perform PATCH request
-        return AlderAPIClient.patch(f'/dailytime/{user_id}', request_body)
+        return await AlderAPIClient.patch(f'/dailytime/{user_id}', request_body)
     
     @staticmethod
-    def get_stime_value_for_user_today(user_id: str) -> int:
+    async def get_stime_value_for_user_today(user_id: str) -> int:
         """
         Returns the stime field from the user's dailytime entry
         for the current day.
         """
-        response = DailyTimeClient.get_dailytime_today_for_user(user_id)
-        body = json.loads(response.text)
+        response = await DailyTimeClient.get_dailytime_today_for_user(user_id)
+        body = response.json()
         return body['stime']
     
     @staticmethod
-    def get_top_10_stime_users_today():
+    async def get_top_10_stime_users_today():
         """
         Returns the top 10 stime users for the current day.
         """
@@ -101,5 +99,5 @@ class DailyTimeClient():
         }
 
         # Obtain response and return users list
-        response = DailyTimeClient.search_dailytime(request_body)
-        return json.loads(response.text)
\ No newline at end of file
+        response = await DailyTimeClient.search_dailytime(request_body)
+        return response.json()
\ No newline at end of file
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 dailytoken resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 from datetime import datetime
 
@@ -31,43 +29,43 @@ class DailyTokenClient():
     # =====================
 
     @staticmethod
-    def set_dailytoken_entry_for_user(request_body):
+    async def set_dailytoken_entry_for_user(request_body):
         """
         Given the request body, set the daily token
         entry for the user.
         """
-        return AlderAPIClient.post('/dailytoken', request_body)
+        return await AlderAPIClient.post('/dailytoken', request_body)
     
     @staticmethod
-    def get_dailytoken_entry_for_user(user_id):
+    async def get_dailytoken_entry_for_user(user_id):
         """
         Given the user_id, return the dailytoken entry
         for the user
         """
-        return AlderAPIClient.get(f'/dailytoken/{user_id}')
+        return await AlderAPIClient.get(f'/dailytoken/{user_id}')
     
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_user_dailytoken_time_entry(user_id):
+    async def get_user_dailytoken_time_entry(user_id):
         """
         Given the user_id, attempts to retrieve the daily token
         entry for the user. If it is not present, create
         and return.
         """
-        get_response = DailyTokenClient.get_dailytoken_entry_for_user(user_id)
+        get_response = await DailyTokenClient.get_dailytoken_entry_for_user(user_id)
         if get_response is None or get_response.status_code == 404:
             return None
         else:
-            entry = json.loads(get_response.text)
+            entry = get_response.json()
             date_time_str = entry['date_time']
             date_time_obj = datetime.strptime(date_time_str, "%Y-%m-%dT%H:%M:%S")
             return date_time_obj
         
     @staticmethod
-    def set_dailytoken_entry_user_current_time(user_id: int, current_time: datetime):
+    async def set_dailytoken_entry_user_current_time(user_id: int, current_time: datetime):
         """
         Constructs and sends set daily token request
         """
@@ -78,5 +76,5 @@ class DailyTokenClient():
             "date_time": current_time.isoformat()
         }
 
-        response = DailyTokenClient.set_dailytoken_entry_for_user(request_body)
-        return json.loads(response.text)
+        response = await DailyTokenClient.set_dailytoken_entry_for_user(request_body)
+        return response.json()
@@ -0,0 +1,88 @@
+"""
+focus_client.py
+author: narlock
+
+Alder interface for making HTTP requests to the
+focus resource on the Alder API.
+"""
+
+from client.alder.alder_api_client import AlderAPIClient
+from tools.log import Logger
+
+# Number of sessions sent per batch request
+SESSION_CHUNK_SIZE = 100
+
+class FocusClient():
+    """
+    Alder interface for making HTTP requests to the
+    focus resource on the Alder API.
+
+    The resource functions section denotes the operations
+    that will directly interact with the focus resource.
+    These functions will return the full HTTP response
+    object.
+
+    The implementation functions section are functions that
+    will be used for Bot operations. These functions will
+    return a specific field or resource that is requested.
+    """
+
+    # =====================
+    # RESOURCE FUNCTIONS
+    # =====================
+
+    @staticmethod
+    async def create_focus_session(request_body):
+        """
+        Records a focus session. Updates the user, dailytime,
+        monthtime and streak resources in one transaction.
+        """
+        return await AlderAPIClient.post('/focus/session', request_body)
+
+    @staticmethod
+    async def create_focus_sessions(request_body):
+        """
+        Records a batch of focus sessions in one transaction.
+        """
+        return await AlderAPIClient.post('/focus/sessions', request_body)
+
+    # ========================
+    # IMPLEMENTATION FUNCTIONS
+    # ========================
+
+    @staticmethod
+    async def add_focus_session(user_id: int, seconds: int, tokens: int):
+        """
+        Adds `seconds` of focus time and `tokens` to the user with
+        `user_id`. Returns the new totals, or None on failure.
+        """
+
+        # Construct request body
+        request_body = {
+            "user_id": user_id,
+            "seconds": seconds,
+            "tokens": tokens
+        }
+
+        # Perform POST request
+        response = await FocusClient.create_focus_session(request_body)
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()
+
+    @staticmethod
+    async def add_focus_sessions(sessions):
+        """
+        Records a list of sessions, where each session is a dictionary
+        with `user_id`, `seconds` and `tokens`. Sessions are sent in
+        chunks of SESSION_CHUNK_SIZE. Returns the sessions that could
+        not be recorded.
+        """
+        failed = []
+        for start in range(0, len(sessions), SESSION_CHUNK_SIZE):
+            chunk = sessions[start:start + SESSION_CHUNK_SIZE]
+            response = await FocusClient.create_focus_sessions({"sessions": chunk})
+            if response is None or response.status_code != 200:
+                Logger.error(f'Unable to record batch of {len(chunk)} focus sessions.')
+                failed.extend(chunk)
+        return failed
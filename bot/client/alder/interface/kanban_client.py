@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 kanban resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class KanbanClient():
@@ -22,53 +20,53 @@ class KanbanClient():
     """
 
     @staticmethod
-    def update_kanban_item_details(id: int, request_body):
+    async def update_kanban_item_details(id: int, request_body):
         """
         Updates the kanban item details given the id and request body
         """
-        return AlderAPIClient.patch(f'/kanban/{id}', request_body)
+        return await AlderAPIClient.patch(f'/kanban/{id}', request_body)
     
     @staticmethod
-    def get_user_kanban_items_by_user_id(user_id: int):
+    async def get_user_kanban_items_by_user_id(user_id: int):
         """
         Retrieves the kanban items by the user_id
         """
-        return AlderAPIClient.get(f'/kanban/user/{user_id}')
+        return await AlderAPIClient.get(f'/kanban/user/{user_id}')
     
     @staticmethod
-    def get_user_kanban_items_by_user_id_content(user_id):
+    async def get_user_kanban_items_by_user_id_content(user_id):
         """
         Retrieves the content of the kanban items by user_id
         """
-        response = KanbanClient.get_user_kanban_items_by_user_id(user_id)
+        response = await KanbanClient.get_user_kanban_items_by_user_id(user_id)
         
         if response is None or response.status_code == 404:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def get_user_kanban_items_by_tag(user_id: int, tag_name: str):
+    async def get_user_kanban_items_by_tag(user_id: int, tag_name: str):
         """
         Retrieves the kanban items by the user_id that match
         the tag_name
         """
-        return AlderAPIClient.get(f'/kanban/user/{user_id}/tag/{tag_name}')
+        return await AlderAPIClient.get(f'/kanban/user/{user_id}/tag/{tag_name}')
     
     @staticmethod
-    def get_user_kanban_items_by_tag_content(user_id: int, tag_name: str):
+    async def get_user_kanban_items_by_tag_content(user_id: int, tag_name: str):
         """
         Retrieves the content of kanban items by tag for the user_id and tag_name
         """
-        response = KanbanClient.get_user_kanban_items_by_tag(user_id, tag_name)
+        response = await KanbanClient.get_user_kanban_items_by_tag(user_id, tag_name)
 
         if response is None or response.status_code == 404:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def move_kanban_item_column(id: int, user_id: int, column=None):
+    async def move_kanban_item_column(id: int, user_id: int, column=None):
         """
         Moves the kanban item based on the column attribute. If no
         column is provided, the item will be moved to the next column
@@ -84,10 +82,10 @@ class KanbanClient():
             request_body['column'] = column
 
         # Make API request
-        return AlderAPIClient.post(f'/kanban/{id}', request_body)
+        return await AlderAPIClient.post(f'/kanban/{id}', request_body)
     
     @staticmethod
-    def create_kanban_item(user_id: int, item_name: str, priority_number: int = None, tag_name: str = None, velocity: int = None):
+    async def create_kanban_item(user_id: int, item_name: str, priority_number: int = None, tag_name: str = None, velocity: int = None):
         """
         Creates a kanban item based on the given criteria.
 
@@ -111,26 +109,26 @@ class KanbanClient():
             request_body['velocity'] = velocity
 
         # Make API request
-        return AlderAPIClient.post('/kanban', request_body)
+        return await AlderAPIClient.post('/kanban', request_body)
 
     @staticmethod
-    def delete_user_kanban_item(user_id: int, id: int):
+    async def delete_user_kanban_item(user_id: int, id: int):
         """
         Given the user id and the id of the kanban item, delete
         the kanban item.
         """
-        return AlderAPIClient.delete(f'/kanban/user/{user_id}/{id}')
+        return await AlderAPIClient.delete(f'/kanban/user/{user_id}/{id}')
     
     @staticmethod
-    def delete_completed_user_kanban_items(user_id: int):
+    async def delete_completed_user_kanban_items(user_id: int):
         """
         Given the user's user id, delete all of their
         kanban items that are in the 'done' column.
         """
-        return AlderAPIClient.delete(f'/kanban/user/{user_id}')
+        return await AlderAPIClient.delete(f'/kanban/user/{user_id}')
     
     @staticmethod
-    def update_kanban_details_with_priority_tag_velocity(id: int, user_id: int, item_name: str, priority_number: int, tag_name: str, velocity: int):
+    async def update_kanban_details_with_priority_tag_velocity(id: int, user_id: int, item_name: str, priority_number: int, tag_name: str, velocity: int):
         """
         Updates the kanban details given the information that is not none.
         id must not be none and at least one of the fields must not be none.
@@ -156,4 +154,4 @@ class KanbanClient():
         if not request_body:
             raise ValueError("At least one field must be provided to update")
         
-        return KanbanClient.update_kanban_item_details(id, request_body)
\ No newline at end of file
+        return await KanbanClient.update_kanban_item_details(id, request_body)
\ No newline at end of file
@@ -0,0 +1,52 @@
+"""
+leaderboard_client.py
+author: narlock
+
+Alder interface for making HTTP requests to the
+leaderboard resource on the Alder API.
+"""
+
+from client.alder.alder_api_client import AlderAPIClient
+
+class LeaderboardClient():
+    """
+    Alder interface for making HTTP requests to the
+    leaderboard resource on the Alder API.
+
+    The resource functions section denotes the operations
+    that will directly interact with the leaderboard resource.
+    These functions will return the full HTTP response
+    object.
+
+    The implementation functions section are functions that
+    will be used for Bot operations. These functions will
+    return a specific field or resource that is requested.
+    """
+
+    # =====================
+    # RESOURCE FUNCTIONS
+    # =====================
+
+    @staticmethod
+    async def get_leaderboard(board: str, limit: int = 10):
+        """
+        Returns the top users of the board. The board is one of
+        all, trivia, month, day, streak, highest_streak or rb.
+        """
+        return await AlderAPIClient.get(f'/leaderboard/{board}?limit={limit}')
+
+    # ========================
+    # IMPLEMENTATION FUNCTIONS
+    # ========================
+
+    @staticmethod
+    async def get_leaderboard_content(board: str, limit: int = 10):
+        """
+        Returns the top users of the board as a list of
+        dictionaries containing `user_id` and `value`, or
+        an empty list if it could not be retrieved.
+        """
+        response = await LeaderboardClient.get_leaderboard(board, limit)
+        if response is None or response.status_code != 200:
+            return []
+        return response.json()
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 monthtime resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class MonthTimeClient():
@@ -30,43 +28,43 @@ class MonthTimeClient():
     # =====================
 
     @staticmethod
-    def search_monthtime(request_body):
+    async def search_monthtime(request_body):
         """
         Searches based on the criteria provided in the request body.
         Returns the results of that search.
         """
-        return AlderAPIClient.post('/monthtime/search', request_body)
+        return await AlderAPIClient.post('/monthtime/search', request_body)
     
     @staticmethod
-    def create_monthtime_current_month_for_user(user_id: int):
+    async def create_monthtime_current_month_for_user(user_id: int):
         """
         Creates a month time entry for the user provided
         in the `user_id` parameter.
         """
-        return AlderAPIClient.post(f'/monthtime/{user_id}', None)
+        return await AlderAPIClient.post(f'/monthtime/{user_id}', None)
     
     @staticmethod
-    def get_monthtime_current_month_for_user(user_id: int):
+    async def get_monthtime_current_month_for_user(user_id: int):
         """
         Retrieves the month time entry for the user for the
         current month.
         """
-        return AlderAPIClient.get(f'/monthtime/{user_id}')
+        return await AlderAPIClient.get(f'/monthtime/{user_id}')
     
     @staticmethod
-    def get_monthtime_for_user_specific_date(user_id: int, month: int, year: int):
+    async def get_monthtime_for_user_specific_date(user_id: int, month: int, year: int):
         """
         Retrieves the month time entry for the user on a specific date
         specified by the `month` and `year` parameters.
         """
-        return AlderAPIClient.get(f'/monthtime?user_id={user_id}&month={month}&year={year}')
+        return await AlderAPIClient.get(f'/monthtime?user_id={user_id}&month={month}&year={year}')
     
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def add_stime_to_user_monthtime(user_id: str, stime_to_add: int):
+    async def add_stime_to_user_monthtime(user_id: str, stime_to_add: int):
         """
         Adds `stime_to_add` to the user's month time entry with `user_id`
         """
@@ -77,20 +75,20 @@ class MonthTimeClient():
         }
 
         # Perform PATCH request
-        return AlderAPIClient.patch(f'/monthtime/{user_id}', request_body)
+        return await AlderAPIClient.patch(f'/monthtime/{user_id}', request_body)
     
     @staticmethod
-    def get_stime_value_for_user_current_month(user_id: str) -> int:
+    async def get_stime_value_for_user_current_month(user_id: str) -> int:
         """
         Returns the stime field from the user's monthtime entry
         corresponding to the current month.
         """
-        response = MonthTimeClient.get_monthtime_current_month_for_user(user_id)
-        body = json.loads(response.text)
+        response = await MonthTimeClient.get_monthtime_current_month_for_user(user_id)
+        body = response.json()
         return body['stime']
     
     @staticmethod
-    def get_top_10_stime_users_current_month():
+    async def get_top_10_stime_users_current_month():
         """
         Returns the top 10 stime users for the current month
         """
@@ -101,5 +99,5 @@ class MonthTimeClient():
         }
 
         # Obtain response and return users list
-        response = MonthTimeClient.search_monthtime(request_body)
-        return json.loads(response.text)
+        response = await MonthTimeClient.search_monthtime(request_body)
+        return response.json()
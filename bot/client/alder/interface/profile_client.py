@@ -0,0 +1,50 @@
+"""
+profile_client.py
+author: narlock
+
+Alder interface for making HTTP requests to the
+profile resource on the Alder API.
+"""
+
+from client.alder.alder_api_client import AlderAPIClient
+
+class ProfileClient():
+    """
+    Alder interface for making HTTP requests to the
+    profile resource on the Alder API.
+
+    The resource functions section denotes the operations
+    that will directly interact with the profile resource.
+    These functions will return the full HTTP response
+    object.
+
+    The implementation functions section are functions that
+    will be used for Bot operations. These functions will
+    return a specific field or resource that is requested.
+    """
+
+    # =====================
+    # RESOURCE FUNCTIONS
+    # =====================
+
+    @staticmethod
+    async def get_profile(user_id: int):
+        """
+        Returns the aggregated profile for the user.
+        """
+        return await AlderAPIClient.get(f'/profile/{user_id}')
+
+    # ========================
+    # IMPLEMENTATION FUNCTIONS
+    # ========================
+
+    @staticmethod
+    async def get_profile_content(user_id: int):
+        """
+        Returns the aggregated profile for the user as a
+        dictionary, or None if it could not be retrieved.
+        """
+        response = await ProfileClient.get_profile(user_id)
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()
@@ -6,10 +6,12 @@ Alder interface for making HTTP requests to the
 reminder resource on the Alder API
 """
 
-import json
-
+from urllib.parse import urlencode
 from client.alder.alder_api_client import AlderAPIClient
 
+# Number of reminders requested per page of due reminders
+DUE_PAGE_SIZE = 500
+
 class ReminderClient():
     """
     Alder interface for making HTTP requests to the
@@ -17,48 +19,88 @@ class ReminderClient():
     """
 
     @staticmethod
-    def get_all_reminders():
+    async def get_all_reminders():
         """
         Retrieves all reminders that are in the database
         """
-        response = AlderAPIClient.get('/reminder')
+        response = await AlderAPIClient.get('/reminder')
         print(response)
 
         # If the response is None, empty, or not successful, return None
         if not response or response.status_code != 200:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def get_user_reminders(user_id: int):
+    async def get_due_reminders(before: str, after: str = None, cursor: str = None, limit: int = DUE_PAGE_SIZE):
+        """
+        Retrieves one page of up to `limit` reminders due before `before`,
+        and at or after `after` if given, ordered by remind_at then id.
+        Dates are UTC strings in the format YYYY-MM-DDTHH:MM:SS. Returns
+        None if the request fails.
+        """
+        params = {'before': before, 'after': after, 'cursor': cursor, 'limit': limit}
+        query = urlencode({k: v for k, v in params.items() if v is not None})
+        response = await AlderAPIClient.get(f'/reminder/due?{query}')
+
+        # If the response is None or not successful, return None
+        if not response or response.status_code != 200:
+            return None
+
+        # The response is streamed, one reminder per line or MessagePack object
+        return response.records()
+
+    @staticmethod
+    async def get_all_due_reminders(before: str, after: str = None):
+        """
+        Retrieves every reminder due before `before`, and at or after
+        `after` if given, reading one page at a time. Returns None if
+        any request fails.
+        """
+        reminders = []
+        cursor = None
+        while True:
+            page = await ReminderClient.get_due_reminders(before, after, cursor)
+            if page is None:
+                return None
+
+            reminders += page
+            if len(page) < DUE_PAGE_SIZE:
+                return reminders
+
+            # The cursor of the next page is the last reminder read
+            cursor = f"{page[-1]['remind_at']}_{page[-1]['id']}"
+
+    @staticmethod
+    async def get_user_reminders(user_id: int):
         """
         Retrieve all reminders for the user denoted by their
         user_id.
         """
-        response = AlderAPIClient.get(f'/reminder/user/{user_id}')
+        response = await AlderAPIClient.get(f'/reminder/user/{user_id}')
 
         # If the response is None, empty or not successful, return None
         if not response or response.status_code != 200:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def get_reminder_by_id(id: int):
+    async def get_reminder_by_id(id: int):
         """
         Retrieve a reminder by its unique identifier.
         """
-        response = AlderAPIClient.get(f'/reminder/{id}')
+        response = await AlderAPIClient.get(f'/reminder/{id}')
 
         # If the response is None or not successful, return None
         if not response or response.status_code != 200:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def create_reminder(user_id: int, title: str, remind_at, repeat_interval = None, repeat_until = None, repeat_count = None):
+    async def create_reminder(user_id: int, title: str, remind_at, repeat_interval = None, repeat_until = None, repeat_count = None):
         """
         Creates a reminder for the user_id called title. Will be reminded at
         remind_at parameter. The reminder will repeat if provided repeat
@@ -80,24 +122,24 @@ class ReminderClient():
         request_body = {k: v for k, v in request_body.items() if v is not None}
 
         # Send the POST request to the '/reminder' endpoint
-        response = AlderAPIClient.post('/reminder', request_body)
+        response = await AlderAPIClient.post('/reminder', request_body)
 
         # If the response is not successful, return None
         if not response or response.status_code != 201:
             return None
 
         # Return the response as JSON
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def delete_reminder_by_id(id: int):
+    async def delete_reminder_by_id(id: int):
         """
         Deletes a reminder by its id.
         """
-        return AlderAPIClient.delete(f'/reminder/{id}')
+        return await AlderAPIClient.delete(f'/reminder/{id}')
 
     @staticmethod
-    def update_reminder_date(id: int, remind_date: str):
+    async def update_reminder_date(id: int, remind_date: str):
         """
         Updates the remind_at date for the reminder with the given id.
         The time component of the remind_at field will remain unchanged.
@@ -111,7 +153,7 @@ class ReminderClient():
         }
 
         # Send the PUT request to the '/reminder/<id>/date' endpoint
-        response = AlderAPIClient.put(f'/reminder/{id}/date', request_body)
+        response = await AlderAPIClient.put(f'/reminder/{id}/date', request_body)
 
         print(response)
 
@@ -120,4 +162,22 @@ class ReminderClient():
             return None
 
         # Return the response as JSON
-        return json.loads(response.text)
+        return response.json()
+
+    @staticmethod
+    async def advance_reminders(ids: list):
+        """
+        Advances the fired reminders with the given ids to their next
+        occurrence in one request. Reminders with no further occurrence
+        are deleted by the API.
+
+        Returns the response body, containing the `updated` reminders and
+        the `deleted` ids, or None if the request fails.
+        """
+        response = await AlderAPIClient.post('/reminder/advance', {'ids': ids})
+
+        # If the response is not successful, return None
+        if not response or response.status_code != 200:
+            return None
+
+        return response.json()
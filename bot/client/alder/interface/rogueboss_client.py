@@ -6,7 +6,6 @@ Alder interface for making HTTP requests to the
 rb resource on the Alder API.
 """
 
-import json
 import traceback
 
 from client.alder.alder_api_client import AlderAPIClient
@@ -31,23 +30,23 @@ class RbClient():
     # =====================
 
     @staticmethod
-    def get_top_rogue_boss_users(limit: int):
+    async def get_top_rogue_boss_users(limit: int):
         """
         Get the top rogue boss users given the limit
         where the limit is the number of users to
         return.
         """
-        return AlderAPIClient.get(f'/rb/top?limit={limit}')
+        return await AlderAPIClient.get(f'/rb/top?limit={limit}')
     
     @staticmethod
-    def get_rogue_boss_user(user_id: int):
+    async def get_rogue_boss_user(user_id: int):
         """
         Gets the rogue boss user for the user_id
         """
-        return AlderAPIClient.get(f'/rb/{user_id}')
+        return await AlderAPIClient.get(f'/rb/{user_id}')
     
     @staticmethod
-    def create_rogue_boss_user(user_id: int, rbtype: str):
+    async def create_rogue_boss_user(user_id: int, rbtype: str):
         """
         Creates a rogue boss profile given user_id and
         rbtype
@@ -60,10 +59,10 @@ class RbClient():
         }
 
         # Make API call
-        return AlderAPIClient.post(f'/rb', request_body)
+        return await AlderAPIClient.post(f'/rb', request_body)
     
     @staticmethod
-    def add_xp_to_rogue_boss_user(user_id, xp_to_add):
+    async def add_xp_to_rogue_boss_user(user_id, xp_to_add):
         """
         Adds xp to the rogue boss user given the user_id
         and the request body
@@ -75,36 +74,36 @@ class RbClient():
         }
 
         # Make API call
-        return AlderAPIClient.patch(f'/rb/{user_id}/xp', request_body)
+        return await AlderAPIClient.patch(f'/rb/{user_id}/xp', request_body)
     
     @staticmethod
-    def update_rogue_boss_user(user_id, request_body):
+    async def update_rogue_boss_user(user_id, request_body):
         """
         Update the rogue boss user given the user_id
         and the request body
         """
-        return AlderAPIClient.patch(f'/rb/{user_id}', request_body)
+        return await AlderAPIClient.patch(f'/rb/{user_id}', request_body)
 
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_top_10_rogue_boss_users():
+    async def get_top_10_rogue_boss_users():
         """
         Returns the top 10 rogue boss users
         """
-        response = RbClient.get_top_rogue_boss_users(10)
+        response = await RbClient.get_top_rogue_boss_users(10)
         
         # Return empty list if not a valid response
         if response is None or response.status_code == 404:
             return []
         
         # Return list of users
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def update_rogue_boss_user_rbtype(user_id: int, rbtype: str):
+    async def update_rogue_boss_user_rbtype(user_id: int, rbtype: str):
         """
         Updates the rogue boss user rbtype given user_id
         and rbtype
@@ -116,10 +115,10 @@ class RbClient():
         }
 
         # Update rogue boss user
-        return RbClient.update_rogue_boss_user(user_id, request_body)
+        return await RbClient.update_rogue_boss_user(user_id, request_body)
 
     @staticmethod
-    def update_rogue_boss_user_model(user_id: int, model: int):
+    async def update_rogue_boss_user_model(user_id: int, model: int):
         """
         Updates the rogue boss user model given user_id
         and model
@@ -131,26 +130,26 @@ class RbClient():
         }
 
         # Update rogue boss user
-        return RbClient.update_rogue_boss_user(user_id, request_body)
+        return await RbClient.update_rogue_boss_user(user_id, request_body)
     
     @staticmethod
-    def get_rogue_boss_user_purchased_models(user_id):
+    async def get_rogue_boss_user_purchased_models(user_id):
         """
         Gets the rogue boss user's purchased models
         """
-        response = RbClient.get_rogue_boss_user(user_id)
-        body = json.loads(response.text)
+        response = await RbClient.get_rogue_boss_user(user_id)
+        body = response.json()
         return body['purchased_models']
 
 
     @staticmethod
-    def add_purchased_model_to_rogue_boss_user(user_id: int, model: int):
+    async def add_purchased_model_to_rogue_boss_user(user_id: int, model: int):
         """
         Adds the model to the rogue boss user's purchased models list.
         """
         
         # Get and add purchased models
-        purchased_models = RbClient.get_rogue_boss_user_purchased_models(user_id)
+        purchased_models = await RbClient.get_rogue_boss_user_purchased_models(user_id)
         purchased_models = f'{purchased_models},{model}'
 
         # Construct request body
@@ -159,52 +158,59 @@ class RbClient():
         }
 
         # Update rogue boss user
-        return RbClient.update_rogue_boss_user(user_id, request_body)
+        return await RbClient.update_rogue_boss_user(user_id, request_body)
     
     @staticmethod
-    def get_rogue_boss_user_content(user_id: int):
+    async def get_rogue_boss_user_content(user_id: int):
         """
         Get Rogue Boss Content for Rogue Boss User
         """
-        response = RbClient.get_rogue_boss_user(user_id)
+        response = await RbClient.get_rogue_boss_user(user_id)
 
         if response is None or response.status_code == 404:
             return None
 
-        body = json.loads(response.text)
+        body = response.json()
         return body
     
     @staticmethod
-    def get_rogue_boss_level(user_id: int) -> int:
+    def get_level_from_xp(xp) -> int:
+        """
+        Calculates the Rogue Boss level for the given xp value.
+        """
+        return 1 if xp < 9 else round(xp ** 0.317)
+
+    @staticmethod
+    async def get_rogue_boss_level(user_id: int) -> int:
         """
         Retrieves the user's rogue boss level. If they do not have
         an entry in the table, this function will return 0.
         """
-        rb_user = RbClient.get_rogue_boss_user(user_id)
+        rb_user = await RbClient.get_rogue_boss_user(user_id)
         if rb_user is None or rb_user.status_code == 404:
             return 0
         else:
             try:
-                rb_user = json.loads(rb_user.text)
-                return 1 if rb_user['xp'] < 9 else round(rb_user['xp'] ** 0.317)
+                rb_user = rb_user.json()
+                return RbClient.get_level_from_xp(rb_user['xp'])
             except Exception as e:
                 traceback.print_exc()
                 return 0
             
     @staticmethod
-    def get_rogue_boss_level_and_xp(user_id: int):
+    async def get_rogue_boss_level_and_xp(user_id: int):
         """
         Retrieves the user's rogue boss level and xp value.
         If they do not have an entry in the table, this
         function will return 0 for both of the values.
         """
-        rb_user = RbClient.get_rogue_boss_user(user_id)
+        rb_user = await RbClient.get_rogue_boss_user(user_id)
         if rb_user is None or rb_user.status_code == 404:
             return 0, 0
         else:
             try:
-                rb_user = json.loads(rb_user.text)
-                rb_level = 1 if rb_user['xp'] < 9 else round(rb_user['xp'] ** 0.317)
+                rb_user = rb_user.json()
+                rb_level = RbClient.get_level_from_xp(rb_user['xp'])
                 return rb_level, rb_user['xp']
             except Exception as e:
                 traceback.print_exc()
@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 streak resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 from tools.log import Logger
 
@@ -31,51 +29,51 @@ class StreakClient():
     # =====================
 
     @staticmethod
-    def get_streak_for_user(user_id):
+    async def get_streak_for_user(user_id):
         """
         Given the user id, return the streak for the user
         """
-        return AlderAPIClient.get(f'/streak/{user_id}')
+        return await AlderAPIClient.get(f'/streak/{user_id}')
     
     @staticmethod
-    def set_streak_for_user(user_id):
+    async def set_streak_for_user(user_id):
         """
         Sets the streak field for the user
         """
-        return AlderAPIClient.post(f'/streak/{user_id}', None)
+        return await AlderAPIClient.post(f'/streak/{user_id}', None)
     
     @staticmethod
-    def search_streaks(request_body):
+    async def search_streaks(request_body):
         """
         Searches for streak entries based on request body
         """
-        return AlderAPIClient.post(f'/streak/search', request_body)
+        return await AlderAPIClient.post(f'/streak/search', request_body)
     
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_streak_entry_for_user(user_id):
+    async def get_streak_entry_for_user(user_id):
         """
         Calls the set streak endpoint to ensure that
         the streak is updated. Then calls the get
         endpoint to return the streak.
         """
-        StreakClient.set_streak_for_user(user_id)
-        response = StreakClient.get_streak_for_user(user_id)
-        return json.loads(response.text)
+        await StreakClient.set_streak_for_user(user_id)
+        response = await StreakClient.get_streak_for_user(user_id)
+        return response.json()
     
     @staticmethod
-    def get_highest_study_streak_for_user(user_id):
+    async def get_highest_study_streak_for_user(user_id):
         """
         Retrieves the highest_streak_achieved field for a 
         user's streak entry.
         """
-        return StreakClient.get_streak_entry_for_user(user_id)['highest_streak_achieved']
+        return (await StreakClient.get_streak_entry_for_user(user_id))['highest_streak_achieved']
     
     @staticmethod
-    def get_top_10_highest_streak_users():
+    async def get_top_10_highest_streak_users():
         """
         Returns a list of the top 10 users with the
         highest streaks. Denoted by the
@@ -87,15 +85,15 @@ class StreakClient():
             "limit": 10
         }
 
-        response = StreakClient.search_streaks(request_body)
+        response = await StreakClient.search_streaks(request_body)
 
         if response is None and response.status_code == 404:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def get_top_10_current_streak_users():
+    async def get_top_10_current_streak_users():
         """
         Returns a list of the top 10 users with the
         highest streaks. Denoted by the
@@ -107,9 +105,9 @@ class StreakClient():
             "limit": 10
         }
 
-        response = StreakClient.search_streaks(request_body)
+        response = await StreakClient.search_streaks(request_body)
 
         if response is None and response.status_code == 404:
             return None
         
-        return json.loads(response.text)
\ No newline at end of file
+        return response.json()
\ No newline at end of file
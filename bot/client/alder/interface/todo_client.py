@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 todo resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class TodoClient():
@@ -26,7 +24,7 @@ class TodoClient():
     # =====================
 
     @staticmethod
-    def update_todo_item_name(id: int, new_item_name: str):
+    async def update_todo_item_name(id: int, new_item_name: str):
         """
         Updates an existing todo item's name
         """
@@ -37,10 +35,10 @@ class TodoClient():
         }
 
         # Update the todo item
-        return AlderAPIClient.patch(f'/todo/{id}', request_body)
+        return await AlderAPIClient.patch(f'/todo/{id}', request_body)
     
     @staticmethod
-    def create_todo_item(user_id: int, item_name: str):
+    async def create_todo_item(user_id: int, item_name: str):
         """
         Creates a todo item given user_id and item_name.
         """
@@ -52,71 +50,71 @@ class TodoClient():
         }
 
         # Create the todo item
-        return AlderAPIClient.post(f'/todo', request_body)
+        return await AlderAPIClient.post(f'/todo', request_body)
     
     @staticmethod
-    def complete_todo_item(id: int):
+    async def complete_todo_item(id: int):
         """
         Completes the todo item given its ID
         """
-        return AlderAPIClient.post(f'/todo/{id}/complete', None)
+        return await AlderAPIClient.post(f'/todo/{id}/complete', None)
     
     @staticmethod
-    def get_incomplete_todo_items_for_user(user_id: int):
+    async def get_incomplete_todo_items_for_user(user_id: int):
         """
         Retrieves the todo items for the user that do not have
         a completed date
         """
-        return AlderAPIClient.get(f'/todo/incomplete/{user_id}')
+        return await AlderAPIClient.get(f'/todo/incomplete/{user_id}')
     
     @staticmethod
-    def get_incomplete_todo_items_for_user_content(user_id: int):
+    async def get_incomplete_todo_items_for_user_content(user_id: int):
         """
         Returns the content of receiving the incomplete todo item
         """
-        response = TodoClient.get_incomplete_todo_items_for_user(user_id)
+        response = await TodoClient.get_incomplete_todo_items_for_user(user_id)
         if response is None or response.status_code == 404:
             return []
         else:
-            return json.loads(response.text)
+            return response.json()
     
     @staticmethod
-    def get_complete_todo_items_for_user(user_id: int):
+    async def get_complete_todo_items_for_user(user_id: int):
         """
         Retrieves the todo items for the user that have
         a completed date
         """
-        return AlderAPIClient.get(f'/todo/complete/{user_id}')
+        return await AlderAPIClient.get(f'/todo/complete/{user_id}')
     
     @staticmethod
-    def get_complete_todo_items_for_user_content(user_id: int):
+    async def get_complete_todo_items_for_user_content(user_id: int):
         """
         Returns the content of receiving the incomplete todo item
         """
-        response = TodoClient.get_complete_todo_items_for_user(user_id)
+        response = await TodoClient.get_complete_todo_items_for_user(user_id)
         if response is None or response.status_code == 404:
             return []
         else:
-            return json.loads(response.text)
+            return response.json()
     
     @staticmethod
-    def delete_todo_item(id: int):
+    async def delete_todo_item(id: int):
         """
         Delete a todo item by its id
         """
-        return AlderAPIClient.delete(f'/todo/{id}')
+        return await AlderAPIClient.delete(f'/todo/{id}')
 
     @staticmethod
-    def delete_old_completed_todo_items_for_user(user_id: int):
+    async def delete_old_completed_todo_items_for_user(user_id: int):
         """
         Deletes all of the completed todo items for the user
         that are older than a day.
         """
-        return AlderAPIClient.delete(f'/todo/complete/{user_id}')
+        return await AlderAPIClient.delete(f'/todo/complete/{user_id}')
     
     @staticmethod
-    def delete_all_todo_items_for_user(user_id: int):
+    async def delete_all_todo_items_for_user(user_id: int):
         """
         Deletes all of the todo items for the user
         """
-        return AlderAPIClient.delete(f'/todo/all/{user_id}')
\ No newline at end of file
+        return await AlderAPIClient.delete(f'/todo/all/{user_id}')
\ No newline at end of file
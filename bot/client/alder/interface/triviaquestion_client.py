@@ -6,8 +6,6 @@ Alder interface for making HTTP requests to the
 triviaquestion resource on the Alder API.
 """
 
-import json
-
 from client.alder.alder_api_client import AlderAPIClient
 
 class TriviaQuestionClient():
@@ -30,22 +28,72 @@ class TriviaQuestionClient():
     # =====================
 
     @staticmethod
-    def get_random_trivia_question():
+    async def get_random_trivia_question(user_id: int = None):
         """
         Returns a random trivia question from the
-        triviaquestion table.
+        triviaquestion table. When user_id is given, the
+        question is one the user has not answered yet.
+        """
+        if user_id is None:
+            return await AlderAPIClient.get('/trivia')
+        return await AlderAPIClient.get(f'/trivia?user_id={user_id}')
+
+    @staticmethod
+    async def get_random_trivia_questions(count: int, user_id: int = None):
+        """
+        Returns a batch of up to `count` distinct random
+        trivia questions from the triviaquestion table. When
+        user_id is given, the questions are ones the user has
+        not answered yet.
+        """
+        if user_id is None:
+            return await AlderAPIClient.get(f'/trivia/random?count={count}')
+        return await AlderAPIClient.get(f'/trivia/random?count={count}&user_id={user_id}')
+
+    @staticmethod
+    async def answer_trivia_question(id: int, user_id: int, selection: int):
+        """
+        Records the user's selected option for the trivia
+        question. The API marks the question as seen and
+        increments the user's trivia count if correct.
         """
-        return AlderAPIClient.get('/trivia')
+        return await AlderAPIClient.post(f'/trivia/{id}/answer', {'user_id': user_id, 'selection': selection})
 
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
     
     @staticmethod
-    def get_random_trivia_question_contents():
+    async def get_random_trivia_question_contents(user_id: int = None):
         """
         Retreives a random trivia question, then returns
         the content of that question
         """
-        response = TriviaQuestionClient.get_random_trivia_question()
-        return json.loads(response.text)
\ No newline at end of file
+        response = await TriviaQuestionClient.get_random_trivia_question(user_id)
+        return response.json()
+
+    @staticmethod
+    async def get_random_trivia_questions_contents(count: int, user_id: int = None):
+        """
+        Retrieves a batch of random trivia questions, then
+        returns the list of questions. Returns an empty list
+        if the questions could not be retrieved.
+        """
+        response = await TriviaQuestionClient.get_random_trivia_questions(count, user_id)
+        if response is None or response.status_code != 200:
+            return []
+        return response.json()
+
+
+    @staticmethod
+    async def answer_trivia_question_contents(id: int, user_id: int, selection: int):
+        """
+        Records the user's answer, then returns a dictionary
+        containing `correct`, the user's new `trivia` count and
+        the number of questions they have `seen`. Returns None
+        if the answer could not be recorded.
+        """
+        response = await TriviaQuestionClient.answer_trivia_question(id, user_id, selection)
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()
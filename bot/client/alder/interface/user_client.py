@@ -6,13 +6,16 @@ Alder user interface for making HTTP requests to the
 user resource on the Alder API.
 """
 
-import json
 import discord
+import pytz
+
+from datetime import datetime
 
 from client.alder.alder_api_client import AlderAPIClient
-from client.alder.interface.monthtime_client import MonthTimeClient
-from client.alder.interface.dailytime_client import DailyTimeClient
-from client.alder.interface.streak_client import StreakClient
+
+# Users whose rows were ensured on ensured_date (UTC)
+ensured_users = set()
+ensured_date = None
 
 class UserClient():
     """
@@ -37,41 +40,41 @@ class UserClient():
     # =====================
 
     @staticmethod
-    def search_users(request_body):
+    async def search_users(request_body):
         """
         Given the search constraints in request_body, search
         for users that meet the constraints.
         """
-        return AlderAPIClient.post('/user/search', request_body)
+        return await AlderAPIClient.post('/user/search', request_body)
     
     @staticmethod
-    def get_user_by_id(id):
+    async def get_user_by_id(id):
         """
         Given the id, corresponding to the user's Discord ID,
         retrieve information from the user resource for that
         user.
         """
-        return AlderAPIClient.get(f'/user/{id}')
+        return await AlderAPIClient.get(f'/user/{id}')
     
     @staticmethod
-    def create_user(request_body):
+    async def create_user(request_body):
         """
         Given a body to create a user, call the API to create
         the user.
         """
-        return AlderAPIClient.post('/user', request_body)
+        return await AlderAPIClient.post('/user', request_body)
     
     @staticmethod
-    def overwrite_user(id, request_body):
+    async def overwrite_user(id, request_body):
         """
         Given the id of a current user corresponding to the
         Discord ID. Overwrite the properites of the user given
         the request body.
         """
-        return AlderAPIClient.put(f'/user/{id}', request_body)
+        return await AlderAPIClient.put(f'/user/{id}', request_body)
     
     @staticmethod
-    def update_user(id, request_body):
+    async def update_user(id, request_body):
         """
         Given the id corresponding to the user's Discord ID,
         perform a partial update against the user resource.
@@ -79,18 +82,35 @@ class UserClient():
         This function can be used to update `hex`, `stime`,
         `tokens`, and `trivia` fields.
         """
-        return AlderAPIClient.patch(f'/user/{id}', request_body)
+        return await AlderAPIClient.patch(f'/user/{id}', request_body)
     
     @staticmethod
-    def delete_user(id):
+    async def delete_user(id):
         """
         Given the id corresponding to the user's Discord ID,
         delete the user resource.
         """
-        return AlderAPIClient.delete(f'/user/{id}')
+        return await AlderAPIClient.delete(f'/user/{id}')
     
     @staticmethod
-    def set_timezone(id: str, timezone: str):
+    async def increment_user(id, request_body):
+        """
+        Atomically adds the deltas in `request_body` (any of
+        tokens, stime, trivia) to the user with Discord ID `id`.
+        Returns the user with the new totals.
+        """
+        return await AlderAPIClient.patch(f'/user/{id}/increment', request_body)
+
+    @staticmethod
+    async def ensure_user(id):
+        """
+        Creates any missing user, monthtime, dailytime and streak
+        rows for the user in one request. Returns the combined state.
+        """
+        return await AlderAPIClient.put(f'/user/{id}/ensure', None)
+
+    @staticmethod
+    async def set_timezone(id: str, timezone: str):
         """
         Calls the set timezone endpoint which puts the
         value of {timezone} parameter in the user with
@@ -102,19 +122,19 @@ class UserClient():
         }
 
         # Perform set timezone operation
-        response = AlderAPIClient.put(f"/user/{id}/timezone", request_body)
+        response = await AlderAPIClient.put(f"/user/{id}/timezone", request_body)
 
         if not response or response.status_code == 404:
             return None
         
-        return json.loads(response.text)
+        return response.json()
     
     @staticmethod
-    def get_timezone(id: str):
+    async def get_timezone(id: str):
         """
         Retrieves a user's timezone by their id.
         """
-        user_profile = UserClient.get_user_profile(id)
+        user_profile = await UserClient.get_user_profile(id)
 
         if user_profile:
             return user_profile['timezone']
@@ -126,29 +146,29 @@ class UserClient():
     # =====================
 
     @staticmethod
-    def get_user_profile(id: int):
+    async def get_user_profile(id: int):
         """
         Retrieves the user profile by id corresponding
         to the user's Discord ID
         """
-        response = UserClient.get_user_by_id(id)
+        response = await UserClient.get_user_by_id(id)
         
         # If the profile was not found, return None
         if response.status_code == 404:
             return None
         
         # Otherwise, return the profile data
-        body = json.loads(response.text)
+        body = response.json()
         return body
 
     @staticmethod
-    def get_user_property(id: int, property: str):
+    async def get_user_property(id: int, property: str):
         """
         Retrieves the user resource given the corresponding
         discord ID `id`. Returns the property on the user
         resource.
         """
-        body = UserClient.get_user_profile(id)
+        body = await UserClient.get_user_profile(id)
 
         # return None if body is None
         if body is None:
@@ -157,7 +177,7 @@ class UserClient():
         return body[property]
     
     @staticmethod
-    def search_top_10_field(field: str):
+    async def search_top_10_field(field: str):
         """
         Calls the search endpoint to return the top
         10 users with the highest `field` column.
@@ -169,47 +189,55 @@ class UserClient():
         }
 
         # Perform search and return response object
-        response = UserClient.search_users(request_body)
-        return json.loads(response.text)
+        response = await UserClient.search_users(request_body)
+        return response.json()
 
     # ========================
     # IMPLEMENTATION FUNCTIONS
     # ========================
 
     @staticmethod
-    def get_user_tokens(id: str) -> int:
+    async def get_user_tokens(id: str) -> int:
         """
         Retrieves the user resource given the corresponding
         discord ID `id`. Then returns only the amount of
         tokens that the user has.
         """
-        return UserClient.get_user_property(id, 'tokens')
+        return await UserClient.get_user_property(id, 'tokens')
     
     @staticmethod
-    def get_user_stime(id: str) -> int:
+    async def get_user_stime(id: str) -> int:
         """
         Retrieves the user resource given the corresponding
         discord ID `id`. Then returns only the stime column's
         value.
         """
-        return UserClient.get_user_property(id, 'stime')
+        return await UserClient.get_user_property(id, 'stime')
     
     @staticmethod
-    def get_user_hex(id: str) -> str:
+    async def get_user_hex(id: str) -> str:
         """
         Retrieves the user resource given the corresponding
         discord ID `id`. Then returns only the hex column's
         value.
         """
-        return UserClient.get_user_property(id, 'hex')
+        return await UserClient.get_user_property(id, 'hex')
     
     @staticmethod
-    def get_discord_user_embed_color(id: str) -> discord.Colour:
+    async def get_discord_user_embed_color(id: str) -> discord.Colour:
         """
         Given the user's hex value, return that hex value as
         a discord.py Colour object.
         """
-        hex_string = UserClient.get_user_hex(id)
+        hex_string = await UserClient.get_user_hex(id)
+        return UserClient.get_embed_color_from_hex(hex_string)
+
+    @staticmethod
+    def get_embed_color_from_hex(hex_string: str) -> discord.Colour:
+        """
+        Converts a hex string such as 383838 into a discord.py
+        Colour object.
+        """
         hex_integer = int(hex_string, 16)
 
         red = (hex_integer >> 16) & 0xff
@@ -219,115 +247,59 @@ class UserClient():
         return discord.Colour.from_rgb(red, green, blue)
     
     @staticmethod
-    def get_user_trivia(id: str) -> int:
+    async def get_user_trivia(id: str) -> int:
         """
         Retrieves the user resource given the corresponding
         discord ID `id`. Then returns only the hex column's
         value.
         """
-        return UserClient.get_user_property(id, 'trivia')
+        return await UserClient.get_user_property(id, 'trivia')
 
     @staticmethod
-    def add_tokens_user(id: str, num_tokens_to_add: int):
+    async def add_tokens_user(id: str, num_tokens_to_add: int):
         """
         Adds `num_tokens_to_add` to the user with Discord ID
         corresponding to `id`.
         """
-        # Retrieve the current amount of tokens
-        current_tokens = UserClient.get_user_tokens(id)
-
-        # Calculate total amount of tokens
-        total_tokens = current_tokens + num_tokens_to_add
-
-        # Construct request body
-        request_body = {
-            "tokens": total_tokens
-        }
-
-        # Update the user
-        UserClient.update_user(id, request_body)
+        await UserClient.increment_user(id, {"tokens": num_tokens_to_add})
 
     @staticmethod
-    def subtract_tokens_user(id: str, num_tokens_to_subtract: int):
+    async def subtract_tokens_user(id: str, num_tokens_to_subtract: int):
         """
         Subtracts `num_tokens_to_subtract` to the user with Discord ID
         corresponding to `id`.
         """
-        # Retrieve the current amount of tokens
-        current_tokens = UserClient.get_user_tokens(id)
-
-        # Calculate total amount of tokens
-        total_tokens = current_tokens - num_tokens_to_subtract
-
-        # Construct request body
-        request_body = {
-            "tokens": total_tokens
-        }
-
-        # Update the user
-        UserClient.update_user(id, request_body)
+        await UserClient.increment_user(id, {"tokens": -num_tokens_to_subtract})
     
     @staticmethod
-    def add_stime_user(id: str, num_stime_to_add: int):
+    async def add_stime_user(id: str, num_stime_to_add: int):
         """
         Adds `num_stime_to_add` to the user with Discord ID
         corresponding to `id`.
         """
-        # Retrieve the current amount of stime
-        current_stime = UserClient.get_user_stime(id)
-
-        # Calculate total amount of stime
-        total_stime = current_stime + num_stime_to_add
-
-        # Construct request body
-        request_body = {
-            "stime": total_stime
-        }
-
-        # Update the user
-        UserClient.update_user(id, request_body)
+        await UserClient.increment_user(id, {"stime": num_stime_to_add})
 
     @staticmethod
-    def add_stime_and_tokens_user(id: str, num_stime_to_add: int, num_tokens_to_add: int):
+    async def add_stime_and_tokens_user(id: str, num_stime_to_add: int, num_tokens_to_add: int):
         """
         Adds both `num_stime_to_add` and `num_tokens_to_add` to the user with Discord ID
         corresponding to `id`.
         """
-        user = UserClient.get_user_profile(id)
-        total_stime = user['stime'] + num_stime_to_add
-        total_tokens = user['tokens'] + num_tokens_to_add
-
-        # Construct request body
-        request_body = {
-            "stime": total_stime,
-            "tokens": total_tokens
-        }
-
-        # Update the user
-        UserClient.update_user(id, request_body)
+        await UserClient.increment_user(id, {"stime": num_stime_to_add, "tokens": num_tokens_to_add})
     
     @staticmethod
-    def add_trivia_win_for_user(id: str):
+    async def add_trivia_win_for_user(id: str):
         """
         Adds a single trivia win to the user with Discord ID
-        corresponding to `id`.
+        corresponding to `id`. Returns the new amount of trivia wins.
         """
-        # Retrieve the current amount of trivia
-        current_trivia = UserClient.get_user_trivia(id)
-
-        # Calculate total amount of trivia
-        total_trivia = current_trivia + 1
-
-        # Construct request body
-        request_body = {
-            "trivia": total_trivia
-        }
-
-        # Update the user
-        UserClient.update_user(id, request_body)
+        response = await UserClient.increment_user(id, {"trivia": 1})
+        if response is None or response.status_code != 200:
+            return None
+        return response.json()['trivia']
     
     @staticmethod
-    def update_hex_user(id: str, hex: str):
+    async def update_hex_user(id: str, hex: str):
         """
         Updates the `hex` column for the user with Discord ID
         corresponding to `id`.
@@ -338,73 +310,60 @@ class UserClient():
         }
 
         # Update the user
-        UserClient.update_user(id, request_body)
+        await UserClient.update_user(id, request_body)
     
     @staticmethod
-    def search_top_stime_users():
+    async def search_top_stime_users():
         """
         Calls the search endpoint to return the top
         10 users with the highest stime column.
         """
-        return UserClient.search_top_10_field('stime')
+        return await UserClient.search_top_10_field('stime')
     
     @staticmethod
-    def search_top_trivia_users():
+    async def search_top_trivia_users():
         """
         Calls the search endpoint to return the top
         10 users with the highest trivia column
         """
-        return UserClient.search_top_10_field('trivia')
+        return await UserClient.search_top_10_field('trivia')
     
     @staticmethod
-    def search_top_tokens_users():
+    async def search_top_tokens_users():
         """
         Calls the search endpoint to return th top
         10 users with the highest tokens column
         """
-        return UserClient.search_top_10_field('tokens')
+        return await UserClient.search_top_10_field('tokens')
     
     # ========================
     # SHARED FUNCTIONS
     # ========================
 
     @staticmethod
-    def create_user_if_dne(user_id):
+    async def create_user_if_dne(user_id):
         """
-        Checks if the user contains:
+        Ensures that the user contains:
         - A user entry in the user table
         - A month time entry in the monthtime table for the current month
-        - A daily time entry in the dailytime table for the current month
+        - A daily time entry in the dailytime table for the current day
         - A streak entry in the streak table
         where user_id is the discord ID of the user.
+
+        All four rows are ensured by a single request. Users that were
+        already ensured today (UTC) are skipped without calling the API.
         """
+        global ensured_date
+
+        # Forget previously ensured users once the UTC day changes
+        today = datetime.now(pytz.utc).date()
+        if ensured_date != today:
+            ensured_users.clear()
+            ensured_date = today
+
+        if user_id in ensured_users:
+            return
 
-        # Fetch the user
-        user = UserClient.get_user_by_id(user_id)
-        if user.status_code == 404:
-            # If the user is None, create it
-            user = UserClient.create_user({
-                "id": user_id,
-                "hex": "383838",
-                "stime": 0,
-                "tokens": 0,
-                "trivia": 0
-            })
-
-        # Fetch the month time entry
-        monthtime = MonthTimeClient.get_monthtime_current_month_for_user(user_id)
-        if monthtime.status_code == 404:
-            # If the monthtime is None, create it
-            monthtime = MonthTimeClient.create_monthtime_current_month_for_user(user_id)
-
-        # Fetch the daily time entry
-        dailytime = DailyTimeClient.get_dailytime_today_for_user(user_id)
-        if dailytime.status_code == 404:
-            # If the dailytime is None, create it
-            dailytime = DailyTimeClient.create_dailytime_today_for_user(user_id)
-
-        # Fetch the streak entry
-        streak = StreakClient.get_streak_for_user(user_id)
-        if streak.status_code == 404:
-            # If the streak entry is None, create it
-            streak = StreakClient.set_streak_for_user(user_id)
+        response = await UserClient.ensure_user(user_id)
+        if response is not None and response.status_code == 200:
+            ensured_users.add(user_id)
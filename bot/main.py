@@ -22,11 +22,13 @@ import traceback
 from datetime import datetime, timedelta
 
 # API clients
+from client.alder.alder_api_client import AlderAPIClient
 from client.alder.interface.user_client import UserClient
 from client.alder.interface.accomplishment_client import AccomplishmentClient
 from client.alder.interface.rogueboss_client import RbClient
 from client.alder.interface.dailytoken_client import DailyTokenClient
 from client.alder.interface.reminder_client import ReminderClient
+from client.alder.interface.achievement_client import AchievementClient
 
 # Discord dependencies
 import discord
@@ -64,6 +66,7 @@ from apps.info.timezone import TimeZoneApp
 # Arcade application dependencies
 from apps.arcade.trivia import Trivia
 from apps.arcade.trivia import TriviaButtons
+from apps.arcade.trivia_buffer import trivia_buffer
 from apps.arcade.rb import RogueBoss
 from apps.arcade.rb import RogueBossTypeChooser
 
@@ -71,6 +74,7 @@ from apps.arcade.rb import RogueBossTypeChooser
 from apps.productivity.todo import Todo
 from apps.productivity.kanban import Kanban
 from apps.productivity.deep_focus import DeepFocus
+from apps.productivity.reminder import ReminderScheduler
 
 """
 Initialize AlderBot and required connections.
@@ -109,6 +113,7 @@ shopcolor_app = ShopColor()
 todo_app = Todo()
 kanban_app = Kanban()
 deepfocus_app = DeepFocus()
+reminder_scheduler = ReminderScheduler(bot)
 
 # # Arcade
 trivia_app = Trivia()
@@ -145,7 +150,7 @@ async def on_ready():
         else:
             Logger.info(f'{bot.user} is connected to {guild.name} (id: {guild.id})')
             # Begin to track active members in dedicated focus rooms
-            time_tracker.start_up(guild)
+            await time_tracker.start_up(guild)
 
     # Set status message
     await bot.change_presence(activity=discord.Game(name="/help • @narlockdev"))
@@ -166,9 +171,9 @@ async def on_ready():
     # Begin scheduled tasks
     sync_time_track.start()
 
-    # Check for reminders
-    await load_all_reminders()
-    check_reminders.start()
+    # Schedule reminders
+    await reminder_scheduler.load()
+    reminder_scheduler.start()
 
     # Indicate on_ready is complete
     Logger.success('AlderBot is officially ready for use!')
@@ -214,7 +219,7 @@ async def sync_time_track():
         Logger.debug(f'Found discord server with id {cfg.DISCORD_SERVER_ID}')
 
         # Sync time track
-        time_tracker.update_connected_users(guild)
+        await time_tracker.update_connected_users(guild)
 
         # Check for month reset
         current_utc_month = datetime.now(pytz.utc).month
@@ -260,12 +265,13 @@ async def shutdown(ctx: commands.Context):
     user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
     if user_has_role:
         # Save the time and tokens earned for each connected user
-        time_tracker.handle_shutdown(guild)
+        await time_tracker.handle_shutdown(guild)
 
         # Alert server of shut down
         await ctx.send("Alder is powering off...")
 
-        # Shut down bot
+        # Release pooled Alder API connections and shut down bot
+        await AlderAPIClient.close()
         await bot.close()
         Logger.success(f"AlderBot Closed Successful")
     else:
@@ -285,10 +291,10 @@ async def give_tokens(ctx: commands.Context, user_id: int, num_tokens: int):
     user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
     if user_has_role:
         # Ensure that the user receiving tokens has a profile
-        UserClient.create_user_if_dne(user_id)
+        await UserClient.create_user_if_dne(user_id)
 
         # Give tokens to user with user_id
-        UserClient.add_tokens_user(user_id, num_tokens)
+        await UserClient.add_tokens_user(user_id, num_tokens)
 
         # Send response message
         await ctx.send(f'{num_tokens} given to {user_id}')
@@ -311,7 +317,7 @@ async def give_accomplishment(ctx: commands.Context, user_id: int, message: str)
     Logger.info(f'Received give_accomplishment command from {ctx.author.name}')
     user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
     if user_has_role:
-        AccomplishmentClient.add_user_accomplishment(user_id, message)
+        await AccomplishmentClient.add_user_accomplishment(user_id, message)
         await ctx.send(f'New accomplishment given to {user_id}')
         Logger.success(f"Successfully gave accomplishment {message} to {user_id}")
     else:
@@ -337,6 +343,75 @@ async def resetmonth(ctx: commands.Context):
         await ctx.send("LOL! :rofl:")
         Logger.warn(f"Reset Month attempt failure. User {ctx.author.name} has insufficient permissions.")
 
+@bot.command(name='evaluateachievements')
+async def evaluateachievements(ctx: commands.Context):
+    """
+    $evaluateachievements
+
+    Traditional context command for administrator use only.
+    This will evaluate and award achievements for every user
+    on the Alder API.
+
+    Utilizes client/alder/interface/achievement_client.py
+    """
+    Logger.info(f"Received evaluateachievements command from {ctx.author.name}")
+    user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
+    if user_has_role:
+        response = await AchievementClient.evaluate_all_achievements()
+        if response is None or response.status_code != 200:
+            await ctx.send("Unable to evaluate achievements")
+            Logger.error("AlderBot achievement evaluation failed")
+            return
+        result = response.json()
+        await ctx.send(f'Evaluated achievements for {result["users"]} users, awarded {result["awarded"]} achievements')
+        Logger.success(f"AlderBot achievement evaluation successful")
+    else:
+        await ctx.send("LOL! :rofl:")
+        Logger.warn(f"Evaluate achievements attempt failure. User {ctx.author.name} has insufficient permissions.")
+
+@bot.command(name='refreshtrivia')
+async def refreshtrivia(ctx: commands.Context):
+    """
+    $refreshtrivia
+
+    Traditional context command for administrator use only.
+    This will discard the prefetched trivia questions. Use after
+    editing or deleting trivia questions on the Alder API.
+
+    Utilizes apps/arcade/trivia_buffer.py
+    """
+    Logger.info(f"Received refreshtrivia command from {ctx.author.name}")
+    user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
+    if user_has_role:
+        trivia_buffer.clear()
+        await ctx.send("Trivia questions refreshed")
+        Logger.success(f"AlderBot trivia buffer refreshed")
+    else:
+        await ctx.send("LOL! :rofl:")
+        Logger.warn(f"Refresh trivia attempt failure. User {ctx.author.name} has insufficient permissions.")
+
+@bot.command(name='reminderstats')
+async def reminderstats(ctx: commands.Context):
+    """
+    $reminderstats
+
+    Traditional context command for administrator use only.
+    This will show the number of pending reminders and the reminder
+    delivery metrics, including the lag from a reminder's due time to
+    the time it was sent.
+
+    Utilizes apps/productivity/reminder.py
+    """
+    Logger.info(f"Received reminderstats command from {ctx.author.name}")
+    user_has_role = discord.utils.get(ctx.author.roles, id=cfg.ADMIN_ROLE_ID) is not None
+    if user_has_role:
+        await ctx.send(f"Pending reminders: {len(reminder_scheduler.queue)}, queued for delivery: {reminder_scheduler.delivery.queue.qsize()}\n"
+                       f"Delivery: {reminder_scheduler.delivery.metrics.summary()}")
+        Logger.success(f"AlderBot reminder stats sent")
+    else:
+        await ctx.send("LOL! :rofl:")
+        Logger.warn(f"Reminder stats attempt failure. User {ctx.author.name} has insufficient permissions.")
+
 ##########################################
 ##########################################
 # Voice Events
@@ -356,7 +431,7 @@ async def on_voice_state_update(member: discord.Member, before: discord.VoiceSta
     Logger.info(f"Handling voice state update for {member.name}")
     guild = member.guild
 
-    time_tracker.update_time_on_event(member, before, after)
+    await time_tracker.update_time_on_event(member, before, after)
     await role_assign.check_role_updates_on_user(member, guild)
 
 ##########################################
@@ -403,17 +478,17 @@ async def handle_profile_stats(interaction: discord.Interaction, member: discord
             member = interaction.guild.get_member(interaction.user.id)
 
         # Ensure that statistics for the member are updated
-        time_tracker.update_time_on_call(interaction, member)
+        await time_tracker.update_time_on_call(interaction, member)
         guild = interaction.guild
 
         # Ensure that achievements are earned if applicable for member
-        achievements_interface.get_achievements(interaction)
+        await achievements_interface.get_achievements(interaction)
 
         # Check if the member has earned a higher activity role
         await role_assign.check_role_updates_on_user(member, guild)
 
         # Create discord embed from profile information
-        embed = profile_interface.create_profile_embed(interaction, member)
+        embed = await profile_interface.create_profile_embed(interaction, member)
         await interaction.response.send_message(embed=embed)
     except Exception as e:
         traceback.print_exc()
@@ -438,7 +513,7 @@ async def achievements(interaction: discord.Interaction):
     Logger.info(f'Achievements command received from {interaction.user.name}')
     try:
         Logger.debug(f'Attempting to get member achievements for {interaction.user.name}')
-        embed = achievements_interface.get_achievements(interaction)
+        embed = await achievements_interface.get_achievements(interaction)
         await interaction.response.send_message(embed=embed)
     except Exception as e:
         traceback.print_exc()
@@ -470,8 +545,11 @@ async def top(interaction: discord.Interaction, board: str = None):
     }
 
     # Get the corresponding function from the dictionary or return an error message
-    embed = board_options.get(board, lambda _: cfg.ErrorEmbed.message(
-        'Invalid parameter: board.\nOptions: `daily`, `all`, `trivia`, `rb`, `streak`, `hstreak`'))(interaction)
+    handler = board_options.get(board)
+    if handler is None:
+        embed = cfg.ErrorEmbed.message('Invalid parameter: board.\nOptions: `daily`, `all`, `trivia`, `rb`, `streak`, `hstreak`')
+    else:
+        embed = await handler(interaction)
 
     # Send the embed in response to the interaction
     await interaction.response.send_message(embed=embed)
@@ -489,12 +567,12 @@ async def timezone(interaction: discord.Interaction, timezone_string: str = None
     """
     if timezone_string is None:
         # Display current timezone
-        embed = TimeZoneApp.get_current_timezone_embed(interaction)
+        embed = await TimeZoneApp.get_current_timezone_embed(interaction)
         await interaction.response.send_message(embed=embed, ephemeral=True)
     else:
         # Set timezone
         Logger.info(f'{interaction.user.id} calling timezone with timezone of {timezone_string}')
-        embed = TimeZoneApp.set_timezone(interaction, timezone_string)
+        embed = await TimeZoneApp.set_timezone(interaction, timezone_string)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
 # ##########################################
@@ -534,11 +612,11 @@ async def shopembed(interaction: discord.Interaction, hex: str = None):
     Logger.info(f"Shop Embed command received from {interaction.user.name}")
 
     # Ensures that the user has earned their tokens
-    time_tracker.update_time_on_call(interaction, interaction.user)
+    await time_tracker.update_time_on_call(interaction, interaction.user)
     
     # Determines purchase result
     if hex and re.match(r'^[0-9a-fA-F]{6}$', hex):
-        embed = shopembed_app.purchase_embed(interaction.user.id, hex)
+        embed = await shopembed_app.purchase_embed(interaction.user.id, hex)
     else:
         embed = cfg.ErrorEmbed.message(f"{interaction.user.mention}, please provide a correct hex code. Example: `FFFFFF` is white in hex. To send command with this hex, you would use `/shopembed FFFFFF`")
 
@@ -562,7 +640,7 @@ async def shopcolor(interaction: discord.Interaction, color: str = None):
     Logger.info(f"Shopcolor command received by {interaction.user.name} where color = {color}")
     
     # Ensures that the user has earned their tokens
-    time_tracker.update_time_on_call(interaction, interaction.user)
+    await time_tracker.update_time_on_call(interaction, interaction.user)
 
     if color is None:
         # Present available colors as interaction response
@@ -699,20 +777,33 @@ async def trivia(interaction: discord.Interaction):
     """
     Logger.info(f"Trivia command received from {interaction.user.name}")
 
+    # A question must be fetched when none is prefetched for the user,
+    # so defer to not run past Discord's interaction deadline
+    if not trivia_buffer.has_question(interaction.user.id):
+        await interaction.response.defer()
+    send = interaction.followup.send if interaction.response.is_done() else interaction.response.send_message
+
     # Retrieve amount of tokens for calling user
-    user_tokens = UserClient.get_user_tokens(interaction.user.id)
+    user_tokens = await UserClient.get_user_tokens(interaction.user.id)
 
     if user_tokens < 25:
         # User cannot play trivia - not enough tokens
         embed = cfg.ErrorEmbed.notokens(user_tokens, 25)
-        await interaction.response.send_message(embed=embed)
-    else:
-        # User can play - subtract tokens for playing
-        UserClient.subtract_tokens_user(interaction.user.id, 25)
+        await send(embed=embed)
+        return
+
+    # Retrieve the question before charging, so a failed request costs nothing
+    embed = trivia_app.play_trivia(interaction)
+    view = await TriviaButtons.create(embed, interaction.user.id)
+    if view is None:
+        await send(embed=cfg.ErrorEmbed.message('Unable to retrieve a trivia question. You have not been charged, please try again later.'))
+        return
+
+    # User can play - subtract tokens for playing
+    await UserClient.subtract_tokens_user(interaction.user.id, 25)
 
-        # Return interactive embed for playing trivia
-        embed = trivia_app.play_trivia(interaction)
-        await interaction.response.send_message(embed=embed, view=TriviaButtons(embed, interaction.user.id))
+    # Return interactive embed for playing trivia
+    await send(embed=embed, view=view)
 
 @bot.tree.command(name='rb', description='Play Rogue Boss (25 tokens to play - active during study streams)')
 async def rb(interaction: discord.Interaction, command: str = None):
@@ -739,7 +830,7 @@ async def rb(interaction: discord.Interaction, command: str = None):
     Utilizes apps/arcade/rb.py for interacting with Rogue Boss.
     """
     Logger.info(f'Received rb command from {interaction.user.name} with command {command}')
-    user = RbClient.get_rogue_boss_user_content(interaction.user.id)
+    user = await RbClient.get_rogue_boss_user_content(interaction.user.id)
 
     if command is None:
         if user is None:
@@ -748,7 +839,7 @@ async def rb(interaction: discord.Interaction, command: str = None):
             await interaction.response.send_message(embed=embed, view=RogueBossTypeChooser(embed, interaction.user.id))
         else:
             # Play Rogue Boss
-            embed = rogue_boss.play_rb(interaction, user)
+            embed = await rogue_boss.play_rb(interaction, user)
             await interaction.response.send_message(embed=embed)
     else:
         if user is None:
@@ -756,7 +847,7 @@ async def rb(interaction: discord.Interaction, command: str = None):
             await interaction.response.send_message(embed=embed, ephemeral=True)
         else:
             if command == 'stats':
-                embed = rogue_boss.show_stats(interaction, user)
+                embed = await rogue_boss.show_stats(interaction, user)
                 await interaction.response.send_message(embed=embed)
             elif command == 'type':
                 embed = rogue_boss.show_type()
@@ -770,7 +861,7 @@ async def rb(interaction: discord.Interaction, command: str = None):
                     if index not in [0, 1]:
                         await interaction.response.send_message(embed=cfg.ErrorEmbed.message('Valid models are `0` and `1`.'))
                     else:
-                        RbClient.update_rogue_boss_user_model(user['user_id'], index)
+                        await RbClient.update_rogue_boss_user_model(user['user_id'], index)
                         await interaction.response.send_message(f'Rogue Boss model changed to `{index}`')
                 except:
                     await interaction.response.send_message(embed=cfg.ErrorEmbed.message('Expected integer value as index.'))
@@ -854,7 +945,7 @@ async def todo(interaction: discord.Interaction, command: str = None):
 
     if command is None:
         # Return the calling user's todo list
-        embed = todo_app.get_todo_list(interaction)
+        embed = await todo_app.get_todo_list(interaction)
         await interaction.response.send_message(embed=embed)
     else:
         # Some command whose response will only be shown to calling user
@@ -863,7 +954,7 @@ async def todo(interaction: discord.Interaction, command: str = None):
 
         if handler:
             # Handle input from todo_commands
-            embed = handler()
+            embed = await handler()
         elif command_lower.startswith(('1 ', '2 ', '3 ', '4 ', '5 ', '6 ', '7 ', '8 ', '9 ', '10 ')) and len(command_lower) > 3:
             # Handle updating a todo list item
             if command_lower[:2] == '10':
@@ -871,18 +962,18 @@ async def todo(interaction: discord.Interaction, command: str = None):
             else:
                 index = int(command_lower[0])
             update_item_name = command[2:]
-            embed = todo_app.update_item(interaction, index, update_item_name)
+            embed = await todo_app.update_item(interaction, index, update_item_name)
         elif command_lower.startswith('remove'):
             # Handle remove todo item
             index_str = command_lower[7:]
             if index_str.isdigit() and 1 <= int(index_str) <= 10:
                 index = int(index_str)
-                embed = todo_app.remove_item(interaction, index)
+                embed = await todo_app.remove_item(interaction, index)
             else:
                 embed = cfg.ErrorEmbed.message(f'Invalid index provided to `remove` operation: {index_str}')
         else:
             # Add a new todo item with the command string
-            embed = todo_app.add_item(interaction, command)
+            embed = await todo_app.add_item(interaction, command)
 
         # Return embed that only the calling user can view
         await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -920,7 +1011,7 @@ async def kanban(interaction: discord.Interaction, command: str=None):
     if command is None:
         # /kanban action
         Logger.debug('Command was none for kanban. Returning kanban board.')
-        embed = kanban_app.view_kanban_board(interaction)
+        embed = await kanban_app.view_kanban_board(interaction)
         await interaction.response.send_message(embed=embed)
 
     # Move kanban item to next column - Branch for /kanban #
@@ -928,7 +1019,7 @@ async def kanban(interaction: discord.Interaction, command: str=None):
         kanban_id = int(command)
         # /kanban # action with kanban_id
         Logger.debug('Command for Kanban was a digit. Attempting to move Kanban item to next column.')
-        embed = kanban_app.move_kanban_item(interaction, kanban_id)
+        embed = await kanban_app.move_kanban_item(interaction, kanban_id)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     # Branch for /kanban # {some_other_text}
@@ -942,7 +1033,7 @@ async def kanban(interaction: discord.Interaction, command: str=None):
                 column = remaining_text.lower()
                 # /kanban # {column_name} action with kanban_id, column_name
                 Logger.debug('Command was a digit with text. Attempting to move Kanban item to a specific column')
-                embed = kanban_app.move_kanban_item_to_column(interaction, kanban_id, column)
+                embed = await kanban_app.move_kanban_item_to_column(interaction, kanban_id, column)
                 await interaction.response.send_message(embed=embed, ephemeral=True)
             else:
                 # Check for flags in some_other_string
@@ -983,7 +1074,7 @@ async def kanban(interaction: discord.Interaction, command: str=None):
 
                 # /kanban {some_other_string} action with some_other_string, priority, tag, velocity
                 Logger.debug('Command initiated for updating kanban item.')
-                embed = kanban_app.update_kanban_item(interaction, kanban_id, some_other_string, priority, tag, velocity)
+                embed = await kanban_app.update_kanban_item(interaction, kanban_id, some_other_string, priority, tag, velocity)
                 await interaction.response.send_message(embed=embed, ephemeral=True)
 
     # Branch for /kanban remove #
@@ -991,17 +1082,17 @@ async def kanban(interaction: discord.Interaction, command: str=None):
         kanban_id = int(command[7:])
         # /kanban remove # action with kanban_id
         Logger.debug('Command was remove. Removing kanban item.')
-        embed = kanban_app.remove_kanban_item(interaction, kanban_id)
+        embed = await kanban_app.remove_kanban_item(interaction, kanban_id)
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
     elif command.startswith('tag '):
         kanban_tag = command[4:]
         Logger.debug('Command starts with tag. Displaying the matching tag.')
-        embed = kanban_app.view_kanban_board_tag(interaction, kanban_tag)
+        embed = await kanban_app.view_kanban_board_tag(interaction, kanban_tag)
         await interaction.response.send_message(embed=embed)
 
     elif command == 'complete':
-        embed = kanban_app.complete(interaction)
+        embed = await kanban_app.complete(interaction)
         Logger.debug('Command was complete. Removing Kanban items in done column.')
         await interaction.response.send_message(embed=embed)
 
@@ -1041,7 +1132,7 @@ async def kanban(interaction: discord.Interaction, command: str=None):
         velocity = values['-v']
 
         # /kanban {some_other_string} action with some_other_string, priority, tag, velocity
-        embed = kanban_app.add_kanban_item(interaction, some_other_string, priority, tag, velocity)
+        embed = await kanban_app.add_kanban_item(interaction, some_other_string, priority, tag, velocity)
         Logger.debug('Adding the kanban item to user\'s board')
         await interaction.response.send_message(embed=embed, ephemeral=True)
 
@@ -1051,8 +1142,6 @@ async def delete_reminder(interaction: discord.Interaction, reminder_id: str):
     Using the reminder id and the interaction, delete the reminder for the
     calling user.
     """
-    global reminders_dict  # Use the global reminders_dict to store reminders
-
     # Ensure that the reminder_id is an integer.
     if not reminder_id.isdigit():
         await interaction.response.send_message(
@@ -1069,7 +1158,7 @@ async def delete_reminder(interaction: discord.Interaction, reminder_id: str):
     user_id = interaction.user.id
 
     # Get the user's reminders to verify the reminder_id belongs to them.
-    user_reminders = ReminderClient.get_user_reminders(user_id)
+    user_reminders = await ReminderClient.get_user_reminders(user_id)
     if not user_reminders:
         await interaction.response.send_message(embed=cfg.ErrorEmbed.message(f'No reminder found with id {reminder_id_int}'), ephemeral=True)
         return
@@ -1081,9 +1170,9 @@ async def delete_reminder(interaction: discord.Interaction, reminder_id: str):
         return
 
     # Try to delete the reminder via the ReminderClient.
-    delete_response = ReminderClient.delete_reminder_by_id(reminder_id_int)
+    delete_response = await ReminderClient.delete_reminder_by_id(reminder_id_int)
     if delete_response and delete_response.status_code == 204:
-        del reminders_dict[reminder_id_int]
+        reminder_scheduler.cancel(reminder_id_int)
         await interaction.response.send_message(embed=discord.Embed(title="Reminder Deleted", description=f"Successfully deleted reminder with ID {reminder_id_int}.", color=discord.Color.green()), ephemeral=True)
     else:
         await interaction.response.send_message(embed=cfg.ErrorEmbed.message('An unexpected error ocurred when attempting to delete reminder'), ephemeral=True)
@@ -1094,7 +1183,7 @@ async def delete_reminder(interaction: discord.Interaction, reminder_id: str):
     title="The title of the reminder", 
     remind_date="The date for the reminder in YYYY-MM-DD format", 
     remind_time="The time for the reminder in HH:MM format", 
-    repeat_interval="How often the reminder should repeat (daily, weekly, monthly, or yearly)"
+    repeat_interval="How often the reminder should repeat (daily, weekly, monthly, yearly, or days like mwf)"
 )
 async def reminders(
     interaction: discord.Interaction, 
@@ -1103,15 +1192,13 @@ async def reminders(
     remind_time: str = None, 
     repeat_interval: str = None
 ):
-    global reminders_dict  # Use the global reminders_dict to store reminders
-
     user_id = interaction.user.id
-    UserClient.create_user_if_dne(user_id)
+    await UserClient.create_user_if_dne(user_id)
 
     # Case 1: Display reminders if no parameters are provided
     if not title and not remind_date and not remind_time:
         # Call ReminderClient.get_user_reminders to get the user's reminders
-        reminders = ReminderClient.get_user_reminders(user_id)
+        reminders = await ReminderClient.get_user_reminders(user_id)
 
         # Check if reminders are present and send them as an embed response
         if reminders:
@@ -1129,7 +1216,7 @@ async def reminders(
                 try:
                     remind_at_datetime = datetime.fromisoformat(remind_at)
 
-                    user_timezone = pytz.timezone(UserClient.get_timezone(interaction.user.id))
+                    user_timezone = pytz.timezone(await UserClient.get_timezone(interaction.user.id))
                     # Mark remind_at_datetime as UTC
                     remind_at_utc = pytz.utc.localize(remind_at_datetime)
 
@@ -1176,7 +1263,7 @@ async def reminders(
         remind_at_local = f"{remind_date}T{remind_time}:00" # Example: "2024-09-22T10:00:00"
         # remind_at will be in the timezone of the calling user. Let's retrieve their
         # timezone from the UserClient, then convert remind_at to be in UTC time.
-        user_timezone_string = UserClient.get_timezone(interaction.user.id)
+        user_timezone_string = await UserClient.get_timezone(interaction.user.id)
         user_timezone = pytz.timezone(user_timezone_string)
         # Localize remind_at to the user's timezone
         remind_at_local_dt = datetime.strptime(remind_at_local, "%Y-%m-%dT%H:%M:%S")
@@ -1187,22 +1274,16 @@ async def reminders(
         print(remind_at_formatted)
 
         # Call ReminderClient.create_reminder to create the new reminder
-        new_reminder = ReminderClient.create_reminder(
+        new_reminder = await ReminderClient.create_reminder(
             user_id=user_id,
             title=title,
             remind_at=remind_at_formatted,  # Pass the ISO 8601 formatted string
             repeat_interval=repeat_interval
         )
 
-        # If the reminder was successfully created, add it to the global reminders_dict
+        # If the reminder was successfully created, schedule it
         if new_reminder:
-            # Add the new reminder to the global dictionary
-            reminders_dict[new_reminder['id']] = {
-                'user_id': user_id,
-                'title': title,
-                'remind_at': remind_at_utc,  # Store as datetime object for easy comparisons
-                'repeat_interval': repeat_interval
-            }
+            reminder_scheduler.add(new_reminder)
 
             await interaction.response.send_message(f"Reminder '{title}' created successfully and added to the global reminder list!", ephemeral=True)
         else:
@@ -1244,11 +1325,11 @@ async def daily(interaction: discord.Interaction):
     has_supporting_role = any(role_id in user_roles for role_id in role_ids_to_check)
     if has_supporting_role:
         # Retrieve daily token entry
-        daily_token_date_time = DailyTokenClient.get_user_dailytoken_time_entry(interaction.user.id)
+        daily_token_date_time = await DailyTokenClient.get_user_dailytoken_time_entry(interaction.user.id)
 
         if daily_token_date_time is None:
             # Under the case that the user has never used this command
-            DailyTokenClient.set_dailytoken_entry_user_current_time(interaction.user.id, datetime.now())
+            await DailyTokenClient.set_dailytoken_entry_user_current_time(interaction.user.id, datetime.now())
             
             # Award tokens
             num_tokens = 0
@@ -1260,7 +1341,7 @@ async def daily(interaction: discord.Interaction):
                 num_tokens = 50
 
             if num_tokens > 0:
-                UserClient.add_tokens_user(interaction.user.id, num_tokens)
+                await UserClient.add_tokens_user(interaction.user.id, num_tokens)
 
                 # Inform the user about the tokens received
                 tokens_msg = f"You've received {num_tokens} tokens!"
@@ -1289,7 +1370,7 @@ async def daily(interaction: discord.Interaction):
                 embed.add_field(name='\u200b', value=cfg.EMBED_FOOTER_STRING, inline=False)
                 await interaction.response.send_message(embed=embed)
             else:
-                DailyTokenClient.set_dailytoken_entry_user_current_time(interaction.user.id, datetime.now())
+                await DailyTokenClient.set_dailytoken_entry_user_current_time(interaction.user.id, datetime.now())
 
                 # Award tokens
                 num_tokens = 0
@@ -1301,7 +1382,7 @@ async def daily(interaction: discord.Interaction):
                     num_tokens = 50
 
                 if num_tokens > 0:
-                    UserClient.add_tokens_user(interaction.user.id, num_tokens)
+                    await UserClient.add_tokens_user(interaction.user.id, num_tokens)
                     
                     # Inform the user about the tokens received
                     tokens_msg = f"You've received {num_tokens} tokens!"
@@ -1320,125 +1401,5 @@ async def daily(interaction: discord.Interaction):
         await interaction.response.send_message(embed=embed)
 
 
-# ##########################################
-# ##########################################
-# Reminders functionality
-# TODO split this apart if possible
-# ##########################################
-# ##########################################
-
-# Store reminders in a dictionary for in-memory access
-reminders_dict = {}
-
-async def load_all_reminders():
-    """
-    Load all reminders from the API and store them in an in-memory dictionary.
-    """
-    global reminders_dict
-
-    # Fetch all reminders using the ReminderClient
-    all_reminders = ReminderClient.get_all_reminders()
-    
-    if all_reminders:
-        for reminder in all_reminders:
-            # Parse the remind_at field to a datetime object in UTC
-            remind_at = datetime.strptime(reminder['remind_at'], "%Y-%m-%dT%H:%M:%S").replace(tzinfo=pytz.utc)
-            reminders_dict[reminder['id']] = {
-                'user_id': reminder['user_id'],
-                'title': reminder['title'],
-                'remind_at': remind_at,
-                'repeat_interval': reminder.get('repeat_interval')
-            }
-
-        print(f"Loaded {len(reminders_dict)} reminders.")
-    else:
-        print("No reminders found.")
-
-@tasks.loop(seconds=60)
-async def check_reminders():
-    """
-    Periodically checks if any reminders are due and sends a direct message.
-    Updates the next reminder time in the dictionary and the database if the reminder repeats.
-    """
-    Logger.info(f'Checking reminders...{len(reminders_dict)} in dictionary.')
-    for key, value in reminders_dict.items():
-        Logger.debug(f'Reminder Key: {key}, Value: {value}')
-
-    current_time = datetime.now(pytz.utc)  # Get the current UTC time
-
-    for reminder_id, reminder in list(reminders_dict.items()):
-        remind_at = reminder['remind_at']
-
-        # Check if it's time to send the reminder
-        if remind_at <= current_time:
-            try:
-                # Get the user object using the user_id
-                user = await bot.fetch_user(reminder['user_id'])
-
-                if user:
-                    # Send the reminder message to the user
-                    await user.send(f"Reminder: {reminder['title']}")
-
-                    # Handle repeated reminders if necessary
-                    if reminder['repeat_interval']:
-                        # Calculate the next reminder time based on the repeat_interval
-                        next_remind_at = get_next_reminder_time(remind_at, reminder['repeat_interval'])
-
-                        # Update the dictionary with the new remind_at time
-                        reminders_dict[reminder_id]['remind_at'] = next_remind_at
-
-                        # Extract only the date part of the new remind_at datetime (e.g., "2024-10-01")
-                        new_remind_date_str = next_remind_at.strftime("%Y-%m-%d")
-
-                        # Update the reminder in the database using ReminderClient
-                        updated_reminder = ReminderClient.update_reminder_date(reminder_id, new_remind_date_str)
-                        if updated_reminder:
-                            Logger.info(f"Updated reminder {reminder_id} in the database with new remind_at date: {new_remind_date_str}")
-                        else:
-                            Logger.error(f"Failed to update reminder {reminder_id} in the database.")
-                    else:
-                        # Remove the reminder from the dictionary if it doesn't repeat
-                        del reminders_dict[reminder_id]
-
-                        # Delete the reminder from the database
-                        deleted = ReminderClient.delete_reminder_by_id(reminder_id)
-                        if deleted:
-                            Logger.info(f"Deleted non-repeating reminder {reminder_id} from the database.")
-                        else:
-                            Logger.error(f"Failed to delete reminder {reminder_id} from the database.")
-            except discord.errors.NotFound:
-                # If the user is not found, delete the reminder from the dictionary and database
-                del reminders_dict[reminder_id]
-
-                # Delete the reminder from the database
-                deleted = ReminderClient.delete_reminder_by_id(reminder_id)
-                if deleted:
-                    Logger.info(f"Deleted reminder {reminder_id} from the database due to user not found.")
-                else:
-                    Logger.error(f"Failed to delete reminder {reminder_id} from the database due to user not found.")
-            except Exception as e:
-                # Log any other unexpected exceptions
-                Logger.error(f"An unexpected error occurred: {str(e)}")
-                traceback.print_exc()
-
-# Helper function to calculate the next reminder time based on interval
-def get_next_reminder_time(current_time, repeat_interval):
-    """
-    Calculate the next reminder time based on the repeat_interval.
-    """
-    if repeat_interval == 'daily':
-        return current_time + timedelta(days=1)
-    elif repeat_interval == 'weekly':
-        return current_time + timedelta(weeks=1)
-    elif repeat_interval == 'monthly':
-        # Increment the month, taking care of year transition
-        new_month = current_time.month + 1 if current_time.month < 12 else 1
-        new_year = current_time.year if current_time.month < 12 else current_time.year + 1
-        return current_time.replace(year=new_year, month=new_month)
-    elif repeat_interval == 'yearly':
-        return current_time.replace(year=current_time.year + 1)
-    else:
-        return current_time
-
 # Starts AlderBot
 bot.run(cfg.TOKEN)
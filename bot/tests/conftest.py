@@ -0,0 +1,7 @@
+import os
+import sys
+
+# The bot modules are imported as top-level packages (apps, tools), as
+# when the bot is run from the bot directory. Only modules that do not
+# read the bot configuration can be tested.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
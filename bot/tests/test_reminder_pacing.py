@@ -0,0 +1,62 @@
+import asyncio
+import time
+
+from apps.productivity.reminder_queue import ReminderEntry
+from apps.productivity.reminder_pacing import RateBudget, DeliveryMetrics, LAG_SAMPLES
+
+def acquire_all(budget, count):
+    """
+    Returns the seconds taken to acquire `count` tokens of the budget.
+    """
+    async def run():
+        start = time.monotonic()
+        for _ in range(count):
+            await budget.acquire()
+        return time.monotonic() - start
+    return asyncio.run(run())
+
+def test_burst_is_not_delayed():
+    assert acquire_all(RateBudget(rate=1, burst=5), 5) < 0.5
+
+def test_requests_past_the_burst_are_paced():
+    rate = 50
+    # Two tokens of burst, then three more at `rate` per second
+    assert acquire_all(RateBudget(rate=rate, burst=2), 5) >= 2.5 / rate
+
+def test_concurrent_requests_share_the_budget():
+    rate = 50
+    budget = RateBudget(rate=rate, burst=1)
+
+    async def run():
+        start = time.monotonic()
+        await asyncio.gather(*(budget.acquire() for _ in range(4)))
+        return time.monotonic() - start
+
+    assert asyncio.run(run()) >= 2.5 / rate
+
+def test_lag_percentiles():
+    metrics = DeliveryMetrics()
+    now = time.time()
+    metrics.lags.extend(range(1, 101))
+    metrics.record_sent(ReminderEntry(now + 60, 1, 1, 'Due later'))
+
+    assert metrics.sent == 1
+    # A reminder sent before it was due has no lag
+    assert metrics.lags[-1] == 0
+    assert metrics.percentile(0.5) == 50
+    assert metrics.percentile(0.95) == 95
+    assert metrics.percentile(1) == 100
+    assert 'lag p50 50.00s p95 95.00s max 100.00s' in metrics.summary()
+
+def test_lags_keep_the_most_recent_samples():
+    metrics = DeliveryMetrics()
+    due = time.time() - 10
+    for id in range(LAG_SAMPLES + 10):
+        metrics.record_sent(ReminderEntry(due, id, 1, 'Due'))
+
+    assert metrics.sent == LAG_SAMPLES + 10
+    assert len(metrics.lags) == LAG_SAMPLES
+    assert 10 <= metrics.percentile(0.5) < 11
+
+def test_no_lags():
+    assert DeliveryMetrics().percentile(0.95) == 0
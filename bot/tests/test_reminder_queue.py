@@ -0,0 +1,60 @@
+import random
+
+from apps.productivity.reminder_queue import ReminderEntry, ReminderQueue
+
+def entry(id, due):
+    return ReminderEntry(due, id, 1, f'Reminder {id}')
+
+def test_pop_due_returns_entries_earliest_first():
+    random.seed(0)
+    queue = ReminderQueue()
+    dues = {id: random.uniform(0, 1000) for id in range(200)}
+    for id, due in dues.items():
+        queue.push(entry(id, due))
+
+    popped = queue.pop_due(500) + queue.pop_due(1000)
+
+    assert [e.id for e in popped] == sorted(dues, key=lambda id: (dues[id], id))
+    assert len(queue) == 0
+    assert queue.next_due() is None
+
+def test_pop_due_leaves_later_entries():
+    queue = ReminderQueue()
+    queue.push(entry(1, 10))
+    queue.push(entry(2, 20))
+    queue.push(entry(3, 30))
+
+    assert [e.id for e in queue.pop_due(20)] == [1, 2]
+    assert queue.next_due() == 30
+    assert 3 in queue and 1 not in queue
+
+def test_ties_are_ordered_by_id():
+    queue = ReminderQueue()
+    for id in (3, 1, 2):
+        queue.push(entry(id, 10))
+    assert [e.id for e in queue.pop_due(10)] == [1, 2, 3]
+
+def test_push_replaces_the_pending_entry_with_the_same_id():
+    queue = ReminderQueue()
+    queue.push(entry(1, 10))
+    queue.push(entry(1, 50))
+
+    assert len(queue) == 1
+    assert queue.pop_due(20) == []
+    assert [e.due for e in queue.pop_due(50)] == [50]
+
+def test_cancelled_entries_are_skipped_and_compacted():
+    queue = ReminderQueue()
+    for id in range(10):
+        queue.push(entry(id, id))
+
+    assert queue.cancel(0)
+    assert not queue.cancel(0)
+    assert queue.next_due() == 1
+
+    for id in range(1, 8):
+        queue.cancel(id)
+
+    # Cancelled entries never make up more than half of the heap
+    assert queue.cancelled_count <= len(queue.heap) // 2
+    assert [e.id for e in queue.pop_due(100)] == [8, 9]
@@ -0,0 +1,94 @@
+"""
+benchmark_reminders.py
+author: narlock
+
+Benchmarks the reminder queue with a large number of pending reminders.
+Run from the bot directory:
+
+    python -m tools.benchmark_reminders [count]
+
+Reports the time to schedule, cancel and fire reminders, and the cost of
+a single scheduler wake-up as the number of pending reminders grows. The
+wake-up cost grows with the log of the pending reminders, where the
+previous minute scan grew with every pending reminder.
+"""
+
+import random
+import sys
+import time
+
+from apps.productivity.reminder_queue import ReminderEntry, ReminderQueue
+
+# Reminders are spread over this many seconds from the start time
+SPREAD_SECONDS = 30 * 24 * 60 * 60
+
+# Fraction of the reminders cancelled after scheduling
+CANCEL_FRACTION = 0.1
+
+# Wake-ups measured for each queue size
+WAKE_SAMPLES = 10000
+
+def build_entries(count, start):
+    return [
+        ReminderEntry(start + random.uniform(0, SPREAD_SECONDS), id, random.randint(1, 10**18), f'Reminder {id}', None)
+        for id in range(count)
+    ]
+
+def timed(label, function, operations):
+    begin = time.perf_counter()
+    result = function()
+    elapsed = time.perf_counter() - begin
+    per_operation = elapsed / operations * 1e6 if operations else 0
+    print(f'{label:<28} {elapsed:>9.3f}s  {per_operation:>8.3f}us/op  ({operations} ops)')
+    return result
+
+def measure_wake(queue, start):
+    """
+    Measures the work the scheduler does when it wakes up: fire the one
+    reminder that is due and look up the next due time.
+    """
+    begin = time.perf_counter()
+    now = start
+    for _ in range(WAKE_SAMPLES):
+        now = queue.next_due()
+        for entry in queue.pop_due(now):
+            entry.due += SPREAD_SECONDS
+            queue.push(entry)
+    return (time.perf_counter() - begin) / WAKE_SAMPLES * 1e6
+
+def run(count):
+    random.seed(0)
+    start = time.time()
+    queue = ReminderQueue()
+
+    print(f'Reminder queue benchmark with {count} reminders')
+    entries = timed('build entries', lambda: build_entries(count, start), count)
+
+    def schedule():
+        for entry in entries:
+            queue.push(entry)
+    timed('schedule', schedule, count)
+
+    cancelled = random.sample(range(count), int(count * CANCEL_FRACTION))
+    def cancel():
+        for id in cancelled:
+            queue.cancel(id)
+    timed('cancel', cancel, len(cancelled))
+
+    pending = len(queue)
+    fired = timed('fire every reminder', lambda: queue.pop_due(start + SPREAD_SECONDS), pending)
+    assert len(fired) == pending
+    assert all(fired[i].due <= fired[i + 1].due for i in range(len(fired) - 1))
+
+    print()
+    print(f'{"pending reminders":<28} {"wake-up cost":>10}')
+    size = 1000
+    while size <= count:
+        queue = ReminderQueue()
+        for entry in build_entries(size, start):
+            queue.push(entry)
+        print(f'{size:<28} {measure_wake(queue, start):>8.3f}us')
+        size *= 10
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
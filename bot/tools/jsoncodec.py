@@ -0,0 +1,60 @@
+"""
+jsoncodec.py
+author: narlock
+
+JSON codec used to parse Alder API responses, using orjson when it
+is installed. The codec is chosen with json.codec in config.yaml.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Codecs that can be chosen with json.codec in config.yaml. auto uses
+# orjson when it is installed.
+CODECS = ('auto', 'orjson', 'json')
+
+class JsonCodec():
+    """
+    JSON encoding and decoding through orjson when it is installed,
+    falling back to the json module. Both codecs encode to compact
+    UTF-8 bytes and decode from bytes or str, so bodies never need to
+    be decoded to text first. Values orjson cannot encode, such as
+    integers wider than 64 bits, are encoded by the json module.
+
+    Datetimes are handed to `default` by both codecs, so the output
+    does not depend on which codec is used.
+    """
+    name = 'orjson' if orjson is not None else 'json'
+
+    @staticmethod
+    def use(name):
+        """
+        Selects the codec. Raises ValueError for an unknown codec or if
+        orjson is asked for but not installed.
+        """
+        if name not in CODECS:
+            raise ValueError(f'Unknown JSON codec: {name}. Must be one of {", ".join(CODECS)}.')
+        if name == 'auto':
+            name = 'orjson' if orjson is not None else 'json'
+        if name == 'orjson' and orjson is None:
+            raise ValueError('The orjson JSON codec is not installed.')
+        JsonCodec.name = name
+
+    @staticmethod
+    def dumps(obj, default=None):
+        if JsonCodec.name == 'orjson':
+            try:
+                return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+            except orjson.JSONEncodeError:
+                pass
+        return json.dumps(obj, default=default, separators=(',', ':'), ensure_ascii=False).encode()
+
+    @staticmethod
+    def loads(data):
+        if JsonCodec.name == 'orjson':
+            return orjson.loads(data)
+        return json.loads(data)
@@ -3,17 +3,25 @@ log.py
 author: narlock
 
 This is the AlderBot logger. It provides a simple interface for providing
-ANSI-colored, formatted logging messages. Utilize LEVEL from the configuration
-to increase or decrease logging level.
+ANSI-colored, formatted logging messages, or JSON lines when log.format is
+json. Utilize LEVEL from the configuration to increase or decrease logging
+level, and log.levels and log.sample to quiet specific modules.
 """
 
 import cfg
-import inspect
-
+import atexit
+import json
+import os
+import queue
+import random
+import sys
+import threading
+import time
 from datetime import datetime
 
 FORMAT = "%Y-%m-%d %H:%M:%S"
 RESET_ANSI = '\033[0m'
+TIME_ANSI = '\033[33m'
 FUNCTION_ANSI = '\033[35m'
 
 """
@@ -22,45 +30,199 @@ Level 1 for INFO+
 Level 2 for SUCCESS+
 Level 3 for WARN+
 """
+DEBUG, INFO, SUCCESS, WARN, ERROR = range(5)
+LEVEL_NAMES = ('DEBUG', 'INFO', 'SUCCESS', 'WARN', 'ERROR')
+LEVEL_ANSI = ('', '\033[36m', '\033[32m', '\033[34m', '\033[31m')
+
+# Level of every module without a level of its own
 LEVEL = cfg.LOG_LEVEL
 
+# Levels of modules by module name prefix, e.g. {'client.alder': 1}
+LEVELS = cfg.LOG_LEVELS
+
+# Fraction of DEBUG, INFO and SUCCESS lines kept for noisy modules,
+# by module name prefix. WARN and ERROR lines are never dropped.
+SAMPLE = cfg.LOG_SAMPLE
+
+# Write each line as a JSON object instead of colored text
+JSON_OUTPUT = cfg.LOG_FORMAT == 'json'
+
+# Lowest level enabled for any module, checked before anything else
+# so a disabled line costs a single comparison
+MIN_LEVEL = min([LEVEL, *LEVELS.values()])
+
+class LogWriter():
+    """
+    Formats and writes log lines from a background thread, so callers
+    never wait on formatting or on the terminal. The thread is started
+    on the first line and again in a forked child process.
+    """
+    def __init__(self):
+        self.stream = None
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self.reset)
+        atexit.register(self.flush)
+
+    def reset(self):
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def put(self, record):
+        if self.thread is None:
+            self.start()
+        self.queue.put(record)
+
+    def start(self):
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name='log-writer', daemon=True)
+                self.thread.start()
+
+    def flush(self, timeout=1):
+        """
+        Waits until every line logged so far is written.
+        """
+        if self.thread is None:
+            return
+        done = threading.Event()
+        self.queue.put(done)
+        done.wait(timeout)
+
+    def run(self):
+        while True:
+            record = self.queue.get()
+            if isinstance(record, threading.Event):
+                self.write(None)
+                record.set()
+            else:
+                self.write(format_record(*record) + '\n')
+
+    def write(self, line):
+        # A closed or broken stream must not stop the writer thread
+        stream = self.stream or sys.stdout
+        try:
+            if line is None:
+                stream.flush()
+            else:
+                stream.write(line)
+        except Exception:
+            pass
+
+def format_record(created, level, name, function, message, fields):
+    if JSON_OUTPUT:
+        line = {
+            'time': datetime.fromtimestamp(created).isoformat(timespec='milliseconds'),
+            'level': LEVEL_NAMES[level],
+            'logger': name,
+            'function': function,
+            'message': message
+        }
+        line.update(fields)
+        return json.dumps(line, default=str)
+
+    if fields:
+        message = f"{message} {' '.join(f'{key}={value}' for key, value in fields.items())}"
+    time_string = datetime.fromtimestamp(created).strftime(FORMAT)
+    return f"{TIME_ANSI}{time_string}{RESET_ANSI} {LEVEL_ANSI[level]}{LEVEL_NAMES[level]} {FUNCTION_ANSI}{function} {RESET_ANSI}{message}"
+
+WRITER = LogWriter()
+
 class Logger():
+    """
+    Messages may be given with %-style arguments, which are only
+    formatted if the line is logged, and keyword arguments, which are
+    written as structured fields:
+
+    Logger.debug('Loaded %d reminders', count, window=window)
+
+    The caller's function is read from its frame rather than the whole
+    stack, and lines are written by a background thread.
+    """
+    _modules = {}
 
     @staticmethod
-    def format_time():
-        return datetime.now().strftime(FORMAT)
+    def configure(level=None, levels=None, sample=None, json_output=None, stream=None):
+        """
+        Changes the logging settings. Arguments that are not given keep
+        their current value.
+        """
+        global LEVEL, LEVELS, SAMPLE, JSON_OUTPUT, MIN_LEVEL
+        if level is not None:
+            LEVEL = level
+        if levels is not None:
+            LEVELS = dict(levels)
+        if sample is not None:
+            SAMPLE = dict(sample)
+        if json_output is not None:
+            JSON_OUTPUT = json_output
+        if stream is not None:
+            WRITER.stream = stream
+        MIN_LEVEL = min([LEVEL, *LEVELS.values()])
+        Logger._modules = {}
 
     @staticmethod
-    def get_caller_function_name():
-        frame = inspect.stack()[2]
-        return frame.function
+    def get_module_settings(name):
+        """
+        Returns the (level, sample rate) of a module, from the longest
+        matching prefix in LEVELS and SAMPLE. Cached per module.
+        """
+        settings = Logger._modules.get(name)
+        if settings is None:
+            settings = (find_prefix(LEVELS, name, LEVEL), find_prefix(SAMPLE, name, 1))
+            Logger._modules[name] = settings
+        return settings
 
     @staticmethod
-    def debug(message):
-        if LEVEL in [0]:
-            func_name = Logger.get_caller_function_name()
-            print(f"\033[33m{Logger.format_time()}{RESET_ANSI} DEBUG {FUNCTION_ANSI}{func_name} {RESET_ANSI}{message}")
+    def log(level, message, args, fields):
+        frame = sys._getframe(2)
+        name = frame.f_globals.get('__name__', '')
+        module_level, rate = Logger.get_module_settings(name)
+        if level < module_level:
+            return
+        if rate < 1 and level < WARN and random.random() >= rate:
+            return
+        message = str(message) % args if args else str(message)
+        WRITER.put((time.time(), level, name, frame.f_code.co_name, message, fields))
 
     @staticmethod
-    def info(message):
-        if LEVEL in [0, 1]:
-            func_name = Logger.get_caller_function_name()
-            print(f"\033[33m{Logger.format_time()}{RESET_ANSI} \033[36mINFO {FUNCTION_ANSI}{func_name} {RESET_ANSI}{message}")
+    def flush(timeout=1):
+        WRITER.flush(timeout)
 
     @staticmethod
-    def success(message):
-        if LEVEL in [0, 1, 2]:
-            func_name = Logger.get_caller_function_name()
-            print(f"\033[33m{Logger.format_time()}{RESET_ANSI} \033[32mSUCCESS {FUNCTION_ANSI}{func_name} {RESET_ANSI}{message}")
+    def debug(message, *args, **fields):
+        if MIN_LEVEL <= DEBUG:
+            Logger.log(DEBUG, message, args, fields)
 
     @staticmethod
-    def warn(message):
-        if LEVEL in [0, 1, 2, 3]:
-            func_name = Logger.get_caller_function_name()
-            print(f"\033[33m{Logger.format_time()}{RESET_ANSI} \033[34mWARN {FUNCTION_ANSI}{func_name} {RESET_ANSI}{message}")
+    def info(message, *args, **fields):
+        if MIN_LEVEL <= INFO:
+            Logger.log(INFO, message, args, fields)
 
     @staticmethod
-    def error(message):
-        if LEVEL in [0, 1, 2, 3, 4]:
-            func_name = Logger.get_caller_function_name()
-            print(f"\033[33m{Logger.format_time()}{RESET_ANSI} \033[31mERROR {FUNCTION_ANSI}{func_name} {RESET_ANSI}{message}")
\ No newline at end of file
+    def success(message, *args, **fields):
+        if MIN_LEVEL <= SUCCESS:
+            Logger.log(SUCCESS, message, args, fields)
+
+    @staticmethod
+    def warn(message, *args, **fields):
+        if MIN_LEVEL <= WARN:
+            Logger.log(WARN, message, args, fields)
+
+    @staticmethod
+    def error(message, *args, **fields):
+        Logger.log(ERROR, message, args, fields)
+
+def find_prefix(settings, name, default):
+    """
+    Returns the value of the longest key of `settings` that is `name`
+    or a dotted prefix of it.
+    """
+    best = None
+    for prefix in settings:
+        if (name == prefix or name.startswith(prefix + '.')) and (best is None or len(prefix) > len(best)):
+            best = prefix
+    return settings[best] if best is not None else default
@@ -0,0 +1,40 @@
+"""
+msgpackcodec.py
+author: narlock
+
+MessagePack codec used to talk to the Alder API when api.msgpack is
+enabled in config.yaml and msgpack is installed.
+"""
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_MIMETYPE = 'application/msgpack'
+
+class MsgpackCodec():
+    """
+    MessagePack encoding and decoding, available when msgpack is
+    installed. Integers up to 64 bits, such as Discord snowflake ids,
+    are encoded natively.
+    """
+    available = msgpack is not None
+
+    @staticmethod
+    def dumps(obj, default=None):
+        return msgpack.packb(obj, default=default, use_bin_type=True)
+
+    @staticmethod
+    def loads(data):
+        return msgpack.unpackb(data, raw=False, strict_map_key=False)
+
+    @staticmethod
+    def loads_sequence(data):
+        """
+        Returns the list of objects written back to back in `data`, as
+        streamed endpoints send them.
+        """
+        unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+        unpacker.feed(data)
+        return list(unpacker)
@@ -15,7 +15,6 @@ them inside of the announcements channel.
 """
 
 import cfg
-import json
 import discord
 
 from tools.log import Logger
@@ -101,11 +100,11 @@ class ResetMonth():
         Logger.success('Month role reset complete')
 
         # Display top 3 users of the month in announcements channel
-        response = MonthTimeClient.search_monthtime({"limit": 3, "date": f'{month}-{year}'})
+        response = await MonthTimeClient.search_monthtime({"limit": 3, "date": f'{month}-{year}'})
         if response is None or response.status_code == 404:
             top_3_users = []
         else:
-            top_3_users = json.loads(response.text)
+            top_3_users = response.json()
 
         top_month_user_message = f"""
 Hey @everyone !
@@ -120,10 +119,10 @@ Hey @everyone !
 
             # Give accomplishment to the top 3 users
             accomplishment_string = f'{PLACES[index]} Focus {cfg.MONTHS[month]} {year}'
-            AccomplishmentClient.add_user_accomplishment(user['user_id'], accomplishment_string)
+            await AccomplishmentClient.add_user_accomplishment(user['user_id'], accomplishment_string)
 
             # Give tokens to the top 3 users
-            UserClient.add_tokens_user(user['user_id'], PLACE_AWARD[index])
+            await UserClient.add_tokens_user(user['user_id'], PLACE_AWARD[index])
 
         # Append footer
         top_month_user_message += '\nCongratulations to the winners of this month!'
@@ -14,7 +14,7 @@ from client.alder.interface.monthtime_client import MonthTimeClient
 
 class RoleAssign():
     async def check_role_updates_on_user(self, member: discord.Member, guild: discord.Guild = None):
-        Logger.debug(f'Checking for role updates for {member.name}')
+        Logger.debug('Checking for role updates for %s', member.name)
 
         # Get Level Roles for Server
         level_one_role = discord.utils.get(guild.roles, id=cfg.LEVEL_1_ACTIVITY_ROLE)
@@ -25,46 +25,46 @@ class RoleAssign():
         level_six_role = discord.utils.get(guild.roles, id=cfg.LEVEL_6_ACTIVITY_ROLE)
 
         # Retrieve the user's month time and convert to hours
-        month_time = MonthTimeClient.get_stime_value_for_user_current_month(member.id) // 3600
+        month_time = await MonthTimeClient.get_stime_value_for_user_current_month(member.id) // 3600
 
         if month_time < 3:
             # Member should not have any level roles since their monthly hours are less than 3
             await member.remove_roles(level_one_role, level_two_role, level_three_role, level_four_role, level_five_role, level_six_role)
-            Logger.debug(f"Ensuring {member.name} does not have a level role.")
+            Logger.debug("Ensuring %s does not have a level role.", member.name)
         elif month_time >= 3 and month_time < 10:
             # Assign Level 1 Role, unless user already has it, deassign other activity roles
             if level_one_role not in member.roles:
                 await member.add_roles(level_one_role)
                 await member.remove_roles(level_two_role, level_three_role, level_four_role, level_five_role, level_six_role)
-                Logger.debug(f"Assigning {member.name} level one role.")
+                Logger.debug("Assigning %s level one role.", member.name)
         elif month_time >= 10 and month_time < 25:
             # Assign Level 2 Role, unless user already has it, deassign other activity roles
             if level_two_role not in member.roles:
                 await member.add_roles(level_two_role)
                 await member.remove_roles(level_one_role, level_three_role, level_four_role, level_five_role, level_six_role)
-                Logger.debug(f"Assigning {member.name} level two role.")
+                Logger.debug("Assigning %s level two role.", member.name)
         elif month_time >= 25 and month_time < 60:
             # Assign Level 3 Role, unless user already has it, deassign other activity roles
             if level_three_role not in member.roles:
                 await member.add_roles(level_three_role)
                 await member.remove_roles(level_one_role, level_two_role, level_four_role, level_five_role, level_six_role)
-                Logger.debug(f"Assigning {member.name} level three role.")
+                Logger.debug("Assigning %s level three role.", member.name)
         elif month_time >= 60 and month_time < 100:
             # Assign Level 4 Role, unless user already has it, deassign other activity roles
             if level_four_role not in member.roles:
                 await member.add_roles(level_four_role)
                 await member.remove_roles(level_one_role, level_two_role, level_three_role, level_five_role, level_six_role)
-                Logger.debug(f"Assigning {member.name} level four role.")
+                Logger.debug("Assigning %s level four role.", member.name)
         elif month_time >= 100 and month_time < 250:
             # Assign Level 5 Role, unless user already has it, deassign other activity roles
             if level_five_role not in member.roles:
                 await member.add_roles(level_five_role)
                 await member.remove_roles(level_one_role, level_two_role, level_three_role, level_four_role, level_six_role)
-                Logger.debug(f"Assigning {member.name} level five role.")
+                Logger.debug("Assigning %s level five role.", member.name)
         elif month_time >= 250:
             # Assign Level 6 Role, unless user already has it, deassign other roles
             if level_six_role not in member.roles:
                 await member.add_roles(level_six_role)
                 await member.remove_roles(level_one_role, level_two_role, level_three_role, level_four_role, level_five_role)
-                Logger.debug(f"Assigning {member.name} level six role.")
+                Logger.debug("Assigning %s level six role.", member.name)
 
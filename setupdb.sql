@@ -1,3 +1,8 @@
+-- Creates a fresh Alder database. This drops any existing database, so
+-- do not run it against a live installation. Afterwards, and whenever
+-- Alder is updated, apply the schema migrations from the api directory
+-- with `python3 migrate.py upgrade`.
+
 -- Create Database
 DROP DATABASE IF EXISTS `alder`;
 CREATE DATABASE alder;